@@ -1,7 +1,7 @@
-import os
-from metacat.filters import MetaCatFilter
+import os, threading
+from metacat.filters import MetaCatBatchFilter
 
-class RucioReplicas(MetaCatFilter):
+class RucioReplicas(MetaCatBatchFilter):
     """
     Inputs: single file set
     
@@ -11,33 +11,43 @@ class RucioReplicas(MetaCatFilter):
     
     Configuration:
         rucio_config:   path to Rucio client configuration file. If unspecified, standard Rucio config file lookup procedure will be used.
+        concurrency:    number of concurrent Rucio requests, default 4
     """
 
+    ChunkSize = 1000                # Rucio can not handle more than 1000 dids at a time
+    OrderPreserving = True
+    LimitPushdownSafe = True        # the filter only adds metadata to every input file
+
     def __init__(self, config):
-        MetaCatFilter.__init__(self, config)
+        MetaCatBatchFilter.__init__(self, config)
         self.RucioConfig = config.get("rucio_config")
-
-    def filter(self, inputs, *params, **ignore):
-
-        from rucio.client.replicaclient import ReplicaClient
-        if self.RucioConfig is not None:
-            os.environ["RUCIO_CONFIG"] = self.RucioConfig
-        client = ReplicaClient()
-
-        for chunk in inputs[0].chunked(1000):               # Rucio can not handle more than 1000 dids at a time
-            chunk_files = {f.did(): f for f in chunk}
-            dids = [{"scope":f.Namespace, "name":f.Name} for f in chunk]
-            for f in chunk_files.values():
-                f.Metadata["rucio.rses"] = []
-
-            replicas = client.list_replicas(dids, all_states=False, ignore_availability=False, resolve_archives=False)
-
-            for r in replicas:
-                did = "%(scope)s:%(name)s" % r
-                f = chunk_files[did]
-                f.Metadata["rucio.rses"] = list(r["rses"].keys())
-
-            yield from chunk_files.values()
+        self.Concurrency = config.get("concurrency", 4)
+        self.Clients = threading.local()
+
+    def client(self):
+        # Rucio client is not thread-safe, use one per thread
+        client = getattr(self.Clients, "client", None)
+        if client is None:
+            from rucio.client.replicaclient import ReplicaClient
+            if self.RucioConfig is not None:
+                os.environ["RUCIO_CONFIG"] = self.RucioConfig
+            client = self.Clients.client = ReplicaClient()
+        return client
+
+    def filter_chunk(self, chunk, *params, **ignore):
+        chunk_files = {f.did(): f for f in chunk}
+        dids = [{"scope":f.Namespace, "name":f.Name} for f in chunk]
+        for f in chunk_files.values():
+            f.Metadata["rucio.rses"] = []
+
+        replicas = self.client().list_replicas(dids, all_states=False, ignore_availability=False, resolve_archives=False)
+
+        for r in replicas:
+            did = "%(scope)s:%(name)s" % r
+            f = chunk_files[did]
+            f.Metadata["rucio.rses"] = list(r["rses"].keys())
+
+        return list(chunk_files.values())
 
 def create_filters(config):
     return {
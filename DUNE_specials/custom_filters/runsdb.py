@@ -1,9 +1,9 @@
-from metacat.filters import MetaCatFilter
+from metacat.filters import MetaCatBatchFilter, filter_cache
 from wsdbtools import ConnectionPool
 import re
 
 
-class RunsDB(MetaCatFilter):
+class RunsDB(MetaCatBatchFilter):
     """
     Inputs: single file set
     
@@ -17,60 +17,78 @@ class RunsDB(MetaCatFilter):
         Selects only runs with given "daqinterface_commit" and "mode" column values.
         For each run record found in the runs database, adds <category>.<column name> value to the file metadata.
         If the file corresponds to multiple run, which run's data will be used is currently undefined.
+        Run records, including absence of a record for a run, are cached in the process-wide filter cache.
     
     Configuration:
         connection:     Postgres connection string to use to connect to the Runs database ("host=... port=... dbname=... ...")
         table:          table name
         columns:        list of columns to add values from
         meta_prefix:    metadata parameter category to use to add metadata values
+        concurrency:    number of chunks processed concurrently, default 2
     """
+
+    OrderPreserving = False
+    LimitPushdownSafe = False       # files without matching runs are dropped
     
     def __init__(self, config):
         self.Config = config
         show_config = config.copy()
         show_config["connection"] = self.hide(show_config["connection"], "user", "password")
-        MetaCatFilter.__init__(self, show_config)
+        MetaCatBatchFilter.__init__(self, show_config)
+        self.Concurrency = self.Config.get("concurrency", 2)
         self.Connection = self.Config["connection"]
-        self.ConnPool = ConnectionPool(postgres=self.Connection, max_idle_connections=1)
+        self.ConnPool = ConnectionPool(postgres=self.Connection, max_idle_connections=self.Concurrency)
         self.TableName = self.Config["table"]
         self.IncludeColumns = self.Config["columns"]
         self.MetaPrefix = self.Config.get("meta_prefix", "runs_history")
+        self.CacheName = "dune_runsdb:" + self.TableName
         
     def hide(self, conn, *fields):
         for f in fields:
              conn = re.sub(f"\s+{f}\s*=\s*\S+", f" {f}=(hidden)", conn, re.I)
         return conn
     
-    def filter(self, inputs, daqinterface_commit=None, mode=None, **ignore):
-        db = self.ConnPool.connect()
-        cursor = db.cursor()
-
-        assert len(inputs) == 1
-
-        colnames = ("," + ",".join(self.IncludeColumns)) if self.IncludeColumns else ""
-
-        for chunk in inputs[0].chunked():
-            by_run = {}
-            for f in chunk:
-                if "core.runs" in f.Metadata:
-                    for runnum in f.Metadata["core.runs"]:
-                        by_run.setdefault(runnum,[]).append(f)
-            run_nums = list(by_run.keys())
+    def lookup_runs(self, run_nums, daqinterface_commit, mode):
+        # returns {runnum: column values or None}
+        cache = filter_cache()
+        keys = [(runnum, daqinterface_commit, mode) for runnum in run_nums]
+        found, missing = cache.get_many(self.CacheName, keys)
+        runs = {runnum: data for (runnum, _, _), data in found.items()}
+        if missing:
+            db = self.ConnPool.connect()
+            cursor = db.cursor()
+            colnames = ("," + ",".join(self.IncludeColumns)) if self.IncludeColumns else ""
+            missing_runs = [runnum for runnum, _, _ in missing]
             cursor.execute(f"""
                 select runnum {colnames}
                     from {self.TableName}
                     where runnum = any(%s)
                         and (%s is null or daqinterface_commit=%s)
                         and (%s is null or mode=%s)
-            """, (run_nums, daqinterface_commit, daqinterface_commit, mode, mode))
-            tup = cursor.fetchone()
-            while tup:
-                runnum, rest = tup[0], tup[1:]
-                for f in by_run[runnum]:
-                    for column, value in zip(self.IncludeColumns, rest):
-                        f.Metadata[f"{self.MetaPrefix}.{column}"] = value
-                    yield f
-                tup = cursor.fetchone()
+            """, (missing_runs, daqinterface_commit, daqinterface_commit, mode, mode))
+            fetched = {runnum: None for runnum in missing_runs}
+            for tup in cursor.fetchall():
+                fetched[tup[0]] = tup[1:]
+            cache.put_many(self.CacheName, {(runnum, daqinterface_commit, mode): data for runnum, data in fetched.items()})
+            runs.update(fetched)
+        return runs
+
+    def filter_chunk(self, chunk, daqinterface_commit=None, mode=None, **ignore):
+        by_run = {}
+        for f in chunk:
+            if "core.runs" in f.Metadata:
+                for runnum in f.Metadata["core.runs"]:
+                    by_run.setdefault(runnum,[]).append(f)
+        runs = self.lookup_runs(list(by_run.keys()), daqinterface_commit, mode)
+        out = []
+        for runnum, rest in runs.items():
+            if rest is None:
+                continue
+            for f in by_run[runnum]:
+                for column, value in zip(self.IncludeColumns, rest):
+                    f.Metadata[f"{self.MetaPrefix}.{column}"] = value
+                out.append(f)
+        return out
 
 def create_filters(config):
     return {
@@ -1,9 +1,9 @@
 import re
 from wsdbtools import ConnectionPool
 from condb import ConDB
-from metacat.filters import MetaCatFilter
+from metacat.filters import MetaCatBatchFilter, filter_cache
 
-class RunsDBinConDB(MetaCatFilter):
+class RunsDBinConDB(MetaCatBatchFilter):
     """
     Inputs: Single file set
 
@@ -15,22 +15,29 @@ class RunsDBinConDB(MetaCatFilter):
         attaches the data to the file metadata under configured category. Database timestamps are converted to floating point timestamps.
         If the file does not have a run number associated with it (core.runs[] is missing from the file metadata) or there is no data
         for the run in the runs history database, then the file metadata is unchanged and will not contain the runs history fields.
+        Runs history data, including absence of data for a run, are cached in the process-wide filter cache.
 
     Configuration:
         connectio: Runs history Posrgres connection string "host=... port=... user=... dbname=..."
         folder: ConDB folder name as "name" or "namespace.name"
         meta_prefix: Metadata category prefix to use when appending the Runs history data to the MetaCat file metadata. Default "runs_history"
+        concurrency: number of chunks processed concurrently, default 2
     """
 
+    OrderPreserving = True
+    LimitPushdownSafe = True        # the filter only adds metadata to every input file
+
     def __init__ (self, config):
         self.Config = config
         show_config = config.copy()
         show_config["connection"] = self.hide(show_config["connection"], "user", "password")
-        MetaCatFilter.__init__(self, show_config)
+        MetaCatBatchFilter.__init__(self, show_config)
+        self.Concurrency = self.Config.get("concurrency", 2)
         self.Connection = self.Config["connection"]
-        self.ConnPool = ConnectionPool(postgres=self.Connection, max_idle_connections=1)
+        self.ConnPool = ConnectionPool(postgres=self.Connection, max_idle_connections=self.Concurrency)
         self.FolderName = self.Config["folder"]
         self.MetaPrefix = self.Config.get("meta_prefix", "runs_history")
+        self.CacheName = "dune_runshistdb:" + self.FolderName
         
         #
         # get column names
@@ -52,42 +59,42 @@ class RunsDBinConDB(MetaCatFilter):
         else:
             return None
 
-    def filter(self, inputs, **ignore):
+    def filter_chunk(self, chunk, **ignore):
 
-        # Conect to db via condb python API
-        db = ConDB(self.ConnPool)
-        folder = db.openFolder(self.FolderName)
-        
-        data_by_run = {}        # cache data by run number across chunks
+        run_nums = set()
+        for f in chunk:
+            runnum = self.file_run_number(f.Metadata)
+            if runnum is not None:
+                run_nums.add(runnum)
 
-        # Get files from metacat input
-        file_set = inputs[0]
-        for chunk in file_set.chunked():
-            need_run_nums = set()
+        cache = filter_cache()
+        data_by_run, need_run_nums = cache.get_many(self.CacheName, run_nums)
 
-            for f in chunk:
-                runnum = self.file_run_number(f.Metadata)
-                if runnum is not None and runnum not in data_by_run:
-                    need_run_nums.add(runnum)
+        if need_run_nums:
+            # Conect to db via condb python API
+            db = ConDB(self.ConnPool)
+            folder = db.openFolder(self.FolderName)
 
-            if need_run_nums:
-                # Get run_hist data
-                data_runhist = folder.getData(0, channel_range=(min(need_run_nums), max(need_run_nums)+1))
-                for row in data_runhist:
-                    runnum, data = row[0], row[4:]
-                    if runnum not in data_by_run:
-                        data_by_run[runnum] = data
-        
-            # Insert run hist data to Metacat
-            for f in chunk:
-                runnum = self.file_run_number(f.Metadata)
-                if runnum is not None and runnum in data_by_run:
-                    for (col, typ), value in zip(self.ColumnTypes, data_by_run[runnum]):
-                        if typ.startswith("timestamp") and value is not None:
-                            value = value.timestamp()
-                        f.Metadata[f"{self.MetaPrefix}.{col}"] = value
+            # Get run_hist data
+            fetched = {runnum: None for runnum in need_run_nums}
+            data_runhist = folder.getData(0, channel_range=(min(need_run_nums), max(need_run_nums)+1))
+            for row in data_runhist:
+                runnum, data = row[0], row[4:]
+                if fetched.get(runnum) is None:
+                    fetched[runnum] = data
+            cache.put_many(self.CacheName, fetched)
+            data_by_run.update(fetched)
+    
+        # Insert run hist data to Metacat
+        for f in chunk:
+            runnum = self.file_run_number(f.Metadata)
+            if data_by_run.get(runnum) is not None:
+                for (col, typ), value in zip(self.ColumnTypes, data_by_run[runnum]):
+                    if typ.startswith("timestamp") and value is not None:
+                        value = value.timestamp()
+                    f.Metadata[f"{self.MetaPrefix}.{col}"] = value
 
-            yield from chunk
+        return chunk
  
 
 def create_filters(config):
@@ -1,6 +1,6 @@
 import json, requests, time, psycopg2
 from pythreader import TaskQueue
-from metacat.db import DBUser, DBNamespace, DBDataset, DBFile
+from metacat.db import DBUser, DBNamespace, DBDataset, DBFile, DBQueryJob, prune_changes
 from metacat.logs import Logged, init as init_logs
 from wsdbtools import ConnectionWithTransactions
 
@@ -20,6 +20,9 @@ class MetaCatDaemon(Logged):
         
         self.FerryUpdateInterval = daemon_config.get("ferry_update_interval", 1*3600)
         self.CountsUpdateInterval = daemon_config.get("counts_update_interval", 1*3600)
+        self.CountsVerifyInterval = daemon_config.get("counts_verify_interval", 24*3600)
+        self.ChangesRetention = daemon_config.get("changes_retention", 24*3600)       # must be longer than query cache TTL
+        self.QueryJobsStaleAfter = daemon_config.get("query_jobs_stale_after", 24*3600)     # active jobs not updated for so long are lost
         self.VO = daemon_config["vo"]
 
         db_config = config["database"]
@@ -30,8 +33,10 @@ class MetaCatDaemon(Logged):
 
         self.Queue = TaskQueue(5, delegate=self)
         self.Queue.append(self.ferry_update, interval=self.FerryUpdateInterval, after=time.time())
-        self.Queue.append(self.update_dataset_file_counts, interval=self.CountsUpdateInterval, after=0) #self.CountsUpdateInterval//3)
-        self.Queue.append(self.update_namespace_file_counts, interval=self.CountsUpdateInterval, after=0) #2*self.CountsUpdateInterval//3)
+        self.Queue.append(self.verify_file_counts, interval=self.CountsVerifyInterval, after=0)
+        self.Queue.append(self.update_file_counts, interval=self.CountsUpdateInterval, after=time.time() + self.CountsUpdateInterval)
+        self.Queue.append(self.prune_changes, interval=3600, after=time.time())
+        self.Queue.append(self.prune_query_jobs, interval=3600, after=time.time())
         self.debug("tasks enqueued")
         
     def db(self):
@@ -40,23 +45,37 @@ class MetaCatDaemon(Logged):
             db.cursor().execute(f"set search_path to {self.Schema}")
         return ConnectionWithTransactions(db)
         
-    def update_dataset_file_counts(self):
+    def update_file_counts(self):
+        # fold the file count deltas accumulated since last update into the counters
         db = self.db()
-        counts = DBDataset.file_count_by_dataset(db)
-        for ds in DBDataset.list(db):
-            ds.FileCount = counts.get((ds.Namespace, ds.Name), 0)
-            ds.save()
+        ndatasets = DBDataset.fold_file_counts(db)
+        nnamespaces = DBNamespace.fold_file_counts(db)
         db.close()
-        self.log("Dataset file counts updated")
+        self.log("File counts updated for", ndatasets, "datasets and", nnamespaces, "namespaces")
 
-    def update_namespace_file_counts(self):
+    def verify_file_counts(self):
+        # compare the counters with actual file counts and fix them, if needed
         db = self.db()
-        counts = DBFile.file_count_by_namespace(db)
-        for ns in DBNamespace.list(db):
-            ns.FileCount = counts.get(ns.Name, 0)
-            ns.save()
+        ndatasets = DBDataset.reconcile_file_counts(db)
+        nnamespaces = DBNamespace.reconcile_file_counts(db)
         db.close()
-        self.log("Namespace file counts updated")
+        if ndatasets or nnamespaces:
+            self.log("File counts corrected for", ndatasets, "datasets and", nnamespaces, "namespaces")
+        else:
+            self.log("File counts verified")
+        self.update_file_counts()
+
+    def prune_changes(self):
+        db = self.db()
+        n = prune_changes(db, self.ChangesRetention)
+        db.close()
+        self.log("Catalog changes pruned:", n)
+
+    def prune_query_jobs(self):
+        db = self.db()
+        n = DBQueryJob.prune(db, self.QueryJobsStaleAfter)
+        db.close()
+        self.log("Expired query jobs removed:", n)
 
     def ferry_update(self):
         self.debug("ferry_update...")
@@ -1,6 +1,7 @@
 import requests, time, json, random
 from urllib.parse import quote_plus, unquote_plus
 from .exceptions import MCError, NotFoundError, InvalidArgument, PermissionError, BadRequestError, WebAPIError
+from .http_session import PooledSession
 
 INVALID_METADATA_ERROR_CODE = 488
 
@@ -21,12 +22,13 @@ class HTTPClient(object):
     RetryExponent = 1.5
     DefaultTimeout = 300.0
 
-    def __init__(self, server_url, token, timeout):
+    def __init__(self, server_url, token, timeout, pool_size=None, retries=None):
         self.ServerURL = server_url
         self.Token = token
         self.Timeout = timeout or self.DefaultTimeout
         self.LastResponse = self.LastStatusCode = None
         self.LastURL = ""
+        self.Session = PooledSession(pool_size, retries)
 
     def retry_request(self, method, url, timeout=None, **args):
         """
@@ -42,9 +44,9 @@ class HTTPClient(object):
         done = False
         while time.time() < tend:
             if method == "get":
-                response = requests.get(url, timeout=self.Timeout, **args)
+                response = self.Session.get(url, timeout=self.Timeout, **args)
             else:
-                response = requests.post(url, timeout=self.Timeout, **args)
+                response = self.Session.post(url, timeout=self.Timeout, **args)
             if response.status_code != 503:
                 break
             sleep_time = min(random.random() * retry_interval, tend-time.time())
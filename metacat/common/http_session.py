@@ -0,0 +1,69 @@
+import requests, threading
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+#
+# Pooled HTTP session
+#
+# One requests.Session per client, shared by all threads using the client. The connections to the server
+# are kept alive and reused by subsequent requests. The session's connection pool is thread safe,
+# up to pool_size connections are kept open, so pool_size should be at least the number of threads
+# sending requests concurrently.
+#
+# Failures to connect are retried by the transport with exponential backoff. Requests which failed
+# after they were sent are retried only for idempotent methods.
+#
+
+class PooledSession(object):
+
+    DefaultPoolSize = 10
+    DefaultRetries = 3
+    DefaultBackoff = 0.5        # seconds, doubled with each retry
+
+    def __init__(self, pool_size=None, retries=None, backoff=None):
+        self.PoolSize = pool_size or self.DefaultPoolSize
+        self.Retries = self.DefaultRetries if retries is None else retries
+        self.Backoff = self.DefaultBackoff if backoff is None else backoff
+        self.Session = None
+        self.Lock = threading.Lock()
+
+    def retry(self):
+        return Retry(
+            total = self.Retries,
+            connect = self.Retries,
+            read = self.Retries,
+            status = 0,                 # status codes, e.g. 503, are handled by the client
+            backoff_factor = self.Backoff,
+            raise_on_status = False
+        )
+
+    def session(self):
+        with self.Lock:
+            if self.Session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.PoolSize, max_retries=self.retry())
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                self.Session = session
+            return self.Session
+
+    def get(self, url, **args):
+        return self.session().get(url, **args)
+
+    def post(self, url, **args):
+        return self.session().post(url, **args)
+
+    def close(self):
+        with self.Lock:
+            if self.Session is not None:
+                self.Session.close()
+                self.Session = None
+
+    def __getstate__(self):
+        # sessions and locks can not be pickled
+        return dict(PoolSize=self.PoolSize, Retries=self.Retries, Backoff=self.Backoff)
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.Session = None
+        self.Lock = threading.Lock()
@@ -66,11 +66,25 @@ class _MetaRegularizer(Ascender):
             Node("meta_and", [Node(typ, children, _meta=meta)])
         ])
 
+def meta_index_expression(name, type, is_array, table_name=None, meta_column_name="metadata"):
+    # expression used in the index for a registered metadata key, see indexed_metadata_keys in schema.sql
+    # Text scalars use the "C" collation: it orders strings by code points, same as jsonpath comparisons,
+    # so that range predicates on the index select the same rows as the jsonpath terms they are ANDed with
+    column = meta_column_name if table_name is None else f"{table_name}.{meta_column_name}"
+    function = f"meta_{type}_array" if is_array else f"meta_{type}"
+    expression = f"{function}({column} -> '{name}')"
+    if type == "text" and not is_array:
+        expression = f'({expression} collate "C")'
+    return expression
+
 class MetaExpressionDNF(object):
     
     ObjectAttributes = []
     
-    def __init__(self, exp):
+    def __init__(self, exp, indexed_keys=None):
+        #
+        # indexed_keys: {name: (type, is_array)} - metadata keys with expression indexes
+        #
         #
         # meta_exp is a nested list representing the query filter expression in DNF:
         #
@@ -80,6 +94,7 @@ class MetaExpressionDNF(object):
         #
         self.Exp = None
         self.DNF = None
+        self.IndexedKeys = indexed_keys or {}
         if exp is not None:
             #
             # converts canonic Node expression (meta_or of one or more meta_ands) into nested or-list or and-lists
@@ -97,6 +112,83 @@ class MetaExpressionDNF(object):
     def regularize(exp):
         return _MetaRegularizer()(exp)
 
+    def indexed_term(self, exp, table_name, meta_column_name="metadata"):
+        #
+        # Returns the term using the expression index for the key, equivalent to the jsonpath term
+        # for the values of the registered type, or None if the index can not be used
+        #
+        if not self.IndexedKeys or exp.get("neg"):
+            return None
+        op = exp.T
+        if op not in ("cmp_op", "in_range", "in_set"):
+            return None
+        arg = exp.C[0]
+        if arg.T not in ("meta_attribute", "array_any"):
+            return None
+        key = self.IndexedKeys.get(arg["name"])
+        if key is None:
+            return None
+        typ, is_array = key
+        if is_array != (arg.T == "array_any"):
+            return None
+        
+        def typed(v):
+            if typ == "text":
+                return isinstance(v, str)
+            else:
+                return isinstance(v, (int, float)) and not isinstance(v, bool)
+
+        def literal(v):
+            return "'%s'" % (v,) if typ == "text" else str(v)
+            
+        def array_literal(values):
+            pgtype = "text" if typ == "text" else "double precision"
+            return "array[%s]::%s[]" % (",".join(literal(v) for v in values), pgtype)
+
+        expression = meta_index_expression(arg["name"], typ, is_array, table_name, meta_column_name)
+
+        if op == "cmp_op":
+            value_node = exp.C[1]
+            value_type, value = value_node.T, value_node["value"]
+            cmp_op = exp["op"]
+            if cmp_op == "==":  cmp_op = "="
+            if not typed(value) or cmp_op not in ("=", "<", "<=", ">", ">="):
+                return None
+            if value_type == "date_constant":
+                if is_array:
+                    return None
+                if cmp_op == "=":
+                    return f"{expression} >= {value} and {expression} < {value + 3600*24}"
+                elif cmp_op == ">":
+                    value += 3600*24
+                    cmp_op = ">="
+                elif cmp_op == "<=":
+                    value += 3600*24
+                    cmp_op = "<"
+            if is_array:
+                if cmp_op != "=":
+                    return None     # GIN index can not be used for ranges
+                return f"{expression} @> {array_literal([value])}"
+            return f"{expression} {cmp_op} {literal(value)}"
+
+        elif op == "in_range":
+            if is_array:
+                return None
+            typ_, low, high = exp["type"], exp["low"], exp["high"]
+            if not (typed(low) and typed(high)):
+                return None
+            if typ_ == "date_constant":
+                high = float(high + 3600*24 - 0.0001)
+            return f"{expression} between {literal(low)} and {literal(high)}"
+
+        elif op == "in_set":
+            values = exp["set"]
+            if not values or not all(typed(v) for v in values):
+                return None
+            if is_array:
+                return f"{expression} && {array_literal(values)}"
+            return f"{expression} in (%s)" % (",".join(literal(v) for v in values),)
+
     def sql_and(self, and_terms, table_name, meta_column_name="metadata"):
         
         def sql_literal(v):
@@ -188,7 +280,7 @@ class MetaExpressionDNF(object):
                         high = json_literal(high)
                     if arg.T == "object_attribute":
                         term = f"{table_name}.{aname} between {low} and {high}"
-                    elif arg.T in ("subscript", "scalar", "array_any"):
+                    elif arg.T in ("subscript", "scalar", "meta_attribute", "array_any"):
                         term = f"{table_name}.{meta_column_name} @? '$.\"{aname}\"{subscript} ? (@ >= {low} && @ <= {high})'"
                     elif arg.T == "array_length":
                         n = "not" if negate else ""
@@ -208,7 +300,7 @@ class MetaExpressionDNF(object):
                         high = json_literal(high)
                     if arg.T == "object_attribute":
                         term = f"not ({table_name}.{aname} between {low} and {high})"
-                    elif arg.T in ("subscript", "scalar", "array_any"):
+                    elif arg.T in ("subscript", "scalar", "meta_attribute", "array_any"):
                         term = f"{table_name}.{meta_column_name} @? '$.\"{aname}\"{subscript} ? (@ < {low} || @ > {high})'"
                     elif arg.T == "array_length":
                         n = "" if negate else "not"
@@ -295,7 +387,13 @@ class MetaExpressionDNF(object):
                         # scalar, subscript, array_any
                         term = f"{table_name}.{meta_column_name} @@ '$.\"{aname}\"{subscript} {cmp_op} {value}'"
                     
-            if negate:  term = f"not ({term})"
+            if negate:  
+                term = f"not ({term})"
+            else:
+                indexed_term = self.indexed_term(exp, table_name, meta_column_name)
+                if indexed_term:
+                    # keep the jsonpath term too, it checks the value type exactly
+                    term = f"{indexed_term} and {term}"
             parts.append(term)
 
         if contains_items:
@@ -8,6 +8,12 @@ from .common import (
 )
 
 from .param_category import DBParamCategory
+from .meta_index import DBIndexedMetaKey
+from .cursors import stream_rows, stream_batches, set_fetch_batch_size, set_stream_connector
+from .prefetch import BranchPrefetcher, set_prefetch_threads
+from .resolver import resolve_files, resolved_only, unresolved_only
+from .changes import log_file_changes, log_dataset_changes, log_namespace_changes, change_horizon, changed_since, prune_changes
+from .query_jobs import DBQueryJob
 
 import os.path as os_path
 
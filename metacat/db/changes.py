@@ -0,0 +1,73 @@
+#
+# Catalog change log
+#
+# Write operations append rows to catalog_changes, naming the namespaces and datasets they modified.
+# The log is append-only, so concurrent writers do not contend on it. Old rows are removed by the daemon.
+#
+# Readers, e.g. the query result cache, remember the change horizon at the time they read the data and
+# later check whether anything relevant to them has changed since then. The horizon is the xmin of
+# the reader's snapshot: any transaction not visible to the reader has txid >= xmin. Transaction ids
+# are used instead of the row ids because row ids are allocated before the writer commits, and a row
+# with a lower id can become visible after a row with a higher one.
+#
+
+def log_dataset_changes(transaction, datasets):
+    # datasets: iterable of (namespace, name)
+    datasets = list(set(datasets))
+    if datasets:
+        transaction.executemany("""
+            insert into catalog_changes(dataset_namespace, dataset_name) values(%s, %s)
+        """, datasets)
+
+def log_namespace_changes(transaction, namespaces):
+    namespaces = [(ns,) for ns in set(namespaces)]
+    if namespaces:
+        transaction.executemany("""
+            insert into catalog_changes(namespace) values(%s)
+        """, namespaces)
+
+def log_file_changes(transaction, file_ids):
+    # logs changes of all datasets containing the files and the namespaces of the files
+    file_ids = list(file_ids)
+    if file_ids:
+        transaction.execute("""
+            insert into catalog_changes(dataset_namespace, dataset_name)
+                select distinct dataset_namespace, dataset_name
+                    from files_datasets
+                    where file_id = any(%s);
+            insert into catalog_changes(namespace)
+                select distinct namespace
+                    from files
+                    where id = any(%s)
+        """, (file_ids, file_ids))
+
+def change_horizon(db):
+    c = db.cursor()
+    c.execute("select txid_snapshot_xmin(txid_current_snapshot())")
+    return c.fetchone()[0]
+
+def changed_since(db, horizon, datasets=None):
+    # datasets: list of (namespace, name) or None - any change
+    c = db.cursor()
+    if datasets is None:
+        c.execute("select exists(select 1 from catalog_changes where txid >= %s)", (horizon,))
+    else:
+        c.execute("""
+            select exists(
+                select 1 from catalog_changes
+                    where txid >= %s
+                        and (dataset_namespace, dataset_name) in (select * from unnest(%s::text[], %s::text[]))
+            )
+        """, (horizon, [ns for ns, n in datasets], [n for ns, n in datasets]))
+    return c.fetchone()[0]
+
+def prune_changes(db, retention):
+    # removes changes older than retention seconds
+    c = db.cursor()
+    c.execute("""
+        delete from catalog_changes
+            where created_timestamp < now() - make_interval(secs => %s)
+    """, (retention,))
+    n = c.rowcount
+    c.execute("commit")
+    return n
@@ -0,0 +1,80 @@
+import itertools
+from psycopg2.extensions import TRANSACTION_STATUS_IDLE, TRANSACTION_STATUS_INERROR
+
+#
+# Streaming of large query results using named server-side cursors
+#
+# Rows are fetched from the server in batches of FetchBatchSize rows, so the memory
+# used by the client is bounded by the batch size instead of the size of the result.
+#
+# Server-side cursors exist only inside a transaction. If the connection is
+# already in a transaction, the cursor is declared in it and closed at the end. The stream
+# never ends the caller's transaction, and the caller must not end it while the stream is being read:
+# that closes the cursor, and the stream fails with RuntimeError.
+#
+# Otherwise the stream needs its own transaction. If a connector is set with set_stream_connector(),
+# the stream takes a dedicated connection for it, so that nothing else can end the transaction
+# or add unrelated work to it. Without the connector, the transaction is open on the given connection
+# for the life time of the stream, and the connection must not be used for anything else until the stream ends.
+#
+
+FetchBatchSize = 5000
+StreamConnector = None
+
+_CursorNames = itertools.count(1)
+
+def set_fetch_batch_size(n):
+    global FetchBatchSize
+    assert n > 0, "Fetch batch size must be positive"
+    FetchBatchSize = n
+
+def set_stream_connector(connect):
+    # connect: callable returning a new connection, e.g. from the connection pool, or None
+    global StreamConnector
+    StreamConnector = connect
+
+def _cursor_open(c, name):
+    # the cursor exists only in the transaction it was declared in
+    c.execute("select exists(select 1 from pg_cursors where name = %s)", (name,))
+    return c.fetchone()[0]
+
+def stream_batches(db, sql, args=None, batch_size=None, dedicated=False):
+    # dedicated: the connection is not used by anything else while the stream is open
+    batch_size = batch_size or FetchBatchSize
+    name = "metacat_cursor_%d" % (next(_CursorNames),)
+    own_transaction = db.get_transaction_status() == TRANSACTION_STATUS_IDLE
+    shared = not dedicated
+    if own_transaction and shared and StreamConnector is not None:
+        db = StreamConnector()
+        shared = False
+    c = db.cursor()
+    if own_transaction and db.autocommit:
+        c.execute("begin")
+    done = False
+    try:
+        c.execute(f"declare {name} no scroll cursor for {sql}", args)
+        while True:
+            c.execute(f"fetch forward {batch_size} from {name}")
+            batch = c.fetchall()
+            if batch:
+                yield batch
+            if len(batch) < batch_size:
+                break
+            if shared and not _cursor_open(c, name):
+                raise RuntimeError("The transaction of the streaming cursor was ended while the results were being read")
+        done = True
+    finally:
+        # end only the transaction the stream owns, and only if it is still the same transaction
+        status = db.get_transaction_status()
+        if status == TRANSACTION_STATUS_INERROR:
+            if own_transaction:
+                c.execute("rollback")
+        elif status != TRANSACTION_STATUS_IDLE and (not shared or _cursor_open(c, name)):
+            if own_transaction:
+                c.execute("commit" if done else "rollback")
+            else:
+                c.execute(f"close {name}")
+
+def stream_rows(db, sql, args=None, batch_size=None, dedicated=False):
+    for batch in stream_batches(db, sql, args, batch_size, dedicated):
+        yield from batch
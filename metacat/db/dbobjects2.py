@@ -1,4 +1,4 @@
-import uuid, json, hashlib, re, time, io, traceback, base64
+import uuid, json, hashlib, re, time, io, traceback, base64, heapq
 from metacat.util import (to_bytes, to_str, epoch, chunked, limited, strided, 
     skipped, first_not_empty, validate_metadata, insert_sql, fetch_generator
 )
@@ -19,6 +19,10 @@ from .common import (
     AlreadyExistsError, DatasetCircularDependencyDetected, NotFoundError, MetaValidationError,
     parse_name, alias
 )
+from .cursors import stream_rows
+from .resolver import resolve_files, resolved_only, ResolveChunkSize
+from .meta_index import DBIndexedMetaKey
+from .changes import log_file_changes, log_dataset_changes, log_namespace_changes
 
 class DBFileSet(DBObject):
     
@@ -29,9 +33,7 @@ class DBFileSet(DBObject):
             self.SQL = sql
             
         def __iter__(self):
-            c = self.DB.cursor()
-            c.execute(self.SQL)
-            return fetch_generator(c)
+            return stream_rows(self.DB, self.SQL)
 
     def __init__(self, db, files=None, sql=None, count=None):
         DBObject.__init__(self, db)
@@ -48,13 +50,13 @@ class DBFileSet(DBObject):
         return self.Count
 
     def limit(self, n):
-        return DBFileSet(self.DB, limited(self.Files, n), 
+        return DBFileSet(self.DB, limited(self, n), 
             count = None if self.Count is None else min(n, self.Count)
         )
         
     def skip(self, n):
         if n == 0:  return self
-        return DBFileSet(self.DB, skipped(self.Files, n),
+        return DBFileSet(self.DB, skipped(self, n),
             count = None if self.Count is None else max(0, self.Count - n)
         )
         
@@ -62,14 +64,117 @@ class DBFileSet(DBObject):
         count = None
         if self.Count is not None:
             count = (self.Count + i + n-1)//n
-        return DBFileSet(self.DB, strided(self.Files, n, i), count = count)
+        return DBFileSet(self.DB, strided(self, n, i), count = count)
         
     def chunked(self, chunk_size=1000):
-        return chunked(self.Files, chunk_size)
+        return chunked(self, chunk_size)
 
     def ordered(self):
-        files = sorted(self, lambda f: f.ID)
-        yield from files
+        if self.SQL is not None:
+            t = alias("t")
+            return DBFileSet(self.DB, sql=insert_sql(f"""\
+                -- ordered {t}
+                    select {t}.*
+                        from (
+                            $sql
+                        ) {t}
+                        order by {t}.id
+                -- end of ordered {t}
+            """, sql=self.SQL), count=self.Count)
+        return DBFileSet(self.DB, sorted(self, key=lambda f: f.FID))
+
+    def keyset_page(self, after=None, page_size=None):
+        #
+        # Keyset pagination: files ordered by id, starting after the given file id, at most page_size files.
+        # Unlike skip/limit, the cost of getting a page does not depend on how far it is from the beginning
+        # of the result, and the scan can be resumed from the last file id received.
+        #
+        if self.SQL is not None:
+            t = alias("t")
+            where = "" if after is None else "where %s.id > '%s'" % (t, after.replace("'", "''"))
+            limit = "" if page_size is None else f"limit {page_size}"
+            return DBFileSet(self.DB, sql=insert_sql(f"""\
+                -- keyset page {t}
+                    select {t}.*
+                        from (
+                            $sql
+                        ) {t}
+                        {where}
+                        order by {t}.id
+                        {limit}
+                -- end of keyset page {t}
+            """, sql=self.SQL))
+        files = (f for f in self if after is None or f.FID > after)
+        if page_size is None:
+            files = sorted(files, key=lambda f: f.FID)
+        else:
+            files = heapq.nsmallest(page_size, files, key=lambda f: f.FID)
+        return DBFileSet(self.DB, files)
+
+    def json_rows(self, with_metadata=False, with_provenance=False):
+        #
+        # Returns generator of JSON representations of the files, as produced by DBFile.to_jsonable(), built by
+        # the database without creating DBFile objects, or None if the file set is not SQL based.
+        # Provenance is not built here: with_provenance=True returns None too, so that the caller uses
+        # with_provenance(), which fetches parents and children with 2 queries per chunk of files
+        #
+        if self.SQL is None or with_provenance:
+            return None
+        t = alias("t")
+        parts = [f"""
+            jsonb_build_object(
+                'fid', {t}.id, 'namespace', {t}.namespace, 'name', {t}.name,
+                'retired', {t}.retired, 'retired_by', {t}.retired_by, 'updated_by', {t}.updated_by,
+                'created_timestamp', extract(epoch from {t}.created_timestamp),
+                'retired_timestamp', extract(epoch from {t}.retired_timestamp),
+                'updated_timestamp', extract(epoch from {t}.updated_timestamp)
+            )""", f"""
+            jsonb_strip_nulls(jsonb_build_object('checksums', {t}.checksums, 'size', {t}.size, 'creator', {t}.creator))"""
+        ]
+        if with_metadata:
+            parts.append(f"""
+            jsonb_build_object('metadata', coalesce({t}.metadata, '{{}}'::jsonb))""")
+        json_exp = " || ".join(parts)
+        sql = insert_sql(f"""\
+            -- json rows {t}
+                select ({json_exp}
+                    )::text
+                    from (
+                        $sql
+                    ) {t}
+            -- end of json rows {t}
+        """, sql=self.SQL)
+        return (text for (text,) in stream_rows(self.DB, sql))
+
+    def with_provenance(self, chunk_size=1000):
+        # attaches parents and children to the files, fetched with 2 queries per chunk of files
+        return DBFileSet(self.DB, self._provenance_loader(chunk_size), count=self.Count)
+
+    def _provenance_loader(self, chunk_size):
+        c = self.DB.cursor()
+        for chunk in self.chunked(chunk_size):
+            by_id = {f.FID: f for f in chunk}
+            file_ids = list(by_id.keys())
+            parents = {fid: [] for fid in file_ids}
+            children = {fid: [] for fid in file_ids}
+            c.execute("""
+                select child_id, array_agg(parent_id) from parent_child
+                    where child_id = any(%s)
+                    group by child_id
+            """, (file_ids,))
+            for fid, ids in c.fetchall():
+                parents[fid] = ids
+            c.execute("""
+                select parent_id, array_agg(child_id) from parent_child
+                    where parent_id = any(%s)
+                    group by parent_id
+            """, (file_ids,))
+            for fid, ids in c.fetchall():
+                children[fid] = ids
+            for f in chunk:
+                f.Parents = parents[f.FID]
+                f.Children = children[f.FID]
+            yield from chunk
 
     @staticmethod
     def from_tuples(db, g, count=None):
@@ -85,56 +190,38 @@ class DBFileSet(DBObject):
         
     @staticmethod
     def from_id_list(db, lst):
-        c = db.cursor()
         columns = DBFile.all_columns()
-        c.execute(f"""
+        rows = stream_rows(db, f"""
             select {columns}
                 from   files
                 where id = any(%s)""", (list(lst),))
-        return DBFileSet.from_tuples(db, fetch_generator(c), count=c.rowcount)
+        return DBFileSet.from_tuples(db, rows)
     
     @staticmethod
     def from_name_list(db, names, default_namespace=None):
-        full_names = [parse_name(x, default_namespace) for x in names]
-        just_names = [name for ns, name in full_names]
-        joined = set("%s:%s" % t for t in full_names)
-        c = db.cursor()
-        columns = DBFile.all_columns()
-        c.execute(f"""
-            select {columns}, null as parents, null as children from files
-                where name = any(%s)""", (just_names,))
-        selected = ((fid, namespace, name, metadata) 
-                    for (fid, namespace, name, metadata) in fetch_generator(c)
-                    if "%s:%s" % (namespace, name) in joined)
-        return DBFileSet.from_tuples(db, selected, count=c.rowcount)
+        # names: list of "namespace:name" or "name" strings
+        columns = DBFile.all_columns("f")
+        rows = resolved_only(resolve_files(db, names, columns=columns, default_namespace=default_namespace))
+        return DBFileSet.from_tuples(db, rows)
         
     @staticmethod
     def from_namespace_name_specs(db, specs, default_namespace=None):
         # specs: list of dicts {"name":..., "namespace":...} - namespace is optional
+        specs = [{"namespace": s.get("namespace") or default_namespace, "name": s["name"]} for s in specs]
         assert all(s["namespace"] for s in specs), "Incomplete file specification:"
-        specs = [(s.get("namespace", default_namespace), s["name"]) for s in specs]
-        just_names = set(name for ns, name in specs)
-        dids = set("%s:%s" % t for t in specs)
-        c = db.cursor()
-        columns = DBFile.all_columns()
-        c.execute(f"""
-            select {columns} from files
-                where name = any(%s)""", (list(just_names),))
-        files = DBFileSet.from_tuples(db, fetch_generator(c))
-        return DBFileSet(db, (f for f in files if "%s:%s" % (f.Namespace, f.Name) in dids))
+        columns = DBFile.all_columns("f")
+        rows = resolved_only(resolve_files(db, specs, columns=columns))
+        return DBFileSet.from_tuples(db, rows)
         
     def __iter__(self):
         if self.Files is not None:
             return (f for f in self.Files)
         else:
-            c = self.DB.cursor()
-            c.execute(self.SQL)
-            debug("DBFileSet.from_sql: return from execute()")
-            return (f for f in DBFileSet.from_tuples(self.DB, fetch_generator(c), count=c.rowcount))
+            return (f for f in DBFileSet.from_tuples(self.DB, stream_rows(self.DB, self.SQL)))
 
     def as_list(self):
         # list(DBFileSet) should work too
-        return list(self.Files)
+        return list(self)
             
     def parents(self, with_metadata = False, with_provenance = False):
         return self._relationship("parents", with_metadata, with_provenance)
@@ -143,40 +230,191 @@ class DBFileSet(DBObject):
         return self._relationship("children", with_metadata, with_provenance)
             
     def _relationship(self, rel, with_metadata, with_provenance):
-        table = "files" if not with_provenance else "files_with_provenance"
+        if self.SQL is not None:
+            # keep the whole thing in the database
+            sql = DBFileSet.sql_for_relationship(rel, self.SQL, with_meta=with_metadata)
+            out = DBFileSet(self.DB, sql=sql)
+        else:
+            file_ids = list(f.FID for f in self)
+            sql = DBFileSet.sql_for_relationship(rel, "select unnest(%s::text[]) as id", with_meta=with_metadata)
+            out = DBFileSet.from_tuples(self.DB, stream_rows(self.DB, sql, (file_ids,)))
+        if with_provenance:
+            out = out.with_provenance()
+        return out
+
+    @staticmethod
+    def sql_for_relationship(rel, arg_sql, with_meta=False, ordered=False):
+        # parents or children of the files returned by arg_sql
+        # semi-join, so that a file related to several files in arg_sql is returned once
+        assert rel in ("parents", "children")
+        if rel == "parents":
+            this_column, other_column = "child_id", "parent_id"
+        else:
+            this_column, other_column = "parent_id", "child_id"
         f = alias("f")
+        a = alias("a")
         pc = alias("pc")
+        meta = f"{f}.metadata" if with_meta else "null as metadata"
         attrs = DBFile.attr_columns(f)
-        if rel == "children":
-            join = f"{f}.id = {pc}.child_id and {pc}.parent_id = any (%s)"
+        order = f"order by {f}.id" if ordered else ""
+        return insert_sql(f"""\
+            -- {rel} of {f}
+                select {f}.id, {f}.namespace, {f}.name, {meta}, {attrs}, null as parents, null as children
+                    from files {f}
+                    where {f}.id in (
+                        select {pc}.{other_column}
+                            from parent_child {pc}, (
+                                $arg_sql
+                            ) {a}
+                            where {pc}.{this_column} = {a}.id
+                    )
+                    {order}
+            -- end of {rel} of {f}
+        """, arg_sql=arg_sql)
+
+    def ancestors(self, depth=None, with_metadata = False, with_provenance = False):
+        return self._provenance_closure("ancestors", depth, with_metadata, with_provenance)
+
+    def descendants(self, depth=None, with_metadata = False, with_provenance = False):
+        return self._provenance_closure("descendants", depth, with_metadata, with_provenance)
+
+    def _provenance_closure(self, direction, depth, with_metadata, with_provenance):
+        file_ids = list(f.FID for f in self)
+        sql = DBFileSet.sql_for_provenance_closure(direction, "select unnest(%s::text[]) as id", 
+            depth=depth, with_meta=with_metadata)
+        out = DBFileSet.from_tuples(self.DB, stream_rows(self.DB, sql, (file_ids,)))
+        if with_provenance:
+            out = out.with_provenance()
+        return out
+
+    @staticmethod
+    def sql_for_provenance_closure(direction, seed_sql, depth=None, with_meta=False, ordered=False):
+        # all ancestors or descendants of the files returned by seed_sql, up to depth generations
+        # union (not union all) drops rows already found, so the recursion terminates even if the graph has cycles.
+        # with depth limit, rows are (id, depth) and the recursion stops at the depth
+        assert direction in ("ancestors", "descendants")
+        if direction == "ancestors":
+            this_column, next_column = "child_id", "parent_id"
         else:
-            join = f"{f}.id = {pc}.parent_id and {pc}.child_id = any (%s)"
-            
-        meta = "null as metadata" if not with_metadata else f"{f}.metadata"
-        provenance = "null as parents, null as children" if not with_provenance else \
-            f"{f}.parents, {f}.children"
-            
-        c = self.DB.cursor()
-        file_ids = list(f.FID for f in self.Files)
+            this_column, next_column = "parent_id", "child_id"
+        f = alias("f")
+        r = alias("r")
+        s = alias("s")
+        pc = alias("pc")
+        meta = f"{f}.metadata" if with_meta else "null as metadata"
+        attrs = DBFile.attr_columns(f)
+        order = f"order by {f}.id" if ordered else ""
+        if depth is None:
+            columns = "id"
+            first_depth = next_depth = depth_condition = ""
+        else:
+            columns = "id, depth"
+            first_depth = ", 1"
+            next_depth = f", {r}.depth + 1"
+            depth_condition = f"and {r}.depth < {depth}"
+        return insert_sql(f"""\
+            -- {direction} {f}
+                select {f}.id, {f}.namespace, {f}.name, {meta}, {attrs}, null as parents, null as children
+                    from files {f}
+                    where {f}.id in (
+                        with recursive {r}({columns}) as (
+                            select {pc}.{next_column}{first_depth}
+                                from parent_child {pc}, (
+                                    $seed_sql
+                                ) {s}
+                                where {pc}.{this_column} = {s}.id
+                            union
+                            select {pc}.{next_column}{next_depth}
+                                from parent_child {pc}, {r}
+                                where {pc}.{this_column} = {r}.id {depth_condition}
+                        )
+                        select {r}.id from {r}
+                    )
+                    {order}
+            -- end of {direction} {f}
+        """, seed_sql=seed_sql)
+
+    @staticmethod
+    def sql_for_join(sqls):
+        # semi-joins on file id, the file set produced by the first query is filtered by the others
+        if len(sqls) == 1:
+            return sqls[0]
+        t = alias("t")
+        inner_sqls = {f"__{i}": sql for i, sql in enumerate(sqls)}
+        conditions = []
+        for i in range(1, len(sqls)):
+            j = alias("j")
+            conditions.append(
+                  f"    {t}.id in (\n"
+                + f"        select {j}.id from (\n"
+                + f"            $__{i}\n"
+                + f"        ) {j}\n"
+                + f"    )"
+            )
+        conditions = "\nand\n".join(conditions)
+        return insert_sql(f"""\
+            -- join {t}
+            select {t}.*
+                from (
+                    $__0
+                ) {t}
+                where
+            $conditions
+            -- end of join {t}
+        """, conditions=conditions, **inner_sqls)
 
-        sql = f"""select distinct {f}.id, {f}.namespace, {f}.name, {meta}, {attrs}, {provenance}
-                    from {table} {f}, parent_child {pc}
-                    where {join}
-                    """
-        c.execute(sql, (file_ids,))
-        return DBFileSet.from_tuples(self.DB, fetch_generator(c), count=c.rowcount)
+    @staticmethod
+    def sql_for_union(sqls):
+        if len(sqls) == 1:
+            return sqls[0]
+        inner_sqls = {f"__{i}": sql for i, sql in enumerate(sqls)}
+        parts = [f"(\n    $__{i}\n)" for i in range(len(sqls))]
+        template = "\nunion\n".join(parts)
+        return insert_sql(template, **inner_sqls)
+
+    @staticmethod
+    def sql_for_minus(left_sql, right_sql):
+        # anti-join on file id
+        t = alias("t")
+        r = alias("r")
+        return insert_sql(f"""\
+            -- minus {t}
+                select {t}.*
+                    from (
+                        $left_sql
+                    ) {t}
+                    where not exists (
+                        select 1 from (
+                            $right_sql
+                        ) {r}
+                        where {r}.id = {t}.id
+                    )
+            -- end of minus {t}
+        """, left_sql=left_sql, right_sql=right_sql)
 
     @staticmethod
     def join(db, file_sets):
+        file_sets = list(file_sets)
         first = file_sets[0]
         if len(file_sets) == 1:
             return first
-        file_list = list(first)
-        file_ids = set(f.FID for f in file_list)
-        for another in file_sets[1:]:
-            another_ids = set(f.FID for f in another)
-            file_ids &= another_ids
-        return DBFileSet(db, (f for f in file_list if f.FID in file_ids), count=len(file_ids))
+        if all(s.SQL is not None for s in file_sets):
+            return DBFileSet(db, sql=DBFileSet.sql_for_join([s.SQL for s in file_sets]))
+
+        # stream one of the SQL based sets, if any, and collect file ids from the others
+        streamed = first
+        for s in file_sets:
+            if s.SQL is not None:
+                streamed = s
+                break
+        file_ids = None
+        for another in file_sets:
+            if another is not streamed:
+                another_ids = set(f.FID for f in another)
+                file_ids = another_ids if file_ids is None else file_ids & another_ids
+                if not file_ids:
+                    return DBFileSet(db)
+        return DBFileSet(db, (f for f in streamed if f.FID in file_ids))
 
     @staticmethod
     def union(db, file_sets):
@@ -188,11 +426,16 @@ class DBFileSet(DBObject):
                     if not f.FID in file_ids:
                         file_ids.add(f.FID)
                         yield f
+        file_sets = list(file_sets)
+        if file_sets and all(s.SQL is not None for s in file_sets):
+            return DBFileSet(db, sql=DBFileSet.sql_for_union([s.SQL for s in file_sets]))
         gen = union_generator(file_sets)
         #print("DBFileSet.union: returning:", gen)
         return DBFileSet(db, gen)
 
     def subtract(self, right):
+        if self.SQL is not None and right.SQL is not None:
+            return DBFileSet(self.DB, sql=DBFileSet.sql_for_minus(self.SQL, right.SQL))
         right_ids = set(f.FID for f in right)
         #print("DBFileSet: right_ids:", right_ids)
         return DBFileSet(self.DB, (f for f in self if not f.FID in right_ids))
@@ -249,14 +492,14 @@ class DBFileSet(DBObject):
         
         debug("sql_for_basic_query: offset:", offset)
 
+        # provenance is loaded separately, see DBFileSet.with_provenance()
         meta = f"{f}.metadata" if basic_file_query.WithMeta else "null as metadata"
-        parents = f"{f}.parents" if basic_file_query.WithProvenance else "null as parents"
-        children = f"{f}.children" if basic_file_query.WithProvenance else "null as children"
-        table = "files_with_provenance" if basic_file_query.WithProvenance else "files"
+        parents = "null as parents"
+        children = "null as children"
+        table = "files"
 
-        debug("sql_for_basic_query: table:", table)
-
-        file_meta_exp = FileMetaExpressionDNF(basic_file_query.Wheres).sql(f) or "true"
+        indexed_keys = DBIndexedMetaKey.registry(db)
+        file_meta_exp = FileMetaExpressionDNF(basic_file_query.Wheres, indexed_keys=indexed_keys).sql(f) or "true"
         retired_condition = "true" if include_retired else f"not {f}.retired"
 
         attrs = DBFile.attr_columns(f)
@@ -312,15 +555,9 @@ class DBFileSet(DBObject):
         
         attrs = DBFile.attr_columns(f)
 
-        if with_provenance:
-            table = "files_with_provenance"
-            prov_columns = f"{f}.parents, {f}.children"
-        else:
-            table = "files"
-            prov_columns = f"null as parents, null as children"
-
+        # provenance is loaded separately, see DBFileSet.with_provenance()
         sql = dedent(f"""\
-                select {f}.id, {f}.namespace, {f}.name, {meta}, {attrs}, {prov_columns} from {table} {f}
+                select {f}.id, {f}.namespace, {f}.name, {meta}, {attrs}, null as parents, null as children from files {f}
         """)
 
         if spec_type == "fid":
@@ -375,9 +612,7 @@ class DBFileSet(DBObject):
                     order by key
                 -- end of summary:keys
             """, fileset_sql=self.SQL)
-            c = self.DB.cursor()
-            c.execute(sql)
-            for tup in fetch_generator(c):
+            for tup in stream_rows(self.DB, sql):
                 yield tup[0]
         else:
             seen = set()
@@ -398,9 +633,7 @@ class DBFileSet(DBObject):
                     order by key
                 -- end of summary:key/values
             """, fileset_sql=self.SQL)
-            c = self.DB.cursor()
-            c.execute(sql)
-            yield from fetch_generator(c)
+            yield from stream_rows(self.DB, sql)
         else:
             seen = {}
             for f in self:
@@ -419,6 +652,39 @@ class DBFileSet(DBObject):
         elif mode == "count":
             return self.count()
 
+class _FileCounts(object):
+    
+    #
+    # Incremental dataset and namespace file counters, see dataset_file_count_deltas in schema.sql
+    #
+    
+    @staticmethod
+    def dataset_delta(transaction, namespace, name, delta):
+        if delta:
+            transaction.execute("""
+                insert into dataset_file_count_deltas(dataset_namespace, dataset_name, delta) values(%s, %s, %s)
+            """, (namespace, name, delta))
+
+    @staticmethod
+    def file_datasets_delta(transaction, file_ids, delta):
+        # add delta to the counts of all datasets containing the files
+        transaction.execute("""
+            insert into dataset_file_count_deltas(dataset_namespace, dataset_name, delta)
+                select dataset_namespace, dataset_name, count(*) * %s
+                    from files_datasets
+                    where file_id = any(%s)
+                    group by dataset_namespace, dataset_name
+        """, (delta, list(file_ids)))
+
+    @staticmethod
+    def namespace_deltas(transaction, deltas):
+        # deltas: {namespace: delta}
+        deltas = [(ns, delta) for ns, delta in deltas.items() if delta]
+        if deltas:
+            transaction.executemany("""
+                insert into namespace_file_count_deltas(namespace, delta) values(%s, %s)
+            """, deltas)
+
 class DBFile(DBObject):
     
     Table = "files"
@@ -447,6 +713,12 @@ class DBFile(DBObject):
         self.Retired = retired
         self.RetiredTimestamp = retired_timestamp
         self.RetiredBy = retired_by
+
+    def __getstate__(self):
+        # the connection can not be pickled, e.g. when the file is sent to a filter running in another process
+        state = self.__dict__.copy()
+        state["DB"] = None
+        return state
     
     @staticmethod
     def generate_id():
@@ -492,12 +764,21 @@ class DBFile(DBObject):
     @transactioned
     def delete(self, transaction=None):
         # delete the file from the DB
+        transaction.execute("select namespace, retired from files where id = %s", (self.FID,))
+        tup = transaction.fetchone()
+        if tup is None:
+            return
+        namespace, retired = tup
+        if not retired:
+            _FileCounts.file_datasets_delta(transaction, [self.FID], -1)
+        log_file_changes(transaction, [self.FID])
         transaction.execute("""
                 delete from parent_child where parent_id = %s;
                 delete from parent_child where child_id = %s;
                 delete from files_datasets where file_id = %s;
                 delete from files where id = %s;
             """, (self.FID, self.FID, self.FID, self.FID))
+        _FileCounts.namespace_deltas(transaction, {namespace: -1})
 
     @transactioned
     def create(self, creator=None, transaction=None):
@@ -509,7 +790,9 @@ class DBFile(DBObject):
                 returning created_timestamp
             """,
             (self.FID, self.Namespace, self.Name, meta, self.Size, checksums, creator))
-        self.CreatedTimestamp = c.fetchone()[0]
+        self.CreatedTimestamp = transaction.fetchone()[0]
+        _FileCounts.namespace_deltas(transaction, {self.Namespace: 1})
+        log_namespace_changes(transaction, [self.Namespace])
         if self.Parents:
             insert_many(self.DB,
                 "parent_child", 
@@ -530,8 +813,10 @@ class DBFile(DBObject):
         files = list(files)
         files_csv = []
         parents_csv = []
+        namespace_counts = {}
         null = r"\N"
         for f in files:
+            namespace_counts[f.Namespace] = namespace_counts.get(f.Namespace, 0) + 1
             f.FID = f.FID or DBFile.generate_id()
             files_csv.append("%s\t%s\t%s\t%s\t%s\t%s\t%s" % (
                 f.FID,
@@ -553,6 +838,8 @@ class DBFile(DBObject):
                 columns = ["id", "namespace", "name", "metadata", "size", "checksums","creator"])
         transaction.copy_from(io.StringIO("\n".join(parents_csv)), "parent_child", 
                 columns=["child_id", "parent_id"])
+        _FileCounts.namespace_deltas(transaction, namespace_counts)
+        log_namespace_changes(transaction, namespace_counts.keys())
             
         return DBFileSet(db, files)
 
@@ -571,6 +858,7 @@ class DBFile(DBObject):
                 """, (self.Namespace, self.Name, meta, self.Size, checksums, user,
                         self.FID)
             )
+        log_file_changes(transaction, [self.FID])
         return self
         
     @transactioned
@@ -583,7 +871,7 @@ class DBFile(DBObject):
                 self.RetiredBy = user
                 transaction.execute("""
                     update files set retired=true, retired_by=%s, retired_timestamp = %s
-                        where id = %s
+                        where id = %s and not retired
                     """, (self.RetiredBy, self.RetiredTimestamp, self.FID)
                 )
             else:
@@ -591,9 +879,12 @@ class DBFile(DBObject):
                 self.UpdatedBy = user
                 transaction.execute("""
                     update files set retired=false, updated_by=%s, updated_timestamp = %s
-                        where id = %s
+                        where id = %s and retired
                     """, (self.UpdatedBy, self.UpdatedTimestamp, self.FID)
                 )
+            if transaction.rowcount:
+                _FileCounts.file_datasets_delta(transaction, [self.FID], -1 if retire else 1)
+                log_file_changes(transaction, [self.FID])
             self.Retired = retire
         return self
 
@@ -652,56 +943,17 @@ class DBFile(DBObject):
                 where id=%s
             """,
             tuples)
+        log_file_changes(transaction, [f.FID for f in files])
         for f in files: f.DB = db
     
     @staticmethod
-    @transactioned
     def get_files(db, files, transaction=None):
-        
-        #
-        # NOT really THREAD SAFE !!
-        #
-
-        # files: list of dicts:
+        # files: iterable of DBFile objects or dicts:
         #  { "fid": ... } or {"namespace":..., "name":...} or {"did":"namespace:name"}
-        
-        #print("DBFile.get_files: files:", files)
-        suffix = int(time.time()*1000)
-        temp_table = f"temp_files_{suffix}"
-        strio = io.StringIO()
-        for f in files:
-            if isinstance(f, DBFile):
-                ns = f.Namespace
-                n = f.Name
-                fid = f.FID
-            else:
-                try:    spec = ObjectSpec(f)
-                except ValueError:
-                    raise ValueError("Invalid file specificication: " + str(f))
-                ns = spec.Namespace
-                n = spec.Name
-                fid = spec.FID
-            strio.write("%s\t%s\t%s\n" % (fid or r'\N', ns or r'\N', n or r'\N'))
-        transaction.execute(f"""create temp table if not exists
-            {temp_table} (
-                id text,
-                namespace text,
-                name text);
-            truncate table {temp_table};
-                """)
-        csv = strio.getvalue()
-        transaction.copy_from(io.StringIO(csv), temp_table)
-        #print("DBFile.get_files: strio:", strio.getvalue())
-        
+        # not found files are skipped
         columns = DBFile.all_columns("f")
-        
-        sql = f"""
-            select {columns}
-                 from files f, {temp_table} t
-                 where t.id = f.id or f.namespace = t.namespace and f.name = t.name
-        """
-        
-        return DBFileSet(db, sql=sql)
+        rows = resolved_only(resolve_files(db, files, columns=columns, transaction=transaction))
+        return DBFileSet.from_tuples(db, rows)
         
     @staticmethod
     @transactioned
@@ -711,29 +963,41 @@ class DBFile(DBObject):
         authorized_namespaces is a set of ns names the user owns (directly or through a role)
         """
 
-        suffix = int(time.time()*1000) % 10000
-        temp_table = f"temp_fids_{suffix}"
-        transaction.execute(f"create temp table {temp_table} ( id text );")
-        
         errors = []
-        for chunk in chunked(files, 1000):
+        moved_counts = {}
+        for chunk in chunked(files, ResolveChunkSize):
             authorized = []
             for f in chunk:
                 if authorized_namespaces is None or f.Namespace in authorized_namespaces:
-                    authorized.append((f.FID,))
+                    authorized.append(f.FID)
                 else:
                     errors.append("not authorized to move file: " + f.did())
-            if authorized:
-                insert_many(db, temp_table, authorized, column_names=["id"], transaction=transaction)
-
-        transaction.execute(f"""
-            update files set namespace = %(ns)s
-                from {temp_table} tt
-                where files.id = tt.id
-                    and files.namespace != %(ns)s
-            """, {"ns": to_namespace}
-        )
-        return transaction.rowcount, errors
+            if not authorized:
+                continue
+            transaction.execute(f"""
+                with moved as (
+                    select f.id, f.namespace
+                        from files f
+                        where f.id = any(%(ids)s)
+                            and f.namespace != %(ns)s
+                        for update of f
+                ),
+                updated as (
+                    update files set namespace = %(ns)s
+                        from moved
+                        where files.id = moved.id
+                        returning moved.namespace
+                )
+                select namespace, count(*) from updated group by namespace
+                """, {"ns": to_namespace, "ids": authorized}
+            )
+            for ns, n in transaction.fetchall():
+                moved_counts[ns] = moved_counts.get(ns, 0) - n
+            log_file_changes(transaction, authorized)
+        nmoved = -sum(moved_counts.values())
+        moved_counts[to_namespace] = nmoved
+        _FileCounts.namespace_deltas(transaction, moved_counts)
+        return nmoved, errors
         
     @staticmethod
     @transactioned
@@ -876,6 +1140,7 @@ class DBFile(DBObject):
                 on conflict(parent_id, child_id) do nothing;
             """, (self.FID, child_fid)
         )
+        log_file_changes(transaction, [self.FID, child_fid])
         
     @transactioned
     def add_parents(self, parents, transaction=None):
@@ -886,6 +1151,7 @@ class DBFile(DBObject):
                 on conflict(parent_id, child_id) do nothing;
             """, [(fid, self.FID) for fid in parent_fids]
         )
+        log_file_changes(transaction, [self.FID])
         
     @transactioned
     def set_parents(self, fids_or_files, transaction=None):
@@ -896,6 +1162,7 @@ class DBFile(DBObject):
                 values(%s, %s)        
             """, [(fid, self.FID) for fid in parent_fids]
         )
+        log_file_changes(transaction, [self.FID])
         
     @transactioned
     def add_children(self, children, transaction=None):
@@ -906,6 +1173,7 @@ class DBFile(DBObject):
                 on conflict(parent_id, child_id) do nothing;
             """, [(self.FID, fid) for fid in child_fids]
         )
+        log_file_changes(transaction, [self.FID])
         
     @transactioned
     def set_children(self, fids_or_files, transaction=None):
@@ -917,6 +1185,7 @@ class DBFile(DBObject):
                 values(%s, %s)        
             """, [(self.FID, fid) for fid in child_fids]
         )
+        log_file_changes(transaction, [self.FID])
         
     @transactioned
     def remove_child(self, child, transaction=None):
@@ -926,6 +1195,7 @@ class DBFile(DBObject):
                 parent_id = %s and child_id = %s;
             """, (self.FID, child_fid)
         )
+        log_file_changes(transaction, [self.FID, child_fid])
 
     @transactioned
     def add_parent(self, parent, transaction=None):
@@ -1020,6 +1290,7 @@ class DBDataset(DBObject):
             )
         )
         self.CreatedTimestamp = transaction.fetchone()[0]
+        log_dataset_changes(transaction, [(namespace, self.Name)])
         return self
         
     @transactioned
@@ -1033,12 +1304,12 @@ class DBDataset(DBObject):
             transaction.execute(f"""
                 update datasets 
                     set frozen=%s, monotonic=%s, metadata=%s, description=%s, 
-                        file_metadata_requirements=%s, file_count=%s,
+                        file_metadata_requirements=%s,
                         updated_by=%s, updated_timestamp=now()
                     where namespace=%s and name=%s
                     returning updated_timestamp
                 """,
-                (   self.Frozen, self.Monotonic, meta, self.Description, file_meta_requirements, self.FileCount,
+                (   self.Frozen, self.Monotonic, meta, self.Description, file_meta_requirements,
                     updated_by,
                     namespace, self.Name
                 )
@@ -1048,78 +1319,223 @@ class DBDataset(DBObject):
             transaction.execute(f"""
                 update datasets 
                     set frozen=%s, monotonic=%s, metadata=%s, description=%s, 
-                        file_metadata_requirements=%s, file_count=%s
+                        file_metadata_requirements=%s
                     where namespace=%s and name=%s
                 """,
-                (   self.Frozen, self.Monotonic, meta, self.Description, file_meta_requirements, self.FileCount,
+                (   self.Frozen, self.Monotonic, meta, self.Description, file_meta_requirements,
                     namespace, self.Name
                 )
             )
+        log_dataset_changes(transaction, [(namespace, self.Name)])
         return self
 
     @transactioned
     def subsets(self, exclude_immediate=False, meta_filter=None, transaction=None):
-        immediate = set()
-        if exclude_immediate:
-            immediate = set((c.Namespace, c.Name) for c in self.children())
         columns = self.columns("d")
         meta_condition = "and " + meta_filter.sql("d") if meta_filter is not None else ""
+        depth_condition = "and dc.depth > 1" if exclude_immediate else ""
         transaction.execute(f"""
-            with recursive subsets (namespace, name, path, loop) as 
-            (
-                select pc.child_namespace, pc.child_name, array[pc.child_namespace || ':' || pc.child_name], false
-                    from datasets_parent_child pc
-                    where pc.parent_namespace = %s and pc.parent_name = %s
-                union
-                    select pc1.child_namespace, pc1.child_name,
-                        s.path || (pc1.child_namespace || ':' || pc1.child_name),
-                        pc1.child_namespace || ':' || pc1.child_name = any(s.path)
-                    from datasets_parent_child pc1, subsets s
-                    where pc1.parent_namespace = s.namespace and pc1.parent_name = s.name and not s.loop
-            )
-            select distinct {columns} from subsets s, datasets d
-                where d.namespace = s.namespace and
-                    d.name = s.name
+            select {columns} from datasets_closure dc, datasets d
+                where dc.ancestor_namespace = %s and dc.ancestor_name = %s
+                    and d.namespace = dc.descendant_namespace
+                    and d.name = dc.descendant_name
+                    {depth_condition}
                     {meta_condition}
         """, (self.Namespace, self.Name))
-        out = (DBDataset.from_tuple(self.DB, tup) for tup in transaction)
-        if exclude_immediate:
-            out = (ds for ds in out if (ds.Namespace, ds.Name) not in immediate)
-        return out
+        return (DBDataset.from_tuple(self.DB, tup) for tup in transaction)
 
     def subset_count(self):
-        return len(list(self.subsets()))
+        c = self.DB.cursor()
+        c.execute("""
+            select count(*) from datasets_closure
+                where ancestor_namespace = %s and ancestor_name = %s
+        """, (self.Namespace, self.Name))
+        return c.fetchone()[0]
             
     @transactioned
     def ancestors(self, exclude_immediate=False, transaction=None):
-        immediate = set()
-        if exclude_immediate:
-            immediate = set((c.Namespace, c.Name) for c in self.parents())
         columns = self.columns("d")
+        depth_condition = "and dc.depth > 1" if exclude_immediate else ""
         transaction.execute(f"""
-            with recursive ancestors (namespace, name, path, loop) as 
+            select {columns} from datasets_closure dc, datasets d
+                where dc.descendant_namespace = %s and dc.descendant_name = %s
+                    and d.namespace = dc.ancestor_namespace
+                    and d.name = dc.ancestor_name
+                    {depth_condition}
+        """, (self.Namespace, self.Name))
+        return (DBDataset.from_tuple(self.DB, tup) for tup in transaction)
+
+    def ancestor_count(self):
+        c = self.DB.cursor()
+        c.execute("""
+            select count(*) from datasets_closure
+                where descendant_namespace = %s and descendant_name = %s
+        """, (self.Namespace, self.Name))
+        return c.fetchone()[0]
+
+    #
+    # datasets_closure maintenance
+    #
+
+    MaxClosureDepth = 1000          # guards against loops in datasets_parent_child
+
+    @staticmethod
+    def _closure_add_edge(transaction, parent_namespace, parent_name, child_namespace, child_name):
+        # connect all ancestors of the parent, including the parent, to all descendants of the child, including the child
+        transaction.execute("""
+            insert into datasets_closure(ancestor_namespace, ancestor_name, descendant_namespace, descendant_name, depth)
+                select a.namespace, a.name, d.namespace, d.name, a.depth + d.depth + 1
+                    from (
+                        select %(parent_namespace)s::text, %(parent_name)s::text, 0
+                        union all
+                        select ancestor_namespace, ancestor_name, depth
+                            from datasets_closure
+                            where descendant_namespace = %(parent_namespace)s and descendant_name = %(parent_name)s
+                    ) as a(namespace, name, depth),
+                    (
+                        select %(child_namespace)s::text, %(child_name)s::text, 0
+                        union all
+                        select descendant_namespace, descendant_name, depth
+                            from datasets_closure
+                            where ancestor_namespace = %(child_namespace)s and ancestor_name = %(child_name)s
+                    ) as d(namespace, name, depth)
+                    where (a.namespace, a.name) != (d.namespace, d.name)
+                on conflict (ancestor_namespace, ancestor_name, descendant_namespace, descendant_name)
+                    do update set depth = least(datasets_closure.depth, excluded.depth)
+        """, dict(parent_namespace=parent_namespace, parent_name=parent_name,
+                child_namespace=child_namespace, child_name=child_name)
+        )
+
+    @staticmethod
+    def _closure_relatives(transaction, namespace, name, direction):
+        # direction: "ancestors" or "descendants"
+        if direction == "ancestors":
+            transaction.execute("""
+                select ancestor_namespace, ancestor_name from datasets_closure
+                    where descendant_namespace = %s and descendant_name = %s
+            """, (namespace, name))
+        else:
+            transaction.execute("""
+                select descendant_namespace, descendant_name from datasets_closure
+                    where ancestor_namespace = %s and ancestor_name = %s
+            """, (namespace, name))
+        return [(ns, n) for ns, n in transaction.fetchall()]
+
+    @staticmethod
+    def _closure_rebuild(transaction, ancestors, descendants):
+        # Recalculates the closure for all (ancestor, descendant) pairs from ancestors x descendants
+        # after an edge or a dataset was removed. Only paths through the datasets which
+        # can still reach one of the descendants are followed. These are the ancestors themselves and
+        # the datasets whose closure pairs with the descendants were not removed: any path from such a dataset
+        # to a descendant does not pass through the removed edge or dataset, otherwise it would be an ancestor.
+        if not ancestors or not descendants:
+            return
+        a_namespaces, a_names = zip(*ancestors)
+        d_namespaces, d_names = zip(*descendants)
+        args = dict(
+            a_namespaces = list(a_namespaces), a_names = list(a_names),
+            d_namespaces = list(d_namespaces), d_names = list(d_names),
+            max_depth = DBDataset.MaxClosureDepth
+        )
+        transaction.execute("""
+            delete from datasets_closure dc
+                using unnest(%(a_namespaces)s::text[], %(a_names)s::text[]) as a(namespace, name),
+                    unnest(%(d_namespaces)s::text[], %(d_names)s::text[]) as d(namespace, name)
+                where dc.ancestor_namespace = a.namespace and dc.ancestor_name = a.name
+                    and dc.descendant_namespace = d.namespace and dc.descendant_name = d.name
+        """, args)
+        transaction.execute("""
+            with recursive 
+            targets(namespace, name) as 
+            (
+                select * from unnest(%(d_namespaces)s::text[], %(d_names)s::text[])
+            ),
+            relevant(namespace, name) as 
+            (
+                select namespace, name from targets
+                union
+                select * from unnest(%(a_namespaces)s::text[], %(a_names)s::text[])
+                union
+                select dc.ancestor_namespace, dc.ancestor_name
+                    from datasets_closure dc, targets t
+                    where dc.descendant_namespace = t.namespace and dc.descendant_name = t.name
+            ),
+            reachable(root_namespace, root_name, namespace, name, depth) as 
             (
-                select pc.parent_namespace, pc.parent_name, array[pc.parent_namespace || ':' || pc.parent_name], false
-                    from datasets_parent_child pc
-                    where pc.child_namespace = %s and pc.child_name = %s
+                select a.namespace, a.name, pc.child_namespace, pc.child_name, 1
+                    from unnest(%(a_namespaces)s::text[], %(a_names)s::text[]) as a(namespace, name), 
+                        datasets_parent_child pc, relevant r
+                    where pc.parent_namespace = a.namespace and pc.parent_name = a.name
+                        and r.namespace = pc.child_namespace and r.name = pc.child_name
                 union
-                    select pc1.parent_namespace, pc1.parent_name,
-                        a.path || (pc1.parent_namespace || ':' || pc1.parent_name),
-                        pc1.parent_namespace || ':' || pc1.parent_name = any(a.path)
-                    from datasets_parent_child pc1, ancestors a
-                    where pc1.child_namespace = a.namespace and pc1.child_name = a.name and not a.loop
+                select rr.root_namespace, rr.root_name, pc.child_namespace, pc.child_name, rr.depth + 1
+                    from reachable rr, datasets_parent_child pc, relevant r
+                    where pc.parent_namespace = rr.namespace and pc.parent_name = rr.name
+                        and r.namespace = pc.child_namespace and r.name = pc.child_name
+                        and rr.depth < %(max_depth)s
             )
-            select distinct {columns} from ancestors a, datasets d
-                where d.namespace = a.namespace and
-                    d.name = a.name
-        """, (self.Namespace, self.Name))
-        out = (DBDataset.from_tuple(self.DB, tup) for tup in transaction)
-        if exclude_immediate:
-            out = (ds for ds in out if (ds.Namespace, ds.Name) not in immediate)
-        return out
+            insert into datasets_closure(ancestor_namespace, ancestor_name, descendant_namespace, descendant_name, depth)
+                select rr.root_namespace, rr.root_name, rr.namespace, rr.name, min(rr.depth)
+                    from reachable rr, targets t
+                    where rr.namespace = t.namespace and rr.name = t.name
+                        and (rr.root_namespace, rr.root_name) != (rr.namespace, rr.name)
+                    group by rr.root_namespace, rr.root_name, rr.namespace, rr.name
+                on conflict (ancestor_namespace, ancestor_name, descendant_namespace, descendant_name)
+                    do update set depth = least(datasets_closure.depth, excluded.depth)
+        """, args)
+
+    # full closure calculated from datasets_parent_child
+    FullClosureSQL = """
+        with recursive reachable(root_namespace, root_name, namespace, name, depth) as 
+        (
+            select parent_namespace, parent_name, child_namespace, child_name, 1
+                from datasets_parent_child
+            union
+            select rr.root_namespace, rr.root_name, pc.child_namespace, pc.child_name, rr.depth + 1
+                from reachable rr, datasets_parent_child pc
+                where pc.parent_namespace = rr.namespace and pc.parent_name = rr.name
+                    and rr.depth < %(max_depth)s
+        )
+        select root_namespace, root_name, namespace, name, min(depth)
+            from reachable
+            where (root_namespace, root_name) != (namespace, name)
+            group by root_namespace, root_name, namespace, name
+    """
 
-    def ancestor_count(self):
-        return len(list(self.ancestors()))
+    @staticmethod
+    @transactioned
+    def rebuild_closure(db, transaction=None):
+        # rebuilds datasets_closure from scratch
+        transaction.execute("delete from datasets_closure")
+        transaction.execute(f"""
+            insert into datasets_closure(ancestor_namespace, ancestor_name, descendant_namespace, descendant_name, depth)
+                {DBDataset.FullClosureSQL}
+        """, dict(max_depth=DBDataset.MaxClosureDepth))
+        transaction.execute("select count(*) from datasets_closure")
+        return transaction.fetchone()[0]
+
+    @staticmethod
+    def check_closure(db):
+        # compares datasets_closure with the closure calculated from scratch
+        # returns list of (ancestor, descendant, stored depth, expected depth) for the pairs which differ,
+        # the depth is None if the pair is missing
+        c = db.cursor()
+        c.execute(f"""
+            with expected(ancestor_namespace, ancestor_name, descendant_namespace, descendant_name, depth) as 
+            (
+                {DBDataset.FullClosureSQL}
+            )
+            select coalesce(dc.ancestor_namespace, e.ancestor_namespace), coalesce(dc.ancestor_name, e.ancestor_name), 
+                    coalesce(dc.descendant_namespace, e.descendant_namespace), coalesce(dc.descendant_name, e.descendant_name), 
+                    dc.depth, e.depth
+                from datasets_closure dc
+                    full outer join expected e 
+                        on e.ancestor_namespace = dc.ancestor_namespace and e.ancestor_name = dc.ancestor_name
+                            and e.descendant_namespace = dc.descendant_namespace and e.descendant_name = dc.descendant_name
+                where dc.depth is distinct from e.depth
+                order by 1, 2, 3, 4
+        """, dict(max_depth=DBDataset.MaxClosureDepth))
+        return [(f"{ans}:{an}", f"{dns}:{dn}", stored, expected) for ans, an, dns, dn, stored, expected in c.fetchall()]
 
     @transactioned
     def children(self, meta_filter=None, transaction=None):
@@ -1185,11 +1601,31 @@ class DBDataset(DBObject):
         )
         return c.fetchone()[0]
 
-    def add_child(self, child):
-        _DatasetParentToChild(self.DB, self).add(child.Namespace, child.Name)
+    @transactioned
+    def add_child(self, child, transaction=None):
+        transaction.execute("""
+            insert into datasets_parent_child(parent_namespace, parent_name, child_namespace, child_name)
+                values(%s, %s, %s, %s)
+                on conflict do nothing
+        """, (self.Namespace, self.Name, child.Namespace, child.Name))
+        if transaction.rowcount:
+            DBDataset._closure_add_edge(transaction, self.Namespace, self.Name, child.Namespace, child.Name)
+            log_dataset_changes(transaction, [(self.Namespace, self.Name)])
     
-    def remove_child(self, child):
-        _DatasetParentToChild(self.DB, self).remove(child.Namespace, child.Name)
+    @transactioned
+    def remove_child(self, child, transaction=None):
+        ancestors = [(self.Namespace, self.Name)] + \
+            DBDataset._closure_relatives(transaction, self.Namespace, self.Name, "ancestors")
+        descendants = [(child.Namespace, child.Name)] + \
+            DBDataset._closure_relatives(transaction, child.Namespace, child.Name, "descendants")
+        transaction.execute("""
+            delete from datasets_parent_child
+                where parent_namespace = %s and parent_name = %s
+                    and child_namespace = %s and child_name = %s
+        """, (self.Namespace, self.Name, child.Namespace, child.Name))
+        if transaction.rowcount:
+            DBDataset._closure_rebuild(transaction, ancestors, descendants)
+            log_dataset_changes(transaction, [(self.Namespace, self.Name)])
     
     @transactioned
     def add_file(self, f, transaction=None, **args):
@@ -1199,41 +1635,37 @@ class DBDataset(DBObject):
     def add_files(self, files, validate_meta=True, transaction=None):
         if isinstance(files, DBFile):
             files = [files]
-        meta_errors = []
-        t = int(time.time()*1000) % 1000000
-        temp_table = f"temp_{t}"
-        transaction.execute(f"""
-            create temp table {temp_table} (fid text, namespace text, name text);
-            truncate table {temp_table}
-        """)
-        for chunk in chunked(files, 1000):
-            if validate_meta:
-                for f in chunk:
-                    assert isinstance(f, DBFile)
-                    errors = self.validate_file_metadata(f.Metadata)
-                    if errors:
-                        meta_errors += errors
-
-            csv = "\n".join(["%s\t%s\t%s" % (f.FID, f.Namespace, f.Name) for f in chunk])
-            transaction.copy_from(io.StringIO(csv), temp_table, columns = ["fid", "namespace", "name"])
-
-        if meta_errors:
-            ransaction.rollback()
-            raise MetaValidationError("File metadata validation errors", meta_errors)
-
-        transaction.execute(f"""
-            insert into files_datasets(file_id, dataset_namespace, dataset_name) 
-                select f.id, %s, %s 
-                    from {temp_table} tt, files f
-                    where tt.fid = f.id or (tt.namespace = f.namespace and tt.name = f.name)
-                on conflict do nothing""", (self.Namespace, self.Name))
-        nadded = transaction.rowcount
-        transaction.execute(f"drop table {temp_table}")
-        transaction.execute(f"""
-            update datasets
-                set file_count = file_count + %s
-                where namespace = %s and name = %s
-        """, (nadded, self.Namespace, self.Name))
+        if validate_meta:
+            files = list(files)
+            meta_errors = []
+            for f in files:
+                assert isinstance(f, DBFile)
+                errors = self.validate_file_metadata(f.Metadata)
+                if errors:
+                    meta_errors += errors
+            if meta_errors:
+                raise MetaValidationError("File metadata validation errors", meta_errors)
+
+        nadded = nactive = 0
+        for chunk in chunked(resolved_only(resolve_files(self.DB, files, transaction=transaction)), ResolveChunkSize):
+            file_ids = [fid for (fid,) in chunk]
+            transaction.execute(f"""
+                with added as (
+                    insert into files_datasets(file_id, dataset_namespace, dataset_name) 
+                        select unnest(%s::text[]), %s, %s 
+                        on conflict do nothing
+                        returning file_id
+                )
+                select count(*), count(*) filter (where not f.retired)
+                    from added a, files f
+                    where f.id = a.file_id
+                """, (file_ids, self.Namespace, self.Name))
+            n, na = transaction.fetchone()
+            nadded += n
+            nactive += na
+        _FileCounts.dataset_delta(transaction, self.Namespace, self.Name, nactive)
+        if nadded:
+            log_dataset_changes(transaction, [(self.Namespace, self.Name)])
         return nadded
 
     @transactioned
@@ -1243,12 +1675,22 @@ class DBDataset(DBObject):
         """
         file_ids = [item.FID if isinstance(item, DBFile) else item for item in files]
         transaction.execute("""
-            delete from files_datasets
-                where dataset_namespace = %s
-                    and dataset_name = %s
-                    and file_id = any(%s)
+            with removed as (
+                delete from files_datasets
+                    where dataset_namespace = %s
+                        and dataset_name = %s
+                        and file_id = any(%s)
+                    returning file_id
+            )
+            select count(*), count(*) filter (where not f.retired)
+                from removed r, files f
+                where f.id = r.file_id
         """, (self.Namespace, self.Name, file_ids))
-        return transaction.rowcount
+        nremoved, nactive = transaction.fetchone()
+        _FileCounts.dataset_delta(transaction, self.Namespace, self.Name, -nactive)
+        if nremoved:
+            log_dataset_changes(transaction, [(self.Namespace, self.Name)])
+        return nremoved
 
     def list_files(self, with_metadata=False, limit=None, include_retired_files=False):
         meta = "null as metadata" if not with_metadata else "f.metadata"
@@ -1261,9 +1703,8 @@ class DBDataset(DBObject):
                         {retired}
                     {limit}
         """
-        c = self.DB.cursor()
-        c.execute(sql, (self.Namespace, self.Name))
-        for fid, namespace, name, meta, size, checksums, creator, created_timestamp in fetch_generator(c):
+        rows = stream_rows(self.DB, sql, (self.Namespace, self.Name))
+        for fid, namespace, name, meta, size, checksums, creator, created_timestamp in rows:
             meta = meta or {}
             checksums = checksums or {}
             f = DBFile(self.DB, fid=fid, namespace=namespace, name=name, metadata=meta, size=size, checksums = checksums)
@@ -1343,20 +1784,24 @@ class DBDataset(DBObject):
         return (DBDataset.from_tuple(db, tup) for tup in transaction.results())
 
     def nfiles(self, exact=False):
+        # exact: include the deltas not yet folded into file_count by the daemon
         c = self.DB.cursor()
         if exact:
-            c.execute("""select count(*) 
-                            from files_datasets fd, files f
-                            where fd.dataset_namespace=%s and fd.dataset_name=%s
-                                and fd.file_id = f.id
-                                and not f.retired
-                            """, (self.Namespace, self.Name))
+            c.execute(f"""
+                select d.file_count + coalesce(
+                        (   select sum(delta) from dataset_file_count_deltas
+                                where dataset_namespace = d.namespace and dataset_name = d.name
+                        ), 0)
+                    from {self.Table} d
+                    where d.namespace = %s and d.name = %s
+            """, (self.Namespace, self.Name))
         else:
             c.execute(f"""
                 select file_count from {self.Table}
                     where namespace = %s and name = %s
             """, (self.Namespace, self.Name))
-        return c.fetchone()[0]     
+        tup = c.fetchone()
+        return 0 if tup is None else tup[0]
     
     def to_jsonable(self, with_relatives=False):
         out = dict(
@@ -1385,9 +1830,13 @@ class DBDataset(DBObject):
     
     @transactioned
     def delete(self, transaction=None):
+        ancestors = DBDataset._closure_relatives(transaction, self.Namespace, self.Name, "ancestors")
+        descendants = DBDataset._closure_relatives(transaction, self.Namespace, self.Name, "descendants")
         transaction.execute("""
             delete from datasets where namespace=%s and name=%s
         """, (self.Namespace, self.Name))
+        DBDataset._closure_rebuild(transaction, ancestors, descendants)
+        log_dataset_changes(transaction, [(self.Namespace, self.Name)])
         
     @staticmethod
     def list_datasets(db, patterns, with_children, recursively, limit=None):
@@ -1471,12 +1920,8 @@ class DBDataset(DBObject):
             recursively = bdq.Recursively
             where = bdq.Where
 
-            pc = alias("pc")
-            pc1 = alias("pc1")
             d = alias("d")
-            s = alias("s")
             ds = alias("ds")
-            t = alias("t")
 
             meta_filter_dnf = DatasetMetaExpressionDNF(where) if where is not None else None
 
@@ -1504,48 +1949,26 @@ class DBDataset(DBObject):
                 #    sql += " and " + meta_filter_dnf.sql(ds)
             else:
                 columns = ",".join(f"{d}.{c}" for c in columns)
-                top_sql = dedent(f"""\
-                    select {ds}.namespace, {ds}.name, array[{ds}.namespace || ':' || {ds}.name], false
-                        from {table} {ds}
-                        where {ds}.namespace = '{namespace}' and {name_cmp}
-                    """)
-
-                if not recursively:
-                    selected_sql = insert_sql(dedent(f"""\
-                        with selected_datasets (namespace, name, path, loop) as 
-                        (
-                            with {t} (namespace, name, path, loop) as 
-                            ( 
-                                $top_sql
-                            )
-                            select namespace, name, path, loop from {t}
-                            union
-                                select {pc}.child_namespace, {pc}.child_name,
-                                    {t}.path || ({pc}.child_namespace || ':' || {pc}.child_name), true
-                                from datasets_parent_child {pc}, {t}
-                                where {pc}.parent_namespace = {t}.namespace and {pc}.parent_name = {t}.name
-                        )"""), top_sql=top_sql)
-                else:
-                    selected_sql = insert_sql(dedent(f"""\
-                        with recursive selected_datasets (namespace, name, path, loop) as 
-                        (
-                            $top_sql
-                            union
-                                select {pc1}.child_namespace, {pc1}.child_name,
-                                    {s}.path || ({pc1}.child_namespace || ':' || {pc1}.child_name),
-                                    {pc1}.child_namespace || ':' || {pc1}.child_name = any({s}.path)
-                                from datasets_parent_child {pc1}, selected_datasets {s}
-                                where {pc1}.parent_namespace = {s}.namespace and {pc1}.parent_name = {s}.name and not {s}.loop
-                        )"""), top_sql=top_sql)
+                dc = alias("dc")
+                depth_condition = "" if recursively else f"and {dc}.depth = 1"
                 meta_condition = "and " + meta_filter_dnf.sql(d) if meta_filter_dnf is not None else ""
-                sql = insert_sql(f"""\
-                    $selected_sql
-                    select distinct {columns} 
-                        from selected_datasets {s}, datasets {d}
-                        where {d}.namespace = {s}.namespace and
-                            {d}.name = {s}.name
+                sql = dedent(f"""\
+                    select {columns} 
+                        from {table} {d}
+                        where ({d}.namespace, {d}.name) in (
+                                select {ds}.namespace, {ds}.name
+                                    from {table} {ds}
+                                    where {ds}.namespace = '{namespace}' and {name_cmp}
+                                union
+                                select {dc}.descendant_namespace, {dc}.descendant_name
+                                    from {table} {ds}, datasets_closure {dc}
+                                    where {ds}.namespace = '{namespace}' and {name_cmp}
+                                        and {dc}.ancestor_namespace = {ds}.namespace
+                                        and {dc}.ancestor_name = {ds}.name
+                                        {depth_condition}
+                            )
                             {meta_condition}
-                """, selected_sql=selected_sql)
+                """)
             debug(f"sql_for_basic_dataset_query({bdq}): sql:\n", sql)
             return sql
 
@@ -1669,16 +2092,62 @@ class DBDataset(DBObject):
     def file_count_by_dataset(db):
         c = db.cursor()
         c.execute(f"""
-            select dataset_namespace, dataset_name, count(*) 
-                from files_datasets 
-                group by dataset_namespace, dataset_name
+            select fd.dataset_namespace, fd.dataset_name, count(*) 
+                from files_datasets fd, files f
+                where f.id = fd.file_id and not f.retired
+                group by fd.dataset_namespace, fd.dataset_name
         """)
         return dict(((ds_ns, ds_name), n) for ds_ns, ds_name, n in fetch_generator(c))
 
+    @staticmethod
+    @transactioned
+    def fold_file_counts(db, transaction=None):
+        # moves accumulated deltas into datasets.file_count
+        transaction.execute("""
+            with folded as (
+                delete from dataset_file_count_deltas
+                    returning dataset_namespace, dataset_name, delta
+            ),
+            totals as (
+                select dataset_namespace, dataset_name, sum(delta) as delta
+                    from folded
+                    group by dataset_namespace, dataset_name
+            )
+            update datasets d
+                set file_count = d.file_count + t.delta
+                from totals t
+                where d.namespace = t.dataset_namespace and d.name = t.dataset_name
+        """)
+        return transaction.rowcount
+
+    @staticmethod
+    @transactioned
+    def reconcile_file_counts(db, transaction=None):
+        # compares counters with actual counts and records corrections as deltas
+        # done in one statement so that counts and deltas are taken from the same snapshot
+        transaction.execute("""
+            insert into dataset_file_count_deltas(dataset_namespace, dataset_name, delta)
+                select d.namespace, d.name, coalesce(actual.n, 0) - d.file_count - coalesce(deltas.delta, 0)
+                    from datasets d
+                    left outer join (
+                        select fd.dataset_namespace, fd.dataset_name, count(*) as n
+                            from files_datasets fd, files f
+                            where f.id = fd.file_id and not f.retired
+                            group by fd.dataset_namespace, fd.dataset_name
+                    ) actual on actual.dataset_namespace = d.namespace and actual.dataset_name = d.name
+                    left outer join (
+                        select dataset_namespace, dataset_name, sum(delta) as delta
+                            from dataset_file_count_deltas
+                            group by dataset_namespace, dataset_name
+                    ) deltas on deltas.dataset_namespace = d.namespace and deltas.dataset_name = d.name
+                    where coalesce(actual.n, 0) != d.file_count + coalesce(deltas.delta, 0)
+        """)
+        return transaction.rowcount
+
 
 class DBNamedQuery(DBObject):
     
-    Columns = "namespace,name,parameters,source,creator,created_timestamp,description,metadata".split(",")
+    Columns = "namespace,name,parameters,source,creator,created_timestamp,description,metadata,version".split(",")
     Table = "queries"
     PK = ["namespace", "name"]
 
@@ -1693,6 +2162,7 @@ class DBNamedQuery(DBObject):
         self.CreatedTimestamp = None
         self.Description = description
         self.Metadata = metadata
+        self.Version = None
         
     def to_jsonable(self):
         return dict(
@@ -1702,16 +2172,18 @@ class DBNamedQuery(DBObject):
             creator = self.Creator,
             created_timestamp = epoch(self.CreatedTimestamp),
             description = self.Description,
-            metadata = self.Metadata
+            metadata = self.Metadata,
+            version = self.Version
         )
 
     @staticmethod
     def from_tuple(db, tup):
-        namespace, name, parameters, source, creator, created_timespamp, description, metadata = tup
+        namespace, name, parameters, source, creator, created_timespamp, description, metadata, version = tup
         #print("DBNamedQuery.from_tuple:", tup)
         query = DBNamedQuery(db, namespace, name, source, parameters, description, metadata)
         query.Creator = creator
         query.CreatedTimestamp = created_timespamp
+        query.Version = version
         return query
         
     @transactioned
@@ -1720,11 +2192,11 @@ class DBNamedQuery(DBObject):
         transaction.execute("""
             insert into queries(namespace, name, source, parameters, creator, description, metadata) 
                 values(%s, %s, %s, %s, %s, %s, %s)
-            returning created_timestamp""",
+            returning created_timestamp, version""",
             (self.Namespace, self.Name, self.Source, self.Parameters, self.Creator, self.Description,
                 meta)
         )
-        self.CreatedTimestamp = transaction.fetchone()[0]
+        self.CreatedTimestamp, self.Version = transaction.fetchone()
         return self
             
     @transactioned
@@ -1733,13 +2205,17 @@ class DBNamedQuery(DBObject):
         transaction.execute("""
             update queries 
                 set source=%s, parameters=%s, creator=%s, created_timestamp=%s,
-                    description=%s, metadata=%s
-                where namespace=%s and name=%s;
+                    description=%s, metadata=%s, version=version+1
+                where namespace=%s and name=%s
+                returning version
             """,
             (self.Source, self.Parameters, self.Creator, self.CreatedTimestamp, 
                 self.Description, meta,
             self.Namespace, self.Name)
         )
+        tup = transaction.fetchone()
+        if tup is not None:
+            self.Version = tup[0]
         return self
             
     @staticmethod
@@ -1854,10 +2330,10 @@ class DBNamespace(DBObject):
     def save(self, transaction=None):
         transaction.execute(f"""
             update {self.Table}
-                set owner_user=%s, owner_role=%s, description=%s, file_count=%s
+                set owner_user=%s, owner_role=%s, description=%s
                 where name=%s
             """,
-            (self.OwnerUser, self.OwnerRole, self.Description, self.FileCount,
+            (self.OwnerUser, self.OwnerRole, self.Description,
                 self.Name)
         )
         return self
@@ -1940,10 +2416,57 @@ class DBNamespace(DBObject):
 
     def file_count(self):
         c = self.DB.cursor()
-        c.execute("""select count(*) from files where namespace=%s""", (self.Name,))
+        c.execute("""
+            select n.file_count + coalesce(
+                    (select sum(delta) from namespace_file_count_deltas where namespace = n.name), 0)
+                from namespaces n
+                where n.name=%s""", (self.Name,))
         tup = c.fetchone()
         if not tup: return 0
         else:       return tup[0]
+
+    @staticmethod
+    @transactioned
+    def fold_file_counts(db, transaction=None):
+        # moves accumulated deltas into namespaces.file_count
+        transaction.execute("""
+            with folded as (
+                delete from namespace_file_count_deltas
+                    returning namespace, delta
+            ),
+            totals as (
+                select namespace, sum(delta) as delta
+                    from folded
+                    group by namespace
+            )
+            update namespaces n
+                set file_count = n.file_count + t.delta
+                from totals t
+                where n.name = t.namespace
+        """)
+        return transaction.rowcount
+
+    @staticmethod
+    @transactioned
+    def reconcile_file_counts(db, transaction=None):
+        # compares counters with actual counts and records corrections as deltas
+        transaction.execute("""
+            insert into namespace_file_count_deltas(namespace, delta)
+                select n.name, coalesce(actual.n, 0) - n.file_count - coalesce(deltas.delta, 0)
+                    from namespaces n
+                    left outer join (
+                        select namespace, count(*) as n
+                            from files
+                            group by namespace
+                    ) actual on actual.namespace = n.name
+                    left outer join (
+                        select namespace, sum(delta) as delta
+                            from namespace_file_count_deltas
+                            group by namespace
+                    ) deltas on deltas.namespace = n.name
+                    where coalesce(actual.n, 0) != n.file_count + coalesce(deltas.delta, 0)
+        """)
+        return transaction.rowcount
         
     def dataset_count(self):
         c = self.DB.cursor()
@@ -1,4 +1,4 @@
 drop view if exists file_provenance, files_with_provenance;
-drop table if exists files_datasets, datasets_parent_child, users_roles, parent_child, queries, parameter_definitions, authenticators cascade;
+drop table if exists query_job_results, query_jobs, catalog_changes, indexed_metadata_keys, dataset_file_count_deltas, namespace_file_count_deltas, files_datasets, datasets_closure, datasets_parent_child, users_roles, parent_child, queries, parameter_definitions, authenticators cascade;
 drop table if exists files, datasets, users, parameter_categories, namespaces, roles cascade;
-
+drop function if exists meta_text, meta_float, meta_text_array, meta_float_array, adler32;
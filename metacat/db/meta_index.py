@@ -0,0 +1,87 @@
+import re, time
+from metacat.common import DBObject, transactioned, meta_index_expression
+from metacat.util import epoch
+
+class DBIndexedMetaKey(DBObject):
+
+    #
+    # Registry of metadata keys with typed expression indexes on the files table.
+    # For registered keys, the MQL compiler adds the indexed expression form of the comparison
+    # to the jsonpath predicate, so that the btree (for scalars) or GIN (for arrays) index can be used.
+    #
+    # Registering a key declares that its values are scalars (or arrays of scalars) of the given type.
+    # Values of other types are not indexed and do not match the indexed predicates.
+    #
+
+    Table = "indexed_metadata_keys"
+    ColumnsText = "name,type,is_array,index_name,creator,created_timestamp"
+    Columns = ColumnsText.split(",")
+    PK = ["name"]
+
+    Types = ("text", "float")
+    NameRE = re.compile(r"^[a-z_][a-z0-9_]*(\.[a-z0-9_]+)+$", re.I)
+
+    RegistryTTL = 60            # seconds
+    Registry = None
+    RegistryLoadedAt = 0
+
+    def __init__(self, db, name, type, is_array=False, index_name=None, creator=None, created_timestamp=None):
+        if not self.NameRE.match(name or ""):
+            raise ValueError("Invalid metadata key name: %s" % (name,))
+        if type not in self.Types:
+            raise ValueError("Unsupported indexed metadata key type: %s. Supported types are: %s" % (type, ", ".join(self.Types)))
+        self.DB = db
+        self.Name = name
+        self.Type = type
+        self.IsArray = is_array
+        self.IndexName = index_name or "files_meta_" + re.sub(r"[^a-z0-9_]", "_", name.lower())
+        self.Creator = creator
+        self.CreatedTimestamp = created_timestamp
+
+    def to_jsonable(self):
+        return dict(
+            name = self.Name,
+            type = self.Type,
+            is_array = self.IsArray,
+            index_name = self.IndexName,
+            creator = self.Creator,
+            created_timestamp = epoch(self.CreatedTimestamp)
+        )
+
+    def create(self, concurrently=False):
+        # concurrently=True requires the connection to be in autocommit mode
+        method = "gin" if self.IsArray else "btree"
+        expression = meta_index_expression(self.Name, self.Type, self.IsArray)
+        concurrently = "concurrently" if concurrently else ""
+        c = self.DB.cursor()
+        c.execute(f"create index {concurrently} if not exists {self.IndexName} on files using {method} (({expression}))")
+        # register the key only after the index is built
+        self._register()
+        return self
+
+    @transactioned
+    def _register(self, transaction=None):
+        columns = self.columns(exclude="created_timestamp")
+        transaction.execute(f"""
+            insert into {self.Table}({columns}) values(%s, %s, %s, %s, %s)
+                on conflict (name) do update
+                    set type = excluded.type, is_array = excluded.is_array, index_name = excluded.index_name
+                returning created_timestamp
+            """, (self.Name, self.Type, self.IsArray, self.IndexName, self.Creator)
+        )
+        self.CreatedTimestamp = transaction.fetchone()[0]
+
+    @transactioned
+    def delete(self, transaction=None):
+        transaction.execute(f"delete from {self.Table} where name = %s", (self.Name,))
+        transaction.execute(f"drop index if exists {self.IndexName}")
+
+    @staticmethod
+    def registry(db):
+        # {name: (type, is_array)}, cached for RegistryTTL seconds
+        if db is None:
+            return {}
+        if DBIndexedMetaKey.Registry is None or time.time() > DBIndexedMetaKey.RegistryLoadedAt + DBIndexedMetaKey.RegistryTTL:
+            DBIndexedMetaKey.Registry = {k.Name: (k.Type, k.IsArray) for k in DBIndexedMetaKey.list(db)}
+            DBIndexedMetaKey.RegistryLoadedAt = time.time()
+        return DBIndexedMetaKey.Registry
@@ -0,0 +1,169 @@
+import threading, queue
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from psycopg2.extensions import TRANSACTION_STATUS_IDLE
+from .cursors import stream_batches
+
+#
+# Parallel prefetch of independent file sets
+#
+# When a query combines file sets which can not be merged into one SQL query (e.g. a union of
+# a meta-filtered set with a file list, or inputs of the "mix" filter), each SQL based file set
+# is otherwise fetched one after another on the request's connection.
+#
+# BranchPrefetcher runs the SQL of each such file set on its own connection taken from the pool,
+# in a thread from a shared thread pool. At most MaxParallel file sets of one request are fetched
+# concurrently, the others wait for their turn. Rows are passed to the consumer through unbounded
+# queues, so that a running branch never waits for the consumer and always releases its connection:
+# the memory used is up to the size of the branches fetched ahead of the consumer.
+#
+# All the branches of one prefetch() read the same database snapshot, so that union, join and minus
+# combine rows taken at the same point in time. If the request's connection is in a transaction, its snapshot
+# is exported and the transaction must stay open until the branches start. Otherwise, the snapshot is exported by
+# a separate connection, which is held until all the branches have imported it.
+#
+
+PrefetchThreads = 16
+_Pool = None
+_PoolLock = threading.Lock()
+
+def set_prefetch_threads(n):
+    global PrefetchThreads, _Pool
+    assert n > 0, "Number of prefetch threads must be positive"
+    with _PoolLock:
+        PrefetchThreads = n
+        if _Pool is not None:
+            _Pool.shutdown(wait=False)
+            _Pool = None
+
+def _pool():
+    global _Pool
+    with _PoolLock:
+        if _Pool is None:
+            _Pool = ThreadPoolExecutor(PrefetchThreads, thread_name_prefix="metacat-prefetch")
+        return _Pool
+
+def _begin_repeatable_read(db):
+    c = db.cursor()
+    if db.autocommit:
+        c.execute("begin isolation level repeatable read")
+    else:
+        c.execute("set transaction isolation level repeatable read")
+    return c
+
+class _Snapshot(object):
+
+    # snapshot shared by the branches of one prefetch
+
+    def __init__(self, db, connect, nbranches):
+        self.Lock = threading.Lock()
+        self.Pending = nbranches
+        self.Exporter = None
+        if db.get_transaction_status() == TRANSACTION_STATUS_IDLE:
+            db = self.Exporter = connect()
+            c = _begin_repeatable_read(db)
+        else:
+            c = db.cursor()
+        c.execute("select pg_export_snapshot()")
+        self.ID = c.fetchone()[0]
+
+    def begin(self, db):
+        # begins a read-only transaction with the snapshot on the branch connection
+        c = _begin_repeatable_read(db)
+        c.execute("set transaction snapshot %s", (self.ID,))
+
+    def done(self):
+        # called once for each branch, after it has imported the snapshot or has decided not to run
+        with self.Lock:
+            self.Pending -= 1
+            if self.Pending > 0 or self.Exporter is None:
+                return
+            exporter, self.Exporter = self.Exporter, None
+        exporter.cursor().execute("rollback")
+
+class _Branch(object):
+
+    def __init__(self, sql, snapshot):
+        self.SQL = sql
+        self.Snapshot = snapshot
+        self.Queue = queue.Queue()
+        self.Stop = False
+
+    def rows(self):
+        try:
+            while True:
+                item = self.Queue.get()
+                if item is None:
+                    break
+                if isinstance(item, Exception):
+                    raise item
+                yield from item
+        finally:
+            # the consumer does not need more rows, e.g. because of a limit
+            self.Stop = True
+
+class BranchPrefetcher(object):
+
+    def __init__(self, db, connect, max_parallel=4):
+        # connect() returns a new connection from the pool
+        self.DB = db
+        self.Connect = connect
+        self.MaxParallel = max_parallel
+        self.Pending = deque()
+        self.Running = 0
+        self.Lock = threading.Lock()
+
+    def prefetch(self, file_sets):
+        # returns list of DBFileSet objects, SQL based ones replaced with prefetched ones
+        # a single SQL based file set is not prefetched: there is nothing to run concurrently with it
+        from .dbobjects2 import DBFileSet
+        nbranches = sum(1 for file_set in file_sets if isinstance(file_set, DBFileSet) and file_set.SQL is not None)
+        if nbranches < 2:
+            return list(file_sets)
+        snapshot = _Snapshot(self.DB, self.Connect, nbranches)
+        out = []
+        for file_set in file_sets:
+            if isinstance(file_set, DBFileSet) and file_set.SQL is not None:
+                branch = _Branch(file_set.SQL, snapshot)
+                with self.Lock:
+                    self.Pending.append(branch)
+                file_set = DBFileSet.from_tuples(self.DB, branch.rows())
+            out.append(file_set)
+        self.start_pending()
+        return out
+
+    def start_pending(self):
+        with self.Lock:
+            while self.Pending and self.Running < self.MaxParallel:
+                branch = self.Pending.popleft()
+                self.Running += 1
+                _pool().submit(self.run_branch, branch)
+
+    def run_branch(self, branch):
+        try:
+            db = None
+            try:
+                if not branch.Stop:
+                    db = self.Connect()
+                    branch.Snapshot.begin(db)
+            finally:
+                branch.Snapshot.done()
+            if db is None:
+                return
+            batches = stream_batches(db, branch.SQL, dedicated=True)
+            try:
+                for batch in batches:
+                    branch.Queue.put(batch)
+                    if branch.Stop:
+                        break
+            finally:
+                batches.close()
+                db.cursor().execute("rollback")
+                db = None
+        except Exception as e:
+            branch.Queue.put(e)
+        finally:
+            branch.Queue.put(None)
+            with self.Lock:
+                self.Running -= 1
+            self.start_pending()
@@ -0,0 +1,146 @@
+import json, secrets
+from metacat.common import DBObject, transactioned
+from metacat.util import epoch
+
+class DBQueryJob(DBObject):
+
+    #
+    # Asynchronous query job
+    #
+    # The job is created in "queued" state, run by a worker which appends the serialized results to
+    # query_job_results as they are produced, and ends up "done", "failed" or "cancelled".
+    # Results can be read in pages while the job is running. The job and its results are removed after
+    # expires_timestamp, which is set when the job ends.
+    #
+
+    Table = "query_jobs"
+    ColumnsText = "id,owner,query,params,status,rows,error,created_timestamp,updated_timestamp,expires_timestamp"
+    Columns = ColumnsText.split(",")
+    PK = ["id"]
+
+    def __init__(self, db, id=None, owner=None, query=None, params=None, status="queued", rows=0, error=None,
+                created_timestamp=None, updated_timestamp=None, expires_timestamp=None):
+        DBObject.__init__(self, db)
+        self.ID = id or secrets.token_hex(16)
+        self.Owner = owner
+        self.Query = query
+        self.Params = params or {}
+        self.Status = status
+        self.Rows = rows
+        self.Error = error
+        self.CreatedTimestamp = created_timestamp
+        self.UpdatedTimestamp = updated_timestamp
+        self.ExpiresTimestamp = expires_timestamp
+
+    def to_jsonable(self):
+        return dict(
+            job_id = self.ID,
+            owner = self.Owner,
+            query = self.Query,
+            params = self.Params,
+            status = self.Status,
+            rows = self.Rows,
+            message = self.Error,             # not "error", which clients interpret as a failed request
+            created_timestamp = epoch(self.CreatedTimestamp),
+            updated_timestamp = epoch(self.UpdatedTimestamp),
+            expires_timestamp = epoch(self.ExpiresTimestamp)
+        )
+
+    @staticmethod
+    def from_tuple(db, tup):
+        return DBQueryJob(db, *tup)
+
+    @staticmethod
+    def get(db, job_id):
+        c = db.cursor()
+        c.execute(f"""
+            select {DBQueryJob.ColumnsText} from query_jobs
+                where id = %s and (expires_timestamp is null or expires_timestamp > now())
+        """, (job_id,))
+        tup = c.fetchone()
+        return None if tup is None else DBQueryJob.from_tuple(db, tup)
+
+    @staticmethod
+    def list(db, owner):
+        c = db.cursor()
+        c.execute(f"""
+            select {DBQueryJob.ColumnsText} from query_jobs
+                where owner = %s and (expires_timestamp is null or expires_timestamp > now())
+                order by created_timestamp
+        """, (owner,))
+        return [DBQueryJob.from_tuple(db, tup) for tup in c.fetchall()]
+
+    @transactioned
+    def create(self, transaction=None):
+        transaction.execute("""
+            insert into query_jobs(id, owner, query, params) values(%s, %s, %s, %s)
+                returning created_timestamp, updated_timestamp
+        """, (self.ID, self.Owner, self.Query, json.dumps(self.Params)))
+        self.CreatedTimestamp, self.UpdatedTimestamp = transaction.fetchone()
+        return self
+
+    @transactioned
+    def set_status(self, status, error=None, ttl=None, transaction=None):
+        # changes status of an active job, returns False if the job is no longer active, e.g. cancelled
+        transaction.execute("""
+            update query_jobs
+                set status = %s, error = %s, updated_timestamp = now(),
+                    expires_timestamp = case when %s::float is null then null else now() + make_interval(secs => %s) end
+                where id = %s and status in ('queued', 'running')
+                returning status, updated_timestamp, expires_timestamp
+        """, (status, error, ttl, ttl, self.ID))
+        tup = transaction.fetchone()
+        if tup is None:
+            return False
+        self.Status, self.UpdatedTimestamp, self.ExpiresTimestamp = tup
+        self.Error = error
+        return True
+
+    @transactioned
+    def append_results(self, rows, transaction=None):
+        # rows: list of serialized results
+        # returns False if the job is no longer running, e.g. cancelled
+        if rows:
+            transaction.execute("""
+                insert into query_job_results(job_id, seq, data)
+                    select %s, %s + ordinality - 1, data
+                        from unnest(%s::text[]) with ordinality as d(data)
+            """, (self.ID, self.Rows, rows))
+        transaction.execute("""
+            update query_jobs
+                set rows = rows + %s, updated_timestamp = now()
+                where id = %s
+                returning status, rows
+        """, (len(rows), self.ID))
+        tup = transaction.fetchone()
+        if tup is None:
+            return False
+        self.Status, self.Rows = tup
+        return self.Status == "running"
+
+    def results(self, offset=0, limit=None):
+        # generates serialized results in the order they were produced
+        c = self.DB.cursor()
+        c.execute("""
+            select data from query_job_results
+                where job_id = %s and seq >= %s
+                order by seq
+                limit %s
+        """, (self.ID, offset, limit))
+        for tup in c.fetchall():
+            yield tup[0]
+
+    @staticmethod
+    def prune(db, stale_after):
+        # removes expired jobs with their results
+        # active jobs not updated for stale_after seconds, e.g. because the server was restarted, are marked failed
+        c = db.cursor()
+        c.execute("""
+            update query_jobs
+                set status = 'failed', error = 'Job lost', expires_timestamp = now() + make_interval(secs => %s)
+                where status in ('queued', 'running') and updated_timestamp < now() - make_interval(secs => %s)
+        """, (stale_after, stale_after))
+        c.execute("delete from query_jobs where expires_timestamp < now()")
+        n = c.rowcount
+        c.execute("commit")
+        return n
@@ -0,0 +1,93 @@
+from metacat.util import chunked
+
+#
+# Bulk resolution of file specifications into files
+#
+# Specifications are sent to the database in chunks as arrays, unnest()-ed on the server side
+# and joined with the files table using the primary key or the file_names_unique index.
+# No staging tables are created, so concurrent resolutions in the same or in different
+# sessions can not collide with each other.
+#
+# A specification can be:
+#   - an object with FID, Namespace and Name attributes, e.g. DBFile or ObjectSpec
+#   - a dictionary {"fid":...} or {"namespace":..., "name":...} or {"did":"namespace:name"}
+#   - a string "namespace:name" or just "name" if the default namespace is given
+# If the file id is known, it is used to find the file, otherwise namespace and name are used.
+#
+
+ResolveChunkSize = 10000
+
+def _fid_namespace_name(spec, default_namespace):
+    if isinstance(spec, str):
+        if ':' in spec:
+            namespace, name = spec.split(':', 1)
+        else:
+            namespace, name = default_namespace, spec
+        fid = None
+    elif isinstance(spec, dict):
+        fid = spec.get("fid")
+        namespace = spec.get("namespace")
+        name = spec.get("name")
+        did = spec.get("did")
+        if did:
+            if ':' in did:
+                namespace, name = did.split(':', 1)
+            else:
+                name = did
+    else:
+        fid, namespace, name = spec.FID, spec.Namespace, spec.Name
+    if not fid:
+        namespace = namespace or default_namespace
+        if not (namespace and name):
+            raise ValueError("Invalid file specification: %s" % (spec,))
+    return fid, namespace, name
+
+def resolve_files(db, specs, columns="f.id", default_namespace=None, chunk_size=None, transaction=None):
+    """
+    Resolves file specifications. Generates tuples (spec, row) in the order of the input specifications.
+    row is the tuple of values of the columns, selected from the "files f" table, or None if the file was not found.
+    """
+    chunk_size = chunk_size or ResolveChunkSize
+    c = transaction if transaction is not None else db.cursor()
+    for chunk in chunked(specs, chunk_size):
+        by_fid = ([], [])                   # (indexes, fids)
+        by_name = ([], [], [])              # (indexes, namespaces, names)
+        for i, spec in enumerate(chunk):
+            fid, namespace, name = _fid_namespace_name(spec, default_namespace)
+            if fid:
+                by_fid[0].append(i)
+                by_fid[1].append(fid)
+            else:
+                by_name[0].append(i)
+                by_name[1].append(namespace)
+                by_name[2].append(name)
+
+        rows = [None] * len(chunk)
+        if by_fid[0]:
+            c.execute(f"""
+                select s.inx, f.id is not null, {columns}
+                    from unnest(%s::int[], %s::text[]) as s(inx, id)
+                        left outer join files f on f.id = s.id
+            """, by_fid)
+            for tup in c.fetchall():
+                if tup[1]:
+                    rows[tup[0]] = tup[2:]
+        if by_name[0]:
+            c.execute(f"""
+                select s.inx, f.id is not null, {columns}
+                    from unnest(%s::int[], %s::text[], %s::text[]) as s(inx, namespace, name)
+                        left outer join files f on f.namespace = s.namespace and f.name = s.name
+            """, by_name)
+            for tup in c.fetchall():
+                if tup[1]:
+                    rows[tup[0]] = tup[2:]
+
+        yield from zip(chunk, rows)
+
+def resolved_only(resolved):
+    # filters the output of resolve_files leaving only found rows
+    return (row for spec, row in resolved if row is not None)
+
+def unresolved_only(resolved):
+    # filters the output of resolve_files leaving only specifications of not found files
+    return (spec for spec, row in resolved if row is None)
@@ -74,6 +74,62 @@ create index files_created_timestamp on files(created_timestamp);
 create index files_size on files(size);
 create index files_name on files(name) include (namespace, id);
 
+--
+-- Typed extraction of metadata values, used in expression indexes on files for the keys listed in indexed_metadata_keys.
+-- Values of unexpected JSON type are mapped to null, so the functions never fail and can be used in indexes.
+--
+
+create or replace function meta_text(v jsonb) returns text as $$
+    select case when jsonb_typeof(v) = 'string' then v #>> '{}' end
+$$ language sql immutable parallel safe;
+
+create or replace function meta_float(v jsonb) returns double precision as $$
+    select case when jsonb_typeof(v) = 'number' then (v #>> '{}')::double precision end
+$$ language sql immutable parallel safe;
+
+create or replace function meta_text_array(v jsonb) returns text[] as $$
+    select case jsonb_typeof(v)
+        when 'array' then array(select e #>> '{}' from jsonb_array_elements(v) e where jsonb_typeof(e) = 'string')
+        when 'string' then array[v #>> '{}']
+    end
+$$ language sql immutable parallel safe;
+
+create or replace function meta_float_array(v jsonb) returns double precision[] as $$
+    select case jsonb_typeof(v)
+        when 'array' then array(select (e #>> '{}')::double precision from jsonb_array_elements(v) e where jsonb_typeof(e) = 'number')
+        when 'number' then array[(v #>> '{}')::double precision]
+    end
+$$ language sql immutable parallel safe;
+
+--
+-- Adler-32 checksum of the UTF-8 bytes of the text, same as Python zlib.adler32(t.encode("utf-8")).
+-- Used by the SQL implementation of the "hash" filter.
+--
+
+create or replace function adler32(t text) returns bigint as $$
+declare
+    b       bytea := convert_to(t, 'UTF8');
+    s1      bigint := 1;
+    s2      bigint := 0;
+begin
+    for i in 0 .. octet_length(b) - 1 loop
+        s1 := s1 + get_byte(b, i);
+        s2 := s2 + s1;
+    end loop;
+    return (s2 % 65521) * 65536 + s1 % 65521;
+end
+$$ language plpgsql immutable strict parallel safe;
+
+create table indexed_metadata_keys
+(
+    name                text    primary key,
+    type                text    check (type in ('text', 'float')),
+    is_array            boolean default false,
+    index_name          text,
+    creator             text references users(username),
+    created_timestamp   timestamp with time zone        default now()
+);
+
 create table parent_child
 (
     parent_id   text references files(id),
@@ -135,6 +191,24 @@ create index datasets_parent_child_child on datasets_parent_child(child_namespac
 create index datasets_parent_child_child_spec on datasets_parent_child( (child_namespace || ':' || child_name ));
 create index datasets_parent_child_parent_spec on datasets_parent_child( (parent_namespace || ':' || parent_name ));
 
+--
+-- transitive closure of datasets_parent_child, maintained by DBDataset.add_child(), remove_child() and delete()
+-- depth is the length of the shortest path from the ancestor to the descendant
+--
+create table datasets_closure
+(
+    ancestor_namespace      text,
+    ancestor_name           text,
+    descendant_namespace    text,
+    descendant_name         text,
+    depth                   int,
+    foreign key (ancestor_namespace, ancestor_name) references datasets(namespace, name) on delete cascade,
+    foreign key (descendant_namespace, descendant_name) references datasets(namespace, name) on delete cascade,
+    primary key (ancestor_namespace, ancestor_name, descendant_namespace, descendant_name)
+);
+
+create index datasets_closure_descendant on datasets_closure(descendant_namespace, descendant_name, ancestor_namespace, ancestor_name);
+
 create table files_datasets
 (
     file_id                 text    references files on delete cascade,
@@ -146,6 +220,73 @@ create table files_datasets
 
 create index files_datasets_file_id on files_datasets(file_id);
 
+--
+-- File counters
+--
+-- datasets.file_count (non-retired files) and namespaces.file_count (all files) are maintained incrementally.
+-- Each transaction changing the counts appends its own delta rows, so concurrent writers never update the same row.
+-- The daemon periodically folds the deltas into the file_count columns and reconciles them with the actual counts.
+-- The exact count is file_count + sum(delta).
+--
+create table dataset_file_count_deltas
+(
+    id                      bigserial   primary key,
+    dataset_namespace       text,
+    dataset_name            text,
+    delta                   bigint,
+    foreign key(dataset_namespace, dataset_name) references datasets(namespace, name) on delete cascade
+);
+
+create index dataset_file_count_deltas_dataset on dataset_file_count_deltas(dataset_namespace, dataset_name) include (delta);
+
+create table namespace_file_count_deltas
+(
+    id                      bigserial   primary key,
+    namespace               text        references namespaces(name) on delete cascade,
+    delta                   bigint
+);
+
+create index namespace_file_count_deltas_namespace on namespace_file_count_deltas(namespace) include (delta);
+
+create table catalog_changes
+(
+    id                      bigserial   primary key,
+    namespace               text,
+    dataset_namespace       text,
+    dataset_name            text,
+    txid                    bigint      default txid_current(),
+    created_timestamp       timestamp with time zone     default now()
+);
+
+create index catalog_changes_txid on catalog_changes(txid);
+create index catalog_changes_dataset on catalog_changes(dataset_namespace, dataset_name, txid);
+create index catalog_changes_created on catalog_changes(created_timestamp);
+
+create table query_jobs
+(
+    id                      text        primary key,
+    owner                   text        references users(username),
+    query                   text,
+    params                  jsonb       default '{}',
+    status                  text        default 'queued'
+        constraint query_job_status check ( status in ('queued', 'running', 'done', 'failed', 'cancelled') ),
+    rows                    bigint      default 0,
+    error                   text,
+    created_timestamp       timestamp with time zone     default now(),
+    updated_timestamp       timestamp with time zone     default now(),
+    expires_timestamp       timestamp with time zone
+);
+
+create index query_jobs_expires on query_jobs(expires_timestamp);
+
+create table query_job_results
+(
+    job_id                  text        references query_jobs(id) on delete cascade,
+    seq                     bigint,
+    data                    text,
+    primary key(job_id, seq)
+);
+
 create table queries
 (
     namespace       text references namespaces(name),
@@ -156,7 +297,8 @@ create table queries
     creator         text references users(username),
     created_timestamp   timestamp with time zone     default now(),
     description     text,
-    metadata        jsonb default '{}'
+    metadata        jsonb default '{}',
+    version         bigint default 1          -- incremented on each update, used to invalidate compiled queries
 );
 
 create table parameter_categories
@@ -1 +1,2 @@
-from .filters import MetaCatFilter, standard_filters, load_filters_module
\ No newline at end of file
+from .filters import MetaCatFilter, MetaCatBatchFilter, standard_filters, load_filters_module
+from .cache import FilterCache, filter_cache, configure_filter_cache
@@ -0,0 +1,78 @@
+import threading
+from metacat.util import LRUCache
+
+#
+# Process-wide cache for the data filters look up in external services, e.g. run information by run number.
+#
+# Entries are keyed by (filter name, lookup key) and expire after TTL seconds. The total number of entries is
+# bounded, least recently used entries are evicted first. Negative results can be cached too: the value None
+# is stored and returned as any other value, and get() returns the <default> argument for missing entries.
+#
+
+class FilterCache(object):
+
+    def __init__(self, max_entries=100000, ttl=3600):
+        self.Cache = LRUCache(max_entries, ttl=ttl)
+        self.Lock = threading.Lock()
+        self.Counters = {}          # filter name -> [hits, misses]
+
+    def count(self, filter_name, hits, misses):
+        with self.Lock:
+            counters = self.Counters.setdefault(filter_name, [0, 0])
+            counters[0] += hits
+            counters[1] += misses
+
+    def get(self, filter_name, key, default=None):
+        found, missing = self.get_many(filter_name, [key])
+        return found.get(key, default)
+
+    def get_many(self, filter_name, keys):
+        # returns ({key: value} for found keys, [missing keys])
+        found = {}
+        missing = []
+        marker = object()
+        for key in keys:
+            value = self.Cache.get((filter_name, key), marker)
+            if value is marker:
+                missing.append(key)
+            else:
+                found[key] = value
+        self.count(filter_name, len(found), len(missing))
+        return found, missing
+
+    def put(self, filter_name, key, value):
+        self.Cache.put((filter_name, key), value)
+
+    def put_many(self, filter_name, items):
+        # items: {key: value} or iterable of (key, value)
+        if isinstance(items, dict):
+            items = items.items()
+        for key, value in items:
+            self.Cache.put((filter_name, key), value)
+
+    def flush(self, filter_name=None):
+        # removes entries of the filter or all entries, returns number of removed entries
+        if filter_name is None:
+            n = len(self.Cache)
+            self.Cache.clear()
+        else:
+            # "name" matches "name" and "name:..."
+            prefix = filter_name + ":"
+            n = self.Cache.remove_matching(lambda key: key[0] == filter_name or key[0].startswith(prefix))
+        return n
+
+    def stats(self):
+        stats = self.Cache.stats()
+        with self.Lock:
+            stats["filters"] = {name: {"hits": hits, "misses": misses} for name, (hits, misses) in self.Counters.items()}
+        return stats
+
+_Cache = FilterCache()
+
+def filter_cache():
+    return _Cache
+
+def configure_filter_cache(max_entries=100000, ttl=3600):
+    global _Cache
+    _Cache = FilterCache(max_entries, ttl)
+    return _Cache
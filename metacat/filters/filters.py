@@ -1,6 +1,6 @@
-from metacat.db import DBFileSet
+from metacat.db import DBFileSet, alias
 import random
-from metacat.util import strided, limited, skipped
+from metacat.util import strided, limited, skipped, insert_sql, chunked, prefetched
 
 #
 # Common filters
@@ -49,6 +49,136 @@ class MetaCatFilter(object):
     def filter(self, *params, **kv):
         raise NotImplementedError()
 
+    # overridable
+    def sql(self, inputs, params, kw, columns, ordered=False):
+        #
+        # Optional SQL implementation of the filter, used when all the inputs are SQL queries.
+        # inputs: list of SQL queries for the input file sets
+        # columns(t): returns the list of columns to select from the file set aliased as t
+        # Returns SQL query for the output file set, or None if the filter has to be run in Python.
+        # skip and limit are applied to the returned query by the caller.
+        #
+        return None
+
+    @staticmethod
+    def sql_literal(v):
+        if isinstance(v, str):
+            return "'%s'" % (v.replace("'", "''"),)
+        return repr(v)
+
+    def sql_row_selection(self, input_sql, columns, condition, ordered):
+        # selects rows by their position in the input set, condition is SQL expression of
+        # the 1-based row number column "filter_row"
+        t = alias("t")
+        order = f"order by {t}.id" if ordered else ""
+        return insert_sql(f"""
+            -- {self.__class__.__name__.lower()} {t}
+                select {columns(t)}
+                from (
+                    select {t}.*, row_number() over ({order}) as filter_row
+                    from (
+                        $input_sql
+                    ) {t}
+                ) {t}
+                where {condition}
+                {order}
+            -- end of {self.__class__.__name__.lower()} {t}
+        """, input_sql=input_sql)
+
+class MetaCatBatchFilter(MetaCatFilter):
+    #
+    # Filter processing its single input in chunks. Subclasses implement filter_chunk() and declare
+    # their properties as class (or instance) attributes, which the framework uses to schedule the work:
+    #
+    #   ChunkSize           number of files passed to filter_chunk() at once
+    #   Concurrency         number of chunks processed concurrently. The next input chunk is always
+    #                       read from the database while the current chunks are being processed.
+    #   CPUBound            if True, chunks are processed in a process pool instead of a thread pool.
+    #                       The filter object and the files are pickled, the files without the
+    #                       database connection.
+    #   OrderPreserving     if True, output chunks are returned in the order of the input chunks.
+    #                       Otherwise, in the order they are done.
+    #   LimitPushdownSafe   if True, filter_chunk() returns each input file exactly once, so skip and
+    #                       limit are applied to the input and the rest of the input is not processed
+    #
+
+    ChunkSize = 1000
+    Concurrency = 1
+    CPUBound = False
+    OrderPreserving = True
+    LimitPushdownSafe = False
+
+    def __init__(self, show_config=None):
+        MetaCatFilter.__init__(self, show_config)
+        self.Pool = None
+
+    # overridable
+    def filter_chunk(self, chunk, *params, **kw):
+        # chunk: list of DBFile objects
+        # returns list of output files
+        raise NotImplementedError()
+
+    def __getstate__(self):
+        # the filter is pickled with each chunk sent to the process pool, the pool itself can not be pickled
+        state = self.__dict__.copy()
+        state["Pool"] = None
+        return state
+
+    def pool(self):
+        if self.Pool is None:
+            from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+            self.Pool = ProcessPoolExecutor(self.Concurrency) if self.CPUBound else ThreadPoolExecutor(self.Concurrency)
+        return self.Pool
+
+    def run(self, inputs, params, kw, limit=None, skip=0,
+                ordered=False, with_meta=False, with_provenance=False):
+        assert len(inputs) == 1, "%s filter accepts single input" % (self.__class__.__name__,)
+        file_set = inputs[0]
+        if self.LimitPushdownSafe:
+            file_set = limited(skipped(file_set, skip), limit)
+        chunks = prefetched(chunked(file_set, self.ChunkSize), max(1, self.Concurrency))
+        if self.Concurrency > 1 or self.CPUBound:
+            out_chunks = self.run_concurrently(chunks, params, kw)
+        else:
+            out_chunks = (self.filter_chunk(chunk, *params, **kw) for chunk in chunks)
+        out = (f for chunk in out_chunks for f in chunk)
+        if not self.LimitPushdownSafe:
+            out = limited(skipped(out, skip), limit)
+        return out
+
+    def run_concurrently(self, chunks, params, kw):
+        from concurrent.futures import wait, FIRST_COMPLETED
+        pool = self.pool()
+        running = []            # [(future, input chunk)]
+
+        def result(future, chunk):
+            out = future.result()
+            if self.CPUBound:
+                # files came back from another process without the database connection
+                db = chunk[0].DB if chunk else None
+                for f in out:
+                    f.DB = db
+            return out
+
+        try:
+            for chunk in chunks:
+                running.append((pool.submit(self.filter_chunk, chunk, *params, **kw), chunk))
+                while len(running) >= self.Concurrency:
+                    if self.OrderPreserving:
+                        future, chunk = running.pop(0)
+                        yield result(future, chunk)
+                    else:
+                        done, _ = wait([future for future, _ in running], return_when=FIRST_COMPLETED)
+                        for future, chunk in [(ft, c) for ft, c in running if ft in done]:
+                            yield result(future, chunk)
+                        running = [(ft, c) for ft, c in running if ft not in done]
+            for future, chunk in running:
+                yield result(future, chunk)
+            running = []
+        finally:
+            for future, _ in running:
+                future.cancel()
+
 class Sample(MetaCatFilter):
     """
     Inputs: single file set
@@ -68,6 +198,13 @@ class Sample(MetaCatFilter):
                 x -= 1.0
                 yield f
 
+    def sql(self, inputs, params, kw, columns, ordered=False):
+        if len(inputs) != 1 or len(params) != 1:
+            return None
+        fraction = float(params[0])
+        return self.sql_row_selection(inputs[0], columns,
+            f"floor(filter_row * {fraction}::float8) > floor((filter_row - 1) * {fraction}::float8)", ordered)
+
 class Limit(MetaCatFilter):
     """
     Inputs: single file set
@@ -101,6 +238,12 @@ class Stride(MetaCatFilter):
             if i % modulo == remainder:
                 yield f
             i += 1
+
+    def sql(self, inputs, params, kw, columns, ordered=False):
+        if len(inputs) != 1 or len(params) != 2:
+            return None
+        modulo, remainder = int(params[0]), int(params[1])
+        return self.sql_row_selection(inputs[0], columns, f"(filter_row - 1) % {modulo} = {remainder}", ordered)
             
 class Hash(MetaCatFilter):
     """
@@ -121,6 +264,25 @@ class Hash(MetaCatFilter):
             r = adler32(f.FID.encode("utf-8")) % modulo
             if r == remainder:
                 yield f
+
+    def sql(self, inputs, params, kw, columns, ordered=False):
+        # adler32() is the SQL function defined in schema.sql, it selects exactly the same files as the Python version
+        if len(inputs) != 1 or len(params) != 2:
+            return None
+        modulo, remainder = int(params[0]), int(params[1])
+        t = alias("t")
+        input_sql = inputs[0]
+        order = f"order by {t}.id" if ordered else ""
+        return insert_sql(f"""
+            -- hash {t}
+                select {columns(t)}
+                from (
+                    $input_sql
+                ) {t}
+                where adler32({t}.id) % {modulo} = {remainder}
+                {order}
+            -- end of hash {t}
+        """, input_sql=input_sql)
                 
 class Randomize(MetaCatFilter):
     
@@ -133,6 +295,7 @@ class Randomize(MetaCatFilter):
             file to its randomaized index will be around the window. Default=1000.
     
     Output: Returns the same files as in the input set, but in randomized order.
+        When run in SQL, the whole set is shuffled, ordered by md5 of the file id and the seed.
     """
     
     def filter(self, inputs, seed=None, window=1000, **ignore):
@@ -147,6 +310,27 @@ class Randomize(MetaCatFilter):
         for f in saved:
             if f is not None:
                 yield f
+
+    def sql(self, inputs, params, kw, columns, ordered=False):
+        if len(inputs) != 1 or params or set(kw) - {"seed", "window"}:
+            return None
+        t = alias("t")
+        input_sql = inputs[0]
+        seed = kw.get("seed")
+        if seed is None:
+            order = "random()"
+        else:
+            seed = self.sql_literal(str(seed))
+            order = f"md5({t}.id || {seed})"
+        return insert_sql(f"""
+            -- randomize {t}
+                select {columns(t)}
+                from (
+                    $input_sql
+                ) {t}
+                order by {order}
+            -- end of randomize {t}
+        """, input_sql=input_sql)
             
 class Mix(MetaCatFilter):
     """
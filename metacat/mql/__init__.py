@@ -1 +1,2 @@
 from .mql10 import MQLQuery, MQLSyntaxError, MQLCompilationError, MQLExecutionError, MQLError
+from .mql10 import set_plan_cache_size, clear_plan_cache, plan_cache_stats
@@ -14,9 +14,9 @@ fid_list:  FID ("," FID)*
 
 //?did_list:  did ("," did)*
 
-param_def_list :  param_def ("," param_def)*
+param_def_list :  param_def (_PARAM_DEF_SEP param_def)*
 
-param_def: FNAME "=" constant
+param_def: PARAM_NAME "=" constant
 
 ?meta_exp:   meta_or                                                           
 
@@ -30,7 +30,7 @@ meta_and:   term_meta ( "and" term_meta )*
     | scalar "in" "(" constant_list ")"             -> in_set
     | scalar "not" "in" "(" constant_list ")"       -> not_in_set
     | META_NAME "present"                               -> present                   
-    | META_NAME "not" "present"                         -> not_present                   
+    | META_NAME _NOT_PRESENT                            -> not_present                   
     | constant "in" META_NAME                           -> constant_in
     | constant "not" "in" META_NAME                     -> constant_not_in
     | "(" meta_exp ")"                              
@@ -68,7 +68,25 @@ WORD: LETTER ("_"|LETTER|DIGIT)*
 
 CMPOP:  "<" "="? | "!"? "=" "="? | "!"? "~" "*"? | ">" "="? | "like"            //# like is not implemented yet
 
-BOOL: "true"i | "false"i
+//
+// Terminals below use lookaheads so that they can be recognized by the LALR parser
+// with contextual lexer, which looks only one token ahead.
+// A number or a boolean followed by characters allowed in an unquoted string is an unquoted string.
+//
+BOOL.2: /(true|false)(?![a-z0-9$@_.-])/i
+SIGNED_INT.2: /[+-]?[0-9]+(?![a-z0-9$@_.-])/i
+SIGNED_FLOAT.2: /[+-]?([0-9]+e[+-]?[0-9]+|([0-9]+\.[0-9]*|\.[0-9]+)(e[+-]?[0-9]+)?)(?![a-z0-9$@_.-])/i
+
+_NOT_PRESENT.2: /not\s+present(?![a-z0-9_])/
+
+// parameter name in filter parameters list
+PARAM_NAME.2: /[a-z_][a-z0-9_]*(?=\s*=)/i
+
+// comma, separating parameters list and named parameters of a filter
+_PARAM_DEF_SEP.2: /,(?=\s*[a-z_][a-z0-9_]*\s*=)/i
+
+// comma, separating file queries in a list, as opposed to a comma inside dataset, file or fid list
+_QUERY_SEP.2: /,(?=\s*((files?|fids?|filter|union|join|parents|children|ancestors|descendants)(?![a-z0-9_.\/:-])|[(\[{]|depth\s*=))/
 
 STRING : /("(?!"").*?(?<!\\\\)(\\\\\\\\)*?"|'(?!'').*?(?<!\\\\)(\\\\\\\\)*?')/i
 SAFE_CHARACTER : /[a-z0-9$@_.-]/i
@@ -77,8 +95,6 @@ PATTERN_CHARACTER : (SAFE_CHARACTER|/[*?^%]/)
 PATTERN : PATTERN_CHARACTER+
 
 %import common.CNAME
-%import common.SIGNED_INT
-%import common.SIGNED_FLOAT
 
 %import common.WS
 %import common.LETTER
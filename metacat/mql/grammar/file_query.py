@@ -2,22 +2,30 @@ FileQuery = """
 
 top_file_query          :    file_query
 
-?file_query: meta_filter                                  
-    | file_query "-" meta_filter                          -> minus
+// The grammar is LALR(1): "-" is left-associative, "where" applies to the preceding term, and
+// "limit", "skip" and "ordered" apply to the whole file query preceding them
 
-?meta_filter: file_query_exression "where" meta_exp     
-    |   file_query_exression                             
+?file_query: file_query_exression
+    |   file_query "-" file_query_exression             -> minus
+    |   file_query_postfix
+    |   file_query_postfix "where" meta_exp              -> meta_filter
 
-?file_query_exression:  file_query_term                   
+?file_query_postfix: file_query "limit" SIGNED_INT     -> limit
+    |   file_query "skip" SIGNED_INT                     -> skip
+    |   file_query "ordered"                             -> ordered
+
+?file_query_exression:  file_query_primary
+    |   file_query_primary "where" meta_exp              -> meta_filter
+
+?file_query_primary:  file_query_term                   
     |   "union" "(" file_query_list ")"                  -> union
     |   "[" file_query_list "]"                          -> union
     |   "join"  "(" file_query_list ")"                  -> join
     |   "{" file_query_list "}"                          -> join
     |   "parents" "(" file_query ")"                     -> parents_of
     |   "children" "(" file_query ")"                    -> children_of
-    |   file_query "limit" SIGNED_INT                    -> limit              
-    |   file_query "skip" SIGNED_INT                     -> skip
-    |   file_query "ordered"                             -> ordered
+    |   "ancestors" "(" file_query (_QUERY_SEP "depth" "=" SIGNED_INT)? ")"     -> ancestors_of
+    |   "descendants" "(" file_query (_QUERY_SEP "depth" "=" SIGNED_INT)? ")"   -> descendants_of
     |   "(" file_query ")"           
 
 file_query_term: "files" ("from" "datasets"? dataset_query_list)?                   -> basic_file_query
@@ -29,11 +37,11 @@ file_query_term: "files" ("from" "datasets"? dataset_query_list)?
     |   ("files"|"file") qualified_name_list
 
 filter_params : params_list
-    |   (params_list ",")? param_def_list
+    |   (params_list _PARAM_DEF_SEP)? param_def_list
 
 params_list : constant_list         // convert date, datetime to floats
 
-file_query_list: file_query ("," file_query)*     
+file_query_list: file_query (_QUERY_SEP file_query)*     
 
 // file attributes
 FILE_ATTR_NAME: ("id" | "namespace" | "name" | "creator" | "updated_by" | "created_timestamp" | "updated_timestamp" | "retired" | "retired_by" | "retired_timestamp" )
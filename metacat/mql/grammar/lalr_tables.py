@@ -0,0 +1,9 @@
+#
+# Generated by tools/mql_lalr_tables.py with Lark 1.3.1. Do not edit.
+#
+
+GrammarHash = '98c645d9553f260da954d80bf625a1f6a5a5efa4'
+
+DATA = {'parser': {'lexer_conf': {'terminals': [{'@': 0}, {'@': 1}, {'@': 2}, {'@': 3}, {'@': 4}, {'@': 5}, {'@': 6}, {'@': 7}, {'@': 8}, {'@': 9}, {'@': 10}, {'@': 11}, {'@': 12}, {'@': 13}, {'@': 14}, {'@': 15}, {'@': 16}, {'@': 17}, {'@': 18}, {'@': 19}, {'@': 20}, {'@': 21}, {'@': 22}, {'@': 23}, {'@': 24}, {'@': 25}, {'@': 26}, {'@': 27}, {'@': 28}, {'@': 29}, {'@': 30}, {'@': 31}, {'@': 32}, {'@': 33}, {'@': 34}, {'@': 35}, {'@': 36}, {'@': 37}, {'@': 38}, {'@': 39}, {'@': 40}, {'@': 41}, {'@': 42}, {'@': 43}, {'@': 44}, {'@': 45}, {'@': 46}, {'@': 47}, {'@': 48}, {'@': 49}, {'@': 50}, {'@': 51}, {'@': 52}, {'@': 53}, {'@': 54}, {'@': 55}, {'@': 56}, {'@': 57}, {'@': 58}, {'@': 59}, {'@': 60}, {'@': 61}, {'@': 62}, {'@': 63}, {'@': 64}], 'ignore': ['WS'], 'g_regex_flags': 0, 'use_bytes': False, 'lexer_type': 'contextual', '__type__': 'LexerConf'}, 'parser_conf': {'rules': [{'@': 65}, {'@': 66}, {'@': 67}, {'@': 68}, {'@': 69}, {'@': 70}, {'@': 71}, {'@': 72}, {'@': 73}, {'@': 74}, {'@': 75}, {'@': 76}, {'@': 77}, {'@': 78}, {'@': 79}, {'@': 80}, {'@': 81}, {'@': 82}, {'@': 83}, {'@': 84}, {'@': 85}, {'@': 86}, {'@': 87}, {'@': 88}, {'@': 89}, {'@': 90}, {'@': 91}, {'@': 92}, {'@': 93}, {'@': 94}, {'@': 95}, {'@': 96}, {'@': 97}, {'@': 98}, {'@': 99}, {'@': 100}, {'@': 101}, {'@': 102}, {'@': 103}, {'@': 104}, {'@': 105}, {'@': 106}, {'@': 107}, {'@': 108}, {'@': 109}, {'@': 110}, {'@': 111}, {'@': 112}, {'@': 113}, {'@': 114}, {'@': 115}, {'@': 116}, {'@': 117}, {'@': 118}, {'@': 119}, {'@': 120}, {'@': 121}, {'@': 122}, {'@': 123}, {'@': 124}, {'@': 125}, {'@': 126}, {'@': 127}, {'@': 128}, {'@': 129}, {'@': 130}, {'@': 131}, {'@': 132}, {'@': 133}, {'@': 134}, {'@': 135}, {'@': 136}, {'@': 137}, {'@': 138}, {'@': 139}, {'@': 140}, {'@': 141}, {'@': 142}, {'@': 143}, {'@': 144}, {'@': 145}, {'@': 146}, {'@': 147}, {'@': 148}, {'@': 149}, {'@': 150}, {'@': 151}, {'@': 152}, {'@': 153}, {'@': 154}, {'@': 155}, {'@': 156}, {'@': 157}, {'@': 158}, {'@': 159}, {'@': 160}, {'@': 161}, {'@': 162}, {'@': 163}, {'@': 164}, {'@': 165}, {'@': 166}, {'@': 167}, {'@': 168}, {'@': 169}, {'@': 170}, {'@': 171}, {'@': 172}, {'@': 173}, {'@': 174}, {'@': 175}, {'@': 176}, {'@': 177}, {'@': 178}, {'@': 179}, {'@': 180}, {'@': 181}, {'@': 182}, {'@': 183}, {'@': 184}, {'@': 185}, {'@': 186}, {'@': 187}, {'@': 188}, {'@': 189}, {'@': 190}, {'@': 191}, {'@': 192}], 'start': ['query'], 'parser_type': 'lalr', '__type__': 'ParserConf'}, 'parser': {'tokens': {0: 'FNAME', 1: 'qualified_name', 2: 'fid_list', 3: 'FID', 4: 'COMMA', 5: 'WITH', 6: 'HAVING', 7: '$END', 8: '_QUERY_SEP', 9: 'SKIP', 10: 'ORDERED', 11: 'LIMIT', 12: 'WHERE', 13: 'MINUS', 14: 'RBRACE', 15: 'RSQB', 16: 'RPAR', 17: '_PARAM_DEF_SEP', 18: 'NOT', 19: 'IN', 20: 'OR', 21: 'AND', 22: 'COLON', 23: 'LPAR', 24: 'file_query', 25: 'PARENTS', 26: 'FILES', 27: 'file_query_postfix', 28: 'FILE', 29: 'file_query_primary', 30: 'LSQB', 31: '__ANON_0', 32: 'FILTER', 33: 'file_query_exression', 34: 'DESCENDANTS', 35: 'FIDS', 36: 'JOIN', 37: 'file_query_list', 38: 'ANCESTORS', 39: 'UNION', 40: 'LBRACE', 41: 'file_query_term', 42: 'file_list', 43: 'CHILDREN', 44: 'SIGNED_INT', 45: 'DATETIME', 46: 'DATE', 47: 'BOOL', 48: 'SIGNED_FLOAT', 49: 'constant', 50: 'UNQUOTED_STRING', 51: 'STRING', 52: 'PARAM_NAME', 53: 'params_list', 54: 'param_def', 55: 'constant_list', 56: 'filter_params', 57: 'param_def_list', 58: 'CMPOP', 59: 'dataset_query_with_subsets', 60: 'MATCHING', 61: 'did', 62: 'dataset_query_list', 63: 'dataset_query', 64: 'dataset_spec', 65: 'meta_and', 66: 'scalar', 67: 'META_NAME', 68: 'meta_exp', 69: 'BANG', 70: 'EXISTS', 71: 'term_meta', 72: 'meta_or', 73: 'LEN', 74: 'OBJECT_ATTRIBUTE', 75: 'EQUAL', 76: '__meta_and_star_4', 77: '__fid_list_star_1', 78: 'regexp_pattern', 79: 'query_name_match', 80: 'sql_pattern', 81: 'REGEXP', 82: '__dataset_query_list_star_7', 83: '__file_query_list_star_6', 84: 'SUBSETS', 85: 'ANY', 86: 'ALL', 87: '__constant_list_star_5', 88: 'QUERIES', 89: 'query', 90: 'top_dataset_query', 91: 'top_file_query', 92: 'DATASETS', 93: 'top_query_query', 94: '__qualified_name_list_star_0', 95: 'BY', 96: 'DEPTH', 97: 'dataset_provenance_op', 98: 'qualified_name_list', 99: '_NOT_PRESENT', 100: 'PRESENT', 101: 'PATTERN', 102: '__param_def_list_star_2', 103: 'FROM', 104: 'SELECTED', 105: 'RECURSIVELY', 106: '__meta_or_star_3'}, 'states': {0: {0: (0, 120), 1: (0, 189)}, 1: {2: (0, 182), 3: (0, 83)}, 2: {4: (1, {'@': 167}), 5: (1, {'@': 167}), 6: (1, {'@': 167}), 7: (1, {'@': 167}), 8: (1, {'@': 167}), 9: (1, {'@': 167}), 10: (1, {'@': 167}), 11: (1, {'@': 167}), 12: (1, {'@': 167}), 13: (1, {'@': 167}), 14: (1, {'@': 167}), 15: (1, {'@': 167}), 16: (1, {'@': 167})}, 3: {7: (1, {'@': 171})}, 4: {17: (1, {'@': 111}), 16: (1, {'@': 111}), 4: (1, {'@': 111}), 18: (1, {'@': 111}), 19: (1, {'@': 111}), 20: (1, {'@': 111}), 10: (1, {'@': 111}), 11: (1, {'@': 111}), 12: (1, {'@': 111}), 13: (1, {'@': 111}), 14: (1, {'@': 111}), 7: (1, {'@': 111}), 21: (1, {'@': 111}), 9: (1, {'@': 111}), 15: (1, {'@': 111}), 8: (1, {'@': 111}), 22: (1, {'@': 111})}, 5: {11: (1, {'@': 135}), 10: (1, {'@': 135}), 13: (1, {'@': 135}), 14: (1, {'@': 135}), 9: (1, {'@': 135}), 8: (1, {'@': 135}), 12: (1, {'@': 135}), 15: (1, {'@': 135}), 16: (1, {'@': 135}), 7: (1, {'@': 135})}, 6: {15: (0, 114)}, 7: {11: (1, {'@': 134}), 10: (1, {'@': 134}), 13: (1, {'@': 134}), 14: (1, {'@': 134}), 9: (1, {'@': 134}), 8: (1, {'@': 134}), 12: (1, {'@': 134}), 15: (1, {'@': 134}), 16: (1, {'@': 134}), 7: (1, {'@': 134})}, 8: {11: (1, {'@': 131}), 10: (1, {'@': 131}), 13: (1, {'@': 131}), 14: (1, {'@': 131}), 9: (1, {'@': 131}), 8: (1, {'@': 131}), 12: (1, {'@': 131}), 15: (1, {'@': 131}), 16: (1, {'@': 131}), 7: (1, {'@': 131})}, 9: {22: (0, 86)}, 10: {4: (1, {'@': 91}), 8: (1, {'@': 91}), 21: (1, {'@': 91}), 20: (1, {'@': 91}), 9: (1, {'@': 91}), 10: (1, {'@': 91}), 11: (1, {'@': 91}), 12: (1, {'@': 91}), 13: (1, {'@': 91}), 14: (1, {'@': 91}), 15: (1, {'@': 91}), 16: (1, {'@': 91}), 7: (1, {'@': 91})}, 11: {10: (0, 190), 9: (0, 18), 16: (0, 238), 11: (0, 256), 13: (0, 46)}, 12: {16: (0, 54)}, 13: {23: (0, 203)}, 14: {24: (0, 132), 25: (0, 63), 26: (0, 240), 27: (0, 44), 28: (0, 202), 29: (0, 47), 30: (0, 40), 31: (0, 1), 32: (0, 199), 33: (0, 21), 34: (0, 13), 35: (0, 217), 36: (0, 53), 37: (0, 149), 38: (0, 232), 39: (0, 260), 40: (0, 14), 41: (0, 209), 42: (0, 248), 23: (0, 169), 43: (0, 212)}, 15: {11: (1, {'@': 140}), 10: (1, {'@': 140}), 13: (1, {'@': 140}), 14: (1, {'@': 140}), 9: (1, {'@': 140}), 8: (1, {'@': 140}), 12: (1, {'@': 140}), 15: (1, {'@': 140}), 16: (1, {'@': 140}), 7: (1, {'@': 140})}, 16: {10: (0, 190), 9: (0, 18), 11: (0, 256), 13: (0, 46), 14: (1, {'@': 189}), 15: (1, {'@': 189}), 16: (1, {'@': 189}), 8: (1, {'@': 189})}, 17: {20: (1, {'@': 185}), 10: (1, {'@': 185}), 11: (1, {'@': 185}), 12: (1, {'@': 185}), 13: (1, {'@': 185}), 14: (1, {'@': 185}), 7: (1, {'@': 185}), 4: (1, {'@': 185}), 21: (1, {'@': 185}), 9: (1, {'@': 185}), 15: (1, {'@': 185}), 16: (1, {'@': 185}), 8: (1, {'@': 185})}, 18: {44: (0, 141)}, 19: {11: (1, {'@': 128}), 10: (1, {'@': 128}), 13: (1, {'@': 128}), 14: (1, {'@': 128}), 9: (1, {'@': 128}), 8: (1, {'@': 128}), 12: (1, {'@': 128}), 15: (1, {'@': 128}), 16: (1, {'@': 128}), 7: (1, {'@': 128})}, 20: {16: (0, 7)}, 21: {9: (1, {'@': 118}), 10: (1, {'@': 118}), 11: (1, {'@': 118}), 13: (1, {'@': 118}), 14: (1, {'@': 118}), 8: (1, {'@': 118}), 15: (1, {'@': 118}), 16: (1, {'@': 118}), 7: (1, {'@': 118})}, 22: {11: (1, {'@': 129}), 10: (1, {'@': 129}), 13: (1, {'@': 129}), 14: (1, {'@': 129}), 9: (1, {'@': 129}), 8: (1, {'@': 129}), 12: (1, {'@': 129}), 15: (1, {'@': 129}), 16: (1, {'@': 129}), 7: (1, {'@': 129})}, 23: {45: (0, 204), 46: (0, 237), 47: (0, 107), 48: (0, 224), 44: (0, 219), 49: (0, 252), 50: (0, 60), 51: (0, 188)}, 24: {52: (0, 42), 46: (0, 237), 48: (0, 224), 53: (0, 27), 49: (0, 152), 44: (0, 219), 45: (0, 204), 54: (0, 226), 16: (0, 34), 50: (0, 60), 55: (0, 108), 56: (0, 29), 47: (0, 107), 57: (0, 259), 51: (0, 188)}, 25: {18: (1, {'@': 99}), 19: (1, {'@': 99}), 58: (1, {'@': 99})}, 26: {59: (0, 33), 60: (0, 241), 61: (0, 145), 62: (0, 227), 63: (0, 129), 64: (0, 187), 0: (0, 163)}, 27: {17: (0, 69), 16: (1, {'@': 151})}, 28: {17: (1, {'@': 181}), 16: (1, {'@': 181})}, 29: {16: (0, 61)}, 30: {4: (1, {'@': 72}), 5: (1, {'@': 72}), 6: (1, {'@': 72}), 7: (1, {'@': 72}), 8: (1, {'@': 72}), 9: (1, {'@': 72}), 10: (1, {'@': 72}), 11: (1, {'@': 72}), 12: (1, {'@': 72}), 13: (1, {'@': 72}), 14: (1, {'@': 72}), 15: (1, {'@': 72}), 16: (1, {'@': 72})}, 31: {4: (0, 52), 16: (0, 100)}, 32: {20: (1, {'@': 184}), 10: (1, {'@': 184}), 11: (1, {'@': 184}), 12: (1, {'@': 184}), 13: (1, {'@': 184}), 14: (1, {'@': 184}), 7: (1, {'@': 184}), 4: (1, {'@': 184}), 9: (1, {'@': 184}), 15: (1, {'@': 184}), 16: (1, {'@': 184}), 8: (1, {'@': 184})}, 33: {6: (0, 37), 4: (1, {'@': 160}), 7: (1, {'@': 160}), 8: (1, {'@': 160}), 9: (1, {'@': 160}), 10: (1, {'@': 160}), 11: (1, {'@': 160}), 12: (1, {'@': 160}), 13: (1, {'@': 160}), 14: (1, {'@': 160}), 15: (1, {'@': 160}), 16: (1, {'@': 160})}, 34: {23: (0, 79)}, 35: {15: (0, 72)}, 36: {4: (1, {'@': 92}), 8: (1, {'@': 92}), 21: (1, {'@': 92}), 20: (1, {'@': 92}), 9: (1, {'@': 92}), 10: (1, {'@': 92}), 11: (1, {'@': 92}), 12: (1, {'@': 92}), 13: (1, {'@': 92}), 14: (1, {'@': 92}), 15: (1, {'@': 92}), 16: (1, {'@': 92}), 7: (1, {'@': 92})}, 37: {65: (0, 261), 46: (0, 237), 66: (0, 233), 48: (0, 224), 44: (0, 219), 67: (0, 207), 45: (0, 204), 23: (0, 194), 68: (0, 161), 50: (0, 60), 69: (0, 183), 70: (0, 81), 49: (0, 150), 71: (0, 71), 72: (0, 126), 73: (0, 67), 74: (0, 111), 47: (0, 107), 51: (0, 188)}, 38: {16: (0, 91)}, 39: {17: (1, {'@': 114}), 16: (1, {'@': 114}), 4: (1, {'@': 114}), 18: (1, {'@': 114}), 19: (1, {'@': 114}), 20: (1, {'@': 114}), 10: (1, {'@': 114}), 11: (1, {'@': 114}), 12: (1, {'@': 114}), 13: (1, {'@': 114}), 14: (1, {'@': 114}), 7: (1, {'@': 114}), 21: (1, {'@': 114}), 9: (1, {'@': 114}), 15: (1, {'@': 114}), 8: (1, {'@': 114}), 22: (1, {'@': 114})}, 40: {24: (0, 132), 25: (0, 63), 26: (0, 240), 27: (0, 44), 28: (0, 202), 29: (0, 47), 30: (0, 40), 31: (0, 1), 32: (0, 199), 33: (0, 21), 34: (0, 13), 35: (0, 217), 36: (0, 53), 38: (0, 232), 39: (0, 260), 40: (0, 14), 41: (0, 209), 42: (0, 248), 37: (0, 160), 23: (0, 169), 43: (0, 212)}, 41: {17: (1, {'@': 182}), 16: (1, {'@': 182})}, 42: {75: (0, 23)}, 43: {15: (0, 73)}, 44: {12: (0, 218), 9: (1, {'@': 120}), 10: (1, {'@': 120}), 11: (1, {'@': 120}), 13: (1, {'@': 120}), 14: (1, {'@': 120}), 8: (1, {'@': 120}), 15: (1, {'@': 120}), 16: (1, {'@': 120}), 7: (1, {'@': 120})}, 45: {16: (0, 140)}, 46: {25: (0, 63), 26: (0, 240), 28: (0, 202), 29: (0, 47), 30: (0, 40), 31: (0, 1), 32: (0, 199), 34: (0, 13), 35: (0, 217), 36: (0, 53), 38: (0, 232), 39: (0, 260), 40: (0, 14), 41: (0, 209), 42: (0, 248), 23: (0, 169), 43: (0, 212), 33: (0, 106)}, 47: {12: (0, 257), 11: (1, {'@': 125}), 13: (1, {'@': 125}), 14: (1, {'@': 125}), 9: (1, {'@': 125}), 8: (1, {'@': 125}), 10: (1, {'@': 125}), 15: (1, {'@': 125}), 7: (1, {'@': 125}), 16: (1, {'@': 125})}, 48: {10: (1, {'@': 191}), 11: (1, {'@': 191}), 12: (1, {'@': 191}), 13: (1, {'@': 191}), 14: (1, {'@': 191}), 7: (1, {'@': 191}), 4: (1, {'@': 191}), 9: (1, {'@': 191}), 15: (1, {'@': 191}), 16: (1, {'@': 191}), 8: (1, {'@': 191})}, 49: {4: (1, {'@': 85}), 8: (1, {'@': 85}), 21: (1, {'@': 85}), 20: (1, {'@': 85}), 9: (1, {'@': 85}), 10: (1, {'@': 85}), 11: (1, {'@': 85}), 12: (1, {'@': 85}), 13: (1, {'@': 85}), 14: (1, {'@': 85}), 15: (1, {'@': 85}), 16: (1, {'@': 85}), 7: (1, {'@': 85})}, 50: {12: (0, 223), 60: (0, 128), 7: (1, {'@': 174})}, 51: {4: (1, {'@': 93}), 8: (1, {'@': 93}), 21: (1, {'@': 93}), 20: (1, {'@': 93}), 9: (1, {'@': 93}), 10: (1, {'@': 93}), 11: (1, {'@': 93}), 12: (1, {'@': 93}), 13: (1, {'@': 93}), 14: (1, {'@': 93}), 15: (1, {'@': 93}), 16: (1, {'@': 93}), 7: (1, {'@': 93})}, 52: {50: (0, 255), 51: (0, 179)}, 53: {23: (0, 138)}, 54: {11: (1, {'@': 136}), 10: (1, {'@': 136}), 13: (1, {'@': 136}), 14: (1, {'@': 136}), 9: (1, {'@': 136}), 8: (1, {'@': 136}), 12: (1, {'@': 136}), 15: (1, {'@': 136}), 16: (1, {'@': 136}), 7: (1, {'@': 136})}, 55: {71: (0, 258), 46: (0, 237), 66: (0, 233), 48: (0, 224), 44: (0, 219), 67: (0, 207), 45: (0, 204), 23: (0, 194), 50: (0, 60), 69: (0, 183), 70: (0, 81), 49: (0, 150), 73: (0, 67), 74: (0, 111), 47: (0, 107), 51: (0, 188)}, 56: {7: (1, {'@': 169}), 12: (1, {'@': 169}), 10: (1, {'@': 169}), 11: (1, {'@': 169}), 13: (1, {'@': 169}), 14: (1, {'@': 169}), 5: (1, {'@': 169}), 4: (1, {'@': 169}), 9: (1, {'@': 169}), 6: (1, {'@': 169}), 15: (1, {'@': 169}), 16: (1, {'@': 169}), 8: (1, {'@': 169})}, 57: {10: (0, 190), 9: (0, 18), 11: (0, 256), 16: (0, 78), 13: (0, 46)}, 58: {19: (0, 254)}, 59: {17: (1, {'@': 115}), 16: (1, {'@': 115}), 4: (1, {'@': 115}), 18: (1, {'@': 115}), 19: (1, {'@': 115}), 20: (1, {'@': 115}), 10: (1, {'@': 115}), 11: (1, {'@': 115}), 12: (1, {'@': 115}), 13: (1, {'@': 115}), 14: (1, {'@': 115}), 7: (1, {'@': 115}), 21: (1, {'@': 115}), 9: (1, {'@': 115}), 15: (1, {'@': 115}), 8: (1, {'@': 115}), 22: (1, {'@': 115})}, 60: {17: (1, {'@': 108}), 16: (1, {'@': 108}), 4: (1, {'@': 108}), 18: (1, {'@': 108}), 19: (1, {'@': 108}), 20: (1, {'@': 108}), 10: (1, {'@': 108}), 11: (1, {'@': 108}), 12: (1, {'@': 108}), 13: (1, {'@': 108}), 14: (1, {'@': 108}), 7: (1, {'@': 108}), 21: (1, {'@': 108}), 9: (1, {'@': 108}), 15: (1, {'@': 108}), 8: (1, {'@': 108}), 22: (1, {'@': 108})}, 61: {23: (0, 193)}, 62: {16: (0, 168)}, 63: {23: (0, 74)}, 64: {65: (0, 261), 68: (0, 3), 46: (0, 237), 66: (0, 233), 48: (0, 224), 44: (0, 219), 67: (0, 207), 45: (0, 204), 23: (0, 194), 50: (0, 60), 69: (0, 183), 70: (0, 81), 49: (0, 150), 71: (0, 71), 72: (0, 126), 73: (0, 67), 74: (0, 111), 47: (0, 107), 51: (0, 188)}, 65: {10: (0, 190), 9: (0, 18), 11: (0, 256), 13: (0, 46), 14: (1, {'@': 190}), 15: (1, {'@': 190}), 16: (1, {'@': 190}), 8: (1, {'@': 190})}, 66: {17: (0, 123), 16: (1, {'@': 75})}, 67: {23: (0, 98)}, 68: {10: (1, {'@': 180}), 11: (1, {'@': 180}), 12: (1, {'@': 180}), 13: (1, {'@': 180}), 14: (1, {'@': 180}), 7: (1, {'@': 180}), 4: (1, {'@': 180}), 9: (1, {'@': 180}), 15: (1, {'@': 180}), 16: (1, {'@': 180}), 8: (1, {'@': 180})}, 69: {54: (0, 226), 52: (0, 42), 57: (0, 112)}, 70: {24: (0, 185), 25: (0, 63), 26: (0, 240), 27: (0, 44), 28: (0, 202), 29: (0, 47), 30: (0, 40), 31: (0, 1), 32: (0, 199), 33: (0, 21), 34: (0, 13), 35: (0, 217), 36: (0, 53), 38: (0, 232), 39: (0, 260), 40: (0, 14), 41: (0, 209), 42: (0, 248), 23: (0, 169), 43: (0, 212)}, 71: {76: (0, 77), 21: (0, 167), 4: (1, {'@': 82}), 20: (1, {'@': 82}), 9: (1, {'@': 82}), 10: (1, {'@': 82}), 11: (1, {'@': 82}), 12: (1, {'@': 82}), 13: (1, {'@': 82}), 14: (1, {'@': 82}), 7: (1, {'@': 82}), 15: (1, {'@': 82}), 16: (1, {'@': 82}), 8: (1, {'@': 82})}, 72: {18: (1, {'@': 98}), 19: (1, {'@': 98}), 58: (1, {'@': 98})}, 73: {18: (1, {'@': 97}), 19: (1, {'@': 97}), 58: (1, {'@': 97})}, 74: {24: (0, 11), 25: (0, 63), 26: (0, 240), 27: (0, 44), 28: (0, 202), 29: (0, 47), 30: (0, 40), 31: (0, 1), 32: (0, 199), 33: (0, 21), 34: (0, 13), 35: (0, 217), 36: (0, 53), 38: (0, 232), 39: (0, 260), 40: (0, 14), 41: (0, 209), 42: (0, 248), 23: (0, 169), 43: (0, 212)}, 75: {10: (0, 190), 9: (0, 18), 11: (0, 256), 16: (0, 5), 13: (0, 46), 8: (0, 176)}, 76: {45: (0, 204), 46: (0, 237), 47: (0, 107), 48: (0, 224), 49: (0, 152), 44: (0, 219), 50: (0, 60), 51: (0, 188), 55: (0, 62)}, 77: {21: (0, 55), 4: (1, {'@': 81}), 20: (1, {'@': 81}), 9: (1, {'@': 81}), 10: (1, {'@': 81}), 11: (1, {'@': 81}), 12: (1, {'@': 81}), 13: (1, {'@': 81}), 14: (1, {'@': 81}), 7: (1, {'@': 81}), 15: (1, {'@': 81}), 16: (1, {'@': 81}), 8: (1, {'@': 81})}, 78: {11: (1, {'@': 138}), 10: (1, {'@': 138}), 13: (1, {'@': 138}), 14: (1, {'@': 138}), 9: (1, {'@': 138}), 8: (1, {'@': 138}), 12: (1, {'@': 138}), 15: (1, {'@': 138}), 16: (1, {'@': 138}), 7: (1, {'@': 138})}, 79: {24: (0, 132), 25: (0, 63), 26: (0, 240), 27: (0, 44), 28: (0, 202), 29: (0, 47), 30: (0, 40), 31: (0, 1), 32: (0, 199), 33: (0, 21), 34: (0, 13), 35: (0, 217), 36: (0, 53), 38: (0, 232), 37: (0, 144), 39: (0, 260), 40: (0, 14), 41: (0, 209), 42: (0, 248), 23: (0, 169), 43: (0, 212)}, 80: {24: (0, 132), 25: (0, 63), 26: (0, 240), 27: (0, 44), 28: (0, 202), 29: (0, 47), 30: (0, 40), 31: (0, 1), 32: (0, 199), 33: (0, 21), 34: (0, 13), 35: (0, 217), 36: (0, 53), 38: (0, 232), 39: (0, 260), 40: (0, 14), 41: (0, 209), 42: (0, 248), 23: (0, 169), 43: (0, 212), 37: (0, 158)}, 81: {51: (0, 146)}, 82: {22: (0, 229)}, 83: {77: (0, 253), 4: (0, 151), 10: (1, {'@': 74}), 11: (1, {'@': 74}), 12: (1, {'@': 74}), 13: (1, {'@': 74}), 14: (1, {'@': 74}), 7: (1, {'@': 74}), 9: (1, {'@': 74}), 15: (1, {'@': 74}), 16: (1, {'@': 74}), 8: (1, {'@': 74})}, 84: {16: (0, 175)}, 85: {45: (0, 204), 46: (0, 237), 47: (0, 107), 48: (0, 224), 44: (0, 219), 50: (0, 60), 51: (0, 188), 49: (0, 122)}, 86: {45: (0, 204), 46: (0, 237), 47: (0, 107), 48: (0, 224), 49: (0, 181), 44: (0, 219), 50: (0, 60), 51: (0, 188)}, 87: {11: (1, {'@': 145}), 10: (1, {'@': 145}), 13: (1, {'@': 145}), 14: (1, {'@': 145}), 9: (1, {'@': 145}), 8: (1, {'@': 145}), 12: (1, {'@': 145}), 15: (1, {'@': 145}), 16: (1, {'@': 145}), 7: (1, {'@': 145})}, 88: {10: (1, {'@': 177}), 11: (1, {'@': 177}), 12: (1, {'@': 177}), 13: (1, {'@': 177}), 14: (1, {'@': 177}), 7: (1, {'@': 177}), 4: (1, {'@': 177}), 9: (1, {'@': 177}), 15: (1, {'@': 177}), 16: (1, {'@': 177}), 8: (1, {'@': 177})}, 89: {10: (1, {'@': 179}), 11: (1, {'@': 179}), 12: (1, {'@': 179}), 13: (1, {'@': 179}), 14: (1, {'@': 179}), 7: (1, {'@': 179}), 4: (1, {'@': 179}), 9: (1, {'@': 179}), 15: (1, {'@': 179}), 16: (1, {'@': 179}), 8: (1, {'@': 179})}, 90: {7: (1, {'@': 173})}, 91: {17: (1, {'@': 110}), 16: (1, {'@': 110}), 4: (1, {'@': 110}), 18: (1, {'@': 110}), 19: (1, {'@': 110}), 20: (1, {'@': 110}), 10: (1, {'@': 110}), 11: (1, {'@': 110}), 12: (1, {'@': 110}), 13: (1, {'@': 110}), 14: (1, {'@': 110}), 7: (1, {'@': 110}), 21: (1, {'@': 110}), 9: (1, {'@': 110}), 15: (1, {'@': 110}), 8: (1, {'@': 110}), 22: (1, {'@': 110})}, 92: {4: (0, 121), 10: (1, {'@': 70}), 11: (1, {'@': 70}), 12: (1, {'@': 70}), 13: (1, {'@': 70}), 14: (1, {'@': 70}), 7: (1, {'@': 70}), 9: (1, {'@': 70}), 15: (1, {'@': 70}), 16: (1, {'@': 70}), 8: (1, {'@': 70})}, 93: {10: (0, 190), 9: (0, 18), 11: (0, 256), 16: (0, 195), 13: (0, 46), 8: (0, 186)}, 94: {16: (0, 36)}, 95: {45: (0, 204), 46: (0, 237), 47: (0, 107), 48: (0, 224), 44: (0, 219), 49: (0, 222), 50: (0, 60), 51: (0, 188)}, 96: {4: (1, {'@': 187}), 16: (1, {'@': 187}), 17: (1, {'@': 187})}, 97: {59: (0, 33), 60: (0, 241), 61: (0, 145), 63: (0, 129), 64: (0, 187), 0: (0, 163), 62: (0, 246)}, 98: {67: (0, 214)}, 99: {24: (0, 65), 25: (0, 63), 26: (0, 240), 27: (0, 44), 28: (0, 202), 29: (0, 47), 30: (0, 40), 31: (0, 1), 32: (0, 199), 33: (0, 21), 34: (0, 13), 35: (0, 217), 36: (0, 53), 38: (0, 232), 39: (0, 260), 40: (0, 14), 41: (0, 209), 42: (0, 248), 23: (0, 169), 43: (0, 212)}, 100: {17: (1, {'@': 116}), 16: (1, {'@': 116}), 4: (1, {'@': 116}), 18: (1, {'@': 116}), 19: (1, {'@': 116}), 20: (1, {'@': 116}), 10: (1, {'@': 116}), 11: (1, {'@': 116}), 12: (1, {'@': 116}), 13: (1, {'@': 116}), 14: (1, {'@': 116}), 7: (1, {'@': 116}), 21: (1, {'@': 116}), 9: (1, {'@': 116}), 15: (1, {'@': 116}), 8: (1, {'@': 116}), 22: (1, {'@': 116})}, 101: {51: (0, 45), 50: (0, 38)}, 102: {4: (0, 95), 17: (1, {'@': 102}), 16: (1, {'@': 102})}, 103: {0: (0, 159), 78: (0, 143)}, 104: {10: (1, {'@': 170}), 11: (1, {'@': 170}), 12: (1, {'@': 170}), 13: (1, {'@': 170}), 14: (1, {'@': 170}), 5: (1, {'@': 170}), 7: (1, {'@': 170}), 4: (1, {'@': 170}), 9: (1, {'@': 170}), 6: (1, {'@': 170}), 15: (1, {'@': 170}), 16: (1, {'@': 170}), 8: (1, {'@': 170})}, 105: {16: (0, 177)}, 106: {9: (1, {'@': 119}), 10: (1, {'@': 119}), 11: (1, {'@': 119}), 13: (1, {'@': 119}), 14: (1, {'@': 119}), 8: (1, {'@': 119}), 15: (1, {'@': 119}), 16: (1, {'@': 119}), 7: (1, {'@': 119})}, 107: {17: (1, {'@': 107}), 16: (1, {'@': 107}), 4: (1, {'@': 107}), 18: (1, {'@': 107}), 19: (1, {'@': 107}), 20: (1, {'@': 107}), 10: (1, {'@': 107}), 11: (1, {'@': 107}), 12: (1, {'@': 107}), 13: (1, {'@': 107}), 14: (1, {'@': 107}), 7: (1, {'@': 107}), 21: (1, {'@': 107}), 9: (1, {'@': 107}), 15: (1, {'@': 107}), 8: (1, {'@': 107}), 22: (1, {'@': 107})}, 108: {17: (1, {'@': 154}), 16: (1, {'@': 154})}, 109: {0: (0, 30)}, 110: {46: (0, 237), 66: (0, 233), 48: (0, 224), 44: (0, 219), 67: (0, 207), 45: (0, 204), 23: (0, 194), 50: (0, 60), 65: (0, 213), 69: (0, 183), 70: (0, 81), 49: (0, 150), 71: (0, 71), 73: (0, 67), 74: (0, 111), 47: (0, 107), 51: (0, 188)}, 111: {18: (1, {'@': 96}), 19: (1, {'@': 96}), 58: (1, {'@': 96})}, 112: {16: (1, {'@': 152})}, 113: {51: (0, 104)}, 114: {18: (1, {'@': 100}), 19: (1, {'@': 100}), 58: (1, {'@': 100})}, 115: {10: (1, {'@': 164}), 11: (1, {'@': 164}), 12: (1, {'@': 164}), 13: (1, {'@': 164}), 14: (1, {'@': 164}), 7: (1, {'@': 164}), 4: (1, {'@': 164}), 9: (1, {'@': 164}), 6: (1, {'@': 164}), 15: (1, {'@': 164}), 16: (1, {'@': 164}), 8: (1, {'@': 164})}, 116: {44: (0, 20)}, 117: {7: (1, {'@': 175}), 12: (1, {'@': 175})}, 118: {52: (0, 42), 54: (0, 28)}, 119: {16: (0, 137)}, 120: {22: (0, 135), 10: (1, {'@': 69}), 11: (1, {'@': 69}), 12: (1, {'@': 69}), 13: (1, {'@': 69}), 14: (1, {'@': 69}), 7: (1, {'@': 69}), 9: (1, {'@': 69}), 15: (1, {'@': 69}), 16: (1, {'@': 69}), 8: (1, {'@': 69}), 4: (1, {'@': 69})}, 121: {0: (0, 120), 1: (0, 154)}, 122: {4: (1, {'@': 83}), 8: (1, {'@': 83}), 21: (1, {'@': 83}), 20: (1, {'@': 83}), 9: (1, {'@': 83}), 10: (1, {'@': 83}), 11: (1, {'@': 83}), 12: (1, {'@': 83}), 13: (1, {'@': 83}), 14: (1, {'@': 83}), 15: (1, {'@': 83}), 16: (1, {'@': 83}), 7: (1, {'@': 83})}, 123: {52: (0, 42), 54: (0, 41)}, 124: {11: (1, {'@': 149}), 10: (1, {'@': 149}), 13: (1, {'@': 149}), 14: (1, {'@': 149}), 9: (1, {'@': 149}), 8: (1, {'@': 149}), 12: (1, {'@': 149}), 15: (1, {'@': 149}), 16: (1, {'@': 149}), 7: (1, {'@': 149})}, 125: {11: (1, {'@': 122}), 10: (1, {'@': 122}), 13: (1, {'@': 122}), 14: (1, {'@': 122}), 9: (1, {'@': 122}), 8: (1, {'@': 122}), 12: (1, {'@': 122}), 15: (1, {'@': 122}), 16: (1, {'@': 122}), 7: (1, {'@': 122})}, 126: {10: (1, {'@': 78}), 11: (1, {'@': 78}), 12: (1, {'@': 78}), 13: (1, {'@': 78}), 14: (1, {'@': 78}), 7: (1, {'@': 78}), 4: (1, {'@': 78}), 9: (1, {'@': 78}), 15: (1, {'@': 78}), 16: (1, {'@': 78}), 8: (1, {'@': 78})}, 127: {11: (1, {'@': 142}), 10: (1, {'@': 142}), 13: (1, {'@': 142}), 14: (1, {'@': 142}), 9: (1, {'@': 142}), 8: (1, {'@': 142}), 12: (1, {'@': 142}), 15: (1, {'@': 142}), 16: (1, {'@': 142}), 7: (1, {'@': 142})}, 128: {79: (0, 230), 80: (0, 117), 81: (0, 180), 0: (0, 139)}, 129: {82: (0, 170), 4: (0, 245), 7: (1, {'@': 159}), 10: (1, {'@': 159}), 11: (1, {'@': 159}), 12: (1, {'@': 159}), 13: (1, {'@': 159}), 14: (1, {'@': 159}), 9: (1, {'@': 159}), 15: (1, {'@': 159}), 16: (1, {'@': 159}), 8: (1, {'@': 159})}, 130: {67: (0, 166)}, 131: {16: (0, 127)}, 132: {9: (0, 18), 13: (0, 46), 8: (0, 249), 11: (0, 256), 83: (0, 234), 10: (0, 190), 14: (1, {'@': 156}), 15: (1, {'@': 156}), 16: (1, {'@': 156})}, 133: {4: (1, {'@': 163}), 6: (1, {'@': 163}), 7: (1, {'@': 163}), 9: (1, {'@': 163}), 10: (1, {'@': 163}), 11: (1, {'@': 163}), 12: (1, {'@': 163}), 13: (1, {'@': 163}), 14: (1, {'@': 163}), 15: (1, {'@': 163}), 16: (1, {'@': 163}), 8: (1, {'@': 163})}, 134: {11: (1, {'@': 133}), 10: (1, {'@': 133}), 13: (1, {'@': 133}), 14: (1, {'@': 133}), 9: (1, {'@': 133}), 8: (1, {'@': 133}), 12: (1, {'@': 133}), 15: (1, {'@': 133}), 16: (1, {'@': 133}), 7: (1, {'@': 133})}, 135: {0: (0, 178)}, 136: {84: (0, 243)}, 137: {17: (1, {'@': 112}), 16: (1, {'@': 112}), 4: (1, {'@': 112}), 18: (1, {'@': 112}), 19: (1, {'@': 112}), 20: (1, {'@': 112}), 10: (1, {'@': 112}), 11: (1, {'@': 112}), 12: (1, {'@': 112}), 13: (1, {'@': 112}), 14: (1, {'@': 112}), 7: (1, {'@': 112}), 21: (1, {'@': 112}), 9: (1, {'@': 112}), 15: (1, {'@': 112}), 8: (1, {'@': 112}), 22: (1, {'@': 112})}, 138: {24: (0, 132), 25: (0, 63), 26: (0, 240), 27: (0, 44), 28: (0, 202), 29: (0, 47), 30: (0, 40), 31: (0, 1), 32: (0, 199), 33: (0, 21), 34: (0, 13), 35: (0, 217), 36: (0, 53), 38: (0, 232), 39: (0, 260), 40: (0, 14), 37: (0, 84), 41: (0, 209), 42: (0, 248), 23: (0, 169), 43: (0, 212)}, 139: {22: (0, 225)}, 140: {17: (1, {'@': 109}), 16: (1, {'@': 109}), 4: (1, {'@': 109}), 18: (1, {'@': 109}), 19: (1, {'@': 109}), 20: (1, {'@': 109}), 10: (1, {'@': 109}), 11: (1, {'@': 109}), 12: (1, {'@': 109}), 13: (1, {'@': 109}), 14: (1, {'@': 109}), 7: (1, {'@': 109}), 21: (1, {'@': 109}), 9: (1, {'@': 109}), 15: (1, {'@': 109}), 8: (1, {'@': 109}), 22: (1, {'@': 109})}, 141: {11: (1, {'@': 123}), 10: (1, {'@': 123}), 13: (1, {'@': 123}), 14: (1, {'@': 123}), 9: (1, {'@': 123}), 8: (1, {'@': 123}), 12: (1, {'@': 123}), 15: (1, {'@': 123}), 16: (1, {'@': 123}), 7: (1, {'@': 123})}, 142: {51: (0, 6), 85: (0, 35), 44: (0, 197), 86: (0, 43)}, 143: {4: (1, {'@': 168}), 5: (1, {'@': 168}), 6: (1, {'@': 168}), 7: (1, {'@': 168}), 8: (1, {'@': 168}), 9: (1, {'@': 168}), 10: (1, {'@': 168}), 11: (1, {'@': 168}), 12: (1, {'@': 168}), 13: (1, {'@': 168}), 14: (1, {'@': 168}), 15: (1, {'@': 168}), 16: (1, {'@': 168})}, 144: {16: (0, 184)}, 145: {4: (1, {'@': 166}), 5: (1, {'@': 166}), 6: (1, {'@': 166}), 7: (1, {'@': 166}), 8: (1, {'@': 166}), 9: (1, {'@': 166}), 10: (1, {'@': 166}), 11: (1, {'@': 166}), 12: (1, {'@': 166}), 13: (1, {'@': 166}), 14: (1, {'@': 166}), 15: (1, {'@': 166}), 16: (1, {'@': 166})}, 146: {4: (1, {'@': 94}), 8: (1, {'@': 94}), 21: (1, {'@': 94}), 20: (1, {'@': 94}), 9: (1, {'@': 94}), 10: (1, {'@': 94}), 11: (1, {'@': 94}), 12: (1, {'@': 94}), 13: (1, {'@': 94}), 14: (1, {'@': 94}), 15: (1, {'@': 94}), 16: (1, {'@': 94}), 7: (1, {'@': 94})}, 147: {7: (1, {'@': 67})}, 148: {3: (0, 68)}, 149: {14: (0, 8)}, 150: {19: (0, 130), 18: (0, 251)}, 151: {3: (0, 89)}, 152: {87: (0, 102), 4: (0, 191), 17: (1, {'@': 103}), 16: (1, {'@': 103})}, 153: {17: (1, {'@': 113}), 16: (1, {'@': 113}), 4: (1, {'@': 113}), 18: (1, {'@': 113}), 19: (1, {'@': 113}), 20: (1, {'@': 113}), 10: (1, {'@': 113}), 11: (1, {'@': 113}), 12: (1, {'@': 113}), 13: (1, {'@': 113}), 14: (1, {'@': 113}), 7: (1, {'@': 113}), 21: (1, {'@': 113}), 9: (1, {'@': 113}), 15: (1, {'@': 113}), 8: (1, {'@': 113}), 22: (1, {'@': 113})}, 154: {10: (1, {'@': 178}), 11: (1, {'@': 178}), 12: (1, {'@': 178}), 13: (1, {'@': 178}), 14: (1, {'@': 178}), 7: (1, {'@': 178}), 4: (1, {'@': 178}), 9: (1, {'@': 178}), 15: (1, {'@': 178}), 16: (1, {'@': 178}), 8: (1, {'@': 178})}, 155: {24: (0, 215), 25: (0, 63), 26: (0, 240), 27: (0, 44), 28: (0, 202), 88: (0, 50), 29: (0, 47), 30: (0, 40), 89: (0, 235), 31: (0, 1), 32: (0, 199), 90: (0, 208), 33: (0, 21), 34: (0, 13), 91: (0, 236), 35: (0, 217), 36: (0, 53), 38: (0, 232), 92: (0, 26), 39: (0, 260), 40: (0, 14), 41: (0, 209), 42: (0, 248), 23: (0, 169), 43: (0, 212), 93: (0, 147)}, 156: {16: (0, 4)}, 157: {23: (0, 24)}, 158: {16: (0, 19)}, 159: {22: (0, 113)}, 160: {15: (0, 22)}, 161: {4: (1, {'@': 161}), 7: (1, {'@': 161}), 8: (1, {'@': 161}), 9: (1, {'@': 161}), 10: (1, {'@': 161}), 11: (1, {'@': 161}), 12: (1, {'@': 161}), 13: (1, {'@': 161}), 14: (1, {'@': 161}), 15: (1, {'@': 161}), 16: (1, {'@': 161})}, 162: {94: (0, 92), 4: (0, 198), 10: (1, {'@': 71}), 11: (1, {'@': 71}), 12: (1, {'@': 71}), 13: (1, {'@': 71}), 14: (1, {'@': 71}), 7: (1, {'@': 71}), 9: (1, {'@': 71}), 15: (1, {'@': 71}), 16: (1, {'@': 71}), 8: (1, {'@': 71})}, 163: {22: (0, 109)}, 164: {75: (0, 116)}, 165: {44: (0, 12)}, 166: {4: (1, {'@': 90}), 8: (1, {'@': 90}), 21: (1, {'@': 90}), 20: (1, {'@': 90}), 9: (1, {'@': 90}), 10: (1, {'@': 90}), 11: (1, {'@': 90}), 12: (1, {'@': 90}), 13: (1, {'@': 90}), 14: (1, {'@': 90}), 15: (1, {'@': 90}), 16: (1, {'@': 90}), 7: (1, {'@': 90})}, 167: {46: (0, 237), 66: (0, 233), 48: (0, 224), 44: (0, 219), 67: (0, 207), 45: (0, 204), 23: (0, 194), 50: (0, 60), 71: (0, 17), 69: (0, 183), 70: (0, 81), 49: (0, 150), 73: (0, 67), 74: (0, 111), 47: (0, 107), 51: (0, 188)}, 168: {4: (1, {'@': 87}), 8: (1, {'@': 87}), 21: (1, {'@': 87}), 20: (1, {'@': 87}), 9: (1, {'@': 87}), 10: (1, {'@': 87}), 11: (1, {'@': 87}), 12: (1, {'@': 87}), 13: (1, {'@': 87}), 14: (1, {'@': 87}), 15: (1, {'@': 87}), 16: (1, {'@': 87}), 7: (1, {'@': 87})}, 169: {24: (0, 57), 25: (0, 63), 26: (0, 240), 27: (0, 44), 28: (0, 202), 29: (0, 47), 30: (0, 40), 31: (0, 1), 32: (0, 199), 33: (0, 21), 34: (0, 13), 35: (0, 217), 36: (0, 53), 38: (0, 232), 39: (0, 260), 40: (0, 14), 41: (0, 209), 42: (0, 248), 23: (0, 169), 43: (0, 212)}, 170: {4: (0, 196), 7: (1, {'@': 158}), 10: (1, {'@': 158}), 11: (1, {'@': 158}), 12: (1, {'@': 158}), 13: (1, {'@': 158}), 14: (1, {'@': 158}), 9: (1, {'@': 158}), 15: (1, {'@': 158}), 16: (1, {'@': 158}), 8: (1, {'@': 158})}, 171: {7: (1, {'@': 176}), 12: (1, {'@': 176})}, 172: {24: (0, 75), 25: (0, 63), 26: (0, 240), 27: (0, 44), 28: (0, 202), 29: (0, 47), 30: (0, 40), 31: (0, 1), 32: (0, 199), 33: (0, 21), 34: (0, 13), 35: (0, 217), 36: (0, 53), 38: (0, 232), 39: (0, 260), 40: (0, 14), 41: (0, 209), 42: (0, 248), 23: (0, 169), 43: (0, 212)}, 173: {51: (0, 156), 50: (0, 119)}, 174: {95: (0, 0), 0: (0, 120), 1: (0, 87)}, 175: {11: (1, {'@': 130}), 10: (1, {'@': 130}), 13: (1, {'@': 130}), 14: (1, {'@': 130}), 9: (1, {'@': 130}), 8: (1, {'@': 130}), 12: (1, {'@': 130}), 15: (1, {'@': 130}), 16: (1, {'@': 130}), 7: (1, {'@': 130})}, 176: {96: (0, 164)}, 177: {4: (1, {'@': 86}), 8: (1, {'@': 86}), 21: (1, {'@': 86}), 20: (1, {'@': 86}), 9: (1, {'@': 86}), 10: (1, {'@': 86}), 11: (1, {'@': 86}), 12: (1, {'@': 86}), 13: (1, {'@': 86}), 14: (1, {'@': 86}), 15: (1, {'@': 86}), 16: (1, {'@': 86}), 7: (1, {'@': 86})}, 178: {10: (1, {'@': 68}), 11: (1, {'@': 68}), 12: (1, {'@': 68}), 13: (1, {'@': 68}), 14: (1, {'@': 68}), 7: (1, {'@': 68}), 9: (1, {'@': 68}), 15: (1, {'@': 68}), 16: (1, {'@': 68}), 8: (1, {'@': 68}), 4: (1, {'@': 68})}, 179: {16: (0, 39)}, 180: {0: (0, 159), 78: (0, 171)}, 181: {4: (1, {'@': 84}), 8: (1, {'@': 84}), 21: (1, {'@': 84}), 20: (1, {'@': 84}), 9: (1, {'@': 84}), 10: (1, {'@': 84}), 11: (1, {'@': 84}), 12: (1, {'@': 84}), 13: (1, {'@': 84}), 14: (1, {'@': 84}), 15: (1, {'@': 84}), 16: (1, {'@': 84}), 7: (1, {'@': 84})}, 182: {11: (1, {'@': 148}), 10: (1, {'@': 148}), 13: (1, {'@': 148}), 14: (1, {'@': 148}), 9: (1, {'@': 148}), 8: (1, {'@': 148}), 12: (1, {'@': 148}), 15: (1, {'@': 148}), 16: (1, {'@': 148}), 7: (1, {'@': 148})}, 183: {46: (0, 237), 66: (0, 233), 48: (0, 224), 44: (0, 219), 67: (0, 207), 45: (0, 204), 23: (0, 194), 71: (0, 51), 50: (0, 60), 69: (0, 183), 70: (0, 81), 49: (0, 150), 73: (0, 67), 74: (0, 111), 47: (0, 107), 51: (0, 188)}, 184: {11: (1, {'@': 143}), 10: (1, {'@': 143}), 13: (1, {'@': 143}), 14: (1, {'@': 143}), 9: (1, {'@': 143}), 8: (1, {'@': 143}), 12: (1, {'@': 143}), 15: (1, {'@': 143}), 16: (1, {'@': 143}), 7: (1, {'@': 143})}, 185: {10: (0, 190), 9: (0, 18), 11: (0, 256), 16: (0, 134), 13: (0, 46)}, 186: {96: (0, 211)}, 187: {97: (0, 133), 5: (0, 136), 4: (1, {'@': 162}), 6: (1, {'@': 162}), 7: (1, {'@': 162}), 9: (1, {'@': 162}), 10: (1, {'@': 162}), 11: (1, {'@': 162}), 12: (1, {'@': 162}), 13: (1, {'@': 162}), 14: (1, {'@': 162}), 15: (1, {'@': 162}), 16: (1, {'@': 162}), 8: (1, {'@': 162})}, 188: {17: (1, {'@': 105}), 16: (1, {'@': 105}), 4: (1, {'@': 105}), 18: (1, {'@': 105}), 19: (1, {'@': 105}), 20: (1, {'@': 105}), 10: (1, {'@': 105}), 11: (1, {'@': 105}), 12: (1, {'@': 105}), 13: (1, {'@': 105}), 14: (1, {'@': 105}), 7: (1, {'@': 105}), 21: (1, {'@': 105}), 9: (1, {'@': 105}), 15: (1, {'@': 105}), 8: (1, {'@': 105}), 22: (1, {'@': 105})}, 189: {11: (1, {'@': 144}), 10: (1, {'@': 144}), 13: (1, {'@': 144}), 14: (1, {'@': 144}), 9: (1, {'@': 144}), 8: (1, {'@': 144}), 12: (1, {'@': 144}), 15: (1, {'@': 144}), 16: (1, {'@': 144}), 7: (1, {'@': 144})}, 190: {11: (1, {'@': 124}), 10: (1, {'@': 124}), 13: (1, {'@': 124}), 14: (1, {'@': 124}), 9: (1, {'@': 124}), 8: (1, {'@': 124}), 12: (1, {'@': 124}), 15: (1, {'@': 124}), 16: (1, {'@': 124}), 7: (1, {'@': 124})}, 191: {45: (0, 204), 46: (0, 237), 47: (0, 107), 48: (0, 224), 49: (0, 96), 44: (0, 219), 50: (0, 60), 51: (0, 188)}, 192: {59: (0, 33), 60: (0, 241), 61: (0, 145), 63: (0, 129), 64: (0, 187), 0: (0, 163), 92: (0, 97), 62: (0, 15)}, 193: {24: (0, 132), 25: (0, 63), 26: (0, 240), 27: (0, 44), 28: (0, 202), 29: (0, 47), 30: (0, 40), 31: (0, 1), 32: (0, 199), 33: (0, 21), 34: (0, 13), 35: (0, 217), 36: (0, 53), 38: (0, 232), 39: (0, 260), 37: (0, 131), 40: (0, 14), 41: (0, 209), 42: (0, 248), 23: (0, 169), 43: (0, 212)}, 194: {65: (0, 261), 46: (0, 237), 66: (0, 233), 48: (0, 224), 44: (0, 219), 67: (0, 207), 45: (0, 204), 23: (0, 194), 50: (0, 60), 69: (0, 183), 70: (0, 81), 49: (0, 150), 71: (0, 71), 72: (0, 126), 73: (0, 67), 74: (0, 111), 47: (0, 107), 68: (0, 94), 51: (0, 188)}, 195: {11: (1, {'@': 137}), 10: (1, {'@': 137}), 13: (1, {'@': 137}), 14: (1, {'@': 137}), 9: (1, {'@': 137}), 8: (1, {'@': 137}), 12: (1, {'@': 137}), 15: (1, {'@': 137}), 16: (1, {'@': 137}), 7: (1, {'@': 137})}, 196: {59: (0, 33), 60: (0, 241), 61: (0, 145), 63: (0, 216), 0: (0, 163), 64: (0, 187)}, 197: {15: (0, 25)}, 198: {1: (0, 88), 0: (0, 120)}, 199: {0: (0, 157)}, 200: {11: (1, {'@': 150}), 10: (1, {'@': 150}), 13: (1, {'@': 150}), 14: (1, {'@': 150}), 9: (1, {'@': 150}), 8: (1, {'@': 150}), 12: (1, {'@': 150}), 15: (1, {'@': 150}), 16: (1, {'@': 150}), 7: (1, {'@': 150})}, 201: {20: (0, 239), 4: (1, {'@': 79}), 8: (1, {'@': 79}), 9: (1, {'@': 79}), 10: (1, {'@': 79}), 11: (1, {'@': 79}), 12: (1, {'@': 79}), 13: (1, {'@': 79}), 14: (1, {'@': 79}), 15: (1, {'@': 79}), 16: (1, {'@': 79}), 7: (1, {'@': 79})}, 202: {1: (0, 162), 98: (0, 200), 0: (0, 120)}, 203: {24: (0, 93), 25: (0, 63), 26: (0, 240), 27: (0, 44), 28: (0, 202), 29: (0, 47), 30: (0, 40), 31: (0, 1), 32: (0, 199), 33: (0, 21), 34: (0, 13), 35: (0, 217), 36: (0, 53), 38: (0, 232), 39: (0, 260), 40: (0, 14), 41: (0, 209), 42: (0, 248), 23: (0, 169), 43: (0, 212)}, 204: {23: (0, 101)}, 205: {9: (1, {'@': 121}), 10: (1, {'@': 121}), 11: (1, {'@': 121}), 13: (1, {'@': 121}), 14: (1, {'@': 121}), 8: (1, {'@': 121}), 15: (1, {'@': 121}), 16: (1, {'@': 121}), 7: (1, {'@': 121})}, 206: {45: (0, 204), 46: (0, 237), 47: (0, 107), 48: (0, 224), 49: (0, 152), 44: (0, 219), 50: (0, 60), 51: (0, 188), 55: (0, 105)}, 207: {30: (0, 142), 99: (0, 231), 100: (0, 210), 18: (1, {'@': 95}), 19: (1, {'@': 95}), 58: (1, {'@': 95})}, 208: {7: (1, {'@': 66})}, 209: {11: (1, {'@': 127}), 10: (1, {'@': 127}), 13: (1, {'@': 127}), 14: (1, {'@': 127}), 9: (1, {'@': 127}), 8: (1, {'@': 127}), 12: (1, {'@': 127}), 15: (1, {'@': 127}), 16: (1, {'@': 127}), 7: (1, {'@': 127})}, 210: {4: (1, {'@': 88}), 8: (1, {'@': 88}), 21: (1, {'@': 88}), 20: (1, {'@': 88}), 9: (1, {'@': 88}), 10: (1, {'@': 88}), 11: (1, {'@': 88}), 12: (1, {'@': 88}), 13: (1, {'@': 88}), 14: (1, {'@': 88}), 15: (1, {'@': 88}), 16: (1, {'@': 88}), 7: (1, {'@': 88})}, 211: {75: (0, 165)}, 212: {23: (0, 70)}, 213: {20: (1, {'@': 183}), 10: (1, {'@': 183}), 11: (1, {'@': 183}), 12: (1, {'@': 183}), 13: (1, {'@': 183}), 14: (1, {'@': 183}), 7: (1, {'@': 183}), 4: (1, {'@': 183}), 9: (1, {'@': 183}), 15: (1, {'@': 183}), 16: (1, {'@': 183}), 8: (1, {'@': 183})}, 214: {16: (0, 250)}, 215: {10: (0, 190), 9: (0, 18), 11: (0, 256), 13: (0, 46), 7: (1, {'@': 117})}, 216: {10: (1, {'@': 192}), 11: (1, {'@': 192}), 12: (1, {'@': 192}), 13: (1, {'@': 192}), 14: (1, {'@': 192}), 7: (1, {'@': 192}), 4: (1, {'@': 192}), 9: (1, {'@': 192}), 15: (1, {'@': 192}), 16: (1, {'@': 192}), 8: (1, {'@': 192})}, 217: {3: (0, 83), 2: (0, 244)}, 218: {65: (0, 261), 46: (0, 237), 66: (0, 233), 48: (0, 224), 44: (0, 219), 67: (0, 207), 45: (0, 204), 23: (0, 194), 50: (0, 60), 69: (0, 183), 70: (0, 81), 49: (0, 150), 71: (0, 71), 72: (0, 126), 73: (0, 67), 74: (0, 111), 47: (0, 107), 68: (0, 205), 51: (0, 188)}, 219: {17: (1, {'@': 106}), 16: (1, {'@': 106}), 4: (1, {'@': 106}), 18: (1, {'@': 106}), 19: (1, {'@': 106}), 20: (1, {'@': 106}), 10: (1, {'@': 106}), 11: (1, {'@': 106}), 12: (1, {'@': 106}), 13: (1, {'@': 106}), 14: (1, {'@': 106}), 7: (1, {'@': 106}), 21: (1, {'@': 106}), 9: (1, {'@': 106}), 15: (1, {'@': 106}), 8: (1, {'@': 106}), 22: (1, {'@': 106})}, 220: {45: (0, 204), 46: (0, 237), 47: (0, 107), 48: (0, 224), 44: (0, 219), 23: (0, 206), 50: (0, 60), 51: (0, 188), 49: (0, 9)}, 221: {51: (0, 228), 50: (0, 31)}, 222: {4: (1, {'@': 188}), 16: (1, {'@': 188}), 17: (1, {'@': 188})}, 223: {65: (0, 261), 46: (0, 237), 66: (0, 233), 48: (0, 224), 44: (0, 219), 67: (0, 207), 45: (0, 204), 23: (0, 194), 50: (0, 60), 68: (0, 90), 69: (0, 183), 70: (0, 81), 49: (0, 150), 71: (0, 71), 72: (0, 126), 73: (0, 67), 74: (0, 111), 47: (0, 107), 51: (0, 188)}, 224: {17: (1, {'@': 104}), 16: (1, {'@': 104}), 4: (1, {'@': 104}), 18: (1, {'@': 104}), 19: (1, {'@': 104}), 20: (1, {'@': 104}), 10: (1, {'@': 104}), 11: (1, {'@': 104}), 12: (1, {'@': 104}), 13: (1, {'@': 104}), 14: (1, {'@': 104}), 7: (1, {'@': 104}), 21: (1, {'@': 104}), 9: (1, {'@': 104}), 15: (1, {'@': 104}), 8: (1, {'@': 104}), 22: (1, {'@': 104})}, 225: {101: (0, 56)}, 226: {102: (0, 66), 17: (0, 118), 16: (1, {'@': 76})}, 227: {7: (1, {'@': 157})}, 228: {16: (0, 153), 4: (0, 173)}, 229: {45: (0, 204), 46: (0, 237), 47: (0, 107), 48: (0, 224), 44: (0, 219), 50: (0, 60), 49: (0, 49), 51: (0, 188)}, 230: {12: (0, 64), 7: (1, {'@': 172})}, 231: {4: (1, {'@': 89}), 8: (1, {'@': 89}), 21: (1, {'@': 89}), 20: (1, {'@': 89}), 9: (1, {'@': 89}), 10: (1, {'@': 89}), 11: (1, {'@': 89}), 12: (1, {'@': 89}), 13: (1, {'@': 89}), 14: (1, {'@': 89}), 15: (1, {'@': 89}), 16: (1, {'@': 89}), 7: (1, {'@': 89})}, 232: {23: (0, 172)}, 233: {19: (0, 220), 18: (0, 58), 58: (0, 85)}, 234: {8: (0, 99), 14: (1, {'@': 155}), 15: (1, {'@': 155}), 16: (1, {'@': 155})}, 235: {}, 236: {7: (1, {'@': 65})}, 237: {23: (0, 221)}, 238: {11: (1, {'@': 132}), 10: (1, {'@': 132}), 13: (1, {'@': 132}), 14: (1, {'@': 132}), 9: (1, {'@': 132}), 8: (1, {'@': 132}), 12: (1, {'@': 132}), 15: (1, {'@': 132}), 16: (1, {'@': 132}), 7: (1, {'@': 132})}, 239: {46: (0, 237), 66: (0, 233), 48: (0, 224), 44: (0, 219), 67: (0, 207), 45: (0, 204), 23: (0, 194), 50: (0, 60), 65: (0, 32), 69: (0, 183), 70: (0, 81), 49: (0, 150), 71: (0, 71), 73: (0, 67), 74: (0, 111), 47: (0, 107), 51: (0, 188)}, 240: {103: (0, 192), 1: (0, 162), 0: (0, 120), 104: (0, 174), 98: (0, 124), 11: (1, {'@': 141}), 10: (1, {'@': 141}), 13: (1, {'@': 141}), 14: (1, {'@': 141}), 9: (1, {'@': 141}), 8: (1, {'@': 141}), 12: (1, {'@': 141}), 15: (1, {'@': 141}), 16: (1, {'@': 141}), 7: (1, {'@': 141})}, 241: {80: (0, 2), 81: (0, 103), 0: (0, 139)}, 242: {11: (1, {'@': 126}), 13: (1, {'@': 126}), 14: (1, {'@': 126}), 9: (1, {'@': 126}), 8: (1, {'@': 126}), 10: (1, {'@': 126}), 15: (1, {'@': 126}), 7: (1, {'@': 126}), 16: (1, {'@': 126})}, 243: {105: (0, 115), 10: (1, {'@': 165}), 11: (1, {'@': 165}), 12: (1, {'@': 165}), 13: (1, {'@': 165}), 14: (1, {'@': 165}), 7: (1, {'@': 165}), 4: (1, {'@': 165}), 9: (1, {'@': 165}), 6: (1, {'@': 165}), 15: (1, {'@': 165}), 16: (1, {'@': 165}), 8: (1, {'@': 165})}, 244: {11: (1, {'@': 147}), 10: (1, {'@': 147}), 13: (1, {'@': 147}), 14: (1, {'@': 147}), 9: (1, {'@': 147}), 8: (1, {'@': 147}), 12: (1, {'@': 147}), 15: (1, {'@': 147}), 16: (1, {'@': 147}), 7: (1, {'@': 147})}, 245: {59: (0, 33), 63: (0, 48), 60: (0, 241), 61: (0, 145), 0: (0, 163), 64: (0, 187)}, 246: {11: (1, {'@': 139}), 10: (1, {'@': 139}), 13: (1, {'@': 139}), 14: (1, {'@': 139}), 9: (1, {'@': 139}), 8: (1, {'@': 139}), 12: (1, {'@': 139}), 15: (1, {'@': 139}), 16: (1, {'@': 139}), 7: (1, {'@': 139})}, 247: {67: (0, 10)}, 248: {11: (1, {'@': 146}), 10: (1, {'@': 146}), 13: (1, {'@': 146}), 14: (1, {'@': 146}), 9: (1, {'@': 146}), 8: (1, {'@': 146}), 12: (1, {'@': 146}), 15: (1, {'@': 146}), 16: (1, {'@': 146}), 7: (1, {'@': 146})}, 249: {24: (0, 16), 25: (0, 63), 26: (0, 240), 27: (0, 44), 28: (0, 202), 29: (0, 47), 30: (0, 40), 31: (0, 1), 32: (0, 199), 33: (0, 21), 34: (0, 13), 35: (0, 217), 36: (0, 53), 38: (0, 232), 39: (0, 260), 40: (0, 14), 41: (0, 209), 42: (0, 248), 23: (0, 169), 43: (0, 212)}, 250: {18: (1, {'@': 101}), 19: (1, {'@': 101}), 58: (1, {'@': 101})}, 251: {19: (0, 247)}, 252: {17: (1, {'@': 77}), 16: (1, {'@': 77})}, 253: {4: (0, 148), 10: (1, {'@': 73}), 11: (1, {'@': 73}), 12: (1, {'@': 73}), 13: (1, {'@': 73}), 14: (1, {'@': 73}), 7: (1, {'@': 73}), 9: (1, {'@': 73}), 15: (1, {'@': 73}), 16: (1, {'@': 73}), 8: (1, {'@': 73})}, 254: {45: (0, 204), 46: (0, 237), 47: (0, 107), 48: (0, 224), 49: (0, 82), 44: (0, 219), 23: (0, 76), 50: (0, 60), 51: (0, 188)}, 255: {16: (0, 59)}, 256: {44: (0, 125)}, 257: {65: (0, 261), 46: (0, 237), 66: (0, 233), 48: (0, 224), 44: (0, 219), 67: (0, 207), 45: (0, 204), 23: (0, 194), 50: (0, 60), 69: (0, 183), 70: (0, 81), 49: (0, 150), 71: (0, 71), 72: (0, 126), 73: (0, 67), 74: (0, 111), 47: (0, 107), 51: (0, 188), 68: (0, 242)}, 258: {20: (1, {'@': 186}), 10: (1, {'@': 186}), 11: (1, {'@': 186}), 12: (1, {'@': 186}), 13: (1, {'@': 186}), 14: (1, {'@': 186}), 7: (1, {'@': 186}), 4: (1, {'@': 186}), 21: (1, {'@': 186}), 9: (1, {'@': 186}), 15: (1, {'@': 186}), 16: (1, {'@': 186}), 8: (1, {'@': 186})}, 259: {16: (1, {'@': 153})}, 260: {23: (0, 80)}, 261: {20: (0, 110), 106: (0, 201), 4: (1, {'@': 80}), 8: (1, {'@': 80}), 9: (1, {'@': 80}), 10: (1, {'@': 80}), 11: (1, {'@': 80}), 12: (1, {'@': 80}), 13: (1, {'@': 80}), 14: (1, {'@': 80}), 15: (1, {'@': 80}), 16: (1, {'@': 80}), 7: (1, {'@': 80})}}, 'start_states': {'query': 155}, 'end_states': {'query': 235}}, '__type__': 'ParsingFrontend'}, 'rules': [{'@': 65}, {'@': 66}, {'@': 67}, {'@': 68}, {'@': 69}, {'@': 70}, {'@': 71}, {'@': 72}, {'@': 73}, {'@': 74}, {'@': 75}, {'@': 76}, {'@': 77}, {'@': 78}, {'@': 79}, {'@': 80}, {'@': 81}, {'@': 82}, {'@': 83}, {'@': 84}, {'@': 85}, {'@': 86}, {'@': 87}, {'@': 88}, {'@': 89}, {'@': 90}, {'@': 91}, {'@': 92}, {'@': 93}, {'@': 94}, {'@': 95}, {'@': 96}, {'@': 97}, {'@': 98}, {'@': 99}, {'@': 100}, {'@': 101}, {'@': 102}, {'@': 103}, {'@': 104}, {'@': 105}, {'@': 106}, {'@': 107}, {'@': 108}, {'@': 109}, {'@': 110}, {'@': 111}, {'@': 112}, {'@': 113}, {'@': 114}, {'@': 115}, {'@': 116}, {'@': 117}, {'@': 118}, {'@': 119}, {'@': 120}, {'@': 121}, {'@': 122}, {'@': 123}, {'@': 124}, {'@': 125}, {'@': 126}, {'@': 127}, {'@': 128}, {'@': 129}, {'@': 130}, {'@': 131}, {'@': 132}, {'@': 133}, {'@': 134}, {'@': 135}, {'@': 136}, {'@': 137}, {'@': 138}, {'@': 139}, {'@': 140}, {'@': 141}, {'@': 142}, {'@': 143}, {'@': 144}, {'@': 145}, {'@': 146}, {'@': 147}, {'@': 148}, {'@': 149}, {'@': 150}, {'@': 151}, {'@': 152}, {'@': 153}, {'@': 154}, {'@': 155}, {'@': 156}, {'@': 157}, {'@': 158}, {'@': 159}, {'@': 160}, {'@': 161}, {'@': 162}, {'@': 163}, {'@': 164}, {'@': 165}, {'@': 166}, {'@': 167}, {'@': 168}, {'@': 169}, {'@': 170}, {'@': 171}, {'@': 172}, {'@': 173}, {'@': 174}, {'@': 175}, {'@': 176}, {'@': 177}, {'@': 178}, {'@': 179}, {'@': 180}, {'@': 181}, {'@': 182}, {'@': 183}, {'@': 184}, {'@': 185}, {'@': 186}, {'@': 187}, {'@': 188}, {'@': 189}, {'@': 190}, {'@': 191}, {'@': 192}], 'options': {'debug': False, 'strict': False, 'keep_all_tokens': False, 'tree_class': None, 'cache': False, 'cache_grammar': False, 'postlex': None, 'parser': 'lalr', 'lexer': 'contextual', 'transformer': None, 'start': ['query'], 'priority': 'normal', 'ambiguity': 'auto', 'regex': False, 'propagate_positions': False, 'lexer_callbacks': {}, 'maybe_placeholders': True, 'edit_terminals': None, 'g_regex_flags': 0, 'use_bytes': False, 'ordered_sets': True, 'import_paths': [], 'source_path': None, '_plugins': {}}, '__type__': 'Lark'}
+
+MEMO = {0: {'name': 'WS', 'pattern': {'value': '(?:[ \t\x0c\r\n])+', 'flags': [], 'raw': None, '_width': [1, 18446744073709551616], '__type__': 'PatternRE'}, 'priority': 0, '__type__': 'TerminalDef'}, 1: {'name': 'META_NAME', 'pattern': {'value': '(?:[A-Z]|[a-z])(?:(?:(?:[A-Z]|[a-z])|[0-9]|_))*(?:\\.(?:[A-Z]|[a-z])(?:(?:(?:[A-Z]|[a-z])|[0-9]|_))*)+', 'flags': [], 'raw': None, '_width': [3, 18446744073709551616], '__type__': 'PatternRE'}, 'priority': 0, '__type__': 'TerminalDef'}, 2: {'name': 'OBJECT_ATTRIBUTE', 'pattern': {'value': '(?:[A-Z]|[a-z])(?:(?:(?:[A-Z]|[a-z])|[0-9]|_))*', 'flags': [], 'raw': None, '_width': [1, 18446744073709551616], '__type__': 'PatternRE'}, 'priority': 0, '__type__': 'TerminalDef'}, 3: {'name': 'FNAME', 'pattern': {'value': '(?:[A-Z]|[a-z])(?:(?:(?:[A-Z]|[a-z])|[0-9]|_|\\-|\\.|/))*', 'flags': [], 'raw': None, '_width': [1, 18446744073709551616], '__type__': 'PatternRE'}, 'priority': 0, '__type__': 'TerminalDef'}, 4: {'name': 'FID', 'pattern': {'value': '(?:(?:(?:[A-Z]|[a-z])|[0-9]|_|\\-|\\.|/))+', 'flags': [], 'raw': None, '_width': [1, 18446744073709551616], '__type__': 'PatternRE'}, 'priority': 0, '__type__': 'TerminalDef'}, 5: {'name': 'CMPOP', 'pattern': {'value': '(?:like|(?:!)?\\~(?:\\*)?|(?:!)?=(?:=)?|<(?:=)?|>(?:=)?)', 'flags': [], 'raw': None, '_width': [1, 4], '__type__': 'PatternRE'}, 'priority': 0, '__type__': 'TerminalDef'}, 6: {'name': 'BOOL', 'pattern': {'value': '(true|false)(?![a-z0-9$@_.-])', 'flags': ['i'], 'raw': '/(true|false)(?![a-z0-9$@_.-])/i', '_width': [4, 5], '__type__': 'PatternRE'}, 'priority': 2, '__type__': 'TerminalDef'}, 7: {'name': 'SIGNED_INT', 'pattern': {'value': '[+-]?[0-9]+(?![a-z0-9$@_.-])', 'flags': ['i'], 'raw': '/[+-]?[0-9]+(?![a-z0-9$@_.-])/i', '_width': [1, 18446744073709551616], '__type__': 'PatternRE'}, 'priority': 2, '__type__': 'TerminalDef'}, 8: {'name': 'SIGNED_FLOAT', 'pattern': {'value': '[+-]?([0-9]+e[+-]?[0-9]+|([0-9]+\\.[0-9]*|\\.[0-9]+)(e[+-]?[0-9]+)?)(?![a-z0-9$@_.-])', 'flags': ['i'], 'raw': '/[+-]?([0-9]+e[+-]?[0-9]+|([0-9]+\\.[0-9]*|\\.[0-9]+)(e[+-]?[0-9]+)?)(?![a-z0-9$@_.-])/i', '_width': [2, 18446744073709551616], '__type__': 'PatternRE'}, 'priority': 2, '__type__': 'TerminalDef'}, 9: {'name': '_NOT_PRESENT', 'pattern': {'value': 'not\\s+present(?![a-z0-9_])', 'flags': [], 'raw': '/not\\s+present(?![a-z0-9_])/', '_width': [11, 18446744073709551616], '__type__': 'PatternRE'}, 'priority': 2, '__type__': 'TerminalDef'}, 10: {'name': 'PARAM_NAME', 'pattern': {'value': '[a-z_][a-z0-9_]*(?=\\s*=)', 'flags': ['i'], 'raw': '/[a-z_][a-z0-9_]*(?=\\s*=)/i', '_width': [1, 18446744073709551616], '__type__': 'PatternRE'}, 'priority': 2, '__type__': 'TerminalDef'}, 11: {'name': '_PARAM_DEF_SEP', 'pattern': {'value': ',(?=\\s*[a-z_][a-z0-9_]*\\s*=)', 'flags': ['i'], 'raw': '/,(?=\\s*[a-z_][a-z0-9_]*\\s*=)/i', '_width': [1, 1], '__type__': 'PatternRE'}, 'priority': 2, '__type__': 'TerminalDef'}, 12: {'name': '_QUERY_SEP', 'pattern': {'value': ',(?=\\s*((files?|fids?|filter|union|join|parents|children|ancestors|descendants)(?![a-z0-9_.\\/:-])|[(\\[{]|depth\\s*=))', 'flags': [], 'raw': '/,(?=\\s*((files?|fids?|filter|union|join|parents|children|ancestors|descendants)(?![a-z0-9_.\\/:-])|[(\\[{]|depth\\s*=))/', '_width': [1, 1], '__type__': 'PatternRE'}, 'priority': 2, '__type__': 'TerminalDef'}, 13: {'name': 'STRING', 'pattern': {'value': '("(?!"").*?(?<!\\\\)(\\\\\\\\)*?"|\'(?!\'\').*?(?<!\\\\)(\\\\\\\\)*?\')', 'flags': ['i'], 'raw': '/("(?!"").*?(?<!\\\\)(\\\\\\\\)*?"|\'(?!\'\').*?(?<!\\\\)(\\\\\\\\)*?\')/i', '_width': [2, 18446744073709551616], '__type__': 'PatternRE'}, 'priority': 0, '__type__': 'TerminalDef'}, 14: {'name': 'UNQUOTED_STRING', 'pattern': {'value': '(?:(?i:[a-z0-9$@_.-]))+', 'flags': ['i'], 'raw': None, '_width': [1, 18446744073709551616], '__type__': 'PatternRE'}, 'priority': 0, '__type__': 'TerminalDef'}, 15: {'name': 'PATTERN', 'pattern': {'value': '(?:(?:(?i:[a-z0-9$@_.-])|[*?^%]))+', 'flags': [], 'raw': None, '_width': [1, 18446744073709551616], '__type__': 'PatternRE'}, 'priority': 0, '__type__': 'TerminalDef'}, 16: {'name': 'COLON', 'pattern': {'value': ':', 'flags': [], 'raw': '":"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 17: {'name': 'COMMA', 'pattern': {'value': ',', 'flags': [], 'raw': '","', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 18: {'name': 'EQUAL', 'pattern': {'value': '=', 'flags': [], 'raw': '"="', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 19: {'name': 'OR', 'pattern': {'value': 'or', 'flags': [], 'raw': '"or"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 20: {'name': 'AND', 'pattern': {'value': 'and', 'flags': [], 'raw': '"and"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 21: {'name': 'IN', 'pattern': {'value': 'in', 'flags': [], 'raw': '"in"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 22: {'name': 'NOT', 'pattern': {'value': 'not', 'flags': [], 'raw': '"not"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 23: {'name': 'LPAR', 'pattern': {'value': '(', 'flags': [], 'raw': '"("', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 24: {'name': 'RPAR', 'pattern': {'value': ')', 'flags': [], 'raw': '")"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 25: {'name': 'PRESENT', 'pattern': {'value': 'present', 'flags': [], 'raw': '"present"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 26: {'name': 'BANG', 'pattern': {'value': '!', 'flags': [], 'raw': '"!"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 27: {'name': 'EXISTS', 'pattern': {'value': 'exists', 'flags': [], 'raw': '"exists"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 28: {'name': 'LSQB', 'pattern': {'value': '[', 'flags': [], 'raw': '"["', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 29: {'name': 'ALL', 'pattern': {'value': 'all', 'flags': [], 'raw': '"all"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 30: {'name': 'RSQB', 'pattern': {'value': ']', 'flags': [], 'raw': '"]"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 31: {'name': 'ANY', 'pattern': {'value': 'any', 'flags': [], 'raw': '"any"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 32: {'name': 'LEN', 'pattern': {'value': 'len', 'flags': [], 'raw': '"len"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 33: {'name': 'DATETIME', 'pattern': {'value': 'datetime', 'flags': [], 'raw': '"datetime"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 34: {'name': 'DATE', 'pattern': {'value': 'date', 'flags': [], 'raw': '"date"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 35: {'name': 'MINUS', 'pattern': {'value': '-', 'flags': [], 'raw': '"-"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 36: {'name': 'WHERE', 'pattern': {'value': 'where', 'flags': [], 'raw': '"where"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 37: {'name': 'LIMIT', 'pattern': {'value': 'limit', 'flags': [], 'raw': '"limit"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 38: {'name': 'SKIP', 'pattern': {'value': 'skip', 'flags': [], 'raw': '"skip"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 39: {'name': 'ORDERED', 'pattern': {'value': 'ordered', 'flags': [], 'raw': '"ordered"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 40: {'name': 'DEPTH', 'pattern': {'value': 'depth', 'flags': [], 'raw': '"depth"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 41: {'name': 'UNION', 'pattern': {'value': 'union', 'flags': [], 'raw': '"union"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 42: {'name': 'JOIN', 'pattern': {'value': 'join', 'flags': [], 'raw': '"join"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 43: {'name': 'LBRACE', 'pattern': {'value': '{', 'flags': [], 'raw': '"{"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 44: {'name': 'RBRACE', 'pattern': {'value': '}', 'flags': [], 'raw': '"}"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 45: {'name': 'PARENTS', 'pattern': {'value': 'parents', 'flags': [], 'raw': '"parents"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 46: {'name': 'CHILDREN', 'pattern': {'value': 'children', 'flags': [], 'raw': '"children"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 47: {'name': 'ANCESTORS', 'pattern': {'value': 'ancestors', 'flags': [], 'raw': '"ancestors"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 48: {'name': 'DESCENDANTS', 'pattern': {'value': 'descendants', 'flags': [], 'raw': '"descendants"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 49: {'name': 'DATASETS', 'pattern': {'value': 'datasets', 'flags': [], 'raw': '"datasets"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 50: {'name': 'FROM', 'pattern': {'value': 'from', 'flags': [], 'raw': '"from"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 51: {'name': 'BY', 'pattern': {'value': 'by', 'flags': [], 'raw': '"by"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 52: {'name': 'FILES', 'pattern': {'value': 'files', 'flags': [], 'raw': '"files"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 53: {'name': 'FILTER', 'pattern': {'value': 'filter', 'flags': [], 'raw': '"filter"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 54: {'name': 'SELECTED', 'pattern': {'value': 'selected', 'flags': [], 'raw': '"selected"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 55: {'name': 'FIDS', 'pattern': {'value': 'fids', 'flags': [], 'raw': '"fids"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 56: {'name': '__ANON_0', 'pattern': {'value': 'fid', 'flags': [], 'raw': '"fid"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 57: {'name': 'FILE', 'pattern': {'value': 'file', 'flags': [], 'raw': '"file"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 58: {'name': 'HAVING', 'pattern': {'value': 'having', 'flags': [], 'raw': '"having"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 59: {'name': 'RECURSIVELY', 'pattern': {'value': 'recursively', 'flags': [], 'raw': '"recursively"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 60: {'name': 'WITH', 'pattern': {'value': 'with', 'flags': [], 'raw': '"with"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 61: {'name': 'SUBSETS', 'pattern': {'value': 'subsets', 'flags': [], 'raw': '"subsets"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 62: {'name': 'MATCHING', 'pattern': {'value': 'matching', 'flags': [], 'raw': '"matching"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 63: {'name': 'REGEXP', 'pattern': {'value': 'regexp', 'flags': [], 'raw': '"regexp"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 64: {'name': 'QUERIES', 'pattern': {'value': 'queries', 'flags': [], 'raw': '"queries"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 65: {'origin': {'name': 'query', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'top_file_query', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 66: {'origin': {'name': 'query', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'top_dataset_query', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 67: {'origin': {'name': 'query', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'top_query_query', '__type__': 'NonTerminal'}], 'order': 2, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 68: {'origin': {'name': 'qualified_name', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'FNAME', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'COLON', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'FNAME', 'filter_out': False, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 69: {'origin': {'name': 'qualified_name', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'FNAME', 'filter_out': False, '__type__': 'Terminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 70: {'origin': {'name': 'qualified_name_list', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'qualified_name', '__type__': 'NonTerminal'}, {'name': '__qualified_name_list_star_0', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 71: {'origin': {'name': 'qualified_name_list', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'qualified_name', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 72: {'origin': {'name': 'did', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'FNAME', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'COLON', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'FNAME', 'filter_out': False, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 73: {'origin': {'name': 'fid_list', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'FID', 'filter_out': False, '__type__': 'Terminal'}, {'name': '__fid_list_star_1', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 74: {'origin': {'name': 'fid_list', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'FID', 'filter_out': False, '__type__': 'Terminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 75: {'origin': {'name': 'param_def_list', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'param_def', '__type__': 'NonTerminal'}, {'name': '__param_def_list_star_2', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 76: {'origin': {'name': 'param_def_list', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'param_def', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 77: {'origin': {'name': 'param_def', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'PARAM_NAME', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'EQUAL', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'constant', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 78: {'origin': {'name': 'meta_exp', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'meta_or', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 79: {'origin': {'name': 'meta_or', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'meta_and', '__type__': 'NonTerminal'}, {'name': '__meta_or_star_3', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 80: {'origin': {'name': 'meta_or', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'meta_and', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 81: {'origin': {'name': 'meta_and', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'term_meta', '__type__': 'NonTerminal'}, {'name': '__meta_and_star_4', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 82: {'origin': {'name': 'meta_and', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'term_meta', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 83: {'origin': {'name': 'term_meta', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'scalar', '__type__': 'NonTerminal'}, {'name': 'CMPOP', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'constant', '__type__': 'NonTerminal'}], 'order': 0, 'alias': 'cmp_op', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 84: {'origin': {'name': 'term_meta', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'scalar', '__type__': 'NonTerminal'}, {'name': 'IN', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'constant', '__type__': 'NonTerminal'}, {'name': 'COLON', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'constant', '__type__': 'NonTerminal'}], 'order': 1, 'alias': 'in_range', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 85: {'origin': {'name': 'term_meta', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'scalar', '__type__': 'NonTerminal'}, {'name': 'NOT', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'IN', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'constant', '__type__': 'NonTerminal'}, {'name': 'COLON', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'constant', '__type__': 'NonTerminal'}], 'order': 2, 'alias': 'not_in_range', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 86: {'origin': {'name': 'term_meta', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'scalar', '__type__': 'NonTerminal'}, {'name': 'IN', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'LPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'constant_list', '__type__': 'NonTerminal'}, {'name': 'RPAR', 'filter_out': True, '__type__': 'Terminal'}], 'order': 3, 'alias': 'in_set', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 87: {'origin': {'name': 'term_meta', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'scalar', '__type__': 'NonTerminal'}, {'name': 'NOT', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'IN', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'LPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'constant_list', '__type__': 'NonTerminal'}, {'name': 'RPAR', 'filter_out': True, '__type__': 'Terminal'}], 'order': 4, 'alias': 'not_in_set', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 88: {'origin': {'name': 'term_meta', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'META_NAME', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'PRESENT', 'filter_out': True, '__type__': 'Terminal'}], 'order': 5, 'alias': 'present', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 89: {'origin': {'name': 'term_meta', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'META_NAME', 'filter_out': False, '__type__': 'Terminal'}, {'name': '_NOT_PRESENT', 'filter_out': True, '__type__': 'Terminal'}], 'order': 6, 'alias': 'not_present', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 90: {'origin': {'name': 'term_meta', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'constant', '__type__': 'NonTerminal'}, {'name': 'IN', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'META_NAME', 'filter_out': False, '__type__': 'Terminal'}], 'order': 7, 'alias': 'constant_in', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 91: {'origin': {'name': 'term_meta', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'constant', '__type__': 'NonTerminal'}, {'name': 'NOT', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'IN', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'META_NAME', 'filter_out': False, '__type__': 'Terminal'}], 'order': 8, 'alias': 'constant_not_in', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 92: {'origin': {'name': 'term_meta', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'LPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'meta_exp', '__type__': 'NonTerminal'}, {'name': 'RPAR', 'filter_out': True, '__type__': 'Terminal'}], 'order': 9, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 93: {'origin': {'name': 'term_meta', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'BANG', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'term_meta', '__type__': 'NonTerminal'}], 'order': 10, 'alias': 'meta_not', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 94: {'origin': {'name': 'term_meta', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'EXISTS', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'STRING', 'filter_out': False, '__type__': 'Terminal'}], 'order': 11, 'alias': 'json_path', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 95: {'origin': {'name': 'scalar', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'META_NAME', 'filter_out': False, '__type__': 'Terminal'}], 'order': 0, 'alias': 'meta_attribute', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 96: {'origin': {'name': 'scalar', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'OBJECT_ATTRIBUTE', 'filter_out': False, '__type__': 'Terminal'}], 'order': 1, 'alias': 'object_attribute', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 97: {'origin': {'name': 'scalar', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'META_NAME', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'LSQB', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'ALL', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'RSQB', 'filter_out': True, '__type__': 'Terminal'}], 'order': 2, 'alias': 'array_all', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 98: {'origin': {'name': 'scalar', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'META_NAME', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'LSQB', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'ANY', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'RSQB', 'filter_out': True, '__type__': 'Terminal'}], 'order': 3, 'alias': 'array_any', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 99: {'origin': {'name': 'scalar', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'META_NAME', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'LSQB', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'SIGNED_INT', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'RSQB', 'filter_out': True, '__type__': 'Terminal'}], 'order': 4, 'alias': 'subscript', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 100: {'origin': {'name': 'scalar', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'META_NAME', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'LSQB', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'STRING', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'RSQB', 'filter_out': True, '__type__': 'Terminal'}], 'order': 5, 'alias': 'subscript', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 101: {'origin': {'name': 'scalar', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'LEN', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'LPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'META_NAME', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'RPAR', 'filter_out': True, '__type__': 'Terminal'}], 'order': 6, 'alias': 'array_length', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 102: {'origin': {'name': 'constant_list', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'constant', '__type__': 'NonTerminal'}, {'name': '__constant_list_star_5', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 103: {'origin': {'name': 'constant_list', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'constant', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 104: {'origin': {'name': 'constant', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'SIGNED_FLOAT', 'filter_out': False, '__type__': 'Terminal'}], 'order': 0, 'alias': 'float_constant', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 105: {'origin': {'name': 'constant', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'STRING', 'filter_out': False, '__type__': 'Terminal'}], 'order': 1, 'alias': 'string_constant', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 106: {'origin': {'name': 'constant', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'SIGNED_INT', 'filter_out': False, '__type__': 'Terminal'}], 'order': 2, 'alias': 'int_constant', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 107: {'origin': {'name': 'constant', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'BOOL', 'filter_out': False, '__type__': 'Terminal'}], 'order': 3, 'alias': 'bool_constant', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 108: {'origin': {'name': 'constant', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'UNQUOTED_STRING', 'filter_out': False, '__type__': 'Terminal'}], 'order': 4, 'alias': 'string_constant', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 109: {'origin': {'name': 'constant', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'DATETIME', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'LPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'STRING', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'RPAR', 'filter_out': True, '__type__': 'Terminal'}], 'order': 5, 'alias': 'datetime_constant', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 110: {'origin': {'name': 'constant', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'DATETIME', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'LPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'UNQUOTED_STRING', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'RPAR', 'filter_out': True, '__type__': 'Terminal'}], 'order': 6, 'alias': 'datetime_constant', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 111: {'origin': {'name': 'constant', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'DATE', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'LPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'STRING', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'COMMA', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'STRING', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'RPAR', 'filter_out': True, '__type__': 'Terminal'}], 'order': 7, 'alias': 'date_constant', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 112: {'origin': {'name': 'constant', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'DATE', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'LPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'STRING', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'COMMA', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'UNQUOTED_STRING', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'RPAR', 'filter_out': True, '__type__': 'Terminal'}], 'order': 8, 'alias': 'date_constant', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 113: {'origin': {'name': 'constant', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'DATE', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'LPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'STRING', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'RPAR', 'filter_out': True, '__type__': 'Terminal'}], 'order': 9, 'alias': 'date_constant', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 114: {'origin': {'name': 'constant', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'DATE', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'LPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'UNQUOTED_STRING', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'COMMA', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'STRING', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'RPAR', 'filter_out': True, '__type__': 'Terminal'}], 'order': 10, 'alias': 'date_constant', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 115: {'origin': {'name': 'constant', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'DATE', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'LPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'UNQUOTED_STRING', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'COMMA', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'UNQUOTED_STRING', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'RPAR', 'filter_out': True, '__type__': 'Terminal'}], 'order': 11, 'alias': 'date_constant', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 116: {'origin': {'name': 'constant', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'DATE', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'LPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'UNQUOTED_STRING', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'RPAR', 'filter_out': True, '__type__': 'Terminal'}], 'order': 12, 'alias': 'date_constant', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 117: {'origin': {'name': 'top_file_query', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'file_query', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 118: {'origin': {'name': 'file_query', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'file_query_exression', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 119: {'origin': {'name': 'file_query', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'file_query', '__type__': 'NonTerminal'}, {'name': 'MINUS', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'file_query_exression', '__type__': 'NonTerminal'}], 'order': 1, 'alias': 'minus', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 120: {'origin': {'name': 'file_query', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'file_query_postfix', '__type__': 'NonTerminal'}], 'order': 2, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 121: {'origin': {'name': 'file_query', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'file_query_postfix', '__type__': 'NonTerminal'}, {'name': 'WHERE', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'meta_exp', '__type__': 'NonTerminal'}], 'order': 3, 'alias': 'meta_filter', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 122: {'origin': {'name': 'file_query_postfix', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'file_query', '__type__': 'NonTerminal'}, {'name': 'LIMIT', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'SIGNED_INT', 'filter_out': False, '__type__': 'Terminal'}], 'order': 0, 'alias': 'limit', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 123: {'origin': {'name': 'file_query_postfix', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'file_query', '__type__': 'NonTerminal'}, {'name': 'SKIP', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'SIGNED_INT', 'filter_out': False, '__type__': 'Terminal'}], 'order': 1, 'alias': 'skip', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 124: {'origin': {'name': 'file_query_postfix', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'file_query', '__type__': 'NonTerminal'}, {'name': 'ORDERED', 'filter_out': True, '__type__': 'Terminal'}], 'order': 2, 'alias': 'ordered', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 125: {'origin': {'name': 'file_query_exression', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'file_query_primary', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 126: {'origin': {'name': 'file_query_exression', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'file_query_primary', '__type__': 'NonTerminal'}, {'name': 'WHERE', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'meta_exp', '__type__': 'NonTerminal'}], 'order': 1, 'alias': 'meta_filter', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 127: {'origin': {'name': 'file_query_primary', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'file_query_term', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 128: {'origin': {'name': 'file_query_primary', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'UNION', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'LPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'file_query_list', '__type__': 'NonTerminal'}, {'name': 'RPAR', 'filter_out': True, '__type__': 'Terminal'}], 'order': 1, 'alias': 'union', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 129: {'origin': {'name': 'file_query_primary', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'LSQB', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'file_query_list', '__type__': 'NonTerminal'}, {'name': 'RSQB', 'filter_out': True, '__type__': 'Terminal'}], 'order': 2, 'alias': 'union', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 130: {'origin': {'name': 'file_query_primary', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'JOIN', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'LPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'file_query_list', '__type__': 'NonTerminal'}, {'name': 'RPAR', 'filter_out': True, '__type__': 'Terminal'}], 'order': 3, 'alias': 'join', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 131: {'origin': {'name': 'file_query_primary', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'LBRACE', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'file_query_list', '__type__': 'NonTerminal'}, {'name': 'RBRACE', 'filter_out': True, '__type__': 'Terminal'}], 'order': 4, 'alias': 'join', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 132: {'origin': {'name': 'file_query_primary', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'PARENTS', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'LPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'file_query', '__type__': 'NonTerminal'}, {'name': 'RPAR', 'filter_out': True, '__type__': 'Terminal'}], 'order': 5, 'alias': 'parents_of', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 133: {'origin': {'name': 'file_query_primary', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'CHILDREN', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'LPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'file_query', '__type__': 'NonTerminal'}, {'name': 'RPAR', 'filter_out': True, '__type__': 'Terminal'}], 'order': 6, 'alias': 'children_of', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 134: {'origin': {'name': 'file_query_primary', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'ANCESTORS', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'LPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'file_query', '__type__': 'NonTerminal'}, {'name': '_QUERY_SEP', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'DEPTH', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'EQUAL', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'SIGNED_INT', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'RPAR', 'filter_out': True, '__type__': 'Terminal'}], 'order': 7, 'alias': 'ancestors_of', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 135: {'origin': {'name': 'file_query_primary', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'ANCESTORS', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'LPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'file_query', '__type__': 'NonTerminal'}, {'name': 'RPAR', 'filter_out': True, '__type__': 'Terminal'}], 'order': 8, 'alias': 'ancestors_of', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 136: {'origin': {'name': 'file_query_primary', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'DESCENDANTS', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'LPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'file_query', '__type__': 'NonTerminal'}, {'name': '_QUERY_SEP', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'DEPTH', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'EQUAL', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'SIGNED_INT', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'RPAR', 'filter_out': True, '__type__': 'Terminal'}], 'order': 9, 'alias': 'descendants_of', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 137: {'origin': {'name': 'file_query_primary', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'DESCENDANTS', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'LPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'file_query', '__type__': 'NonTerminal'}, {'name': 'RPAR', 'filter_out': True, '__type__': 'Terminal'}], 'order': 10, 'alias': 'descendants_of', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 138: {'origin': {'name': 'file_query_primary', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'LPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'file_query', '__type__': 'NonTerminal'}, {'name': 'RPAR', 'filter_out': True, '__type__': 'Terminal'}], 'order': 11, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 139: {'origin': {'name': 'file_query_term', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'FILES', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'FROM', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'DATASETS', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'dataset_query_list', '__type__': 'NonTerminal'}], 'order': 0, 'alias': 'basic_file_query', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 140: {'origin': {'name': 'file_query_term', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'FILES', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'FROM', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'dataset_query_list', '__type__': 'NonTerminal'}], 'order': 1, 'alias': 'basic_file_query', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 141: {'origin': {'name': 'file_query_term', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'FILES', 'filter_out': True, '__type__': 'Terminal'}], 'order': 2, 'alias': 'basic_file_query', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 142: {'origin': {'name': 'file_query_term', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'FILTER', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'FNAME', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'LPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'filter_params', '__type__': 'NonTerminal'}, {'name': 'RPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'LPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'file_query_list', '__type__': 'NonTerminal'}, {'name': 'RPAR', 'filter_out': True, '__type__': 'Terminal'}], 'order': 3, 'alias': 'filter', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 143: {'origin': {'name': 'file_query_term', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'FILTER', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'FNAME', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'LPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'RPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'LPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'file_query_list', '__type__': 'NonTerminal'}, {'name': 'RPAR', 'filter_out': True, '__type__': 'Terminal'}], 'order': 4, 'alias': 'filter', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 144: {'origin': {'name': 'file_query_term', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'FILES', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'SELECTED', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'BY', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'qualified_name', '__type__': 'NonTerminal'}], 'order': 5, 'alias': 'named_query', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 145: {'origin': {'name': 'file_query_term', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'FILES', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'SELECTED', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'qualified_name', '__type__': 'NonTerminal'}], 'order': 6, 'alias': 'named_query', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 146: {'origin': {'name': 'file_query_term', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'file_list', '__type__': 'NonTerminal'}], 'order': 7, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 147: {'origin': {'name': 'file_list', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'FIDS', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'fid_list', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': True, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 148: {'origin': {'name': 'file_list', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__ANON_0', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'fid_list', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': True, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 149: {'origin': {'name': 'file_list', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'FILES', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'qualified_name_list', '__type__': 'NonTerminal'}], 'order': 2, 'alias': None, 'options': {'keep_all_tokens': True, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 150: {'origin': {'name': 'file_list', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'FILE', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'qualified_name_list', '__type__': 'NonTerminal'}], 'order': 3, 'alias': None, 'options': {'keep_all_tokens': True, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 151: {'origin': {'name': 'filter_params', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'params_list', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 152: {'origin': {'name': 'filter_params', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'params_list', '__type__': 'NonTerminal'}, {'name': '_PARAM_DEF_SEP', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'param_def_list', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 153: {'origin': {'name': 'filter_params', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'param_def_list', '__type__': 'NonTerminal'}], 'order': 2, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 154: {'origin': {'name': 'params_list', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'constant_list', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 155: {'origin': {'name': 'file_query_list', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'file_query', '__type__': 'NonTerminal'}, {'name': '__file_query_list_star_6', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 156: {'origin': {'name': 'file_query_list', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'file_query', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 157: {'origin': {'name': 'top_dataset_query', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'DATASETS', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'dataset_query_list', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 158: {'origin': {'name': 'dataset_query_list', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'dataset_query', '__type__': 'NonTerminal'}, {'name': '__dataset_query_list_star_7', '__type__': 'NonTerminal'}], 'order': 0, 'alias': 'dataset_query_list', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 159: {'origin': {'name': 'dataset_query_list', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'dataset_query', '__type__': 'NonTerminal'}], 'order': 1, 'alias': 'dataset_query_list', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 160: {'origin': {'name': 'dataset_query', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'dataset_query_with_subsets', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 161: {'origin': {'name': 'dataset_query', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'dataset_query_with_subsets', '__type__': 'NonTerminal'}, {'name': 'HAVING', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'meta_exp', '__type__': 'NonTerminal'}], 'order': 1, 'alias': 'dataset_add_where', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 162: {'origin': {'name': 'dataset_query_with_subsets', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'dataset_spec', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 163: {'origin': {'name': 'dataset_query_with_subsets', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'dataset_spec', '__type__': 'NonTerminal'}, {'name': 'dataset_provenance_op', '__type__': 'NonTerminal'}], 'order': 1, 'alias': 'dataset_add_subsets', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 164: {'origin': {'name': 'dataset_provenance_op', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'WITH', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'SUBSETS', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'RECURSIVELY', 'filter_out': False, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': True, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 165: {'origin': {'name': 'dataset_provenance_op', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'WITH', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'SUBSETS', 'filter_out': False, '__type__': 'Terminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': True, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 166: {'origin': {'name': 'dataset_spec', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'did', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': True, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 167: {'origin': {'name': 'dataset_spec', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'MATCHING', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'sql_pattern', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': True, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 168: {'origin': {'name': 'dataset_spec', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'MATCHING', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'REGEXP', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'regexp_pattern', '__type__': 'NonTerminal'}], 'order': 2, 'alias': None, 'options': {'keep_all_tokens': True, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 169: {'origin': {'name': 'sql_pattern', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'FNAME', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'COLON', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'PATTERN', 'filter_out': False, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 170: {'origin': {'name': 'regexp_pattern', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'FNAME', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'COLON', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'STRING', 'filter_out': False, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 171: {'origin': {'name': 'top_query_query', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'QUERIES', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'MATCHING', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'query_name_match', '__type__': 'NonTerminal'}, {'name': 'WHERE', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'meta_exp', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': True, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 172: {'origin': {'name': 'top_query_query', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'QUERIES', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'MATCHING', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'query_name_match', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': True, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 173: {'origin': {'name': 'top_query_query', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'QUERIES', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'WHERE', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'meta_exp', '__type__': 'NonTerminal'}], 'order': 2, 'alias': None, 'options': {'keep_all_tokens': True, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 174: {'origin': {'name': 'top_query_query', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'QUERIES', 'filter_out': False, '__type__': 'Terminal'}], 'order': 3, 'alias': None, 'options': {'keep_all_tokens': True, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 175: {'origin': {'name': 'query_name_match', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'sql_pattern', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': True, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 176: {'origin': {'name': 'query_name_match', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'REGEXP', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'regexp_pattern', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': True, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 177: {'origin': {'name': '__qualified_name_list_star_0', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'COMMA', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'qualified_name', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 178: {'origin': {'name': '__qualified_name_list_star_0', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__qualified_name_list_star_0', '__type__': 'NonTerminal'}, {'name': 'COMMA', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'qualified_name', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 179: {'origin': {'name': '__fid_list_star_1', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'COMMA', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'FID', 'filter_out': False, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 180: {'origin': {'name': '__fid_list_star_1', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__fid_list_star_1', '__type__': 'NonTerminal'}, {'name': 'COMMA', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'FID', 'filter_out': False, '__type__': 'Terminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 181: {'origin': {'name': '__param_def_list_star_2', '__type__': 'NonTerminal'}, 'expansion': [{'name': '_PARAM_DEF_SEP', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'param_def', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 182: {'origin': {'name': '__param_def_list_star_2', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__param_def_list_star_2', '__type__': 'NonTerminal'}, {'name': '_PARAM_DEF_SEP', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'param_def', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 183: {'origin': {'name': '__meta_or_star_3', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'OR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'meta_and', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 184: {'origin': {'name': '__meta_or_star_3', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__meta_or_star_3', '__type__': 'NonTerminal'}, {'name': 'OR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'meta_and', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 185: {'origin': {'name': '__meta_and_star_4', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'AND', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'term_meta', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 186: {'origin': {'name': '__meta_and_star_4', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__meta_and_star_4', '__type__': 'NonTerminal'}, {'name': 'AND', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'term_meta', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 187: {'origin': {'name': '__constant_list_star_5', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'COMMA', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'constant', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 188: {'origin': {'name': '__constant_list_star_5', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__constant_list_star_5', '__type__': 'NonTerminal'}, {'name': 'COMMA', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'constant', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 189: {'origin': {'name': '__file_query_list_star_6', '__type__': 'NonTerminal'}, 'expansion': [{'name': '_QUERY_SEP', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'file_query', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 190: {'origin': {'name': '__file_query_list_star_6', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__file_query_list_star_6', '__type__': 'NonTerminal'}, {'name': '_QUERY_SEP', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'file_query', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 191: {'origin': {'name': '__dataset_query_list_star_7', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'COMMA', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'dataset_query', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 192: {'origin': {'name': '__dataset_query_list_star_7', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__dataset_query_list_star_7', '__type__': 'NonTerminal'}, {'name': 'COMMA', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'dataset_query', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}}
@@ -1,5 +1,6 @@
 import re, traceback
 from metacat.common import FileAttributes
+from metacat.util import epoch
 
 class MetaEvaluator(object):
 
@@ -25,7 +26,7 @@ class MetaEvaluator(object):
         if op == "meta_and":    op = "and"
         if op == "meta_or":     op = "or"
         if op in self.BOOL_OPS:
-            return self.eval_meta_bool(metadata, op, args)
+            return self.eval_meta_bool(f, op, args)
         elif op == "present":
             return meta_expression["name"] in metadata
         elif op == "not_present":
@@ -237,3 +238,156 @@ class MetaEvaluator(object):
     def evaluate(meta, exp):
         return MetaEvaluator().evaluate_meta_expression(meta, exp)
     
+
+class MetaExpressionCompiler(object):
+
+    #
+    # Compiles meta expression tree into a single predicate function: predicate(f) -> bool
+    #
+    # The tree is interpreted once, at compile time. Attribute names, constants and operators are bound
+    # into closures, sets are frozen and regular expressions are compiled, so that evaluation for each file
+    # does not depend on the size of the tree representation or on string comparisons of node types.
+    #
+    # The semantics follow MetaEvaluator and the SQL translation of the expression in FileMetaExpressionDNF:
+    # type errors in comparisons (e.g. a string compared with a number) make the comparison false,
+    # and "neg" negates the result of the whole term.
+    #
+
+    CmpOps = {
+        "<":    lambda x, y: x < y,
+        ">":    lambda x, y: x > y,
+        "<=":   lambda x, y: x <= y,
+        ">=":   lambda x, y: x >= y,
+        "=":    lambda x, y: x == y,
+        "==":   lambda x, y: x == y,
+        "!=":   lambda x, y: x != y
+    }
+
+    def __call__(self, meta_expression):
+        term = self.compile(meta_expression)
+        def predicate(f):
+            return term(f, f.metadata())
+        return predicate
+
+    def compile(self, exp):
+        # returns term(f, metadata) -> bool
+        op = exp.T
+        if op in ("meta_and", "meta_or"):
+            parts = [self.compile(c) for c in exp.C]
+            if len(parts) == 1:
+                return parts[0]
+            if op == "meta_and":
+                def term(f, metadata):
+                    for p in parts:
+                        if not p(f, metadata):
+                            return False
+                    return True
+            else:
+                def term(f, metadata):
+                    for p in parts:
+                        if p(f, metadata):
+                            return True
+                    return False
+            return term
+        elif op == "meta_not":
+            (part,) = [self.compile(c) for c in exp.C]
+            return lambda f, metadata: not part(f, metadata)
+        elif op == "present":
+            name = exp["name"]
+            return lambda f, metadata: name in metadata
+        elif op == "not_present":
+            name = exp["name"]
+            return lambda f, metadata: name not in metadata
+        elif op in ("in_set", "not_in_set"):
+            vset = frozenset(exp.get("set", []))
+            neg = exp.get("neg", False) != (op == "not_in_set")
+            return self.compile_left(exp.C[0], lambda v: v in vset, neg)
+        elif op in ("in_range", "not_in_range"):
+            low, high = exp["low"], exp["high"]
+            neg = exp.get("neg", False) != (op == "not_in_range")
+            return self.compile_left(exp.C[0], lambda v: low <= v <= high, neg)
+        elif op == "cmp_op":
+            left, right = exp.C
+            return self.compile_left(left, self.compile_cmp(exp["op"], right["value"]), exp.get("neg", False))
+        raise ValueError("Invalid expression:\n"+exp.pretty())
+
+    def compile_cmp(self, op, value):
+        # returns test(x) -> bool
+        if op in ("~", "!~", "~*", "!~*"):
+            negated = op[0] == '!'
+            r = re.compile(value, re.IGNORECASE if op[-1] == '*' else 0)
+            search = r.search
+            if negated:
+                return lambda x: search(x) is None
+            else:
+                return lambda x: search(x) is not None
+        cmp = self.CmpOps.get(op)
+        if cmp is None:
+            raise ValueError("Invalid comparison operator '%s'" % (op,))
+        return lambda x: cmp(x, value)
+
+    def compile_left(self, left, test, neg):
+        # returns term(f, metadata) -> bool, which applies test to the value(s) selected by the left side
+        # of the expression and negates the result if neg is true
+
+        def safe(test):
+            def safe_test(x):
+                try:    return test(x)
+                except (TypeError, ValueError):
+                    return False
+            return safe_test
+
+        test = safe(test)
+        aname = left["name"]
+        typ = left.T
+
+        if typ in ("meta_attribute", "scalar"):
+            def term(f, metadata):
+                return (aname in metadata and test(metadata[aname])) != neg
+        elif typ == "object_attribute":
+            if aname not in FileAttributes:
+                raise ValueError("Unknown file attribute: %s" % (aname,))
+            getter = self.FileAttributeGetters[aname]
+            def term(f, metadata):
+                return test(getter(f)) != neg
+        elif typ == "array_any":
+            def term(f, metadata):
+                lst = metadata.get(aname)
+                if isinstance(lst, dict):
+                    lst = lst.values()
+                elif not isinstance(lst, list):
+                    return neg
+                for x in lst:
+                    if test(x):
+                        return not neg
+                return neg
+        elif typ in ("subscript", "array_subscript"):
+            inx = left["index"]
+            def term(f, metadata):
+                lst = metadata.get(aname)
+                if lst is None:
+                    return neg
+                try:    v = lst[inx]
+                except (IndexError, KeyError, TypeError):
+                    return neg
+                return test(v) != neg
+        elif typ == "array_length":
+            def term(f, metadata):
+                lst = metadata.get(aname)
+                if not isinstance(lst, list):
+                    return neg
+                return test(len(lst)) != neg
+        else:
+            raise ValueError("Unsupported left side of the expression: %s" % (typ,))
+        return term
+
+    FileAttributeGetters = {
+        "creator":              lambda f: f.Creator,
+        "created_timestamp":    lambda f: epoch(f.CreatedTimestamp),
+        "name":                 lambda f: f.Name,
+        "namespace":            lambda f: f.Namespace,
+        "size":                 lambda f: f.Size
+    }
+
+def compile_meta_expression(meta_expression):
+    return MetaExpressionCompiler()(meta_expression)
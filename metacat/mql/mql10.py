@@ -1,6 +1,6 @@
 import json, time, pprint, traceback
-from metacat.db import DBDataset, DBFile, DBNamedQuery, DBFileSet
-from metacat.util import limited, unique
+from metacat.db import DBDataset, DBFile, DBNamedQuery, DBFileSet, DBIndexedMetaKey
+from metacat.util import limited, unique, LRUCache
 from metacat.common.trees import Node, Ascender, Descender, Converter
 from metacat.common import FileMetaExpressionDNF
 from .sql_converter import SQLConverter
@@ -8,13 +8,37 @@ from .query_executor import FileQueryExecutor
 from .meta_evaluator import MetaEvaluator
 from datetime import date, datetime, timezone
 
-from lark import Lark, LarkError
+from lark import LarkError
 from lark import Tree, Token
 
 CMP_OPS = [">" , "<" , ">=" , "<=" , "==" , "=" , "!=", "~~", "~~*", "!~~", "!~~*"]
 
-from .grammar import MQL_Grammar
-_Parser = Lark(MQL_Grammar, start="query")
+from .parser import MQLParser
+_Parser = MQLParser()
+
+#
+# Plan cache
+#
+# Parsed queries are cached by the query text. Compiled file queries are cached by the query text,
+# versions of the named queries used by the query, the set of indexed metadata keys and compilation options.
+# Updating a named query increments its version, so the plans using it are not reused.
+#
+
+PlanCacheSize = 1000
+_ParseCache = LRUCache(PlanCacheSize)
+_PlanCache = LRUCache(PlanCacheSize)
+
+def set_plan_cache_size(size):
+    global _ParseCache, _PlanCache
+    _ParseCache = LRUCache(size)
+    _PlanCache = LRUCache(size)
+
+def clear_plan_cache():
+    _ParseCache.clear()
+    _PlanCache.clear()
+
+def plan_cache_stats():
+    return dict(parsed = _ParseCache.stats(), compiled = _PlanCache.stats())
 
 class MQLError(Exception):
 
@@ -107,14 +131,34 @@ class DatasetQuery(object):
         return _DatasetQueryExecutor(db)(compiled)
 
 
+def _unordered_selection(node):
+    if not isinstance(node, Node):
+        return False
+    selects = node.T in ("filter", "skip_limit") and (node.get("limit") is not None or node.get("skip"))
+    if node.T == "basic_file_query":
+        q = node["query"]
+        return (q.Limit is not None or bool(q.Skip)) and not q.Ordered
+    elif node.T == "filter":
+        if selects and not node.get("ordered"):
+            return True
+    elif node.T == "skip_limit":
+        child = node.C[0]
+        ordered = child.T == "ordered" \
+            or child.T == "filter" and child.get("ordered") \
+            or child.T == "basic_file_query" and child["query"].Ordered
+        if selects and not ordered:
+            return True
+    return any(_unordered_selection(c) for c in node.C or [])
+
 class FileQuery(object):
 
     Type = "file"
 
-    def __init__(self, tree, include_retired=False):
+    def __init__(self, tree, include_retired=False, source_key=None):
         self.Tree = tree
         self.Assembled = self.Optimized = self.Compiled = None
         self.IncludeRetired = include_retired
+        self.SourceKey = source_key         # identifies the query source for the plan cache, None - do not cache
 
     def __str__(self):
         return "FileQuery(\n%s\n)" % (self.Tree.pretty("  "),)
@@ -124,6 +168,11 @@ class FileQuery(object):
             self.Assembled = self.Tree
         return self.Assembled
 
+    def unordered_selection(self):
+        # True if skip or limit is applied to unordered files somewhere in the query, so that
+        # different runs of the query may return different files
+        return _unordered_selection(self.Tree)
+
     def optimize(self, debug=False, skip=0, limit=None):
         if self.Optimized is None:
             #print("Query.optimize: assembled:----\n", self.Assembled.pretty())
@@ -163,7 +212,17 @@ class FileQuery(object):
             self.Optimized = optimized
         return self.Optimized
 
-    def compile(self, db=None, skip=0, limit=None, with_meta=False, with_provenance=False, debug=False):
+    def compile(self, db=None, skip=0, limit=None, with_meta=False, with_provenance=False, debug=False, filters=None):
+        # filters: filters with SQL implementations, see MetaCatFilter.sql()
+        plan_key = None
+        if self.SourceKey is not None and not debug:
+            indexed_keys = tuple(sorted(DBIndexedMetaKey.registry(db).items()))
+            filter_names = tuple(sorted(filters or {}))
+            plan_key = (self.SourceKey, self.IncludeRetired, skip, limit, with_meta, with_provenance, indexed_keys, filter_names)
+            compiled = _PlanCache.get(plan_key)
+            if compiled is not None:
+                self.Compiled = compiled
+                return compiled
         try:
             optimized = self.optimize(debug=debug, skip=skip, limit=limit)
             optimized = _QueryOptionsApplier().walk(optimized, 
@@ -173,26 +232,35 @@ class FileQuery(object):
                 ))
             if debug:
                 print("after _QueryOptionsApplier:", optimized.pretty())
-            self.Compiled = compiled = SQLConverter(db, debug=debug, include_retired=self.IncludeRetired)(optimized)
+            self.Compiled = compiled = SQLConverter(db, debug=debug, include_retired=self.IncludeRetired, filters=filters)(optimized)
         except Exception as e:
             raise MQLCompilationError(traceback.format_exc(limit=-1))
 
         if debug:
             print("\nCompiled:", compiled.pretty())
 
+        if plan_key is not None:
+            _PlanCache.put(plan_key, compiled)
         return compiled
 
-    def run(self, db=None, filters={}, skip=0, limit=None, with_meta=True, with_provenance=True, debug=False):
+    def run(self, db=None, filters={}, skip=0, limit=None, with_meta=True, with_provenance=True, debug=False,
+                after=None, page_size=None, connect=None, max_parallel=1):
+        # after, page_size: keyset pagination, see DBFileSet.keyset_page()
+        # connect, max_parallel: fetch independent parts of the query concurrently, see FileQueryExecutor
 
         compiled = self.compile(db=db, 
                     skip=skip, limit=limit, 
                     with_meta=with_meta, with_provenance=with_provenance,
-                    debug=debug)
+                    debug=debug, filters=filters)
         try:
-            result = FileQueryExecutor(db, filters, debug=debug)(compiled)
+            result = FileQueryExecutor(db, filters, debug=debug, connect=connect, max_parallel=max_parallel)(compiled)
         except Exception as e:
             raise MQLExecutionError(str(e))
         assert isinstance(result, DBFileSet)
+        if after is not None or page_size is not None:
+            result = result.keyset_page(after, page_size)
+        if with_provenance:
+            result = result.with_provenance()
         return result
 
 class _OrderedApplier(Descender):
@@ -216,6 +284,8 @@ class _OrderedApplier(Descender):
     def children_of(self, node, ordered):
         return node.clone(ordered=ordered or node.get("ordered"))
 
+    ancestors_of = descendants_of = children_of
+
     basic_dataset_query = basic_file_query
 
     def skip_limit(self, node, ordered):
@@ -410,7 +480,7 @@ class _QueryOptionsApplier(Descender):
         new_params["with_provenance"] = True
         return self.visit_children(node, new_params)
         
-    children_of = parents_of
+    children_of = ancestors_of = descendants_of = parents_of
 
     def filter(self, node, params):
         # the filter may need metadata but probably not provenance
@@ -459,7 +529,7 @@ class _MetaExpPusher(Descender):
             #
             return Node("meta_filter", query=self.visit_children(node, None), meta_exp=meta_exp)
         
-    parents_of = children_of
+    parents_of = ancestors_of = descendants_of = children_of
     
     def meta_filter(self, node, meta_exp):
         child = node["query"]
@@ -670,7 +740,7 @@ class Orderer(Descender):
     def filter(self, node, _):
         return node.clone(ordered = True)
 
-    parents_of = children_of = filter
+    parents_of = children_of = ancestors_of = descendants_of = filter
     
     def _done(self, node, _):
         return node
@@ -696,6 +766,7 @@ class QueryConverter(Converter):
         self.DB = db
         self.Loader = loader
         self.DefaultNamespace = default_namespace
+        self.NamedQueryVersions = []            # [(namespace, name, version), ...] of named queries used, version is None if unknown
 
     def convert(self, tree):
         q = self.transform(tree)
@@ -715,7 +786,7 @@ class QueryConverter(Converter):
         elif q.T == "top_query_query":      out = QueryQuery(q.C[0])
         else:
             raise ValueError("Unrecognozed top level node type: %s" % (q.T,))
-        print("QueryConverter: returning:", out.pretty())
+        #print("QueryConverter: returning:", out.pretty())
         return out
     
     def __default__(self, typ, children, meta):
@@ -845,6 +916,21 @@ class QueryConverter(Converter):
                 skip=0, limit=None,
                 with_meta=False, with_provenance=False)
 
+    def ancestors_of(self, args):
+        return self._provenance_closure("ancestors_of", args)
+
+    def descendants_of(self, args):
+        return self._provenance_closure("descendants_of", args)
+
+    def _provenance_closure(self, typ, args):
+        query = args[0]
+        depth = None
+        if len(args) > 1:
+            depth = int(args[1].value)
+            if depth < 1:
+                raise ValueError("Provenance depth must be positive, got: %d" % (depth,))
+        return Node(typ, [query], depth=depth, ordered=False)
+
     def int_constant(self, args):
         v = args[0]
         return Node("int", value=int(v.value))
@@ -911,9 +997,14 @@ class QueryConverter(Converter):
         namespace = q["namespace"] or self.DefaultNamespace
         name = q["name"]
         if self.DB is not None:
-            loaded = MQLQuery.from_db(self.DB, namespace, name, convert=False)
+            named_query = DBNamedQuery.get(self.DB, namespace, name)
+            if named_query is None:
+                raise ValueError("Named query %s:%s not found" % (namespace, name))
+            self.NamedQueryVersions.append((namespace, name, named_query.Version))
+            loaded = MQLQuery.parse(named_query.Source, convert=False)
         else:
             loaded = MQLQuery.from_loader(self.Loader, namespace, name, convert=False)
+            self.NamedQueryVersions.append((namespace, name, None))
         if loaded is None:
             raise ValueError("Named query %s:%s not found" % (namespace, name))
         tree = self.convert(loaded)
@@ -1362,13 +1453,22 @@ class MQLQuery(object):
             out.append(l)
         text = '\n'.join(out)
         try:
-            parsed = _Parser.parse(text)
-            print("parsed:\n", parsed.pretty())
+            parsed = _ParseCache.get(text)
+            if parsed is None:
+                parsed = _Parser.parse(text)
+                _ParseCache.put(text, parsed)
+            #print("parsed:\n", parsed.pretty())
             if convert:
-                converted = QueryConverter(db=db, loader=loader, default_namespace=default_namespace).convert(parsed)
-                print("converted:\n", converted.pretty())
+                converter = QueryConverter(db=db, loader=loader, default_namespace=default_namespace)
+                converted = converter.convert(parsed)
+                #print("converted:\n", converted.pretty())
                 if converted.T == "top_file_query":
-                    q = FileQuery(converted.C[0], include_retired_files)
+                    versions = tuple(converter.NamedQueryVersions)
+                    source_key = None
+                    if all(version is not None for _, _, version in versions):
+                        source_key = (text, default_namespace, versions)
+                    q = FileQuery(converted.C[0], include_retired_files, source_key=source_key)
+                    q.NamedQueryVersions = versions
                 elif converted.T == "top_dataset_query":
                     q = DatasetQuery(converted.C[0])
                 else:
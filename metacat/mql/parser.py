@@ -0,0 +1,67 @@
+import hashlib
+from lark import Lark, LarkError
+from .grammar import MQL_Grammar
+
+#
+# MQL parser
+#
+# Queries are parsed with the LALR(1) parser, which works in linear time. The LALR parse tables are
+# pre-generated and stored in grammar/lalr_tables.py, so that they do not have to be computed
+# every time the module is imported. If the tables are missing or were generated for a different
+# version of the grammar, they are computed at run time.
+#
+# The LALR parser with the contextual lexer looks only one token ahead. There are still few valid queries
+# it can not parse, e.g. an unquoted string constant compared with an array: "abc in x.y".
+# If the LALR parser fails, the query is parsed with the Earley parser, which was used before.
+#
+# To regenerate the tables after a grammar change:
+#
+#   python tools/mql_lalr_tables.py
+#
+
+GrammarHash = hashlib.sha1(MQL_Grammar.encode("utf-8")).hexdigest()
+
+def build_lalr_parser():
+    return Lark(MQL_Grammar, start="query", parser="lalr")
+
+def build_earley_parser():
+    return Lark(MQL_Grammar, start="query")
+
+def load_lalr_parser():
+    try:
+        from .grammar import lalr_tables
+    except ImportError:
+        lalr_tables = None
+    if lalr_tables is not None and lalr_tables.GrammarHash == GrammarHash:
+        try:
+            return Lark.load({"data": lalr_tables.DATA, "memo": lalr_tables.MEMO})
+        except Exception:
+            # tables generated by a different version of Lark
+            pass
+    return build_lalr_parser()
+
+class MQLParser(object):
+
+    def __init__(self):
+        self.LALR = None
+        self.Earley = None
+
+    def parse(self, text):
+        if self.LALR is None:
+            self.LALR = load_lalr_parser()
+        try:
+            return self.LALR.parse(text)
+        except LarkError:
+            if self.Earley is None:
+                self.Earley = build_earley_parser()
+            return self.Earley.parse(text)
+
+def generate_tables(out):
+    from lark.lexer import TerminalDef
+    from lark.grammar import Rule
+    from lark import __version__ as lark_version
+    data, memo = build_lalr_parser().memo_serialize([TerminalDef, Rule])
+    out.write("#\n# Generated by tools/mql_lalr_tables.py with Lark %s. Do not edit.\n#\n\n" % (lark_version,))
+    out.write("GrammarHash = %r\n\n" % (GrammarHash,))
+    out.write("DATA = %r\n\n" % (data,))
+    out.write("MEMO = %r\n" % (memo,))
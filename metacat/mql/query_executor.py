@@ -1,16 +1,21 @@
 from metacat.common.trees  import Ascender, Node
-from metacat.db import DBFileSet
-from .meta_evaluator import MetaEvaluator
+from metacat.db import DBFileSet, BranchPrefetcher
+from .meta_evaluator import compile_meta_expression
 
 class FileQueryExecutor(Ascender):
     
     # the assumption is that the entire tree consists of:
     # Node(T="sql") and DBFileSet objects
     
-    def __init__(self, db, filters, debug=False):
+    def __init__(self, db, filters, debug=False, connect=None, max_parallel=1):
+        # connect: function returning a new pooled connection. If specified and max_parallel > 1,
+        # independent SQL based inputs of union, join, minus and filters are fetched concurrently
         self.DB = db
         self.Filters = filters
         self.Debug = False
+        self.Prefetcher = None
+        if connect is not None and max_parallel > 1:
+            self.Prefetcher = BranchPrefetcher(db, connect, max_parallel)
         
     def debug(self, *params, **args):
         if self.Debug:
@@ -29,32 +34,43 @@ class FileQueryExecutor(Ascender):
         return DBFileSet(self.DB, sql=sql)
         
     def meta_filter(self, node, query=None, meta_exp=None, with_meta=False, with_provenance=False):
-        evaluator = MetaEvaluator()
-        filtered_files = (f for f in query if evaluator(f, meta_exp))
-        return DBFileSet(self.DB, filtered_files)
+        predicate = compile_meta_expression(meta_exp)
+        return DBFileSet(self.DB, filter(predicate, query))
+
+    def prefetch(self, file_sets):
+        # file sets which are all SQL based are combined into a single SQL query by DBFileSet
+        if self.Prefetcher is None or all(s.SQL is not None for s in file_sets):
+            return file_sets
+        return self.Prefetcher.prefetch(file_sets)
 
     def union(self, node, *args):
-        return DBFileSet.union(self.DB, args)
+        return DBFileSet.union(self.DB, self.prefetch(args))
 
     def join(self, node, *args, **kv):
-        return DBFileSet.join(self.DB, args)
+        return DBFileSet.join(self.DB, self.prefetch(args))
         
-    def ordered(self, node):
-        assert isinstance(node, DBFileSet)
-        return node.ordered()
+    def ordered(self, node, arg):
+        assert isinstance(arg, DBFileSet)
+        return arg.ordered()
 
     def minus(self, node, *args, **kv):
         #print("Evaluator.union: args:", args)
         assert len(args) == 2
         assert all(isinstance(n, DBFileSet) or n.T == "sql" for n in args)
-        left, right = args
+        left, right = self.prefetch(args)
         return left - right
 
-    def parents_of(self, node, arg, with_meta=False, with_provenance=False):
-        return arg.parents(as_files=True, with_metadata=with_meta, with_provenance=with_provenance)
+    def parents_of(self, node, arg, with_meta=False, with_provenance=False, ordered=False):
+        return arg.parents(with_metadata=with_meta, with_provenance=with_provenance)
+
+    def children_of(self, node, arg, with_meta=False, with_provenance=False, ordered=False):
+        return arg.children(with_metadata=with_meta, with_provenance=with_provenance)
+
+    def ancestors_of(self, node, arg, depth=None, with_meta=False, with_provenance=False, ordered=False):
+        return arg.ancestors(depth=depth, with_metadata=with_meta, with_provenance=with_provenance)
 
-    def children_of(self, node, *args, with_meta=False, with_provenance=False):
-        return args[0].children(as_files=True, with_metadata=with_meta, with_provenance=with_provenance)
+    def descendants_of(self, node, arg, depth=None, with_meta=False, with_provenance=False, ordered=False):
+        return arg.descendants(depth=depth, with_metadata=with_meta, with_provenance=with_provenance)
 
     def skip_limit(self, node, arg, skip=0, limit=None, **kv):
         return arg.skip(skip).limit(limit)
@@ -66,5 +82,7 @@ class FileQueryExecutor(Ascender):
         assert name is not None
         filter_object = self.Filters[name]
         #print("filter: queries:", queries)
+        if self.Prefetcher is not None:
+            queries = self.Prefetcher.prefetch(queries)
         return DBFileSet(self.DB, filter_object.run(queries, params, kw, 
                 limit=limit, skip=skip, with_meta=with_meta, ordered=ordered))
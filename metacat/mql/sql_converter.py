@@ -1,5 +1,5 @@
 from metacat.common.trees import Ascender, Node
-from metacat.db import DBFileSet, alias, DBDataset, DBFile
+from metacat.db import DBFileSet, alias, DBDataset, DBFile, DBIndexedMetaKey
 from metacat.common import FileMetaExpressionDNF
 from .meta_evaluator import MetaEvaluator
 from metacat.util import limited, insert_sql
@@ -7,24 +7,18 @@ from textwrap import dedent, indent
 
 class SQLConverter(Ascender):
     
-    def __init__(self, db, debug=False, include_retired=False, summary=None):
+    def __init__(self, db, debug=False, include_retired=False, summary=None, filters=None):
         self.DB = db
+        self.Filters = filters or {}
         self.Debug = debug
         self.IncludeRetired = include_retired
         self.Summary = summary
 
     def columns(self, t, with_meta=True, with_provenance=True):
+        # provenance is not selected here, it is loaded in batches by DBFileSet.with_provenance()
         meta = f"{t}.metadata" if with_meta else "null as metadata"
-        if with_provenance:
-            parents = f"{t}.parents"
-            children = f"{t}.children"
-        else:
-            parents = "null as parents"
-            children = "null as children"
-
         attrs = DBFile.attr_columns(alias=t)
-
-        return f"{t}.id, {t}.namespace, {t}.name, {meta}, {attrs}, {parents}, {children}"
+        return f"{t}.id, {t}.namespace, {t}.name, {meta}, {attrs}, null as parents, null as children"
 
     def debug(self, *params, **args):
         if self.Debug:
@@ -54,7 +48,7 @@ class SQLConverter(Ascender):
             return query
         if query.T == "sql":
             t = alias("t")
-            dnf = FileMetaExpressionDNF(meta_exp)
+            dnf = FileMetaExpressionDNF(meta_exp, indexed_keys=DBIndexedMetaKey.registry(self.DB))
             where_sql = dnf.sql(t)
             if not where_sql:
                 return node
@@ -72,6 +66,19 @@ class SQLConverter(Ascender):
         else:
             return node
 
+    def filter(self, node, *queries, **named):
+        # use SQL implementation of the filter if it has one and all the inputs are SQL
+        filter_object = self.Filters.get(named.get("name"))
+        if filter_object is None or not queries or not all(q.T == "sql" for q in queries):
+            return self._default(node, *queries, **named)
+        skip, limit = named.get("skip", 0), named.get("limit")
+        ordered = named.get("ordered", False) or bool(skip or limit)
+        sql = filter_object.sql([q["sql"] for q in queries], named.get("params", []), named.get("kw", {}), self.columns, ordered=ordered)
+        if sql is None:
+            return self._default(node, *queries, **named)
+        self.debug("SQLConverter.filter: sql:---------\n", sql, "\n-----------")
+        return self.skip_limit(node, Node("sql", sql=sql), skip=skip, limit=limit)
+
     def ordered(self, node, child):
         if child.T == "sql":
             t = alias("t")
@@ -110,10 +117,7 @@ class SQLConverter(Ascender):
         if not sqls:
             return Node("union", args)
         if len(sqls) >= 2:
-            inner_sqls = {f"__{i}": n["sql"] for i, n in enumerate(sqls)}
-            parts = [f"(\n    $__{i}\n)" for i, n in enumerate(sqls)]
-            template = "\nunion\n".join(parts)
-            combined_sql = insert_sql(template, **inner_sqls)
+            combined_sql = DBFileSet.sql_for_union([n["sql"] for n in sqls])
             sqls = [Node("sql", sql=combined_sql)]
         others = [n for n in args if n.T != "sql"]
         if not others:
@@ -128,10 +132,7 @@ class SQLConverter(Ascender):
         if not sqls:
             return node
         if len(sqls) >= 2:
-            inner_sqls = {f"__{i}": n["sql"] for i, n in enumerate(sqls)}
-            parts = [f"(\n    $__{i}\n)" for i, n in enumerate(sqls)]
-            template = "\nintersect\n".join(parts)
-            combined_sql = insert_sql(template, **inner_sqls)
+            combined_sql = DBFileSet.sql_for_join([n["sql"] for n in sqls])
             sqls = [Node("sql", sql=combined_sql)]
         others = [n for n in args if n.T != "sql"]
         if not others:
@@ -147,75 +148,43 @@ class SQLConverter(Ascender):
         elif right.T == "empty":
             return left
         if left.T == "sql" and right.T == "sql":
-            s1 = left["sql"]
-            s2 = right["sql"]
-            sql = insert_sql("""\
-                (
-                    $s1
-                )
-                except
-                (
-                    $s2
-                )""", s1=s1, s2=s2)
+            sql = DBFileSet.sql_for_minus(left["sql"], right["sql"])
             self.debug("SQLConverter.minus: sql:---------\n", sql, "\n-----------")
             return Node("sql", sql=sql)
         else:
             return node
 
     def parents_of(self, node, *args, with_meta=False, with_provenance=False, ordered=False):
+        return self._relationship("parents", node, args, ordered)
+
+    def children_of(self, node, *args, with_meta=False, with_provenance=False, ordered=False):
+        return self._relationship("children", node, args, ordered)
+
+    def _relationship(self, rel, node, args, ordered):
         assert len(args) == 1
         arg = args[0]
         if arg.T == "empty":    return arg
         if arg.T == "sql":
-            with_meta = node["with_meta"]
-            with_provenance = node["with_provenance"]
-            arg_sql = arg["sql"]
-            p = alias("p")
-            c = alias("c")
-            pc = alias("pc")
-            columns = self.columns(p, with_meta, with_provenance)
-            order = f"order by {p}.id" if ordered else ""
-            table = "files_with_provenance" if with_provenance else "files"
-            new_sql = insert_sql(f"""\
-                --  parents of {p}
-                    select {columns}
-                    from {table} {p}
-                        inner join parent_child {pc} on {p}.id = {pc}.parent_id
-                        inner join (
-                            $arg_sql
-                        ) as {c} on {c}.id = {pc}.child_id
-                    {order}
-                --  end of parents of {p}
-            """, arg_sql=arg_sql)
+            new_sql = DBFileSet.sql_for_relationship(rel, arg["sql"], with_meta=node["with_meta"], ordered=ordered)
+            self.debug(f"SQLConverter.{rel}_of: sql:---------\n", new_sql, "\n-----------")
             return Node("sql", sql=new_sql)
         else:
             return node
 
-    def children_of(self, node, *args, with_meta=False, with_provenance=False, ordered=False):
+    def ancestors_of(self, node, *args, depth=None, with_meta=False, with_provenance=False, ordered=False):
+        return self._provenance_closure("ancestors", node, args, depth, ordered)
+
+    def descendants_of(self, node, *args, depth=None, with_meta=False, with_provenance=False, ordered=False):
+        return self._provenance_closure("descendants", node, args, depth, ordered)
+
+    def _provenance_closure(self, direction, node, args, depth, ordered):
         assert len(args) == 1
         arg = args[0]
         if arg.T == "empty":    return arg
         if arg.T == "sql":
-            with_meta = node["with_meta"]
-            with_provenance = node["with_provenance"]
-            arg_sql = arg["sql"]
-            p = alias("p")
-            c = alias("c")
-            pc = alias("pc")
-            columns = self.columns(c, with_meta, with_provenance)
-            order = f"order by {p}.id" if ordered else ""
-            table = "files_with_provenance" if with_provenance else "files"
-            new_sql = insert_sql(f"""\
-                -- children of {c}
-                    select {columns}
-                    from {table} {c}
-                        inner join parent_child {pc} on {c}.id = {pc}.child_id
-                        inner join (
-                            $arg_sql
-                        ) as {p} on {p}.id = {pc}.parent_id
-                    {order}
-                -- end of children of {c}
-            """, arg_sql=arg_sql)
+            new_sql = DBFileSet.sql_for_provenance_closure(direction, arg["sql"], depth=depth,
+                with_meta=node["with_meta"], ordered=ordered)
+            self.debug(f"SQLConverter.{direction}_of: sql:---------\n", new_sql, "\n-----------")
             return Node("sql", sql=new_sql)
         else:
             return node
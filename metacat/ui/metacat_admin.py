@@ -2,13 +2,14 @@ import sys, getopt
 from metacat.common import password_digest_hash, ConnectionWithTransactions
 from metacat.ui.cli import CLI, CLICommand
 
-def connect(config):
+def connect(config, autocommit=False):
     import psycopg2
     dbcfg = config["database"]
     connstr = "host=%(host)s port=%(port)s dbname=%(dbname)s user=%(user)s" % dbcfg
     if "password" in dbcfg:
         connstr += " password=%(password)s" % dbcfg
     conn = psycopg2.connect(connstr)
+    conn.autocommit = autocommit
     schema = dbcfg.get("schema")
     if schema:
         conn.cursor().execute(f"set search_path to {schema}")
@@ -195,6 +196,81 @@ class InitDtabaseCommand(CLICommand):
         print("database initialized")
 
 
+class RebuildClosureCommand(CLICommand):
+
+    Usage = """                                     -- rebuild the dataset hierarchy closure table"""
+
+    def __call__(self, command, config, opts, args):
+        from metacat.db import DBDataset
+        db = connect(config)
+        n = DBDataset.rebuild_closure(db)
+        print("Dataset closure rebuilt:", n, "ancestor/descendant pairs")
+
+
+class CheckClosureCommand(CLICommand):
+
+    Usage = """                                     -- compare the dataset hierarchy closure table with the hierarchy"""
+
+    def __call__(self, command, config, opts, args):
+        from metacat.db import DBDataset
+        db = connect(config)
+        diffs = DBDataset.check_closure(db)
+        for ancestor, descendant, stored, expected in diffs:
+            print("%-40s %-40s stored depth: %-6s expected depth: %s" % (ancestor, descendant, stored, expected))
+        if diffs:
+            print(len(diffs), "pairs differ, run 'metacat admin rebuild-closure' to fix the table")
+            sys.exit(1)
+        print("Dataset closure is consistent")
+
+
+class CreateMetaIndexCommand(CLICommand):
+
+    Opts = "a"
+    MinArgs = 2
+    Usage = """[-a] <metadata key> (text|float)     -- create expression index for the metadata key and register it
+        -a      -- the values are arrays of the type, the index will be used for key[any] comparisons
+    """
+
+    def __call__(self, command, config, opts, args):
+        from metacat.db import DBIndexedMetaKey
+        db = connect(config, autocommit=True)
+        name, typ = args[:2]
+        key = DBIndexedMetaKey(db, name, typ, is_array="-a" in opts)
+        print(f"creating index {key.IndexName} ...")
+        key.create(concurrently=True)
+        print(f"metadata key {name} indexed")
+
+class ListMetaIndexesCommand(CLICommand):
+
+    Usage = """                                     -- list indexed metadata keys"""
+
+    def __call__(self, command, config, opts, args):
+        from metacat.db import DBIndexedMetaKey
+        db = connect(config)
+        for key in DBIndexedMetaKey.list(db):
+            print("%-40s %-6s %-6s %s" % (key.Name, key.Type, "array" if key.IsArray else "", key.IndexName))
+
+class DropMetaIndexCommand(CLICommand):
+
+    MinArgs = 1
+    Usage = """<metadata key>                       -- unregister the metadata key and drop its index"""
+
+    def __call__(self, command, config, opts, args):
+        from metacat.db import DBIndexedMetaKey
+        db = connect(config)
+        key = DBIndexedMetaKey.get(db, args[0])
+        if key is None:
+            print("Metadata key", args[0], "is not indexed", file=sys.stderr)
+            sys.exit(1)
+        key.delete()
+        print(f"index {key.IndexName} dropped")
+
+MetaIndexCLI = CLI(
+    "create",       CreateMetaIndexCommand(),
+    "list",         ListMetaIndexesCommand(),
+    "drop",         DropMetaIndexCommand()
+)
+
 class AdminCLI(CLI):
 
     Opts = "c:"
@@ -216,7 +292,10 @@ AdminCLI = AdminCLI(
     "password",     PasswordCommand(),
     "list",         ListCommand(),
     "remove",       RemoveCommand(),
-    "generate",     GenerateCommand()
+    "generate",     GenerateCommand(),
+    "rebuild-closure",  RebuildClosureCommand(),
+    "check-closure",    CheckClosureCommand(),
+    "meta-index",   MetaIndexCLI
     )
 
 
@@ -204,11 +204,17 @@ class DeclareSingleCommand(CLICommand):
 class DeclareManyCommand(CLICommand):
     
     MinArgs = 2
-    Opts = ("N:dj", ["namespace=", "dry-run", "json"])
+    Opts = ("N:djc:p:J:v", ["namespace=", "dry-run", "json", "chunk-size=", "parallel=", "journal=", "verbose"])
     Usage = """[options] <JSON file with file list> <dataset namespace>:<dataset name>
     Declare multiple files:
+            -N|--namespace <default namespace>  - default namespace for files
             -d|--dry-run                        - dry run: run all the checks but stop short of actual file declaration
             -j|--json                           - print results as JSON
+            -c|--chunk-size <n>                 - declare files in chunks of <n> files, default 1000
+            -p|--parallel <n>                   - declare up to <n> chunks concurrently, default 4
+            -J|--journal <file>                 - journal of declared chunks, default: <JSON file>.journal
+                                                  re-running the command skips the chunks found in the journal
+            -v|--verbose                        - print progress for each chunk to stderr
     """
 
     def __call__(self, command, client, opts, args):
@@ -220,19 +226,44 @@ class DeclareManyCommand(CLICommand):
             raise InvalidArguments("Invalid dataset specification")
             
         dataset_namespace, dataset_name = undid(dataset_spec)
+        default_namespace = opts.get("-N") or opts.get("--namespace")
+        chunk_size = int(opts.get("-c") or opts.get("--chunk-size") or 1000)
+        parallel = int(opts.get("-p") or opts.get("--parallel") or 4)
+        journal = opts.get("-J") or opts.get("--journal") or json_file + ".journal"
+        verbose = "-v" in opts or "--verbose" in opts
 
+        def report(info):
+            if info["error"] is not None:
+                print("chunk %(chunk)d: files %(start)d-%(end)d: failed: %(error)s" % dict(info, end=info["start"]+info["files"]-1),
+                    file=sys.stderr)
+            elif verbose:
+                rate = "%.1f files/sec" % (info["rate"],) if info["rate"] else ""
+                print("chunk %d: files %d-%d: %s %.3f sec %s" % (info["chunk"], info["start"], info["start"]+info["files"]-1, 
+                    info["status"], info["elapsed"], rate), file=sys.stderr)
+
+        t0 = time.time()
         try:
-            response = client.declare_files(f"{dataset_namespace}:{dataset_name}", files, dry_run = "-d" in opts)
-        except MCError as e:
-            print(e)
+            declared, errors = client.declare_files_bulk(f"{dataset_namespace}:{dataset_name}", files,
+                namespace=default_namespace, chunk_size=chunk_size, concurrency=parallel, journal=journal,
+                dry_run = "-d" in opts or "--dry-run" in opts, report=report)
+        except (MCError, ValueError) as e:
+            print(e, file=sys.stderr)
             sys.exit(1)
+        dt = time.time() - t0
 
         if "-j" in opts or "--json" in opts:
-            print(json.dumps(response, indent=4, sort_keys=True))
+            print(json.dumps(declared, indent=4, sort_keys=True))
         else:
-            for f in response:
+            for f in declared:
                 print(f["fid"], f["namespace"]+':'+f["name"])
 
+        if verbose:
+            print("%d files declared in %.1f sec" % (len(declared), dt), file=sys.stderr)
+        if errors:
+            nfailed = sum(info["files"] for info in errors)
+            print(f"{len(errors)} chunks with {nfailed} files failed. Re-run the command to retry them", file=sys.stderr)
+            sys.exit(1)
+
 
 class DatasetsCommand(CLICommand):
 
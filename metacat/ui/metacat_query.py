@@ -12,7 +12,7 @@ class QueryCommand(CLICommand):
         "jim:N:pq:S:A:lPxrL:U:S:R:Q:2t:s", 
         ["line", "json", "ids", "summary=", "metadata=", "namespace=", "pretty",
             "with-provenance", "save-as=", "add-to=", "explain", "include-retired-files",
-            "list=", "source=", "create=", "update=", "run=", "1024", "timeout="
+            "list=", "source=", "create=", "update=", "run=", "1024", "timeout=", "parallel=", "partition-output="
         ]
     )
     Usage = """[<options>] (-q <MQL query file>|"<MQL query>")
@@ -37,6 +37,10 @@ class QueryCommand(CLICommand):
             -S|--save-as=<namespace>:<name>     - save files as a new datset
             -A|--add-to=<namespace>:<name>      - add files to an existing dataset
             -r|--include-retired-files          - include retired files into the query results
+               --parallel <n>                   - split the query into <n> partitions by file id and run them concurrently,
+                                                  the query must be ordered if it uses skip or limit
+               --partition-output <pattern>     - with --parallel, write files of each partition to its own file as JSON lines,
+                                                  "%d" in the pattern is replaced with the partition number
             
             -x|--explain                        - dp not run the query, show resulting SQL only
     """
@@ -53,6 +57,12 @@ class QueryCommand(CLICommand):
         include_retired = "-r" in opts or "--include-retired-files" in opts
         summary = opts.get("--summary", "count" if "-s" in opts else None)
         timeout = int(opts.get("-t", opts.get("--timeout", 600)))
+        partitions = int(opts.get("--parallel", 0)) or None
+        partition_output = opts.get("--partition-output")
+        if partitions and (summary or save_as or add_to):
+            raise InvalidOptions("--parallel can not be used with --summary, --save-as or --add-to")
+        if partition_output and (not partitions or "%d" not in partition_output):
+            raise InvalidOptions('--partition-output requires --parallel and "%d" in the pattern')
         if args:
             query_text = " ".join(args)
         else:
@@ -84,12 +94,21 @@ class QueryCommand(CLICommand):
             print(compiled.pretty("    "))
         else:
             client.Timeout = timeout
-            results = client.query(query_text, 
-                        namespace=namespace, with_metadata = with_meta, 
-                        save_as=save_as, add_to=add_to,
-                        with_provenance=with_provenance,
-                        include_retired_files=include_retired, summary=summary
-            )
+            try:
+                results = client.query(query_text, 
+                            namespace=namespace, with_metadata = with_meta, 
+                            save_as=save_as, add_to=add_to,
+                            with_provenance=with_provenance,
+                            include_retired_files=include_retired, summary=summary,
+                            partitions=partitions, partition_output=partition_output
+                )
+            except ValueError as e:
+                raise InvalidArguments(str(e))
+
+            if partition_output:
+                for i, n in enumerate(results):
+                    print("%s: %d files" % (partition_output % (i,), n))
+                return
 
             in_line = "-l" in opts or "--line" in opts
             print_format = "json" if ("--json" in opts or "-j" in opts) \
@@ -4,4 +4,5 @@ from .trace import Tracer
 from .object_spec import ObjectSpec, undid
 from .utils import first_not_empty, insert_sql
 from .validation import validate_metadata
-from .generators import fetch_generator, chunked, limited, unique, strided, skipped
\ No newline at end of file
+from .generators import fetch_generator, chunked, limited, unique, strided, skipped, prefetched
+from .lru import LRUCache
@@ -58,3 +58,38 @@ def skipped(iterable, n):
             n -= 1
         else:
             yield f
+
+def prefetched(iterable, depth=1):
+    # iterates the iterable in a separate thread, staying up to <depth> items ahead of the consumer
+    import threading, queue
+    q = queue.Queue(depth)
+    stop = threading.Event()
+    done = object()
+
+    def reader():
+        try:
+            for item in iterable:
+                if stop.is_set():
+                    break
+                q.put((item, None))
+        except Exception as e:
+            q.put((None, e))
+        q.put((done, None))
+
+    t = threading.Thread(target=reader, daemon=True)
+    t.start()
+    try:
+        while True:
+            item, error = q.get()
+            if error is not None:
+                raise error
+            if item is done:
+                break
+            yield item
+    finally:
+        stop.set()
+        # unblock the reader if it is waiting for space in the queue
+        while t.is_alive():
+            try:    q.get(timeout=0.1)
+            except queue.Empty:
+                pass
@@ -0,0 +1,92 @@
+import time, threading
+from collections import OrderedDict
+
+class LRUCache(object):
+
+    #
+    # Thread-safe LRU cache bounded by the total size of the entries
+    #
+    # size_fn(value) returns the size of the value in arbitrary units, default: 1 per entry, so that
+    # max_size is the maximum number of entries.
+    # Entries older than ttl seconds are considered expired and removed on access.
+    #
+
+    def __init__(self, max_size, size_fn=None, ttl=None):
+        self.MaxSize = max_size
+        self.SizeFn = size_fn or (lambda value: 1)
+        self.TTL = ttl
+        self.Entries = OrderedDict()         # key -> (value, size, timestamp)
+        self.Size = 0
+        self.Lock = threading.RLock()
+        self.Hits = self.Misses = self.Evictions = 0
+
+    def __len__(self):
+        return len(self.Entries)
+
+    def __contains__(self, key):
+        return self.get(key, count=False) is not None
+
+    def _remove(self, key):
+        value, size, timestamp = self.Entries.pop(key)
+        self.Size -= size
+
+    def get(self, key, default=None, count=True):
+        with self.Lock:
+            entry = self.Entries.get(key)
+            if entry is not None:
+                value, size, timestamp = entry
+                if self.TTL is not None and time.time() > timestamp + self.TTL:
+                    self._remove(key)
+                else:
+                    self.Entries.move_to_end(key)
+                    if count:   self.Hits += 1
+                    return value
+            if count:   self.Misses += 1
+            return default
+
+    def put(self, key, value):
+        # returns True if the value was stored, False if it is larger than the whole cache
+        size = self.SizeFn(value)
+        with self.Lock:
+            if key in self.Entries:
+                self._remove(key)
+            if size > self.MaxSize:
+                return False
+            while self.Entries and self.Size + size > self.MaxSize:
+                oldest = next(iter(self.Entries))
+                self._remove(oldest)
+                self.Evictions += 1
+            self.Entries[key] = (value, size, time.time())
+            self.Size += size
+            return True
+
+    __setitem__ = put
+
+    def remove(self, key):
+        with self.Lock:
+            if key in self.Entries:
+                self._remove(key)
+
+    def remove_matching(self, predicate):
+        # removes entries with keys for which predicate(key) is true, returns number of removed entries
+        with self.Lock:
+            keys = [key for key in self.Entries if predicate(key)]
+            for key in keys:
+                self._remove(key)
+            return len(keys)
+
+    def clear(self):
+        with self.Lock:
+            self.Entries.clear()
+            self.Size = 0
+
+    def stats(self):
+        with self.Lock:
+            return dict(
+                entries = len(self.Entries),
+                size = self.Size,
+                max_size = self.MaxSize,
+                hits = self.Hits,
+                misses = self.Misses,
+                evictions = self.Evictions
+            )
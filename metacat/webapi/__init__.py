@@ -1,5 +1,6 @@
 from .webapi import MetaCatClient, MCError
+from .async_client import AsyncMetaCatClient
 from .webapi import ServerReportedError as MCServerError
 from .webapi import AuthenticationError
 from .webapi import WebAPIError as MCWebAPIError
-from .webapi import InvalidMetadataError as MCInvalidMetadataError
\ No newline at end of file
+from .webapi import InvalidMetadataError as MCInvalidMetadataError
@@ -0,0 +1,603 @@
+import json, fnmatch, os, random, time, asyncio
+from urllib.parse import quote_plus
+from metacat.util import ObjectSpec, chunked, to_str
+from metacat.common import TokenAuthClientMixin
+from .webapi import AcceptEncoding, WebAPIError, ServerReportedError, error_class, parse_name, \
+    file_specs, declare_files_list, files_lookup_list, file_spec_data, query_url, NotFoundError
+
+#
+# asyncio MetaCat client
+#
+# Same methods as MetaCatClient, as coroutines. All requests of the client share one aiohttp session with
+# a pool of keep-alive connections. The number of requests in progress is limited by max_concurrent,
+# further requests wait for their turn, so that any number of coroutines can use the client concurrently.
+#
+# Methods which return a generator in MetaCatClient (get_dataset_files, list_datasets, list_namespaces, query_iter)
+# are async generators here. They yield objects as they arrive from the server and hold their request slot
+# until the iteration is complete.
+#
+
+def _aiohttp():
+    try:
+        import aiohttp
+    except ModuleNotFoundError:
+        raise ModuleNotFoundError("aiohttp module required for the asyncio client. Use: pip install aiohttp")
+    return aiohttp
+
+class _Response(object):
+    # response with the body read, in the form expected by WebAPIError
+
+    def __init__(self, status_code, headers, text):
+        self.status_code = status_code
+        self.headers = headers
+        self.text = text
+
+class AsyncMetaCatClient(TokenAuthClientMixin):
+
+    InitialRetry = 1.0
+    RetryExponent = 1.5
+    DefaultTimeout = 1800.0
+    RS = b'\x1E'
+
+    def __init__(self, server_url=None, auth_server_url=None, max_concurrent=100,
+                token=None, token_file=None, token_library=None, timeout=None,
+                pool_size=None, retries=3, retry_timeout=None):
+        """Initializes the AsyncMetaCatClient object. Must be closed with ``await client.close()`` or used as
+        an asynchronous context manager:
+
+        .. code-block:: python
+
+            async with AsyncMetaCatClient(server_url) as client:
+                files = await client.get_files(lookup_list)
+
+        Arguments
+        ---------
+        server_url : str
+            The server endpoint URL, defult = from METACAT_SERVER_URL environment variable
+        auth_server_url : str
+            The endpoint URL for the Authentication server, default = server_url + "/auth"
+        max_concurrent : int
+            Maximum number of requests in progress at any time. Default: 100
+        token_file : str
+            File path to read the authentication token from
+        token : bytes or str or SignedToken
+            Use this token for authentication, optional
+        timeout : int or float
+            Connect and read timeout in seconds. Default: None - use default timeout, 0 - no timeout
+        pool_size : int
+            Maximum number of connections to the server. Default: max_concurrent
+        retries : int
+            Number of times to retry connection failures, with exponential backoff. Default: 3
+        retry_timeout : int or float
+            For how long to retry requests while the server responds with 503. Default: 1800 seconds
+        """
+        server_url = server_url or os.environ.get("METACAT_SERVER_URL")
+        if not server_url:
+            raise RuntimeError("MetaCat server URL unspecified")
+        auth_server_url = auth_server_url or os.environ.get("METACAT_AUTH_SERVER_URL")
+        TokenAuthClientMixin.__init__(self, server_url, auth_server_url, token=token, token_file=token_file, token_library=token_library)
+        self.ServerURL = server_url
+        self.MaxConcurrent = max_concurrent
+        self.PoolSize = pool_size or max_concurrent
+        if timeout is not None and timeout <= 0:
+            self.Timeout = None         # no timeout
+        else:
+            self.Timeout = timeout or self.DefaultTimeout
+        self.Retries = retries
+        self.RetryTimeout = self.DefaultTimeout if retry_timeout is None else retry_timeout
+        self.Session = None
+        self.Semaphore = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *params):
+        await self.close()
+
+    async def close(self):
+        """Closes the client's connections to the server
+        """
+        if self.Session is not None:
+            await self.Session.close()
+            self.Session = None
+
+    def session(self):
+        # session and semaphore are created in the running event loop
+        if self.Session is None:
+            aiohttp = _aiohttp()
+            self.Session = aiohttp.ClientSession(
+                connector = aiohttp.TCPConnector(limit=self.PoolSize),
+                timeout = aiohttp.ClientTimeout(total=None, sock_connect=self.Timeout, sock_read=self.Timeout)
+            )
+            self.Semaphore = asyncio.Semaphore(self.MaxConcurrent)
+        return self.Session
+
+    def slot(self):
+        # the semaphore limiting the number of requests in progress
+        self.session()
+        return self.Semaphore
+
+    #
+    # Transport
+    #
+
+    def headers(self, headers=None):
+        out = {
+            "Accept": "application/json-seq, application/json, text/json, text/plain",
+            "Accept-Encoding": AcceptEncoding
+        }
+        token = self.token()
+        if token is not None:
+            out["X-Authentication-Token"] = to_str(token.encode())
+        if headers:
+            out.update(headers)
+        return out
+
+    async def request(self, method, uri_suffix, data=None):
+        # sends the request, retrying on connection errors and 503 responses
+        # returns (url, response) with the response body not read yet. The caller must release the response.
+        url = "%s/%s" % (self.ServerURL, uri_suffix)
+        headers = None
+        if data is not None and not isinstance(data, (str, bytes)):
+            data = json.dumps(data)
+            headers = {"Content-Type": "text/json"}
+        session = self.session()
+        aiohttp = _aiohttp()
+        tend = time.time() + self.RetryTimeout
+        retry_interval = self.InitialRetry
+        attempt = 0
+        while True:
+            try:
+                response = await session.request(method, url, data=data, headers=self.headers(headers))
+            except aiohttp.ClientConnectorError:
+                # the connection was not established, safe to retry any request
+                if attempt >= self.Retries:
+                    raise
+                await asyncio.sleep(0.5 * 2**attempt)
+                attempt += 1
+                continue
+            if response.status != 503:
+                break
+            sleep_time = min(random.random() * retry_interval, tend-time.time())
+            retry_interval *= self.RetryExponent
+            if sleep_time < 0:
+                break           # time out
+            response.release()
+            await asyncio.sleep(sleep_time)
+
+        error = error_class(response.status)
+        if error is not None:
+            try:
+                text = await response.text()
+            finally:
+                response.release()
+            raise error(url, _Response(response.status, response.headers, text))
+        return url, response
+
+    def unpack_json(self, url, status, json_text):
+        results = json.loads(json_text)
+        if isinstance(results, dict):
+            if "results" in results:
+                results = results["results"]
+            elif "error" in results:
+                raise ServerReportedError(url, status, results["error"]["type"], results["error"].get("value", ""))
+        return results
+
+    async def get_text(self, uri_suffix):
+        async with self.slot():
+            url, response = await self.request("GET", uri_suffix)
+            try:
+                return await response.text()
+            finally:
+                response.release()
+
+    async def send_json(self, method, uri_suffix, data=None):
+        # returns the whole response. application/json-seq response is returned as a list
+        async with self.slot():
+            url, response = await self.request(method, uri_suffix, data)
+            try:
+                if "application/json-seq" in response.headers.get("Content-Type", ""):
+                    return [obj async for obj in self.json_seq(url, response)]
+                return self.unpack_json(url, response.status, await response.text())
+            finally:
+                response.release()
+
+    async def json_stream(self, method, uri_suffix, data=None):
+        # async generator of objects, application/json-seq objects are yielded as they arrive
+        async with self.slot():
+            url, response = await self.request(method, uri_suffix, data)
+            try:
+                if "application/json-seq" in response.headers.get("Content-Type", ""):
+                    async for obj in self.json_seq(url, response):
+                        yield obj
+                else:
+                    results = self.unpack_json(url, response.status, await response.text())
+                    if isinstance(results, list):
+                        for obj in results:
+                            yield obj
+                    else:
+                        yield results
+            finally:
+                response.release()
+
+    async def json_seq(self, url, response):
+        async for line in response.content:
+            line = line.strip()
+            while line.startswith(self.RS):
+                line = line[1:]
+            if line:
+                yield self.unpack_json(url, response.status, line)
+
+    async def get_json(self, uri_suffix):
+        return await self.send_json("GET", uri_suffix)
+
+    async def post_json(self, uri_suffix, data):
+        return await self.send_json("POST", uri_suffix, data)
+
+    #
+    # API
+    #
+
+    async def get_version(self):
+        """Returns server version as text
+        """
+        return await self.get_text("data/version")
+
+    async def list_datasets(self, namespace_pattern=None, name_pattern=None, with_counts=False):
+        """Async generator of datasets with namespace/name matching the ``fnmatch`` style templates.
+        See ``MetaCatClient.list_datasets``. With ``with_counts=True``, the counts are fetched concurrently.
+        """
+        lst = await self.get_json("data/datasets?with_counts=no")
+        items = [item for item in lst
+            if (namespace_pattern is None or fnmatch.fnmatch(item["namespace"], namespace_pattern))
+                and (name_pattern is None or fnmatch.fnmatch(item["name"], name_pattern))
+        ]
+        if with_counts:
+            counts = await asyncio.gather(*[self.get_dataset_counts(item["namespace"] + ":" + item["name"]) for item in items])
+            for item, c in zip(items, counts):
+                item.update(c or {})
+        for item in items:
+            yield item
+
+    async def get_dataset_counts(self, did=None, namespace=None, name=None):
+        """Gets single dataset files, subsets, supersets, etc. counts, or None if the dataset was not found
+        """
+        did = ObjectSpec(did, namespace=namespace, name=name).did()
+        try:
+            return await self.get_json(f"data/dataset_counts?dataset={did}")
+        except NotFoundError:
+            return None
+
+    async def get_dataset(self, did=None, namespace=None, name=None, exact_file_count=False):
+        """Gets single dataset attributes, or None if the dataset was not found
+        """
+        spec = ObjectSpec(did, namespace=namespace, name=name).did()
+        url = f"data/dataset?dataset={spec}"
+        if exact_file_count:
+            url += "&exact_file_count=yes"
+        try:
+            return await self.get_json(url)
+        except NotFoundError:
+            return None
+
+    async def get_dataset_files(self, did, namespace=None, name=None, with_metadata=False, include_retired_files=False):
+        """Async generator of dataset files, one dictionary per file
+        """
+        if namespace is not None:
+            did = namespace + ':' + name
+        with_metadata = "yes" if with_metadata else "no"
+        include_retired_files = "yes" if include_retired_files else "no"
+        url = f"data/dataset_files?dataset={did}&with_metadata={with_metadata}&include_retired_files={include_retired_files}"
+        async for f in self.json_stream("GET", url):
+            yield f
+
+    async def create_dataset(self, did, frozen=False, monotonic=False, metadata=None, metadata_requirements=None,
+            files_query=None, subsets_query=None, description=""):
+        """Creates new dataset. Requires client authentication. See ``MetaCatClient.create_dataset``
+        """
+        namespace, name = did.split(":",1)
+        params = {
+            "namespace":    namespace,
+            "name":         name,
+            "frozen":       frozen,
+            "monotonic":    monotonic,
+            "metadata":     metadata or {},
+            "metadata_requirements":    metadata_requirements or None,
+            "description":  description or "",
+            "files_query":  files_query or None,
+            "subsets_query":  subsets_query or None
+        }
+        return await self.post_json("data/create_dataset", params)
+
+    async def add_child_dataset(self, parent_spec, child_spec):
+        """Adds a child dataset to a dataset
+        """
+        return await self.get_text(f"data/add_child_dataset?parent={parent_spec}&child={child_spec}")
+
+    async def update_dataset(self, dataset, metadata=None, mode="update", frozen=None, monotonic=None, description=None):
+        """Updates dataset. Requires client authentication. See ``MetaCatClient.update_dataset``
+        """
+        request_data = {}
+        if metadata is not None:
+            request_data["mode"] = mode
+            request_data["metadata"] = metadata
+        if frozen is not None:  request_data["frozen"] = frozen
+        if monotonic is not None:  request_data["monotonic"] = monotonic
+        if description is not None: request_data["description"] = description
+        return await self.post_json(f"data/update_dataset?dataset={dataset}", request_data)
+
+    async def remove_dataset(self, dataset):
+        """Removes a dataset. Requires client authentication.
+        """
+        return await self.get_text(f"data/remove_dataset/{dataset}")
+
+    async def add_files(self, dataset, file_list=None, namespace=None, query=None):
+        """Adds existing files to an existing dataset. Requires client authentication.
+        Returns number of files added. See ``MetaCatClient.add_files``
+        """
+        if ':' not in dataset:
+            if namespace is None:
+                raise ValueError("Namespace not specified for the target dataset")
+            dataset = f"{namespace}:{dataset}"
+        if (file_list is None) == (query is None):
+            raise ValueError("Either file_list or query must be specified, but not both")
+        params = {"namespace": namespace}
+        if file_list is not None:
+            params["file_list"] = file_specs(file_list, namespace)
+        else:
+            params["query"] = query
+        out = await self.post_json(f"data/add_files?dataset={dataset}", params)
+        return out["files_added"]
+
+    async def remove_files(self, dataset, file_list=None, namespace=None, query=None):
+        """Removes files from a dataset. Requires client authentication.
+        Returns number of files removed. See ``MetaCatClient.remove_files``
+        """
+        dataset_spec = ObjectSpec(dataset, namespace=namespace)
+        if (file_list is None) == (query is None):
+            raise ValueError("Either file_list or query must be specified, but not both")
+        params = {
+            "dataset_namespace": dataset_spec.Namespace,
+            "dataset_name": dataset_spec.Name,
+            "namespace": namespace
+        }
+        if file_list is not None:
+            params["file_list"] = file_specs(file_list, namespace)
+        else:
+            params["query"] = query
+        out = await self.post_json("data/remove_files", params)
+        return out["files_removed"]
+
+    async def declare_file(self, did=None, namespace=None, name=None, auto_name=None,
+                     dataset_did=None, dataset_namespace=None,
+                     dataset_name=None, size=0, metadata={}, fid=None, parents=[], checksums={},
+                     dry_run=False):
+        """Declares new file and adds it to the dataset. Requires client authentication. See ``MetaCatClient.declare_file``
+        """
+        if not did:
+            if not namespace:
+                raise ValueError("Unspecified file namespace")
+            if not name and not auto_name:
+                raise ValueError("Unspecified file name")
+        else:
+            namespace, name = parse_name(did)
+        if not (dataset_namespace and dataset_name) and not dataset_did:
+            raise ValueError("Either dataset_did or dataset_namespace and dataset_name must be provided")
+        if dataset_did is None:
+            dataset_did = f"{dataset_namespace}:{dataset_name}"
+        info = dict(
+            namespace = namespace,
+            name = name,
+            size = size,
+            checksums = checksums,
+            fid = fid,
+            parents = parents,
+            metadata = metadata
+        )
+        if not name and auto_name:
+            info["auto_name"] = auto_name
+        return (await self.declare_files(dataset_did, [info], dry_run=dry_run))[0]
+
+    async def declare_files(self, dataset, files, namespace=None, dry_run=False):
+        """Declares new files and adds them to an existing dataset. Requires client authentication.
+        See ``MetaCatClient.declare_files``
+        """
+        lst = declare_files_list(files, namespace)
+        url = f"data/declare_files?dataset={dataset}"
+        if dry_run: url += "&dry_run=yes"
+        return await self.post_json(url, lst)
+
+    async def move_files(self, namespace, file_list=None, query=None):
+        """Moves files to the namespace. Returns tuple (number of files moved, list of errors, number of errors)
+        """
+        params = {"namespace": namespace}
+        if file_list is not None:
+            params["files"] = file_specs(file_list)
+        elif query:
+            params["query"] = query
+        else:
+            raise ValueError("Either file_list or query must be specified, but not both")
+        out = await self.post_json("data/move_files", params)
+        errors = out.get("errors", [])
+        return out["files_moved"], errors, out.get("nerrors", len(errors))
+
+    async def update_file(self, did=None, namespace=None, name=None, fid=None, replace=False,
+                size=None, checksums=None, parents=None, children=None, metadata=None):
+        """Updates file attributes. See ``MetaCatClient.update_file``
+        """
+        data = {"mode":"replace" if replace else "add-update"}
+        data.update(file_spec_data(did, namespace, name, fid))
+        if size is not None:
+            assert isinstance(size, int) and size >= 0
+            data["size"] = size
+        if checksums is not None:
+            assert isinstance(checksums, dict)
+            data["checksums"] = checksums
+        if parents is not None:
+            assert isinstance(parents, list)
+            data["parents"] = [ObjectSpec(p).as_dict() for p in parents]
+        if children is not None:
+            assert isinstance(children, list)
+            data["children"] = [ObjectSpec(c).as_dict() for c in children]
+        if metadata is not None:
+            assert isinstance(metadata, dict)
+            data["metadata"] = metadata
+        return await self.post_json("data/update_file", data)
+
+    async def update_file_meta(self, metadata, files=None, names=None, fids=None, namespace=None, dids=None, mode="update"):
+        """Updates metadata for existing files. Requires client authentication. See ``MetaCatClient.update_file_meta``
+        """
+        if names and not namespace:
+            raise ValueError("Namespace must be specified with names argument")
+        specs = [ObjectSpec(namespace, name).as_dict() for name in (names or [])] \
+            + [ObjectSpec(did).as_dict() for did in (dids or [])] \
+            + [ObjectSpec(fid=fid).as_dict() for fid in (fids or [])] \
+            + file_specs(files or [])
+        chunks = await asyncio.gather(*[
+            self.post_json("data/update_file_meta", {"metadata":metadata, "files":chunk, "mode":mode})
+            for chunk in chunked(specs, 1000)
+        ])
+        return [f for chunk in chunks for f in chunk]
+
+    async def delete_file(self, did=None, namespace=None, name=None, fid=None):
+        """Deletes an existing file
+        """
+        return await self.post_json("data/delete_file", file_spec_data(did, namespace, name, fid))
+
+    async def retire_file(self, did=None, namespace=None, name=None, fid=None, retire=True):
+        """Modifies retired status of the file
+        """
+        data = {"retire": retire}
+        data.update(file_spec_data(did, namespace, name, fid))
+        return await self.post_json("data/retire_file", data)
+
+    async def get_files(self, lookup_list, with_metadata=True, with_provenance=True):
+        """Gets many file records. See ``MetaCatClient.get_files``
+        """
+        with_metadata = "yes" if with_metadata else "no"
+        with_provenance = "yes" if with_provenance else "no"
+        url = "data/files?with_metadata=%s&with_provenance=%s" % (with_metadata, with_provenance)
+        return await self.post_json(url, files_lookup_list(lookup_list))
+
+    async def get_file(self, name=None, namespace=None, fid=None, did=None, with_metadata=True, with_provenance=True, with_datasets=False):
+        """Gets one file record, or None if the file was not found. See ``MetaCatClient.get_file``
+        """
+        assert (fid is not None) or (did is not None) or (name is not None and namespace is not None), \
+            "Either DID or file id or namespace and name must be specified"
+        with_meta = "yes" if with_metadata else "no"
+        with_rels = "yes" if with_provenance else "no"
+        with_datasets = "yes" if with_datasets else "no"
+        url = f"data/file?with_metadata={with_meta}&with_provenance={with_rels}&with_datasets={with_datasets}"
+        if did:
+            namespace, name = parse_name(did, None)
+        if name:
+            url += f"&name={name}&namespace={namespace}"
+        else:
+            url += f"&fid={fid}"
+        try:
+            return await self.get_json(url)
+        except NotFoundError:
+            return None
+
+    async def query(self, query, namespace=None, with_metadata=False, with_provenance=False, save_as=None, add_to=None,
+                        include_retired_files=False, summary=None, after=None):
+        """Runs file query. Returns list of file dictionaries, or the summary. See ``MetaCatClient.query``
+        """
+        assert not (summary is not None and (add_to or save_as)), "Summary can not be used together with add_to or save_as"
+        assert summary in ("count", "keys", None)
+        url = query_url(namespace, with_metadata, with_provenance, save_as, add_to, include_retired_files, summary)
+        if after is not None:
+            url += f"&after={quote_plus(after)}"
+        return await self.post_json(url, query)
+
+    async def query_iter(self, query, namespace=None, with_metadata=False, with_provenance=False,
+                        include_retired_files=False, after=None):
+        """Runs file query. Async generator of file dictionaries, yielded as they arrive from the server
+        """
+        url = query_url(namespace, with_metadata, with_provenance, include_retired_files=include_retired_files)
+        if after is not None:
+            url += f"&after={quote_plus(after)}"
+        async for f in self.json_stream("POST", url, query):
+            yield f
+
+    async def search_named_queries(self, query):
+        """Runs MQL query for named queries
+        """
+        return await self.post_json("data/search_queries", query)
+
+    async def create_namespace(self, name, owner_role=None, description=None):
+        """Creates new namespace. Requires client authentication.
+        """
+        url = f"data/create_namespace?name={name}"
+        if owner_role:
+            url += f"&owner_role={owner_role}"
+        if description:
+            url += f"&description={quote_plus(description)}"
+        return await self.get_json(url)
+
+    async def get_namespace(self, name):
+        """Gets namespace information, or None if the namespace was not found
+        """
+        try:
+            return await self.get_json(f"data/namespace?name={name}")
+        except NotFoundError:
+            return None
+
+    async def get_namespaces(self, names):
+        """Gets information for multiple namespaces
+        """
+        return await self.post_json("data/namespaces", names)
+
+    async def list_namespaces(self, pattern=None, owner_user=None, owner_role=None, directly=False):
+        """Async generator of namespaces. See ``MetaCatClient.list_namespaces``
+        """
+        args = []
+        if owner_user:
+            args.append(f"owner_user={owner_user}")
+            if directly:
+                args.append("directly=yes")
+        if owner_role:
+            args.append(f"owner_role={owner_role}")
+        url = "data/namespaces"
+        if args:
+            url += "?" + "&".join(args)
+        for item in await self.get_json(url):
+            if pattern is None or fnmatch.fnmatch(item["name"], pattern):
+                yield item
+
+    async def list_categories(self, root=None):
+        """Lists categories, sorted by the path, optionally under the root
+        """
+        lst = await self.get_json("data/categories")
+        if root:
+            if not root.endswith('.'):
+                root += '.'
+            lst = [cat for cat in lst if cat["path"].startswith(root)]
+        return sorted(lst, key=lambda c: c["path"])
+
+    async def get_category(self, path):
+        """Gets category information
+        """
+        return await self.get_json(f"data/category/{path}")
+
+    async def get_named_query(self, namespace, name):
+        """Gets named query, or None if the named query does not exist
+        """
+        try:
+            return await self.get_json(f"data/named_query?namespace={namespace}&name={name}")
+        except NotFoundError:
+            return None
+
+    async def list_named_queries(self, namespace=None):
+        """Gets named queries, optionally in the namespace
+        """
+        url = "data/named_queries"
+        if namespace is not None:
+            url += f"?namespace={namespace}"
+        return await self.get_json(url)
+
+    async def create_named_query(self, namespace, name, source, parameters=[], update=False):
+        data = dict(namespace=namespace, name=name, source=source, parameters=parameters)
+        url = "data/create_named_query"
+        if update: url += "?update=yes"
+        return await self.post_json(url, data)
@@ -0,0 +1,160 @@
+import json, hashlib, os, threading, time
+from concurrent.futures import ThreadPoolExecutor
+from metacat.util import chunked
+from .webapi import declare_files_list, AlreadyExistsError
+
+#
+# Bulk file declaration
+#
+# The list of files is split into chunks, each chunk is declared with its own declare_files request
+# and its own server side transaction. Chunks are sent concurrently using the client's pooled connections.
+#
+# Declared chunks are recorded in the journal file, one JSON line per chunk. A chunk is identified by the
+# digest of its contents, so re-running the same declaration with the same journal and chunk size skips
+# the chunks declared before. If a chunk was declared but not recorded (e.g. the client was killed while
+# waiting for the response), the rerun finds its files already in the catalog, adds them to the dataset
+# in case they were declared into another one, and records the chunk then.
+#
+
+class DeclarationJournal(object):
+
+    def __init__(self, path):
+        self.Path = path
+        self.Lock = threading.Lock()
+        self.Done = {}          # digest -> list of declared files
+        if path and os.path.isfile(path):
+            with open(path, "r") as f:
+                for line in f:
+                    line = line.strip()
+                    if line:
+                        try:
+                            record = json.loads(line)
+                        except ValueError:
+                            continue            # last line may be incomplete if the client was killed
+                        self.Done[record["digest"]] = record["files"]
+        self.File = open(path, "a") if path else None
+
+    @staticmethod
+    def digest(dataset, chunk):
+        return hashlib.sha1(json.dumps([dataset, chunk], sort_keys=True).encode("utf-8")).hexdigest()
+
+    def declared(self, digest):
+        # returns list of declared files or None
+        return self.Done.get(digest)
+
+    def record(self, digest, index, files):
+        with self.Lock:
+            self.Done[digest] = files
+            if self.File is not None:
+                self.File.write(json.dumps({"digest": digest, "chunk": index, "files": files}) + "\n")
+                self.File.flush()
+
+    def close(self):
+        if self.File is not None:
+            self.File.close()
+            self.File = None
+
+def _summary(f):
+    return {"fid": f.get("fid"), "namespace": f.get("namespace"), "name": f.get("name")}
+
+class BulkDeclaration(object):
+
+    def __init__(self, client, dataset, files, namespace=None, chunk_size=1000, concurrency=4, journal=None,
+                dry_run=False, report=None):
+        self.Client = client
+        self.Dataset = dataset
+        self.Files = declare_files_list(files, namespace)
+        self.ChunkSize = chunk_size
+        self.Concurrency = concurrency
+        self.DryRun = dry_run
+        self.Journal = DeclarationJournal(None if dry_run else journal)
+        self.Report = report
+        if self.references_input():
+            # parents declared in the same input must be declared before their children
+            self.Concurrency = 1
+
+    def references_input(self):
+        # True if some file refers to a parent, which is in the input list too
+        names = set()
+        fids = set()
+        for f in self.Files:
+            if f.get("fid"):
+                fids.add(f["fid"])
+            if f.get("name"):
+                names.add((f.get("namespace"), f["name"]))
+        for f in self.Files:
+            for p in f.get("parents") or []:
+                if isinstance(p, str):
+                    if p in fids:
+                        return True
+                elif p.get("fid") in fids:
+                    return True
+                elif "did" in p:
+                    if tuple(p["did"].split(":", 1)) in names:
+                        return True
+                elif (p.get("namespace"), p.get("name")) in names:
+                    return True
+        return False
+
+    def already_declared(self, chunk):
+        # if all the files in the chunk exist, makes sure they are in the dataset and returns their list, otherwise None
+        # the files may have been declared into another dataset, adding them again is a no-op
+        lookup = [{"namespace": f["namespace"], "name": f["name"]} for f in chunk if f.get("name")]
+        if len(lookup) != len(chunk):
+            return None                 # auto-named files
+        found = self.Client.get_files(lookup, with_metadata=False, with_provenance=False)
+        found = [_summary(f) for f in found]
+        if len(found) != len(chunk):
+            return None
+        self.Client.add_files(self.Dataset, [{"fid": f["fid"]} for f in found])
+        return found
+
+    def declare_chunk(self, index, start, chunk):
+        # returns (list of declared files, chunk report)
+        digest = self.Journal.digest(self.Dataset, chunk)
+        info = dict(chunk=index, start=start, files=len(chunk), status="declared", error=None, elapsed=0.0, rate=None)
+        t0 = time.time()
+        declared = self.Journal.declared(digest)
+        if declared is not None:
+            info["status"] = "skipped"
+        else:
+            try:
+                try:
+                    declared = [_summary(f) for f in self.Client.declare_files(self.Dataset, chunk, dry_run=self.DryRun)]
+                except AlreadyExistsError:
+                    declared = None if self.DryRun else self.already_declared(chunk)
+                    if declared is None:
+                        raise
+                    info["status"] = "recovered"
+                if not self.DryRun:
+                    self.Journal.record(digest, index, declared)
+            except Exception as e:
+                info["status"] = "failed"
+                info["error"] = e
+                declared = []
+        info["elapsed"] = dt = time.time() - t0
+        if info["status"] == "declared" and dt > 0:
+            info["rate"] = len(chunk)/dt
+        if self.Report is not None:
+            self.Report(info)
+        return declared, info
+
+    def run(self):
+        # returns (list of declared files, list of reports for failed chunks)
+        chunks = []
+        start = 0
+        for chunk in chunked(self.Files, self.ChunkSize):
+            chunks.append((len(chunks), start, chunk))
+            start += len(chunk)
+        try:
+            with ThreadPoolExecutor(max(1, self.Concurrency)) as executor:
+                results = list(executor.map(lambda args: self.declare_chunk(*args), chunks))
+        finally:
+            self.Journal.close()
+        declared = []
+        errors = []
+        for files, info in results:
+            declared.extend(files)
+            if info["error"] is not None:
+                errors.append(info)
+        return declared, errors
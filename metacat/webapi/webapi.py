@@ -1,10 +1,22 @@
-import requests, json, fnmatch, sys, os, random, time
+import requests, json, fnmatch, sys, os, random, time, threading, queue
 from metacat.util import to_str, to_bytes, ObjectSpec, chunked
 from metacat.common import SignedToken, TokenLib, TokenAuthClientMixin, AuthenticationError
+from metacat.common.http_session import PooledSession
 from urllib.parse import quote_plus, unquote_plus
 
 INVALID_METADATA_ERROR_CODE = 488
 
+def _accept_encoding():
+    # encodings the installed urllib3 can decode, e.g. "gzip,deflate" or "gzip,deflate,br,zstd".
+    # requests decodes the responses transparently, including streamed ones.
+    try:
+        from urllib3.util import make_headers
+        return make_headers(accept_encoding=True)["accept-encoding"]
+    except Exception:
+        return "gzip, deflate"
+
+AcceptEncoding = _accept_encoding()
+
 def parse_name(name, default_namespace=None):
     words = name.split(":", 1)
     if len(words) < 2:
@@ -17,6 +29,94 @@ def parse_name(name, default_namespace=None):
 
 undid = parse_name
 
+#
+# Request building helpers shared by MetaCatClient and AsyncMetaCatClient
+#
+
+def file_specs(file_list, default_namespace=None):
+    # validates file specifications, returns list of dictionaries to send to the server
+    lst = []
+    for f in file_list:
+        spec = ObjectSpec.from_dict(f, default_namespace)
+        spec.validate()
+        lst.append(spec.as_dict())
+    return lst
+
+def declare_files_list(files, default_namespace=None):
+    # validates list of files to declare, returns list of dictionaries to send to the server
+    if isinstance(files, dict):
+        files = [files]                     # convenience
+    lst = []
+    for i, item in enumerate(files):
+        f = item.copy()
+        namespace = f.get("namespace", default_namespace)
+        if "did" in f:
+            if "name" in f or "namespace" in f:
+                raise ValueError(f"Both DID and namespace/name specified for {f['did']}")
+            did = f.pop("did")
+            namespace, name = parse_name(did, default_namespace)
+            f["name"] = name
+        f["namespace"] = namespace
+        size = f.get("size")
+        if not isinstance(size, int) or size < 0:
+            raise ValueError(f"File size is unspecified or invalid for file #{i} in the list")
+
+        meta = item.get("metadata", {})
+        for k in meta.keys():
+            if '.' not in k:
+                raise ValueError(f'Invalid metadata key "{k}" for file #{i} in the list: metadata key must contain dot (.)')
+
+        f["metadata"] = meta
+        lst.append(f)
+    return lst
+
+def files_lookup_list(lookup_list):
+    # converts DIDs to namespace/name, returns list of dictionaries to send to the server
+    new_list = []
+    for item in lookup_list:
+        if "fid" in item or "namespace" in item and "name" in item:
+            pass
+        elif "did" in item:
+            did = item["did"]
+            try:
+                namespace, name = did.split(':', 1)
+            except ValueError:
+                raise ValueError("Invalid DID format: " + did)
+            item = {"namespace":namespace, "name":name}
+        else:
+            raise ValueError("Invalid file specifification: " + str(item))
+        new_list.append(item)
+    return new_list
+
+def file_spec_data(did=None, namespace=None, name=None, fid=None):
+    # file specification for update_file, delete_file, retire_file requests
+    if fid:
+        return {"fid": fid}
+    if did:
+        namespace, name = did.split(':', 1)
+    assert namespace and name
+    return {"namespace": namespace, "name": name}
+
+def query_url(namespace=None, with_metadata=False, with_provenance=False, save_as=None, add_to=None,
+                include_retired_files=False, summary=None):
+    if summary:
+        url = f"data/query?summary={summary}"
+        if namespace:
+            url += f"&namespace={namespace}"
+        if include_retired_files:
+            url += "&include_retired_files=yes"
+    else:
+        url = "data/query?with_meta=%s&with_provenance=%s" % ("yes" if with_metadata else "no","yes" if with_provenance else "no")
+        if namespace:
+            url += f"&namespace={namespace}"
+        if save_as:
+            url += f"&save_as={save_as}"
+        if add_to:
+            url += f"&add_to={add_to}"
+        if include_retired_files:
+            url += "&include_retired_files=yes"
+    return url
+
 class MCError(Exception):
     pass
 
@@ -26,7 +126,7 @@ class WebAPIError(MCError):
     
     def __init__(self, url, response=None, message=None):
         self.URL = url
-        self.StatusCode = response.status_code
+        self.StatusCode = None if response is None else response.status_code
         self.Data = None
         self.Body = None
         if message:
@@ -99,13 +199,29 @@ class InvalidMetadataError(WebAPIError):
                 msg.append("    %s: %s" % (error["name"], error["reason"]))
         return "\n".join(msg)
 
+def error_class(status_code):
+    # returns the exception class for the response status code, or None for success
+    if status_code == INVALID_METADATA_ERROR_CODE:
+        return InvalidMetadataError
+    elif status_code == 404:
+        return NotFoundError
+    elif status_code == 403:
+        return PermissionDeniedError
+    elif status_code == 409:
+        return AlreadyExistsError
+    elif status_code == 400:
+        return BadRequestError
+    elif status_code//100 != 2:
+        return WebAPIError
+    return None
+
 class HTTPClient(object):
 
     InitialRetry = 1.0
     RetryExponent = 1.5
     DefaultTimeout = 1800.0
 
-    def __init__(self, server_url, token, timeout=None):
+    def __init__(self, server_url, token, timeout=None, pool_size=None, retries=None):
         self.ServerURL = server_url
         self.Token = token
         if timeout is not None and timeout <= 0:
@@ -113,6 +229,12 @@ class HTTPClient(object):
         else:
             self.Timeout = timeout or self.DefaultTimeout
         self.LastResponse = self.LastURL = self.LastStatusCode = None
+        self.Session = PooledSession(pool_size, retries)      # keep-alive connections, shared by all threads
+
+    def close(self):
+        """Closes the client's persistent connections to the server. They will be re-opened on the next request.
+        """
+        self.Session.close()
 
     def retry_request(self, method, url, timeout=None, **args):
         """
@@ -128,9 +250,9 @@ class HTTPClient(object):
         done = False
         while not done:
             if method == "get":
-                response = requests.get(url, timeout=self.Timeout, **args)
+                response = self.Session.get(url, timeout=self.Timeout, **args)
             else:
-                response = requests.post(url, timeout=self.Timeout, **args)
+                response = self.Session.post(url, timeout=self.Timeout, **args)
             if response.status_code != 503:
                 break
             sleep_time = min(random.random() * retry_interval, tend-time.time())
@@ -144,7 +266,8 @@ class HTTPClient(object):
     def send_request(self, method, uri_suffix, headers=None, timeout=None, **args):
         self.LastURL = url = "%s/%s" % (self.ServerURL, uri_suffix)
         default_headers = {
-            "Accept": "text/plain, application/json, text/json, application/json-seq"
+            "Accept": "text/plain, application/json, text/json, application/json-seq",
+            "Accept-Encoding": AcceptEncoding
         }
         if self.Token is not None:
             default_headers["X-Authentication-Token"] = self.Token.encode()
@@ -154,18 +277,9 @@ class HTTPClient(object):
         self.LastResponse = response = self.retry_request(method, url, headers=headers, **args)
         self.LastStatusCode = response.status_code
         #print("webapi.send_request: status:", response.status_code)
-        if response.status_code == INVALID_METADATA_ERROR_CODE:
-            raise InvalidMetadataError(url, response)
-        elif response.status_code == 404:
-            raise NotFoundError(url, response)
-        elif response.status_code == 403:
-            raise PermissionDeniedError(url, response)
-        elif response.status_code == 409:
-            raise AlreadyExistsError(url, response)
-        elif response.status_code == 400:
-            raise BadRequestError(url, response)
-        elif response.status_code/100 != 2:
-            raise WebAPIError(url, response)
+        error = error_class(response.status_code)
+        if error is not None:
+            raise error(url, response)
         return response
 
     def get_text(self, uri_suffix):
@@ -217,7 +331,7 @@ class HTTPClient(object):
 
     def get_json_stream(self, uri_suffix):
         url = "%s/%s" % (self.ServerURL, uri_suffix)
-        headers = {"Accept": "application/json-seq"}
+        headers = {"Accept": "application/json-seq", "Accept-Encoding": AcceptEncoding}
         if self.Token is not None:
             headers["X-Authentication-Token"] = self.Token.encode()
 
@@ -246,7 +360,8 @@ class MetaCatClient(HTTPClient, TokenAuthClientMixin):
     Version = "1.0"
     
     def __init__(self, server_url=None, auth_server_url=None, max_concurrent_queries = 5,
-                token = None, token_file = None, token_library = None, timeout = None):    
+                token = None, token_file = None, token_library = None, timeout = None,
+                pool_size = None, retries = None):
 
         """Initializes the MetaCatClient object
 
@@ -264,6 +379,10 @@ class MetaCatClient(HTTPClient, TokenAuthClientMixin):
             Use this token for authentication, optional
         timeout : int or float
             Request timeout in seconds. Default: None - use default timeout, which is 300 seconds
+        pool_size : int
+            Maximum number of persistent connections to the server kept open. Default: max(10, max_concurrent_queries)
+        retries : int
+            Number of times to retry connection failures, with exponential backoff. Default: 3
         """
 
         server_url = server_url or os.environ.get("METACAT_SERVER_URL")
@@ -273,7 +392,8 @@ class MetaCatClient(HTTPClient, TokenAuthClientMixin):
         auth_server_url = auth_server_url or os.environ.get("METACAT_AUTH_SERVER_URL")
 
         TokenAuthClientMixin.__init__(self, server_url, auth_server_url, token=token, token_file=token_file, token_library=token_library)
-        HTTPClient.__init__(self, server_url, token=self.token(), timeout=timeout)
+        pool_size = pool_size or max(PooledSession.DefaultPoolSize, max_concurrent_queries)
+        HTTPClient.__init__(self, server_url, token=self.token(), timeout=timeout, pool_size=pool_size, retries=retries)
         self.MaxConcurrent = max_concurrent_queries
         self.AsyncQueue = None
         
@@ -540,12 +660,7 @@ class MetaCatClient(HTTPClient, TokenAuthClientMixin):
             "namespace": namespace,
         }
         if file_list is not None:
-            lst = []
-            for f in file_list:
-                spec = ObjectSpec.from_dict(f, default_namespace)
-                spec.validate()
-                lst.append(spec.as_dict())
-            params["file_list"] = lst
+            params["file_list"] = file_specs(file_list, default_namespace)
         elif query:
             params["query"] = query
         else:
@@ -608,12 +723,7 @@ class MetaCatClient(HTTPClient, TokenAuthClientMixin):
             "namespace": namespace
         }
         if file_list is not None:
-            lst = []
-            for f in file_list:
-                spec = ObjectSpec.from_dict(f, default_namespace)
-                spec.validate()
-                lst.append(spec.as_dict())
-            params["file_list"] = lst
+            params["file_list"] = file_specs(file_list, default_namespace)
         elif query:
             params["query"] = query
         else:
@@ -785,33 +895,7 @@ class MetaCatClient(HTTPClient, TokenAuthClientMixin):
         DEPRECATED: if the parent is specified with a string instead of a dictionary, it is interpreferd as the parent file id.
         """        
         
-        default_namespace = namespace
-        if isinstance(files, dict):
-            files = [files]                     # convenience
-
-        lst = []
-
-        for i, item in enumerate(files):
-            f = item.copy()
-            namespace = f.get("namespace", default_namespace)
-            if "did" in f:
-                if "name" in f or "namespace" in f:
-                    raise ValueError(f"Both DID and namespace/name specified for {did}")
-                did = f.pop("did")
-                namespace, name = parse_name(did, default_namespace)
-                f["name"] = name
-            f["namespace"] = namespace
-            size = f.get("size")
-            if not isinstance(size, int) or size < 0:
-                raise ValueError(f"File size is unspecified or invalid for file #{i} in the list")
-
-            meta = item.get("metadata", {})
-            for k in meta.keys():
-                if '.' not in k:
-                    raise ValueError(f'Invalid metadata key "{k}" for file #{i} in the list: metadata key must contain dot (.)')
-
-            f["metadata"] = meta
-            lst.append(f)
+        lst = declare_files_list(files, namespace)
 
         url = f"data/declare_files?dataset={dataset}"
         if dry_run: url += "&dry_run=yes"
@@ -819,6 +903,46 @@ class MetaCatClient(HTTPClient, TokenAuthClientMixin):
         out = self.post_json(url, lst)
         #print("webapi: declare_files: out:", out)
         return out
+
+    def declare_files_bulk(self, dataset, files, namespace=None, chunk_size=1000, concurrency=4, journal=None,
+                dry_run=False, report=None):
+        """Declare large number of files in chunks. Each chunk is declared with a separate request, in its own
+        transaction on the server side. Chunks are declared concurrently. Requires client authentication.
+
+        Arguments
+        ---------
+        dataset : str
+            "namespace:name"
+        files : list
+            List of dictionaries, one dictionary per file, same as for ``declare_files``
+        namespace: str, optional
+            Default namespace for files to be declared
+        chunk_size : int
+            Number of files per request. Default: 1000
+        concurrency : int
+            Number of chunks declared concurrently. Default: 4. If some files have parents in the same
+            list of files, the chunks are declared one after another, in the order of the list.
+        journal : str
+            Path to the journal file, optional. Declared chunks are recorded in the journal. When the same
+            list of files is declared again with the same chunk size and journal, chunks found in the journal are skipped.
+        dry_run : boolean
+            If true, run all the checks for each chunk, but do not declare the files
+        report : callable
+            Optional, called after each chunk with a dictionary:
+            ``{"chunk":index, "start":index of first file, "files":count, "status":"declared" | "skipped" | "recovered" | "failed",
+            "error":exception or None, "elapsed":seconds, "rate":files per second}``.
+            May be called concurrently from multiple threads.
+
+        Returns
+        -------
+        tuple
+            list of dictionaries ``{"fid":..., "namespace":..., "name":...}`` for declared files,
+            list of reports for failed chunks
+        """
+        from .bulk_declare import BulkDeclaration
+        bulk = BulkDeclaration(self, dataset, files, namespace=namespace, chunk_size=chunk_size, concurrency=concurrency,
+                    journal=journal, dry_run=dry_run, report=report)
+        return bulk.run()
         
     def move_files(self, namespace, file_list=None, query=None):
         """
@@ -855,12 +979,7 @@ class MetaCatClient(HTTPClient, TokenAuthClientMixin):
             "namespace": namespace,
         }
         if file_list is not None:
-            lst = []
-            for f in file_list:
-                spec = ObjectSpec.from_dict(f)
-                spec.validate()
-                lst.append(spec.as_dict())
-            params["files"] = lst
+            params["files"] = file_specs(file_list)
         elif query:
             params["query"] = query
         else:
@@ -906,15 +1025,7 @@ class MetaCatClient(HTTPClient, TokenAuthClientMixin):
         """
 
         data = {"mode":"replace" if replace else "add-update"}
-
-        if fid:
-            data["fid"] = fid
-        else:
-            if did:
-                namespace, name = did.split(':', 1)
-            assert namespace and name
-            data["namespace"] = namespace
-            data["name"] = name
+        data.update(file_spec_data(did, namespace, name, fid))
             
         if size is not None:
             assert isinstance(size, int) and size >= 0
@@ -1035,15 +1146,7 @@ class MetaCatClient(HTTPClient, TokenAuthClientMixin):
         retire : bool
             whether the file should be retired
         """
-        data = {}
-        if fid:
-            data["fid"] = fid
-        else:
-            if did:
-                namespace, name = did.split(':', 1)
-            assert namespace and name
-            data["namespace"] = namespace
-            data["name"] = name
+        data = file_spec_data(did, namespace, name, fid)
         #print("API.delete: sending:", data)
         return self.post_json("data/delete_file", data)
 
@@ -1074,14 +1177,7 @@ class MetaCatClient(HTTPClient, TokenAuthClientMixin):
         data = {
             "retire":   retire
         }
-        if fid:
-            data["fid"] = fid
-        else:
-            if did:
-                namespace, name = did.split(':', 1)
-            assert namespace and name
-            data["namespace"] = namespace
-            data["name"] = name
+        data.update(file_spec_data(did, namespace, name, fid))
         #print("API.retire: sending:", data)
         return self.post_json("data/retire_file", data)
 
@@ -1146,20 +1242,7 @@ class MetaCatClient(HTTPClient, TokenAuthClientMixin):
         
         #print("with_metadata:", with_metadata)
         
-        new_list = []
-        for item in lookup_list:
-            if "fid" in item or "namespace" in item and "name" in item:
-                pass
-            elif "did" in item:
-                did = item["did"]
-                try:
-                    namespace, name = did.split(':', 1)
-                except ValueError:
-                    raise ValueError("Invalid DID format: " + did)
-                item = {"namespace":namespace, "name":name}
-            else:
-                raise ValueError("Invalid file specifification: " + str(item))
-            new_list.append(item)
+        new_list = files_lookup_list(lookup_list)
 
         url = "data/files?with_metadata=%s&with_provenance=%s" % (with_metadata, with_provenance)
 
@@ -1235,8 +1318,11 @@ class MetaCatClient(HTTPClient, TokenAuthClientMixin):
         except NotFoundError:
             return None
 
+    ResumeRetries = 5
+
     def query(self, query, namespace=None, with_metadata=False, with_provenance=False, save_as=None, add_to=None,
-                        include_retired_files=False, summary=None):
+                        include_retired_files=False, summary=None, after=None, page_size=None,
+                        partitions=None, partition_output=None):
         """Run file query. Requires client authentication if save_as or add_to are used.
         
         Arguments
@@ -1259,6 +1345,24 @@ class MetaCatClient(HTTPClient, TokenAuthClientMixin):
             "count" - return file count only as int
             "keys" - return list of all top level metadata keys for the selected files
             ``summary`` can not be used together with ``save_as`` or ``add_to``
+        after : str or None
+            file id. If specified, the results are ordered by file id and include only files with ids greater than ``after``.
+            Use the ``fid`` of the last file received to continue an interrupted query
+        page_size : int or None
+            if specified, the results are ordered by file id and retrieved in pages of up to ``page_size`` files.
+            Each next page is requested after the last file id received. If the connection breaks, the query
+            is resumed after the last file received.
+            ``after`` and ``page_size`` can not be used together with ``summary``, ``save_as`` or ``add_to``
+        partitions : int or None
+            if specified, the query is split into ``partitions`` queries using the ``hash`` filter on the file id,
+            which run concurrently, each on its own connection. The results are returned in the order they arrive.
+            If ``page_size`` is also specified, each partition is retrieved in pages.
+            ``partitions`` can not be used together with ``summary``, ``save_as`` or ``add_to``.
+            If the query uses ``skip`` or ``limit``, it must be ``ordered``, otherwise ValueError is raised
+        partition_output : str or None
+            used with ``partitions``. File path pattern with ``%d``, which is replaced with the partition number.
+            If specified, files of each partition are written to its own file as JSON, one file per line,
+            and the method returns the list of file counts per partition.
 
         Returns
         -------
@@ -1272,27 +1376,121 @@ class MetaCatClient(HTTPClient, TokenAuthClientMixin):
         
         assert not (summary is not None and (add_to or save_as)), "Summary can not be used together with add_to or save_as"
         assert summary in ("count", "keys", None)
-        
-        if summary:
-            url = f"data/query?summary={summary}"
-            if namespace:
-                url += f"&namespace={namespace}"
-            if include_retired_files:
-                url += "&include_retired_files=yes"
-        else:
-            url = "data/query?with_meta=%s&with_provenance=%s" % ("yes" if with_metadata else "no","yes" if with_provenance else "no")
-            if namespace:
-                url += f"&namespace={namespace}"
-            if save_as:
-                url += f"&save_as={save_as}"
-            if add_to:
-                url += f"&add_to={add_to}"
-            if include_retired_files:
-                url += "&include_retired_files=yes"
+        assert not ((after is not None or page_size is not None) and (summary or add_to or save_as)), \
+            "Pagination can not be used together with summary, add_to or save_as"
+        
+        assert not (partitions and (summary or add_to or save_as)), \
+            "Partitions can not be used together with summary, add_to or save_as"
+        
+        url = query_url(namespace, with_metadata, with_provenance, save_as, add_to, include_retired_files, summary)
+        if partitions:
+            self._check_partitioned_query(query, namespace)
+            if partition_output:
+                return self._query_partitions_to_files(query, url, after, page_size, partitions, partition_output)
+            return self._query_partitions(query, url, after, page_size, partitions)
+        if page_size is not None:
+            return self._query_pages(query, url, after, page_size)
+        if after is not None:
+            url += f"&after={quote_plus(after)}"
         #print("url:", url)
         results = self.post_json(url, query)
         return results
 
+    def _query_pages(self, query, url, after, page_size):
+        retries = self.ResumeRetries
+        while True:
+            page_url = url + f"&page_size={page_size}"
+            if after is not None:
+                page_url += f"&after={quote_plus(after)}"
+            n = 0
+            try:
+                for f in self.post_json(page_url, query):
+                    after = f["fid"]
+                    n += 1
+                    yield f
+            except (requests.exceptions.ConnectionError, requests.exceptions.ChunkedEncodingError):
+                if retries <= 0:
+                    raise
+                retries -= 1
+                continue            # resume after the last file received
+            retries = self.ResumeRetries
+            if n < page_size:
+                break
+
+    def _check_partitioned_query(self, query, namespace):
+        # each partition runs the whole query and selects its part of the results, so the query must return
+        # the same files every time. That is not the case if skip or limit is applied to unordered files.
+        from metacat.mql import MQLQuery
+        q = MQLQuery.parse(query, loader=self, default_namespace=namespace)
+        if q.Type == "file" and q.unordered_selection():
+            raise ValueError("Query with skip or limit can be partitioned only if it is ordered")
+
+    def _query_partition(self, query, url, after, page_size, partitions, i):
+        partition_query = f"filter hash({partitions}, {i}) (\n{query}\n)"
+        if page_size is not None:
+            return self._query_pages(partition_query, url, after, page_size)
+        if after is not None:
+            url += f"&after={quote_plus(after)}"
+        return self.post_json(url, partition_query)
+
+    PartitionQueueSize = 10000
+
+    def _query_partitions(self, query, url, after, page_size, partitions):
+        # runs the partitions in threads, yields files as they arrive
+        results = queue.Queue(self.PartitionQueueSize)
+        stop = threading.Event()
+
+        def put(item):
+            while not stop.is_set():
+                try:
+                    results.put(item, timeout=1.0)
+                    return True
+                except queue.Full:
+                    pass
+            return False
+
+        def run(i):
+            try:
+                for f in self._query_partition(query, url, after, page_size, partitions, i):
+                    if not put(f):
+                        break
+            except Exception as e:
+                put(e)
+            finally:
+                put(None)
+
+        threads = [threading.Thread(target=run, args=(i,), daemon=True) for i in range(partitions)]
+        for t in threads:
+            t.start()
+        try:
+            running = partitions
+            while running:
+                item = results.get()
+                if item is None:
+                    running -= 1
+                elif isinstance(item, Exception):
+                    raise item
+                else:
+                    yield item
+        finally:
+            stop.set()          # the consumer stopped early or failed
+
+    def _query_partitions_to_files(self, query, url, after, page_size, partitions, path_pattern):
+        # runs the partitions concurrently, writes files of each partition as JSON lines
+        # returns list of file counts per partition
+        from concurrent.futures import ThreadPoolExecutor
+
+        def run(i):
+            n = 0
+            with open(path_pattern % (i,), "w") as output:
+                for f in self._query_partition(query, url, after, page_size, partitions, i):
+                    output.write(json.dumps(f) + "\n")
+                    n += 1
+            return n
+
+        with ThreadPoolExecutor(partitions) as executor:
+            return list(executor.map(run, range(partitions)))
+
     def async_query(self, query, data=None, **args):
         """Run the query asynchronously. Requires client authentication if save_as or add_to are used.
         
@@ -1323,6 +1521,106 @@ class MetaCatClient(HTTPClient, TokenAuthClientMixin):
         self.async_queue.waitUntilEmpty()
 
 
+    #
+    # Asynchronous query jobs
+    #
+    def submit_query(self, query, namespace=None, with_metadata=False, with_provenance=False, save_as=None, add_to=None,
+                        include_retired_files=False, summary=None):
+        """Submit a query to run on the server in the background. Unlike ``query``, the query does not depend on the
+        connection to the server. Requires client authentication if save_as or add_to are used.
+        
+        Arguments
+        ---------
+        query : str
+            Query in MQL
+        others
+            same as for ``query``
+        
+        Returns
+        -------
+        dict
+            Job status, see ``job_status``. Use ``"job_id"`` to get the status and the results of the query later.
+        """
+        assert not (summary is not None and (add_to or save_as)), "Summary can not be used together with add_to or save_as"
+        assert summary in ("count", "keys", None)
+        url = query_url(namespace, with_metadata, with_provenance, save_as, add_to, include_retired_files, summary)
+        url = url.replace("data/query?", "data/query_jobs?", 1)
+        return self.post_json(url, query)
+
+    def job_status(self, job_id):
+        """Get status of a query job
+        
+        Arguments
+        ---------
+        job_id : str
+        
+        Returns
+        -------
+        dict or None
+            ``{"job_id":..., "status":"queued" | "running" | "done" | "failed" | "cancelled", "rows":number of results so far,
+            "message":error message or None, "expires_timestamp":when the results will be removed, ...}``
+            or None if the job is not found or expired
+        """
+        try:
+            return self.get_json(f"data/query_jobs/{job_id}")
+        except NotFoundError:
+            return None
+
+    def cancel_job(self, job_id):
+        """Cancel a query job
+        
+        Returns
+        -------
+        dict
+            Job status
+        """
+        return self.get_json(f"data/query_jobs/{job_id}/cancel")
+
+    JobPollInterval = 5.0
+
+    def job_results(self, job_id, offset=0, page_size=10000, wait=True):
+        """Get results of a query job, in pages
+        
+        Arguments
+        ---------
+        job_id : str
+        offset : int
+            number of results to skip
+        page_size : int
+            number of results to request at once
+        wait : boolean
+            if True, wait for the job to end, getting the results as they are produced.
+            Otherwise, return the results available now.
+        
+        Yields
+        ------
+        generator
+            file or dataset dictionaries, or summary, same as returned by ``query``
+        
+        Notes
+        -----
+        Raises ``WebAPIError`` if the job failed or was cancelled
+        """
+        while True:
+            status = self.job_status(job_id)
+            if status is None:
+                raise NotFoundError(f"data/query_jobs/{job_id}", message=f"Query job {job_id} not found or expired")
+            ended = status["status"] not in ("queued", "running")
+            while offset < status["rows"]:
+                n = 0
+                for item in self.get_json(f"data/query_jobs/{job_id}/results?offset={offset}&limit={page_size}"):
+                    n += 1
+                    yield item
+                offset += n
+                if n < page_size:
+                    break
+            if status["status"] in ("failed", "cancelled"):
+                raise WebAPIError(f"data/query_jobs/{job_id}", 
+                    message=f"Query job {job_id} {status['status']}: {status.get('message') or ''}".strip())
+            if ended or not wait:
+                break
+            time.sleep(self.JobPollInterval)
+
     def search_named_queries(self, query):
         """
         Run MQL query for named queries
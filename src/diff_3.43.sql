@@ -0,0 +1,197 @@
+--
+-- Upgrade of a 3.42 database: schema objects added since then, and backfill of the derived tables and counters
+--
+-- Run with: psql -v ON_ERROR_STOP=1 -f diff_3.43.sql <database>
+-- The script runs in one transaction and can be re-run.
+--
+
+begin;
+
+--
+-- Typed extraction of metadata values, used by expression indexes of the keys listed in indexed_metadata_keys
+--
+
+create or replace function meta_text(v jsonb) returns text as $$
+    select case when jsonb_typeof(v) = 'string' then v #>> '{}' end
+$$ language sql immutable parallel safe;
+
+create or replace function meta_float(v jsonb) returns double precision as $$
+    select case when jsonb_typeof(v) = 'number' then (v #>> '{}')::double precision end
+$$ language sql immutable parallel safe;
+
+create or replace function meta_text_array(v jsonb) returns text[] as $$
+    select case jsonb_typeof(v)
+        when 'array' then array(select e #>> '{}' from jsonb_array_elements(v) e where jsonb_typeof(e) = 'string')
+        when 'string' then array[v #>> '{}']
+    end
+$$ language sql immutable parallel safe;
+
+create or replace function meta_float_array(v jsonb) returns double precision[] as $$
+    select case jsonb_typeof(v)
+        when 'array' then array(select (e #>> '{}')::double precision from jsonb_array_elements(v) e where jsonb_typeof(e) = 'number')
+        when 'number' then array[(v #>> '{}')::double precision]
+    end
+$$ language sql immutable parallel safe;
+
+--
+-- Adler-32 checksum of the UTF-8 bytes of the text, same as Python zlib.adler32(t.encode("utf-8")).
+-- Used by the SQL implementation of the "hash" filter.
+--
+
+create or replace function adler32(t text) returns bigint as $$
+declare
+    b       bytea := convert_to(t, 'UTF8');
+    s1      bigint := 1;
+    s2      bigint := 0;
+begin
+    for i in 0 .. octet_length(b) - 1 loop
+        s1 := s1 + get_byte(b, i);
+        s2 := s2 + s1;
+    end loop;
+    return (s2 % 65521) * 65536 + s1 % 65521;
+end
+$$ language plpgsql immutable strict parallel safe;
+
+create table if not exists indexed_metadata_keys
+(
+    name                text    primary key,
+    type                text    check (type in ('text', 'float')),
+    is_array            boolean default false,
+    index_name          text,
+    creator             text references users(username),
+    created_timestamp   timestamp with time zone        default now()
+);
+
+--
+-- Dataset hierarchy closure
+--
+
+create table if not exists datasets_closure
+(
+    ancestor_namespace      text,
+    ancestor_name           text,
+    descendant_namespace    text,
+    descendant_name         text,
+    depth                   int,
+    foreign key (ancestor_namespace, ancestor_name) references datasets(namespace, name) on delete cascade,
+    foreign key (descendant_namespace, descendant_name) references datasets(namespace, name) on delete cascade,
+    primary key (ancestor_namespace, ancestor_name, descendant_namespace, descendant_name)
+);
+
+create index if not exists datasets_closure_descendant on datasets_closure(descendant_namespace, descendant_name, ancestor_namespace, ancestor_name);
+
+-- same as DBDataset.rebuild_closure()
+delete from datasets_closure;
+
+insert into datasets_closure(ancestor_namespace, ancestor_name, descendant_namespace, descendant_name, depth)
+    with recursive reachable(root_namespace, root_name, namespace, name, depth) as
+    (
+        select parent_namespace, parent_name, child_namespace, child_name, 1
+            from datasets_parent_child
+        union
+        select rr.root_namespace, rr.root_name, pc.child_namespace, pc.child_name, rr.depth + 1
+            from reachable rr, datasets_parent_child pc
+            where pc.parent_namespace = rr.namespace and pc.parent_name = rr.name
+                and rr.depth < 1000
+    )
+    select root_namespace, root_name, namespace, name, min(depth)
+        from reachable
+        where (root_namespace, root_name) != (namespace, name)
+        group by root_namespace, root_name, namespace, name;
+
+--
+-- File counters
+--
+-- datasets.file_count now counts non-retired files only, namespaces.file_count counts all files.
+-- Both are exact once the deltas are added, so they are recalculated here.
+--
+
+create table if not exists dataset_file_count_deltas
+(
+    id                      bigserial   primary key,
+    dataset_namespace       text,
+    dataset_name            text,
+    delta                   bigint,
+    foreign key(dataset_namespace, dataset_name) references datasets(namespace, name) on delete cascade
+);
+
+create index if not exists dataset_file_count_deltas_dataset on dataset_file_count_deltas(dataset_namespace, dataset_name) include (delta);
+
+create table if not exists namespace_file_count_deltas
+(
+    id                      bigserial   primary key,
+    namespace               text        references namespaces(name) on delete cascade,
+    delta                   bigint
+);
+
+create index if not exists namespace_file_count_deltas_namespace on namespace_file_count_deltas(namespace) include (delta);
+
+delete from dataset_file_count_deltas;
+delete from namespace_file_count_deltas;
+
+update datasets d
+    set file_count = coalesce(
+        (
+            select count(*)
+                from files_datasets fd, files f
+                where fd.dataset_namespace = d.namespace and fd.dataset_name = d.name
+                    and f.id = fd.file_id and not f.retired
+        ), 0);
+
+update namespaces n
+    set file_count = coalesce((select count(*) from files f where f.namespace = n.name), 0);
+
+--
+-- Catalog change log, used to invalidate cached query results
+--
+
+create table if not exists catalog_changes
+(
+    id                      bigserial   primary key,
+    namespace               text,
+    dataset_namespace       text,
+    dataset_name            text,
+    txid                    bigint      default txid_current(),
+    created_timestamp       timestamp with time zone     default now()
+);
+
+create index if not exists catalog_changes_txid on catalog_changes(txid);
+create index if not exists catalog_changes_dataset on catalog_changes(dataset_namespace, dataset_name, txid);
+create index if not exists catalog_changes_created on catalog_changes(created_timestamp);
+
+--
+-- Named query versions
+--
+
+alter table queries add column if not exists version bigint default 1;
+
+--
+-- Asynchronous query jobs
+--
+
+create table if not exists query_jobs
+(
+    id                      text        primary key,
+    owner                   text        references users(username),
+    query                   text,
+    params                  jsonb       default '{}',
+    status                  text        default 'queued'
+        constraint query_job_status check ( status in ('queued', 'running', 'done', 'failed', 'cancelled') ),
+    rows                    bigint      default 0,
+    error                   text,
+    created_timestamp       timestamp with time zone     default now(),
+    updated_timestamp       timestamp with time zone     default now(),
+    expires_timestamp       timestamp with time zone
+);
+
+create index if not exists query_jobs_expires on query_jobs(expires_timestamp);
+
+create table if not exists query_job_results
+(
+    job_id                  text        references query_jobs(id) on delete cascade,
+    seq                     bigint,
+    data                    text,
+    primary key(job_id, seq)
+);
+
+commit;
@@ -0,0 +1,44 @@
+import os, threading
+from metacat.db import DBFile
+from metacat.filters import MetaCatBatchFilter
+
+class _Unpicklable(object):
+    # stands for the database connection, which can not be sent to another process
+    Lock = threading.Lock()
+
+class ParityFilter(MetaCatBatchFilter):
+
+    ChunkSize = 3
+    Concurrency = 2
+    CPUBound = True
+
+    def filter_chunk(self, chunk, remainder, **ignore):
+        out = []
+        for f in chunk:
+            if int(f.Name.split(".")[0]) % 2 == remainder:
+                f.Metadata["pid"] = os.getpid()
+                out.append(f)
+        return out
+
+def files(n):
+    db = _Unpicklable()
+    return [DBFile(db, namespace="test", name="%d.dat" % (i,), fid="f%d" % (i,), metadata={}) for i in range(n)]
+
+def test_process_pool():
+    inputs = files(20)
+    f = ParityFilter()
+    try:
+        out = list(f.run([inputs], [1], {}))
+    finally:
+        f.Pool.shutdown()
+    assert [x.FID for x in out] == ["f%d" % (i,) for i in range(1, 20, 2)]
+    assert all(x.DB is inputs[0].DB for x in out)
+    assert all(x.Metadata["pid"] != os.getpid() for x in out)
+
+def test_process_pool_limit():
+    f = ParityFilter()
+    try:
+        out = list(f.run([files(20)], [0], {}, limit=4, skip=1))
+    finally:
+        f.Pool.shutdown()
+    assert [x.FID for x in out] == ["f2", "f4", "f6", "f8"]
@@ -0,0 +1,74 @@
+#
+# Client per-call latency benchmark
+#
+# Compares a new connection per request (plain requests.get) with the pooled keep-alive session
+# used by the MetaCat client. By default, runs against a minimal local HTTP/1.1 server started
+# in this process, which answers the "data/version" request. Use -u to run against a real server.
+#
+#   python tools/client_latency_benchmark.py [-u <server URL>] [-n <calls>] [-t <threads>]
+#
+
+import sys, time, getopt, threading, requests
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from concurrent.futures import ThreadPoolExecutor
+from metacat.common.http_session import PooledSession
+
+class Handler(BaseHTTPRequestHandler):
+
+    protocol_version = "HTTP/1.1"       # keep-alive
+    disable_nagle_algorithm = True      # headers and body are written separately
+
+    def do_GET(self):
+        body = b'"benchmark"'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *params):
+        pass
+
+def local_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, "http://127.0.0.1:%d" % (server.server_address[1],)
+
+def run(get, url, ncalls, nthreads):
+    # returns (total time, list of per-call latencies)
+    def call(_):
+        t0 = time.perf_counter()
+        response = get(url, timeout=30)
+        response.raise_for_status()
+        return time.perf_counter() - t0
+    t0 = time.perf_counter()
+    with ThreadPoolExecutor(nthreads) as executor:
+        latencies = sorted(executor.map(call, range(ncalls)))
+    return time.perf_counter() - t0, latencies
+
+def main():
+    opts, args = getopt.getopt(sys.argv[1:], "u:n:t:")
+    opts = dict(opts)
+    ncalls = int(opts.get("-n", 1000))
+    nthreads = int(opts.get("-t", 1))
+    server = None
+    server_url = opts.get("-u")
+    if not server_url:
+        server, server_url = local_server()
+    url = server_url.rstrip("/") + "/data/version"
+
+    session = PooledSession(pool_size=nthreads)
+    print("%s, %d calls, %d threads" % (url, ncalls, nthreads))
+    print("  %-20s %10s %10s %10s %12s" % ("", "median ms", "p99 ms", "max ms", "calls/second"))
+    for title, get in [("new connection", requests.get), ("pooled session", session.get)]:
+        total, latencies = run(get, url, ncalls, nthreads)
+        print("  %-20s %10.2f %10.2f %10.2f %12.0f" % (title,
+            latencies[len(latencies)//2]*1000, latencies[int(len(latencies)*0.99)]*1000, latencies[-1]*1000,
+            ncalls/total))
+    session.close()
+    if server is not None:
+        server.shutdown()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+#
+# Hash filter benchmark
+#
+# Compares the ways to select files by Adler-32 of the file id, on synthetic file ids in a temporary table:
+#
+#   python      - ids are fetched and hashed with zlib.adler32, as the Python implementation of the filter does
+#   inline SQL  - per-row subquery over generate_series() of the id bytes, the previous SQL implementation
+#   adler32()   - the adler32() SQL function from schema.sql, used by Hash.sql()
+#
+# The database must have the adler32() function, see schema.sql or src/diff_3.43.sql
+#
+#   python tools/hash_filter_benchmark.py [-n <files>] [-r <repeat>] [-m <modulo>] "<postgres connection string>"
+#
+
+import sys, time, getopt, random, base64, uuid, zlib
+import psycopg2
+
+InlineSQL = """
+    select count(*) from hash_benchmark_ids t
+        where (
+            select ((count(*) + sum((n - i) * get_byte(b, i))) %% 65521) * 65536 + (1 + sum(get_byte(b, i))) %% 65521
+                from (select convert_to(t.id, 'UTF8') as b, octet_length(convert_to(t.id, 'UTF8')) as n) x,
+                    generate_series(0, x.n - 1) i
+        ) %% %(modulo)s = %(remainder)s
+"""
+
+FunctionSQL = """
+    select count(*) from hash_benchmark_ids t
+        where adler32(t.id) %% %(modulo)s = %(remainder)s
+"""
+
+def python_count(c, modulo, remainder):
+    c.execute("select id from hash_benchmark_ids")
+    n = 0
+    for (fid,) in c.fetchall():
+        if zlib.adler32(fid.encode("utf-8")) % modulo == remainder:
+            n += 1
+    return n
+
+def sql_count(sql):
+    def count(c, modulo, remainder):
+        c.execute(sql, dict(modulo=modulo, remainder=remainder))
+        return c.fetchone()[0]
+    return count
+
+def run(count, c, modulo, repeat):
+    best = None
+    total = 0
+    for _ in range(repeat):
+        t0 = time.time()
+        total = sum(count(c, modulo, r) for r in range(modulo))
+        dt = time.time() - t0
+        best = dt if best is None else min(best, dt)
+    return total, best
+
+def main():
+    opts, args = getopt.getopt(sys.argv[1:], "n:r:m:")
+    opts = dict(opts)
+    if not args:
+        print('Usage: python tools/hash_filter_benchmark.py [-n <files>] [-r <repeat>] [-m <modulo>] "<postgres connection string>"')
+        sys.exit(2)
+    nfiles = int(opts.get("-n", 100000))
+    repeat = int(opts.get("-r", 3))
+    modulo = int(opts.get("-m", 4))
+
+    db = psycopg2.connect(args[0])
+    c = db.cursor()
+    random.seed(0)
+    c.execute("create temp table hash_benchmark_ids(id text)")
+    ids = [base64.b64encode(uuid.UUID(int=random.getrandbits(128)).bytes, b"__")[:16].decode("utf-8") for _ in range(nfiles)]
+    c.executemany("insert into hash_benchmark_ids(id) values(%s)", [(fid,) for fid in ids])
+    c.execute("analyze hash_benchmark_ids")
+
+    print("%d file ids, all %d partitions, best of %d:" % (nfiles, modulo, repeat))
+    print("  %-12s %10s %14s %10s" % ("method", "time", "ids/second", "selected"))
+    for name, count in [
+                ("python", python_count),
+                ("inline SQL", sql_count(InlineSQL)),
+                ("adler32()", sql_count(FunctionSQL))
+            ]:
+        n, t = run(count, c, modulo, repeat)
+        print("  %-12s %10.3f %14.0f %10d" % (name, t, nfiles/t, n))
+    db.rollback()
+
+if __name__ == "__main__":
+    main()
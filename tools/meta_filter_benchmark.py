@@ -0,0 +1,92 @@
+#
+# Meta filter benchmark
+#
+# Compares the interpreting MetaEvaluator with the predicates compiled by MetaExpressionCompiler
+# on synthetic files. Meta expressions are taken from the "where" clauses of MQL queries.
+#
+#   python tools/meta_filter_benchmark.py [-n <files>] [-r <repeat>]
+#
+
+import sys, time, getopt, random
+from datetime import datetime, timezone
+from metacat.mql import MQLQuery
+from metacat.mql.meta_evaluator import MetaEvaluator, compile_meta_expression
+
+Expressions = [
+    'core.data_tier = raw',
+    'core.run > 1500 and core.data_tier = raw',
+    'core.runs[any] in (1001, 1002, 1003, 1004, 1005)',
+    'core.runs[0] = 1001',
+    'len(core.runs) >= 2',
+    'core.file_type in ("detector", "mc") and core.events in 100:200',
+    'core.data_stream ~ "phys.*" and params.energy > 0.5',
+    'core.data_tier = raw or core.data_tier = reco or core.data_tier = "root-tuple"',
+    'DUNE_data.detector_config.list present and core.run not in 1000:1200',
+    'size > 1000000 and namespace = dune',
+    'params.energy in 0.1:0.9 and core.runs[any] = 1500 and core.data_stream !~* "COSMICS" and core.file_type = detector',
+]
+
+class File(object):
+
+    def __init__(self, i):
+        self.Namespace = "dune"
+        self.Name = "file_%08d.root" % (i,)
+        self.Creator = "user%d" % (i % 7,)
+        self.Size = random.randint(1, 10000000)
+        self.CreatedTimestamp = datetime.now(timezone.utc)
+        run = random.randint(1000, 2000)
+        self.Metadata = {
+            "core.data_tier":   random.choice(["raw", "reco", "root-tuple", "full-reconstructed"]),
+            "core.file_type":   random.choice(["detector", "mc", "importedDetector"]),
+            "core.data_stream": random.choice(["physics", "cosmics", "test", "calibration"]),
+            "core.run":         run,
+            "core.runs":        [run, run + 1],
+            "core.events":      random.randint(0, 300),
+            "params.energy":    random.random()
+        }
+        if i % 3 == 0:
+            self.Metadata["DUNE_data.detector_config.list"] = ["a", "b"]
+
+    def metadata(self):
+        return self.Metadata
+
+def meta_expression(where):
+    q = MQLQuery.parse("files from a:b where " + where)
+    bfq = next(q.Tree.find_all("basic_file_query"))
+    return bfq["query"].Wheres
+
+def run(predicate, files, repeat):
+    best = None
+    for _ in range(repeat):
+        t0 = time.time()
+        n = sum(1 for _ in filter(predicate, files))
+        dt = time.time() - t0
+        best = dt if best is None else min(best, dt)
+    return n, best
+
+def main():
+    opts, args = getopt.getopt(sys.argv[1:], "n:r:")
+    opts = dict(opts)
+    nfiles = int(opts.get("-n", 100000))
+    repeat = int(opts.get("-r", 3))
+
+    random.seed(0)
+    files = [File(i) for i in range(nfiles)]
+
+    print("%d files, best of %d, files/second:" % (nfiles, repeat))
+    print("  %-60s %12s %12s %8s" % ("expression", "interpreted", "compiled", "speedup"))
+    for where in Expressions:
+        exp = meta_expression(where)
+        evaluator = MetaEvaluator()
+        def interpreted(f):
+            # the interpreter does not support some of the node types produced by the current compiler
+            try:    return evaluator(f, exp)
+            except Exception:
+                return False
+        n0, t0 = run(interpreted, files, repeat)
+        n1, t1 = run(compile_meta_expression(exp), files, repeat)
+        note = "" if n0 == n1 else "   (selected %d vs %d)" % (n0, n1)
+        print("  %-60s %12.0f %12.0f %8.1f%s" % (where[:60], nfiles/t0, nfiles/t1, t0/t1, note))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,15 @@
+#
+# Generates pre-computed LALR parse tables for the MQL parser, see metacat/mql/parser.py
+# Run after any change in the MQL grammar:
+#
+#   python tools/mql_lalr_tables.py [<output file>]
+#
+
+import sys, os.path
+from metacat.mql.parser import generate_tables
+import metacat.mql.grammar
+
+path = sys.argv[1] if len(sys.argv) > 1 else os.path.join(os.path.dirname(metacat.mql.grammar.__file__), "lalr_tables.py")
+with open(path, "w") as out:
+    generate_tables(out)
+print("LALR tables written to", path)
@@ -0,0 +1,256 @@
+#
+# MQL parser benchmark
+#
+# Compares the Earley parser (used by MetaCat up to now and kept as the fallback) with the LALR parser
+# built from the pre-generated tables:
+#   - time to create the parser in a new process
+#   - time to parse a corpus of queries from the documentation
+#   - time to parse long generated queries of growing size
+#
+#   python tools/mql_parser_benchmark.py [-n <repeat>]
+#
+
+import sys, time, getopt, subprocess
+from metacat.mql.parser import build_earley_parser, load_lalr_parser
+
+Corpus = [
+    'files from MyScope:MyDataset',
+    'files from MyScope:MC1, MyScope:MC2, AnotherScope:MC',
+    'files my_namespace:file_name.data, file1.data, file2.data,\nanoher_namespace:file3.data',
+    'fids 1234, 12354, 12363',
+    'files from MyScope:MyDataset\nwhere params.x > 0.5',
+    'files from scope:dataset where data.type = monte-carlo and creator=joe',
+    'datasets matching scope:data_* having frozen=false and math.pi=3.14',
+    'parents (\nfiles from MyScope:MyDataset\nwhere x > 0.5 and x < 1.5\nand run = 123\nand ( type="MC" or type="Data" )\n)',
+    'children (\nfiles from MyScope:MyDataset\nwhere params.x > 0.5 and params.x < 1.5\nand dara.run = 123\nand ( data.type="MC" or data.type="Data" )\n)',
+    'ancestors (\nfiles from MyScope:RecoDataset\n) where core.data_tier = raw',
+    'descendants (\nfiles from MyScope:RawDataset where core.runs[any] = 1234,\ndepth = 2\n)',
+    'files from MyScope:MyDataset\n- parents (\nchildren (\nfiles from MyScope:MyDataset\n)\n)',
+    'files from MC:All\nwhere params.p > 0.5 and params.p < 1.5 and params.e = 10',
+    'files from MC:Beam where params.e1 > 10 - files from MC:Exotics',
+    '(files from MC:Beam where params.e1 > 10)\n- (files from MC:Exotics where data.type = "abcd")',
+    'union (\nfiles from s:A,\njoin(\nfiles from s:B,\nfiles from s:C\n)\n)',
+    '[\nfiles from s:A,\n{\nfiles from s:B,\nfiles from s:C\n}\n]',
+    'filter sample(0.5)( files from s:A )',
+    'filter every_nth(3,1)( files from s:A )',
+    'filter sample(1,2,5)(\nfiles from s:A,\nfiles from s:B,\nfiles from s:C\n)',
+    "filter my_filter(3, 'test', pi=3.14, e=2.718) (\nfiles from user:dataset_a,\nfiles from group:dataset_b where params.x=5\n)",
+    '{\nfiles from s:B,\nfiles from s:C\n}',
+    'files from namespace:dataset\nwhere core.timestamp > datetime("2011-11-04 00:05:23.283")',
+    'files from namespace:dataset\nwhere core.timestamp > date("2011-11-04")',
+    'files from namespace:dataset\nwhere core.timestamp < date(2011-11-04, "-05:00")',
+    'files from namespace:dataset\nwhere core.timestamp in date(2011-11-04, "-05:00") : date(2011-11-05, "+01:00")',
+    'files from namespace:dataset\nwhere\ncore.timestamp = date("2011-11-04")\nor core.timestamp = date("2011-11-06")\nor core.timestamp = date("2011-11-08")',
+    'files from dune:all where\nDUNE_data.detector_config.list present\nlimit 100',
+    'union (\nfiles from dune:all where\nDUNE_data.detector_config.list present\nlimit 100\n,\nfiles from dune:mc where\nlen(core.events) > 10\n) limit 200',
+    'filter sample(0.1) (\nfiles from dune:all where\nDUNE_data.detector_config.list present\nlimit 10000\n)',
+    'files from dune:all where\nDUNE_data.detector_config.list present\nskip 100\nlimit 100',
+    'files from dune:all where\nDUNE_data.detector_config.list present\nskip 100\nlimit 1000\nskip 10\nskip 5\nlimit 50',
+    '(\n(\n(\n(\n(\nfiles from dune:all where\nDUNE_data.detector_config.list present\n) skip 100\n) limit 1000\n) skip 10\n) skip 5\n) limit 50',
+    'files from dune:all where\nDUNE_data.detector_config.list present\nskip 115\nlimit 50',
+    'files from dc4:dc4\nwhere 12345 in core.runs\nskip 100',
+    '(\n(\nfiles from dc4:dc4\nwhere 12345 in core.runs\n) ordered\n) skip 100',
+    'datasets matching test:*',
+    'datasets test:a with subsets recursively,\ntest:c with subsets,\nmatching test:x*',
+    'files',
+    'files from a:b',
+    'files from datasets a:b',
+    'files from a:b, c:d',
+    'files from matching a:b*',
+    'files from matching regexp a:"b.*"',
+    'files from a:b with subsets',
+    'files from a:b with subsets recursively',
+    'files from a:b with subsets recursively having x.y = 1',
+    'files from a:b having x.y = 1 and frozen = true',
+    'files from a:b where x.y = 1 or x.z != "abc"',
+    'files from a:b where x.y ~ "ab.*" and x.z ~* "q" and x.w !~ "x" and x.v !~* "x"',
+    'files from a:b where x.y like "ab%"',
+    'files from a:b where x.y >= 1.5 and x.y <= -2 and x.z > +3 and x.w < 4e3',
+    'files from a:b where x.y == 5',
+    'files from a:b where x.y in 1:5',
+    'files from a:b where x.y not in 1:5',
+    'files from a:b where x.y in 1.0:2.5',
+    'files from a:b where x.y in "a":"b"',
+    'files from a:b where x.y in (1,2,3)',
+    'files from a:b where x.y not in (1, 2, 3)',
+    'files from a:b where x.y in (a, b, c)',
+    'files from a:b where x.y in ("a", \'b\', c)',
+    'files from a:b where x.y present',
+    'files from a:b where x.y not present',
+    'files from a:b where x.y not present and x.z present',
+    'files from a:b where 5 in x.y',
+    'files from a:b where 5 not in x.y',
+    'files from a:b where "abc" in x.y',
+    'files from a:b where abc not in x.y',
+    'files from a:b where x.y[any] = 5',
+    'files from a:b where x.y[all] > 5',
+    'files from a:b where x.y[2] = 5',
+    'files from a:b where x.y[-1] = 5',
+    'files from a:b where x.y["k"] = 5',
+    'files from a:b where len(x.y) > 5',
+    'files from a:b where !(x.y = 5)',
+    'files from a:b where ! x.y = 5',
+    'files from a:b where !(x.y = 5 or x.z in 1:2)',
+    'files from a:b where exists "$.x.y"',
+    'files from a:b where name = "abc"',
+    'files from a:b where namespace = abc and size > 100',
+    'files from a:b where creator = joe',
+    'files from a:b where x.y = true and x.z = False',
+    'files from a:b where x.y = trueish',
+    'files from a:b where x.y = 2011-11-04',
+    'files from a:b where x.y = 1.5e',
+    'files from a:b where x.y = 123abc',
+    'files from a:b where x.y = abc-def.ghi',
+    'files from a:b where x.y = datetime(2011-11-04)',
+    'files from a:b where x.y = date(2011-11-04)',
+    'files from a:b where x.y = date("2011-11-04", "+05:00")',
+    'files from a:b where x.y in date(2011-11-04):date(2011-11-05)',
+    'files from a:b where created_timestamp > datetime("2020-01-01 10:00:00")',
+    'files from a:b where x.y = 5 limit 10',
+    'files from a:b limit 10 where x.y = 5',
+    'files from a:b skip 10 limit 5',
+    'files from a:b ordered',
+    'files from a:b ordered skip 10 limit 5',
+    'files from a:b where x.y = 5 ordered limit 3',
+    'files from a:b - files from c:d',
+    'files from a:b - files from c:d - files from e:f',
+    'files from a:b - files from c:d limit 10',
+    'files from a:b - files from c:d where x.y=1',
+    'files from a:b where x.y=1 - files from c:d where z.w=2 ordered skip 5 limit 3',
+    'files from a:b - files from c:d limit 10 where x.y=1',
+    'files from a:b limit 10 where x.y=1 - files from c:d',
+    'files from a:b - files from c:d limit 10 where x.y=1 - files from e:f',
+    'files from a:b - (files from c:d limit 10)',
+    '(files from a:b - files from c:d) limit 10',
+    'union(files from a:b, files from c:d)',
+    'union(files from a:b, c:d, files from e:f)',
+    'union(files from a:b, c:d)',
+    'join(files from a:b where x.y = 1, files from c:d)',
+    '[files from a:b, files from c:d] where x.y = 1',
+    '{files from a:b, files from c:d} - files from e:f',
+    'union(files from a:b, files from c:d) limit 5',
+    'join(files a:b, c:d, files e:f)',
+    'union(fids 1,2,3, fids 4, files from a:b)',
+    'union(fids 1,2,3, files a:b, c:d, filter sample(0.5)(files from a:b))',
+    'parents(files from a:b)',
+    'children(files from a:b where x.y = 1) where z.w = 2',
+    'children(files from a:b, c:d)',
+    'ancestors(files from a:b)',
+    'ancestors(files from a:b, depth=2)',
+    'ancestors(files from a:b, c:d, depth = 3)',
+    'descendants(files from a:b where x.y = 1, depth=1) limit 10',
+    'descendants(parents(files from a:b), depth=1)',
+    'filter sample(0.5)(files from a:b)',
+    'filter sample()(files from a:b)',
+    'filter sample(0.5, 1, abc)(files from a:b)',
+    'filter sample(a=1)(files from a:b)',
+    'filter sample(0.5, a=1, b="x")(files from a:b)',
+    'filter sample(0.5, 2, a=1, b=x)(files from a:b, files from c:d)',
+    'filter sample(x, y=1)(files from a:b)',
+    'filter every_nth(3, 1)(files from a:b) where x.y = 1',
+    'filter every_nth(3, 1)(files from a:b) limit 10',
+    'files selected by a:q',
+    'files selected a:q',
+    'fids 1,2,3',
+    'fid 1',
+    'fids abc-def, x.y/z',
+    'files a:b',
+    'file a:b, c:d, e',
+    'files a, b, c',
+    'files a:b where x.y = 1',
+    'datasets a:b',
+    'datasets a:b, c:d',
+    'datasets matching a:b*',
+    'datasets matching regexp a:"b.*"',
+    'datasets matching a:b* having x.y = 1',
+    'datasets a:b with subsets having x.y = 1, c:d',
+    'datasets a:b with subsets recursively having frozen = true and x.y in (1,2)',
+    'queries',
+    'queries matching a:b*',
+    'queries matching regexp a:"b.*"',
+    'queries where x.y = 1',
+    'queries matching a:* where x.y = 1',
+]
+
+def generated_queries(n):
+    # queries like the ones produced by scripts: long lists of datasets, values and file ids
+    datasets = ", ".join("scope_%d:dataset_%d" % (i%10, i) for i in range(n))
+    runs = ", ".join(str(1000+i) for i in range(n))
+    fids = ", ".join("%08x" % (i,) for i in range(n))
+    union = ", ".join("files from scope:dataset_%d where core.runs[any] = %d" % (i, i) for i in range(n))
+    return [
+        f"files from {datasets} where core.data_tier = raw",
+        f"files from scope:dataset where core.runs[any] in ({runs})",
+        f"fids {fids}",
+        f"union({union}) limit 100"
+    ]
+
+Creation = {
+    "earley":           "build_earley_parser",
+    "lalr":             "build_lalr_parser",
+    "lalr (tables)":    "load_lalr_parser"
+}
+
+CreationCode = """
+import time
+from metacat.mql.parser import %s as create
+t0 = time.time()
+create()
+print(time.time() - t0)
+"""
+
+def creation_time(function, repeat):
+    # runs in a new process to avoid caching by Lark and by the re module
+    best = None
+    for _ in range(repeat):
+        out = subprocess.run([sys.executable, "-c", CreationCode % (function,)], check=True, capture_output=True, text=True).stdout
+        dt = float(out.strip().split()[-1])
+        best = dt if best is None else min(best, dt)
+    return best
+
+def parse_time(parser, queries, repeat):
+    best = None
+    for _ in range(repeat):
+        t0 = time.time()
+        for q in queries:
+            try:    parser.parse(q)
+            except: pass
+        dt = time.time() - t0
+        best = dt if best is None else min(best, dt)
+    return best
+
+def main():
+    opts, args = getopt.getopt(sys.argv[1:], "n:")
+    opts = dict(opts)
+    repeat = int(opts.get("-n", 3))
+
+    print("Parser creation, previously done on import of metacat.mql, best of %d:" % (repeat,))
+    for name, function in Creation.items():
+        print("  %-16s %8.3f sec" % (name, creation_time(function, repeat)))
+    print()
+
+    earley = build_earley_parser()
+    lalr = load_lalr_parser()
+
+    nfailed = 0
+    for q in Corpus:
+        try:    lalr.parse(q)
+        except: nfailed += 1
+
+    print("Corpus: %d queries, %d require Earley fallback" % (len(Corpus), nfailed))
+    te = parse_time(earley, Corpus, repeat)
+    tl = parse_time(lalr, Corpus, repeat)
+    print("  %-16s %8.3f sec" % ("earley", te))
+    print("  %-16s %8.3f sec   x%.1f" % ("lalr", tl, te/tl))
+    print()
+
+    print("Generated queries:")
+    print("  %8s %12s %12s %8s" % ("items", "earley", "lalr", "speedup"))
+    for n in (10, 100, 1000, 3000):
+        queries = generated_queries(n)
+        te = parse_time(earley, queries, 1)
+        tl = parse_time(lalr, queries, repeat)
+        print("  %8d %12.3f %12.3f %8.1f" % (n, te, tl, te/tl))
+
+if __name__ == "__main__":
+    main()
@@ -2,8 +2,9 @@ import yaml, os, getopt, sys
 
 from webpie import WPApp, WPHandler, Response, WPStaticHandler
 from pythreader import schedule_task, Primitive, synchronized
-from metacat.db import DBUser, DBRole, DBDataset
-from metacat.filters import load_filters_module, standard_filters
+from metacat.db import DBUser, DBRole, DBDataset, set_fetch_batch_size, set_prefetch_threads, set_stream_connector
+from metacat.filters import load_filters_module, standard_filters, configure_filter_cache
+from metacat.mql import set_plan_cache_size
 
 from datetime import datetime, timezone
 #import webpie
@@ -20,6 +21,9 @@ from wsdbtools import ConnectionPool
 
 from gui_handler import GUIHandler
 from data_handler import DataHandler
+from query_cache import QueryResultCache
+from compression import CompressionStats
+from query_jobs import QueryJobRunner
 from metacat.auth.server import GUIAuthHandler, BaseApp
             
 class RootHandler(WPHandler):
@@ -91,6 +95,11 @@ class App(BaseApp, Primitive):
         self.CustomFilters = {}
 
         filters_config = self.Cfg.get("filters", {})
+        filter_cache_config = filters_config.get("cache", {})
+        configure_filter_cache(
+            max_entries = filter_cache_config.get("max_entries", 100000),
+            ttl = filter_cache_config.get("ttl", 3600)
+        )
         if filters_config.get("standard_filters", True):
             self.StandardFilters.update(standard_filters)
 
@@ -104,6 +113,36 @@ class App(BaseApp, Primitive):
         self.Filters = {}
         self.Filters.update(self.StandardFilters)
         self.Filters.update(self.CustomFilters)
+
+        query_config = self.Cfg.get("query", {})
+        if "fetch_batch_size" in query_config:
+            set_fetch_batch_size(query_config["fetch_batch_size"])
+        set_stream_connector(self.connect)
+        if "plan_cache_size" in query_config:
+            set_plan_cache_size(query_config["plan_cache_size"])
+        if "prefetch_threads" in query_config:
+            set_prefetch_threads(query_config["prefetch_threads"])
+        self.QueryParallelism = query_config.get("parallel_branches", 1)
+
+        self.CompressionStats = CompressionStats()
+
+        self.QueryCache = None
+        cache_config = query_config.get("cache")
+        if cache_config:
+            self.QueryCache = QueryResultCache(
+                size_mb = cache_config.get("size_mb", 100),
+                max_entry_mb = cache_config.get("max_entry_mb", 10),
+                ttl = cache_config.get("ttl", 600)
+            )
+
+        self.QueryJobs = None
+        jobs_config = query_config.get("jobs", {})
+        if jobs_config.get("workers", 4) > 0:
+            self.QueryJobs = QueryJobRunner(self,
+                workers = jobs_config.get("workers", 4),
+                ttl = jobs_config.get("ttl", 24*3600)
+            )
+
         self.init_auth_core(cfg)
         self.Realm = self.AuthCore.Realm
 
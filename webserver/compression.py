@@ -0,0 +1,115 @@
+import zlib, time, threading, itertools
+
+#
+# Response compression
+#
+# The encoding is chosen from the request Accept-Encoding header: zstd if the zstandard module is available
+# and the client accepts it, then gzip. The response body is compressed incrementally, chunk by chunk,
+# so that streamed responses are never held in memory as a whole. Responses shorter than MinSize are
+# sent uncompressed. For streamed responses, this is found out by reading ahead up to MinSize.
+#
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+MinSize = 1024          # do not compress responses known to be shorter than this
+
+class CompressionStats(object):
+
+    def __init__(self):
+        self.Lock = threading.Lock()
+        self.Responses = {}         # encoding -> count
+        self.BytesIn = self.BytesOut = 0
+        self.CPUTime = 0.0
+
+    def add(self, encoding, bytes_in, bytes_out, cpu_time):
+        with self.Lock:
+            self.Responses[encoding] = self.Responses.get(encoding, 0) + 1
+            self.BytesIn += bytes_in
+            self.BytesOut += bytes_out
+            self.CPUTime += cpu_time
+
+    def stats(self):
+        with self.Lock:
+            return dict(
+                responses = self.Responses.copy(),
+                bytes_in = self.BytesIn,
+                bytes_out = self.BytesOut,
+                ratio = self.BytesIn/self.BytesOut if self.BytesOut else None,
+                cpu_time = self.CPUTime,
+                cpu_time_per_mb = self.CPUTime*1024*1024/self.BytesIn if self.BytesIn else None
+            )
+
+def accepted_encodings(accept_encoding):
+    # parses Accept-Encoding header, returns set of encodings with non-zero quality
+    out = set()
+    for item in (accept_encoding or "").split(","):
+        parts = [p.strip() for p in item.split(";")]
+        encoding = parts[0].lower()
+        q = 1.0
+        for p in parts[1:]:
+            if p.startswith("q="):
+                try:    q = float(p[2:])
+                except ValueError:
+                    q = 0.0
+        if encoding and q > 0:
+            out.add(encoding)
+    return out
+
+def choose_encoding(accept_encoding):
+    accepted = accepted_encodings(accept_encoding)
+    if zstandard is not None and "zstd" in accepted:
+        return "zstd"
+    if "gzip" in accepted:
+        return "gzip"
+    return None
+
+def read_ahead(chunks, min_size):
+    # reads chunks until they add up to at least min_size
+    # returns (body, None) if the whole body is shorter than min_size, body is str or bytes
+    # otherwise, (None, iterable of all the chunks)
+    chunks = iter(chunks)
+    head = []
+    size = 0
+    for chunk in chunks:
+        head.append(chunk)
+        size += len(chunk)
+        if size >= min_size:
+            return None, itertools.chain(head, chunks)
+    if all(isinstance(chunk, str) for chunk in head):
+        return "".join(head), None
+    return b"".join(chunk.encode("utf-8") if isinstance(chunk, str) else chunk for chunk in head), None
+
+def compressor(encoding, level=None):
+    if encoding == "gzip":
+        return zlib.compressobj(6 if level is None else level, zlib.DEFLATED, 31)     # 31: gzip header
+    elif encoding == "zstd":
+        return zstandard.ZstdCompressor(level=3 if level is None else level).compressobj()
+    raise ValueError("Unsupported encoding: %s" % (encoding,))
+
+def compressed(chunks, encoding, stats=None):
+    # chunks: iterable of str or bytes
+    # returns generator of compressed bytes
+    c = compressor(encoding)
+    bytes_in = bytes_out = 0
+    cpu_time = 0.0
+    for chunk in chunks:
+        if isinstance(chunk, str):
+            chunk = chunk.encode("utf-8")
+        bytes_in += len(chunk)
+        t0 = time.thread_time()
+        out = c.compress(chunk)
+        cpu_time += time.thread_time() - t0
+        if out:
+            bytes_out += len(out)
+            yield out
+    t0 = time.thread_time()
+    out = c.flush()
+    cpu_time += time.thread_time() - t0
+    bytes_out += len(out)
+    if stats is not None:
+        stats.add(encoding, bytes_in, bytes_out, cpu_time)
+    if out:
+        yield out
@@ -1,11 +1,13 @@
 from webpie import WPApp, WPHandler, Response, WPStaticHandler
 import psycopg2, json, time, secrets, traceback, hashlib, pprint, uuid, random
-from metacat.db import DBFile, DBDataset, DBFileSet, DBNamedQuery, DBUser, DBNamespace, DBRole, \
+from metacat.db import DBFile, DBDataset, DBFileSet, DBNamedQuery, DBUser, DBNamespace, DBRole, DBQueryJob, \
     DBParamCategory, parse_name, AlreadyExistsError, IntegrityError, MetaValidationError
 from wsdbtools import ConnectionPool
 from urllib.parse import quote_plus, unquote_plus
 from metacat.util import to_str, to_bytes, ObjectSpec
-from metacat.mql import MQLQuery, MQLSyntaxError, MQLExecutionError, MQLCompilationError, MQLError
+from metacat.mql import MQLQuery, MQLSyntaxError, MQLExecutionError, MQLCompilationError, MQLError, plan_cache_stats
+from metacat.filters import filter_cache
+from compression import choose_encoding, compressed, read_ahead, MinSize as MinCompressSize
 from metacat import Version
 from datetime import datetime, timezone
 
@@ -73,9 +75,29 @@ class DataHandler(MetaCatHandler):
     RS = '\x1E'
     LF = '\n'    
 
+    def json_lines(self, iterable):
+        # iterable is an iterable, returning jsonable items, one item at a time
+        return ("%s%s%s" % (self.RS, json.dumps(item), self.LF) for item in iterable)
+
     def json_stream(self, iterable, chunk=100000):
         # iterable is an iterable, returning jsonable items, one item at a time
-        return self.text_chunks(("%s%s%s" % (self.RS, json.dumps(item), self.LF) for item in iterable), chunk)
+        return self.text_chunks(self.json_lines(iterable), chunk)
+
+    def compressed_response(self, request, body, content_type):
+        # body: str or iterable of str chunks
+        # compresses the body if the client accepts compressed responses
+        encoding = choose_encoding(request.headers.get("Accept-Encoding"))
+        if encoding is None:
+            return body, content_type
+        if not isinstance(body, (str, bytes)):
+            short_body, chunks = read_ahead(body, MinCompressSize)
+            body = short_body if chunks is None else chunks
+        if isinstance(body, (str, bytes)):
+            if len(body) < MinCompressSize:
+                return body, content_type
+            body = [body]
+        return compressed(body, encoding, self.App.CompressionStats), content_type, \
+            {"Content-Encoding": encoding, "Vary": "Accept-Encoding"}
 
     def realm(self, request, relpath, **args):
         return self.App.Realm           # realm used for the digest password authentication
@@ -184,7 +206,8 @@ class DataHandler(MetaCatHandler):
             return 404, "Dataset not found"
         files = dataset.list_files(with_metadata=with_metadata, 
                         include_retired_files = include_retired_files == "yes")
-        return self.json_stream((f.to_jsonable(with_metadata=with_metadata) for f in files)), "application/json-seq"
+        return self.compressed_response(request, 
+            self.json_stream((f.to_jsonable(with_metadata=with_metadata) for f in files)), "application/json-seq")
         
     @sanitized
     def dataset(self, request, relpath, dataset=None, exact_file_count="no", **args):
@@ -279,7 +302,6 @@ class DataHandler(MetaCatHandler):
 
             if files is not None:
                 dataset.FileCount = dataset.add_files(files, transaction=transaction)
-                dataset.save(transaction=transaction)
         
         return dataset.to_json(), "application/json"
     
@@ -478,8 +500,6 @@ class DataHandler(MetaCatHandler):
             try:
                 with db.transaction() as transaction:
                     nadded = ds.add_files(files, transaction=transaction)
-                    ds.FileCount += nadded
-                    ds.save(transaction=transaction)
             except MetaValidationError as e:
                 return e.as_json(), 400, "application/json"
         return json.dumps({"files_added": nadded}), "application/json"
@@ -1256,21 +1276,75 @@ class DataHandler(MetaCatHandler):
             lookup_lst.append(spec.as_dict())
 
         db = self.App.connect()
-        files = list(DBFile.get_files(db, lookup_lst))
+        files = DBFile.get_files(db, lookup_lst)
+        if with_provenance:
+            files = files.with_provenance()
         out = [f.to_jsonable(with_metadata = with_metadata, with_provenance = with_provenance) 
                 for f in files
         ]
-        return json.dumps(out), "application/json"
+        return self.compressed_response(request, json.dumps(out), "application/json")
+
+    def _target_dataset(self, db, user, namespace, save_as, add_to):
+        # checks permissions and returns (dataset, None) or (None, error response)
+        # for save_as, creates the dataset
+        # returns (None, None) if neither save_as nor add_to is specified
+        if save_as:
+            ds_namespace, ds_name = parse_name(save_as, namespace)
+            self.sanitize(dataset_namespace=ds_namespace, dataset_name=ds_name)
+            ns = DBNamespace.get(db, ds_namespace)
+
+            if ns is None:
+                return None, (f"Namespace {ds_namespace} does not exist", 404)
+
+            if not ns.owned_by_user(user):
+                return None, (f"Permission to create a dataset in the namespace {ds_namespace} denied", 403)
+
+            if DBDataset.exists(db, ds_namespace, ds_name):
+                return None, (f"Dataset {ds_namespace}:{ds_name} already exists", 409)
+                
+            dataset = DBDataset(db, ds_namespace, ds_name)
+            dataset.create()
+            return dataset, None
+            
+        elif add_to:
+            add_namespace, add_name = parse_name(add_to, namespace)
+            self.sanitize(dataset_namespace=add_namespace, dataset_name=add_name)
+            ns = DBNamespace.get(db, add_namespace)
+
+            if ns is None:
+                return None, (f"Namespace {add_namespace} does not exist", 404)
+
+            if not ns.owned_by_user(user):
+                return None, (f"Permission to add files to dataset in the namespace {add_namespace} denied", 403)
+
+            dataset = DBDataset.get(db, add_namespace, add_name)
+            if dataset is None:
+                return None, (f"Dataset {add_namespace}:{add_name} does not exist", 404)
+            return dataset, None
+
+        return None, None
 
     @sanitized
     def query(self, request, relpath, query=None, namespace=None, 
                     with_meta="no", with_provenance="no", debug="no", include_retired_files="no",
-                    add_to=None, save_as=None, summary=None,
+                    add_to=None, save_as=None, summary=None, after=None, page_size=None,
                     **args):
 
         if summary not in ("count", "keys", None):
             return 400, f"Unsupported summary type: {summary}"
 
+        # keyset pagination: files ordered by id, starting after file id "after", up to page_size files
+        keyset = after is not None or page_size is not None
+        if keyset and (summary or add_to or save_as):
+            return 400, "Pagination can not be used together with summary, add_to or save_as"
+        if page_size is not None:
+            try:    page_size = int(page_size)
+            except ValueError:
+                return 400, f"Invalid page size: {page_size}"
+            if page_size <= 0:
+                return 400, f"Invalid page size: {page_size}"
+        self.sanitize(after=after)
+
         with_meta = with_meta == "yes"
         with_provenance = with_provenance == "yes"
         include_retired_files = include_retired_files == "yes"
@@ -1296,45 +1370,14 @@ class DataHandler(MetaCatHandler):
             #print("query from body:", query_text)
         query_text = to_str(query_text or "")
         
-        add_namespace = add_name = ds_namespace = ds_name = None
-
         db = self.App.connect()
         user, error = self.authenticated_user()
         if (save_as or add_to) and user is None:
             return 401, error
 
-        add_to_dataset = None
-        if save_as:
-            ds_namespace, ds_name = parse_name(save_as, namespace)
-            self.sanitize(dataset_namespace=ds_namespace, dataset_name=ds_name)
-            ns = DBNamespace.get(db, ds_namespace)
-
-            if ns is None:
-                return f"Namespace {ds_namespace} does not exist", 404
-
-            if not ns.owned_by_user(user):
-                return f"Permission to create a dataset in the namespace {ds_namespace} denied", 403
-
-            if DBDataset.exists(db, ds_namespace, ds_name):
-                return f"Dataset {ds_namespace}:{ds_name} already exists", 409
-                
-            add_to_dataset = DBDataset(db, ds_namespace, ds_name)
-            add_to_dataset.create()
-            
-        elif add_to:
-            add_namespace, add_name = parse_name(add_to, namespace)
-            self.sanitize(dataset_namespace=add_namespace, dataset_name=add_name)
-            ns = DBNamespace.get(db, add_namespace)
-
-            if ns is None:
-                return f"Namespace {add_namespace} does not exist", 404
-
-            if not ns.owned_by_user(user):
-                return f"Permission to add files to dataset in the namespace {add_namespace} denied", 403
-
-            add_to_dataset = DBDataset.get(db, add_namespace, add_name)
-            if add_to_dataset is None:
-                return f"Dataset {add_namespace}:{add_name} does not exist", 404
+        add_to_dataset, error = self._target_dataset(db, user, namespace, save_as, add_to)
+        if error is not None:
+            return error
 
         t0 = time.time()
         if not query_text:
@@ -1347,8 +1390,26 @@ class DataHandler(MetaCatHandler):
                         include_retired_files=include_retired_files
             )
             query_type = query.Type
-            results = query.run(db, filters=self.App.filters(), with_meta=with_meta, with_provenance=with_provenance,
-                debug = debug == "yes"
+            if keyset and query_type != "file":
+                return 400, "Pagination is supported for file queries only"
+
+            cache = self.App.QueryCache if add_to_dataset is None else None
+            if cache is not None:
+                cache_key = cache.key(query, namespace or None, 
+                    with_meta=with_meta, with_provenance=with_provenance, include_retired_files=include_retired_files,
+                    summary=summary, after=after, page_size=page_size
+                )
+                cached = cache.get(db, cache_key)
+                if cached is not None:
+                    content_type, lines = cached
+                    return self.compressed_response(request, self.text_chunks(iter(lines), 100000), content_type)
+                cache_horizon = cache.horizon(db)
+                cache_scope = cache.scope(query, with_provenance)
+
+            # provenance is added below, by the database if possible
+            results = query.run(db, filters=self.App.filters(), with_meta=with_meta, with_provenance=False,
+                debug = debug == "yes", after=after, page_size=page_size,
+                connect = self.App.connect, max_parallel = self.App.QueryParallelism
             )
         except (AssertionError, ValueError, MQLError) as e:
             #traceback.print_exc()
@@ -1359,23 +1420,159 @@ class DataHandler(MetaCatHandler):
 
         if query_type == "file":
 
-            if summary == "count":
-                count, size = results.counts()
-                return json.dumps({"count":count, "total_size":size}), "application/json"
-            elif summary == "keys":
-                return json.dumps(list(results.metadata_keys())), "application/json"
-
+            if summary is not None:
+                if summary == "count":
+                    count, size = results.counts()
+                    out = json.dumps({"count":count, "total_size":size})
+                elif summary == "keys":
+                    out = json.dumps(list(results.metadata_keys()))
+                if cache is not None:
+                    cache.put(cache_key, cache_horizon, cache_scope, "application/json", [out])
+                return out, "application/json"
+
+            json_rows = None
             if add_to_dataset is not None:
                 results = list(results)
                 nfiles = add_to_dataset.add_files(results)
-            data = (f.to_jsonable(with_metadata=with_meta, with_provenance=with_provenance) for f in results)
-            return self.json_stream(data), "application/json-seq"
+            else:
+                # fast path: JSON built by the database, if the results are not produced by Python filters and provenance is not requested
+                json_rows = results.json_rows(with_metadata=with_meta, with_provenance=with_provenance)
+
+            if json_rows is not None:
+                lines = ("%s%s%s" % (self.RS, row, self.LF) for row in json_rows)
+            else:
+                if with_provenance:
+                    if isinstance(results, list):
+                        results = DBFileSet(db, results)
+                    results = results.with_provenance()
+                lines = self.json_lines(f.to_jsonable(with_metadata=with_meta, with_provenance=with_provenance) for f in results)
 
         else:
             # dataset query
-            data = ( d.to_jsonable(with_relatives=with_provenance) for d in results )
+            lines = self.json_lines(d.to_jsonable(with_relatives=with_provenance) for d in results)
 
-        return self.json_stream(data), "application/json-seq"
+        if cache is not None:
+            lines = cache.record(cache_key, cache_horizon, cache_scope, "application/json-seq", lines)
+        return self.compressed_response(request, self.text_chunks(lines, 100000), "application/json-seq")
+
+    @sanitized
+    def query_jobs(self, request, relpath, namespace=None, with_meta="no", with_provenance="no", include_retired_files="no",
+                    add_to=None, save_as=None, summary=None, offset="0", limit="1000", **args):
+        #
+        # Asynchronous queries
+        #
+        #   POST data/query_jobs?<same arguments as for data/query>     - submit the query in the request body
+        #                                                                   returns job status with "job_id"
+        #   GET  data/query_jobs                                        - list jobs of the authenticated user
+        #   GET  data/query_jobs/<job id>                               - job status and number of results so far
+        #   GET  data/query_jobs/<job id>/results?offset=<n>&limit=<n>  - results, as application/json-seq
+        #   GET  data/query_jobs/<job id>/cancel                        - cancel the job
+        #
+        runner = self.App.QueryJobs
+        if runner is None:
+            return 404, "Query jobs are not enabled"
+
+        db = self.App.connect()
+        user, error = self.authenticated_user()
+        words = [w for w in (relpath or "").split("/") if w]
+
+        if not words:
+            if request.method == "POST":
+                return self._submit_query_job(request, db, user, error, namespace, with_meta, with_provenance,
+                    include_retired_files, add_to, save_as, summary)
+            if user is None:
+                return 401, error
+            return json.dumps([job.to_jsonable() for job in DBQueryJob.list(db, user.Username)]), "application/json"
+
+        job_id = words[0]
+        self.sanitize(job_id=job_id)
+        job = DBQueryJob.get(db, job_id)
+        if job is None:
+            return 404, f"Query job {job_id} not found or expired"
+        if job.Owner is not None and (user is None or user.Username != job.Owner and not user.is_admin()):
+            return 403, "Permission denied"
+
+        action = words[1] if len(words) > 1 else None
+        if action is None:
+            return json.dumps(job.to_jsonable()), "application/json"
+        elif action == "results":
+            try:
+                offset, limit = int(offset), int(limit)
+            except ValueError:
+                return 400, "Invalid offset or limit"
+            if offset < 0 or limit <= 0:
+                return 400, "Invalid offset or limit"
+            lines = ("%s%s%s" % (self.RS, row, self.LF) for row in job.results(offset, limit))
+            return self.compressed_response(request, self.text_chunks(lines, 100000), "application/json-seq")
+        elif action == "cancel":
+            job.set_status("cancelled", ttl=runner.TTL)
+            return json.dumps(job.to_jsonable()), "application/json"
+        return 400, f"Unknown query job request: {action}"
+
+    def _submit_query_job(self, request, db, user, error, namespace, with_meta, with_provenance, include_retired_files,
+                    add_to, save_as, summary):
+        if summary not in ("count", "keys", None):
+            return 400, f"Unsupported summary type: {summary}"
+        if summary and (add_to or save_as):
+            return 400, "Summary can not be used together with add_to or save_as"
+        if (save_as or add_to) and user is None:
+            return 401, error
+        self.sanitize(namespace=namespace)
+
+        with_meta = with_meta == "yes" or summary == "keys"
+        with_provenance = with_provenance == "yes" and summary is None
+
+        query_text = to_str(request.POST.get("query") or request.body or "")
+        if not query_text:
+            return 400, "Query not specified"
+
+        try:
+            # syntax errors are reported right away
+            MQLQuery.parse(query_text, db=db, default_namespace=namespace or None)
+        except (AssertionError, ValueError, MQLError) as e:
+            return 400, e.__class__.__name__ + ": " + e.Message
+
+        dataset, error = self._target_dataset(db, user, namespace, save_as, add_to)
+        if error is not None:
+            return error
+
+        job = DBQueryJob(db, owner=None if user is None else user.Username, query=query_text,
+            params = dict(
+                namespace = namespace or None,
+                with_meta = with_meta,
+                with_provenance = with_provenance,
+                include_retired_files = include_retired_files == "yes",
+                summary = summary,
+                dataset = None if dataset is None else [dataset.Namespace, dataset.Name]
+            )
+        )
+        job.create()
+        self.App.QueryJobs.submit(job)
+        return json.dumps(job.to_jsonable()), "application/json"
+
+    def query_cache_stats(self, request, relpath, **args):
+        cache = self.App.QueryCache
+        if cache is None:
+            return json.dumps(None), "application/json"
+        return json.dumps(cache.stats()), "application/json"
+
+    def plan_cache_stats(self, request, relpath, **args):
+        return json.dumps(plan_cache_stats()), "application/json"
+
+    def compression_stats(self, request, relpath, **args):
+        return json.dumps(self.App.CompressionStats.stats()), "application/json"
+
+    def filter_cache_stats(self, request, relpath, **args):
+        return json.dumps(filter_cache().stats()), "application/json"
+
+    def flush_filter_cache(self, request, relpath, name=None, **args):
+        user, error = self.authenticated_user()
+        if user is None:
+            return 401, error
+        if not user.is_admin():
+            return 403
+        removed = filter_cache().flush(name)
+        return json.dumps({"removed": removed}), "application/json"
         
     @sanitized
     def search_queries(self, request, relpath, query=None,**args):
@@ -1452,7 +1649,8 @@ class DataHandler(MetaCatHandler):
             existing.save()
             q = existing
         else:
-            q = DBNamedQuery(db, namespace, name, data["source"], data.get("parameters", []))
+            q = DBNamedQuery(db, namespace, name, data["source"], data.get("parameters", []), 
+                data.get("description"), data.get("metadata", {}))
             q.Creator = user.Username
             q.create()
         return 200, q.to_json(), "application/json"
@@ -0,0 +1,110 @@
+from metacat.util import LRUCache
+from metacat.db import change_horizon, changed_since
+
+class QueryResultCache(object):
+
+    #
+    # Cache of serialized query results
+    #
+    # The key is the normalized (parsed) MQL text together with the query options.
+    # Each entry remembers the change horizon at the time the query was run and the scope of the query:
+    # the list of datasets the results depend on, or None if the results may depend on any part of the catalog.
+    # On lookup, the entry is valid only if the change log has no changes in its scope after the horizon.
+    #
+
+    Uncacheable = "uncacheable"
+
+    def __init__(self, size_mb=100, max_entry_mb=10, ttl=600):
+        self.MaxEntrySize = int(max_entry_mb*1024*1024)
+        self.Cache = LRUCache(int(size_mb*1024*1024),
+            size_fn = lambda entry: sum(len(line) for line in entry[3]),
+            ttl = ttl
+        )
+        self.Invalidated = 0
+
+    @staticmethod
+    def key(query, default_namespace, **options):
+        # versions of named queries used by the query are part of the key, so updating a named query
+        # makes the cached results unreachable
+        named_queries = getattr(query, "NamedQueryVersions", ())
+        return (repr(query.Parsed), default_namespace, named_queries) + tuple(sorted(options.items()))
+
+    @staticmethod
+    def scope(query, with_provenance=False):
+        # returns list of (namespace, name) of datasets the query results depend on,
+        # None if the results can depend on anything in the catalog,
+        # or Uncacheable
+        if any(version is None for _, _, version in getattr(query, "NamedQueryVersions", ())):
+            return QueryResultCache.Uncacheable
+        if query.Type != "file":
+            return QueryResultCache.Uncacheable if query.Type == "query" else None
+        if with_provenance:
+            return None
+        datasets = set()
+        for node in QueryResultCache._nodes(query.Tree):
+            if node.T == "filter":
+                # filters may be not deterministic, e.g. random sampling
+                return QueryResultCache.Uncacheable
+            elif node.T == "basic_file_query":
+                selectors = node["query"].DatasetSelectors
+                if not selectors or not all(s.is_explicit() for s in selectors):
+                    return None
+                datasets.update((s.Namespace, s.Name) for s in selectors)
+            elif node.T not in ("union", "join", "minus", "skip_limit", "ordered", "meta_filter", "empty"):
+                # file lists, provenance
+                return None
+        return sorted(datasets)
+
+    @staticmethod
+    def _nodes(tree):
+        yield tree
+        for c in tree.C:
+            if hasattr(c, "C"):
+                yield from QueryResultCache._nodes(c)
+
+    def get(self, db, key):
+        # returns (content_type, lines) or None
+        entry = self.Cache.get(key)
+        if entry is None:
+            return None
+        horizon, scope, content_type, lines = entry
+        if changed_since(db, horizon, scope):
+            self.Cache.remove(key)
+            self.Invalidated += 1
+            return None
+        return content_type, lines
+
+    def horizon(self, db):
+        # must be called before the query is run
+        return change_horizon(db)
+
+    def put(self, key, horizon, scope, content_type, lines):
+        if scope != self.Uncacheable:
+            self.Cache.put(key, (horizon, scope, content_type, lines))
+
+    def record(self, key, horizon, scope, content_type, lines):
+        # passes the lines through and stores them in the cache if the whole result was generated
+        # and it is not too large
+        if scope == self.Uncacheable:
+            yield from lines
+            return
+        saved = []
+        size = 0
+        for line in lines:
+            if saved is not None:
+                size += len(line)
+                if size > self.MaxEntrySize:
+                    saved = None
+                else:
+                    saved.append(line)
+            yield line
+        if saved is not None:
+            self.put(key, horizon, scope, content_type, saved)
+
+    def clear(self):
+        self.Cache.clear()
+
+    def stats(self):
+        stats = self.Cache.stats()
+        stats["invalidated"] = self.Invalidated
+        return stats
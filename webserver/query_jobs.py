@@ -0,0 +1,96 @@
+import json, traceback
+from concurrent.futures import ThreadPoolExecutor
+from metacat.db import DBQueryJob, DBDataset, DBFileSet
+from metacat.mql import MQLQuery, MQLError
+
+class QueryJobRunner(object):
+
+    #
+    # Runs asynchronous query jobs in a pool of worker threads
+    #
+    # The job parameters are validated and the permissions are checked by the request handler, when the job is submitted.
+    # The worker runs the query on its own connection and appends the serialized results to the job in batches,
+    # so that they can be read while the job is running. A job cancelled by the client stops at the next batch.
+    # The results are written using another connection: committing them on the query connection would close
+    # the server side cursor the results are read from.
+    #
+
+    BatchSize = 1000
+
+    def __init__(self, app, workers=4, ttl=24*3600):
+        self.App = app
+        self.TTL = ttl
+        self.Executor = ThreadPoolExecutor(workers, thread_name_prefix="metacat-query-job")
+
+    def submit(self, job):
+        self.Executor.submit(self.run, job.ID)
+
+    def run(self, job_id):
+        job = DBQueryJob.get(self.App.connect(), job_id)
+        if job is None or not job.set_status("running"):
+            return          # cancelled while queued
+        try:
+            batch = []
+            for row in self.results(self.App.connect(), job):
+                batch.append(row)
+                if len(batch) >= self.BatchSize:
+                    if not job.append_results(batch):
+                        return          # cancelled
+                    batch = []
+            if job.append_results(batch):
+                job.set_status("done", ttl=self.TTL)
+        except MQLError as e:
+            job.set_status("failed", error=e.__class__.__name__ + ": " + e.Message, ttl=self.TTL)
+        except Exception as e:
+            traceback.print_exc()
+            job.set_status("failed", error=e.__class__.__name__ + ": " + str(e), ttl=self.TTL)
+
+    def results(self, db, job):
+        # generates serialized results, same as returned by the data/query request
+        params = job.Params
+        with_meta = params.get("with_meta", False)
+        with_provenance = params.get("with_provenance", False)
+        summary = params.get("summary")
+        query = MQLQuery.parse(job.Query,
+                    db=db,
+                    default_namespace=params.get("namespace"),
+                    include_retired_files=params.get("include_retired_files", False)
+        )
+        results = query.run(db, filters=self.App.filters(), with_meta=with_meta, with_provenance=False,
+            connect = self.App.connect, max_parallel = self.App.QueryParallelism
+        )
+        if results is None:
+            return
+
+        if query.Type == "file":
+            if summary == "count":
+                count, size = results.counts()
+                yield json.dumps({"count":count, "total_size":size})
+                return
+            elif summary == "keys":
+                yield json.dumps(list(results.metadata_keys()))
+                return
+
+            dataset = None
+            if params.get("dataset"):
+                namespace, name = params["dataset"]
+                dataset = DBDataset.get(db, namespace, name)
+                if dataset is None:
+                    raise ValueError(f"Dataset {namespace}:{name} does not exist")
+                results = list(results)
+                dataset.add_files(results)
+            else:
+                json_rows = results.json_rows(with_metadata=with_meta, with_provenance=with_provenance)
+                if json_rows is not None:
+                    yield from json_rows
+                    return
+
+            if with_provenance:
+                if isinstance(results, list):
+                    results = DBFileSet(db, results)
+                results = results.with_provenance()
+            for f in results:
+                yield json.dumps(f.to_jsonable(with_metadata=with_meta, with_provenance=with_provenance))
+        else:
+            for d in results:
+                yield json.dumps(d.to_jsonable(with_relatives=with_provenance))